@@ -74,7 +74,7 @@ from deeplake.util.storage import (
 )
 from deeplake.util.compute import get_compute_provider
 from deeplake.util.remove_cache import get_base_storage
-from deeplake.util.cache_chain import generate_chain
+from deeplake.util.cache_chain import generate_chain, get_cache_chain_options
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
 
 
@@ -89,6 +89,10 @@ class dataset:
         public: bool = False,
         memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
         local_cache_size: int = DEFAULT_LOCAL_CACHE_SIZE,
+        eviction_policy: str = "lru",
+        num_shards: int = 1,
+        write_behind: bool = False,
+        use_mmap: bool = False,
         creds: Optional[Union[Dict, str]] = None,
         token: Optional[str] = None,
         org_id: Optional[str] = None,
@@ -134,6 +138,14 @@ class dataset:
             public (bool): Defines if the dataset will have public access. Applicable only if Deep Lake cloud storage is used and a new Dataset is being created. Defaults to ``True``.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            eviction_policy (str): The order in which objects are evicted from the memory and local caches. One of ``"lru"``,
+                ``"lfu"``, ``"2q"`` and ``"arc"``. ``"2q"`` and ``"arc"`` keep metadata cached during sequential scans. Defaults to ``"lru"``.
+            num_shards (int): Number of independently locked partitions of each cache, which reduces lock contention when
+                the dataset is read by many threads. Defaults to 1.
+            write_behind (bool): If ``True``, the caches write to the underlying storage in background threads instead of
+                blocking the caller. :meth:`Dataset.flush <deeplake.core.dataset.Dataset.flush>` waits for the writes to complete. Defaults to ``False``.
+            use_mmap (bool): If ``True``, chunks of local datasets are read from memory mapped files instead of being copied
+                into memory, which saves memory and copies when the same chunks are read by several processes. Not supported on Windows. Defaults to ``False``.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -220,6 +232,10 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                eviction_policy=eviction_policy,
+                num_shards=num_shards,
+                write_behind=write_behind,
+                use_mmap=use_mmap,
             )
 
             feature_report_path(path, "dataset", {"Overwrite": overwrite}, token=token)
@@ -267,6 +283,10 @@ class dataset:
                     "access_method": access_method,
                     "memory_cache_size": memory_cache_size,
                     "local_cache_size": local_cache_size,
+                    "eviction_policy": eviction_policy,
+                    "num_shards": num_shards,
+                    "write_behind": write_behind,
+                    "use_mmap": use_mmap,
                     "creds": creds,
                     "ds_exists": ds_exists,
                     "num_workers": num_workers,
@@ -355,6 +375,9 @@ class dataset:
         public: bool = False,
         memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
         local_cache_size: int = DEFAULT_LOCAL_CACHE_SIZE,
+        eviction_policy: str = "lru",
+        num_shards: int = 1,
+        write_behind: bool = False,
         creds: Optional[Union[Dict, str]] = None,
         token: Optional[str] = None,
         org_id: Optional[str] = None,
@@ -375,6 +398,12 @@ class dataset:
             public (bool): Defines if the dataset will have public access. Applicable only if Deep Lake cloud storage is used and a new Dataset is being created. Defaults to ``False``.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            eviction_policy (str): The order in which objects are evicted from the memory and local caches. One of ``"lru"``,
+                ``"lfu"``, ``"2q"`` and ``"arc"``. ``"2q"`` and ``"arc"`` keep metadata cached during sequential scans. Defaults to ``"lru"``.
+            num_shards (int): Number of independently locked partitions of each cache, which reduces lock contention when
+                the dataset is read by many threads. Defaults to 1.
+            write_behind (bool): If ``True``, the caches write to the underlying storage in background threads instead of
+                blocking the caller. :meth:`Dataset.flush <deeplake.core.dataset.Dataset.flush>` waits for the writes to complete. Defaults to ``False``.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -422,6 +451,9 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                eviction_policy=eviction_policy,
+                num_shards=num_shards,
+                write_behind=write_behind,
             )
 
             feature_report_path(
@@ -470,6 +502,10 @@ class dataset:
         read_only: Optional[bool] = None,
         memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
         local_cache_size: int = DEFAULT_LOCAL_CACHE_SIZE,
+        eviction_policy: str = "lru",
+        num_shards: int = 1,
+        write_behind: bool = False,
+        use_mmap: bool = False,
         creds: Optional[Union[dict, str]] = None,
         token: Optional[str] = None,
         org_id: Optional[str] = None,
@@ -512,6 +548,14 @@ class dataset:
                 Datasets stored on Deep Lake cloud that your account does not have write access to will automatically open in read mode.
             memory_cache_size (int): The size of the memory cache to be used in MB.
             local_cache_size (int): The size of the local filesystem cache to be used in MB.
+            eviction_policy (str): The order in which objects are evicted from the memory and local caches. One of ``"lru"``,
+                ``"lfu"``, ``"2q"`` and ``"arc"``. ``"2q"`` and ``"arc"`` keep metadata cached during sequential scans. Defaults to ``"lru"``.
+            num_shards (int): Number of independently locked partitions of each cache, which reduces lock contention when
+                the dataset is read by many threads. Defaults to 1.
+            write_behind (bool): If ``True``, the caches write to the underlying storage in background threads instead of
+                blocking the caller. :meth:`Dataset.flush <deeplake.core.dataset.Dataset.flush>` waits for the writes to complete. Defaults to ``False``.
+            use_mmap (bool): If ``True``, chunks of local datasets are read from memory mapped files instead of being copied
+                into memory, which saves memory and copies when the same chunks are read by several processes. Not supported on Windows. Defaults to ``False``.
             creds (dict, str, optional): The string ``ENV`` or a dictionary containing credentials used to access the dataset at the path.
                 - If 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token' are present, these take precedence over credentials present in the environment or in credentials file. Currently only works with s3 paths.
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
@@ -591,6 +635,10 @@ class dataset:
                 token=token,
                 memory_cache_size=memory_cache_size,
                 local_cache_size=local_cache_size,
+                eviction_policy=eviction_policy,
+                num_shards=num_shards,
+                write_behind=write_behind,
+                use_mmap=use_mmap,
             )
             feature_report_path(
                 path,
@@ -630,6 +678,10 @@ class dataset:
                     "access_method": access_method,
                     "memory_cache_size": memory_cache_size,
                     "local_cache_size": local_cache_size,
+                    "eviction_policy": eviction_policy,
+                    "num_shards": num_shards,
+                    "write_behind": write_behind,
+                    "use_mmap": use_mmap,
                     "creds": creds,
                     "ds_exists": True,
                     "num_workers": num_workers,
@@ -1221,6 +1273,7 @@ class dataset:
                 memory_cache_size=DEFAULT_MEMORY_CACHE_SIZE,
                 local_cache_size=DEFAULT_LOCAL_CACHE_SIZE,
                 path=src_ds.path,
+                **get_cache_chain_options(src_ds.storage),
             )
             for key in keys:
                 # don't copy the lock file
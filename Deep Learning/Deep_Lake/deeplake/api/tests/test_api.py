@@ -44,6 +44,7 @@ from deeplake.util.exceptions import (
 from deeplake.util.path import convert_string_to_pathlib_if_needed, verify_dataset_name
 from deeplake.util.testing import assert_array_equal
 from deeplake.util.pretty_print import summary_tensor, summary_dataset
+from deeplake.util.remove_cache import get_base_storage
 from deeplake.util.shape_interval import ShapeInterval
 from deeplake.constants import GDRIVE_OPT, MB
 from deeplake.client.config import REPORTING_CONFIG_FILE_PATH
@@ -324,6 +325,37 @@ def test_fixed_tensor(local_ds):
     assert_array_equal(local_ds.image.numpy(), np.ones((32, 28, 28)))
 
 
+@pytest.mark.parametrize("chunk_compression", [None, "lz4"])
+def test_bulk_numpy_read(local_ds, chunk_compression):
+    data = np.arange(200 * 4 * 3, dtype="int32").reshape(200, 4, 3)
+    tensor = local_ds.create_tensor(
+        "image", chunk_compression=chunk_compression, max_chunk_size=1000
+    )
+    tensor.extend(data)
+    assert tensor.chunk_engine.num_chunks > 1
+
+    assert_array_equal(tensor.numpy(), data)
+    assert_array_equal(tensor[10:190:3].numpy(), data[10:190:3])
+    assert_array_equal(tensor[150:20:-7].numpy(), data[150:20:-7])
+    assert_array_equal(tensor[20:180, 1:3, 2].numpy(), data[20:180, 1:3, 2])
+
+    indices = list(np.random.permutation(200)[:50])
+    assert_array_equal(
+        tensor.chunk_engine.numpy(tensor.index[indices], fetch_chunks=True),
+        data[indices],
+    )
+
+    # sub indexes are applied to every sample, even when numpy would move their advanced indexes to the front
+    volumes = np.arange(60 * 4 * 5 * 3, dtype="int32").reshape(60, 4, 5, 3)
+    tensor = local_ds.create_tensor(
+        "volume", chunk_compression=chunk_compression, max_chunk_size=1000
+    )
+    tensor.extend(volumes)
+    expected = np.stack([sample[1, :, [0, 2]] for sample in volumes[:40]])
+    assert expected.shape == (40, 2, 5)
+    assert_array_equal(tensor[:40, 1, :, [0, 2]].numpy(fetch_chunks=True), expected)
+
+
 def test_dynamic_tensor(local_ds):
     local_ds.create_tensor("image")
 
@@ -2198,6 +2230,32 @@ def test_empty_sample_partial_read(s3_ds):
     assert ds.xyz[1].numpy().tolist() == []
 
 
+@pytest.mark.parametrize("compression", [None, "png"])
+def test_coalesced_partial_read(s3_ds_generator, compression):
+    ds = s3_ds_generator()
+    arrs = [np.random.randint(0, 255, (32, 32, 3), dtype="uint8") for _ in range(64)]
+    with ds:
+        ds.create_tensor("xyz", sample_compression=compression, max_chunk_size=64 * MB)
+        ds.xyz.extend(arrs)
+
+    ds = s3_ds_generator()
+    storage = get_base_storage(ds.storage)
+    requested = []
+    get_byte_ranges = storage.get_byte_ranges
+
+    def counting_get_byte_ranges(path, ranges):
+        requested.append(path)
+        return get_byte_ranges(path, ranges)
+
+    storage.get_byte_ranges = counting_get_byte_ranges
+    idxs = [40, 3, 17, 3, 62, 8]
+    np.testing.assert_array_equal(
+        ds.xyz[idxs].numpy(), np.stack([arrs[i] for i in idxs])
+    )
+    # all the samples are read from one chunk with a single bulk read
+    assert len(requested) == 1
+
+
 def test_htype_config_bug(local_ds):
     with local_ds as ds:
         ds.create_tensor("abc", htype="class_label")
@@ -149,6 +149,27 @@ class BaseChunk(DeepLakeMemoryObject):
         # should only be called if self.is_fixed_shape
         return local_index * self.sample_size, (local_index + 1) * self.sample_size
 
+    def _sample_byte_range(self, local_index: int) -> Optional[Tuple[int, int]]:
+        """Byte range of the data read by `read_sample` for a sample, if it reads a range of the data."""
+        bps = self.byte_positions_encoder
+        if bps.is_empty():
+            return None
+        sb, eb = bps[local_index]
+        return int(sb), int(eb)
+
+    def prefetch_samples(self, local_indices: List[int]):
+        """Fetches the bytes of multiple samples of a partially read chunk ahead of them being read,
+        with as few requests as possible. No op for chunks that are fully read.
+        """
+        if not isinstance(self.data_bytes, PartialReader):
+            return
+        ranges = []
+        for local_index in local_indices:
+            byte_range = self._sample_byte_range(local_index)
+            if byte_range is not None:
+                ranges.append(byte_range)
+        self.data_bytes.prefetch(ranges)
+
     @property
     def is_partially_read_chunk(self):
         return isinstance(self.data_bytes, PartialReader)
@@ -1,5 +1,5 @@
 import numpy as np
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Tuple
 from deeplake.core.linked_tiled_sample import LinkedTiledSample
 from deeplake.core.serialize import (
     check_sample_shape,
@@ -184,6 +184,11 @@ class UncompressedChunk(BaseChunk):
 
         return num_samples
 
+    def _sample_byte_range(self, local_index: int) -> Optional[Tuple[int, int]]:
+        if self.is_fixed_shape and self.htype != "polygon":
+            return self.get_byte_positions(local_index)
+        return super()._sample_byte_range(local_index)
+
     @catch_chunk_read_error
     def read_sample(
         self,
@@ -1,4 +1,5 @@
-from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from deeplake.client.log import logger
 import deeplake
 import numpy as np
@@ -27,6 +28,10 @@ from deeplake.core.version_control.commit_diff import CommitDiff
 from deeplake.core.partial_reader import PartialReader
 from deeplake.core.version_control.commit_node import CommitNode  # type: ignore
 from deeplake.core.version_control.commit_chunk_map import CommitChunkMap  # type: ignore
+from deeplake.core.version_control.chunk_commit_index import (
+    ChunkCommitIndex,
+    load_chunk_commit_index,
+)
 from typing import Any, Dict, List, Optional, Sequence, Union, Callable
 from deeplake.core.meta.encode.tile import TileEncoder
 from deeplake.core.storage.provider import StorageProvider
@@ -60,6 +65,7 @@ from deeplake.core.chunk.uncompressed_chunk import UncompressedChunk
 from deeplake.core.fast_forwarding import ffw_chunk_id_encoder
 from deeplake.core.index.index import Index, IndexEntry
 from deeplake.core.meta.encode.chunk_id import CHUNK_ID_COLUMN, ChunkIdEncoder
+from deeplake.core.meta.encode.chunk_stats import ChunkStats, compute_stats
 from deeplake.core.meta.encode.sequence import SequenceEncoder
 from deeplake.core.meta.encode.pad import PadEncoder
 from deeplake.core.meta.tensor_meta import TensorMeta
@@ -83,6 +89,7 @@ from deeplake.util.keys import (
     get_tensor_commit_chunk_map_key,
     get_tensor_meta_key,
     get_tensor_tile_encoder_key,
+    get_tensor_chunk_stats_key,
     get_tensor_info_key,
 )
 from deeplake.util.exceptions import (
@@ -98,7 +105,7 @@ from deeplake.util.exceptions import (
 )
 from deeplake.util.remove_cache import get_base_storage
 from deeplake.util.image import convert_sample, convert_img_arr
-from deeplake.util.class_label import convert_to_idx, convert_to_hash
+from deeplake.util.class_label import convert_to_idx, has_int_labels_from
 from deeplake.compression import (
     BYTE_COMPRESSION,
     VIDEO_COMPRESSIONS,
@@ -110,6 +117,10 @@ from collections.abc import Iterable
 from PIL import Image  # type: ignore
 
 
+# number of chunks fetched concurrently by bulk reads
+BULK_READ_NUM_WORKERS = 8
+
+
 class ChunkEngine:
     def __init__(
         self,
@@ -199,9 +210,17 @@ class ChunkEngine:
         self._tile_encoder: Optional[TileEncoder] = None
         self._tile_encoder_commit_id: Optional[str] = None
 
+        self._chunk_stats: Optional[ChunkStats] = None
+        self._chunk_stats_commit_id: Optional[str] = None
+        # commit at which the tensor was found to have no chunk stats, to not look them up on every write
+        self._chunk_stats_absent_commit_id: Optional[str] = None
+
         self._commit_chunk_map: Optional[CommitChunkMap] = None
         self._commit_chunk_map_commit_id: Optional[str] = None
 
+        self._chunk_commit_index: Optional[ChunkCommitIndex] = None
+        self._chunk_commit_index_commit_id: Optional[str] = None
+
         self._commit_diff: Optional[CommitDiff] = None
         self._commit_diff_commit_id: Optional[str] = None
 
@@ -212,8 +231,11 @@ class ChunkEngine:
         self._info_commit_id: Optional[str] = None
 
         self._all_chunk_engines: Optional[Dict[str, ChunkEngine]] = None
-        self._is_temp_label_tensor: bool = False
-        self._hash_label_map: Dict[int, str] = OrderedDict()
+        # class names used by a transform worker to convert labels, see ``merge_class_labels``
+        self._transform_class_names: Optional[List[str]] = None
+        # number of class names of the tensor when the transform started, and whether labels >= it were given as indexes
+        self._transform_num_known_labels = 0
+        self._transform_int_labels = False
         self._sample_compression = None
         self._chunk_compression = None
 
@@ -464,6 +486,74 @@ class ChunkEngine:
             self.meta_cache.register_deeplake_object(key, enc)
         return self._tile_encoder
 
+    @property
+    def chunk_stats(self) -> ChunkStats:
+        """Gets the per chunk statistics from cache, if they are not found it creates blank ones."""
+        commit_id = self.commit_id
+        if self._chunk_stats is None or self._chunk_stats_commit_id != commit_id:
+            key = get_tensor_chunk_stats_key(self.key, commit_id)
+            if not self.chunk_stats_exists:
+                stats = ChunkStats()
+                try:
+                    self.meta_cache[key] = stats
+                except ReadOnlyModeError:
+                    pass
+            else:
+                stats = self.meta_cache.get_deeplake_object(key, ChunkStats)
+            self._chunk_stats = stats
+            self._chunk_stats_commit_id = commit_id
+            self.meta_cache.register_deeplake_object(key, stats)
+        return self._chunk_stats
+
+    @property
+    def chunk_stats_exists(self) -> bool:
+        commit_id = self.commit_id
+        if self._chunk_stats is not None and self._chunk_stats_commit_id == commit_id:
+            return True
+
+        key = get_tensor_chunk_stats_key(self.key, commit_id)
+        if self._chunk_stats_absent_commit_id == commit_id:
+            # stats created since by another chunk engine of the tensor are registered in the cache
+            return key in self.meta_cache.deeplake_objects
+        try:
+            self.meta_cache[key]
+            return True
+        except KeyError:
+            self._chunk_stats_absent_commit_id = commit_id
+            return False
+
+    @property
+    def _chunk_stats_enabled(self) -> bool:
+        """Min / max statistics are only kept for tensors of plain numbers, which queries can compare against."""
+        meta = self.tensor_meta
+        return (
+            meta.dtype is not None
+            and np.dtype(meta.dtype).kind in "iuf"
+            and meta.htype in ("generic", "class_label")
+            and not meta.is_link
+        )
+
+    def _update_chunk_stats(self, chunk: BaseChunk, samples, new_chunk: bool = False):
+        """Records the statistics of samples written to a chunk.
+
+        The statistics of a new chunk are set, those of an existing chunk are widened. Chunks whose samples can't be
+        summarized are marked as unknown.
+        """
+        if not self._chunk_stats_enabled:
+            return
+        stats = compute_stats(samples, self.tensor_meta.dtype)
+        chunk_stats = self.chunk_stats
+        if stats is None:
+            chunk_stats.invalidate(chunk.id)
+        elif new_chunk:
+            chunk_stats.set(chunk.id, stats)
+        else:
+            chunk_stats.update(chunk.id, stats)
+
+    def _invalidate_chunk_stats(self, chunk_id):
+        if self._chunk_stats_enabled and self.chunk_stats_exists:
+            self.chunk_stats.invalidate(chunk_id)
+
     @property
     def tile_encoder_exists(self) -> bool:
         commit_id = self.commit_id
@@ -633,18 +723,37 @@ class ChunkEngine:
         """Returns the commit id and tensor key that contains the chunk_name."""
         cur_node: Optional[CommitNode] = self.version_state["commit_node"]
         key = self.key
-        while cur_node is not None:
+        if cur_node is not None and cur_node.is_head_node:
+            # the head commit can still change, its chunk map is looked up before the index of the committed history
             commit_id = cur_node.commit_id
-            chunk_map_key = get_tensor_commit_chunk_map_key(key, commit_id)
-            try:
-                # the first commit doesn't contain a chunk map, don't repeatedly try to fetch from storage
-                if commit_id == FIRST_COMMIT_ID:
-                    chunk_map = dict()
-                else:
-                    chunk_map = self.meta_cache.get_deeplake_object(
-                        chunk_map_key, CommitChunkMap
-                    ).chunks
-            except Exception:
+            v = self._get_commit_chunk_map(commit_id, create=True).get(chunk_name)
+            if v is not None:
+                return v.get("commit_id", commit_id), v.get("key", key)
+            cur_node = cur_node.parent  # type: ignore
+        if cur_node is not None:
+            source = self._get_cached_chunk_commit_index(cur_node).get(chunk_name)
+            if source is not None:
+                return source[0], source[1] or key
+        # the first commit doesn't have a commit chunk map, so any chunk that wasn't found belongs to the first commit
+        return FIRST_COMMIT_ID, key
+
+    def _get_commit_chunk_map(
+        self, commit_id: str, create: bool = False
+    ) -> CommitChunkMap:
+        """Returns the commit chunk map of a commit, empty if the map doesn't exist.
+
+        Args:
+            commit_id (str): The commit.
+            create (bool): Whether to create a blank chunk map if the commit doesn't have one.
+        """
+        # the first commit doesn't contain a chunk map, don't repeatedly try to fetch from storage
+        if commit_id == FIRST_COMMIT_ID:
+            return CommitChunkMap()
+        chunk_map_key = get_tensor_commit_chunk_map_key(self.key, commit_id)
+        try:
+            return self.meta_cache.get_deeplake_object(chunk_map_key, CommitChunkMap)
+        except Exception:
+            if create:
                 commit_chunk_map = CommitChunkMap()
                 try:
                     self.meta_cache[chunk_map_key] = commit_chunk_map
@@ -652,15 +761,23 @@ class ChunkEngine:
                     # put CommitChunkMap in deeplake_objects to keep in cache temporarily, but won't write to storage
                     # this shouldn't happen in latest version of deeplake, chunk map would always be present
                     self.meta_cache.deeplake_objects[chunk_map_key] = commit_chunk_map
-                chunk_map = dict()
-            v = chunk_map.get(chunk_name)
-            if v is not None:
-                commit_id = v.get("commit_id", commit_id)
-                key = v.get("key", key)
-                return commit_id, key
-            cur_node = cur_node.parent  # type: ignore
-        # the first commit doesn't have a commit chunk map, so any chunk that wasn't found belongs to the first commit
-        return FIRST_COMMIT_ID, key
+            return CommitChunkMap()
+
+    def _get_cached_chunk_commit_index(self, node: CommitNode) -> ChunkCommitIndex:
+        commit_id = node.commit_id
+        if (
+            self._chunk_commit_index is None
+            or self._chunk_commit_index_commit_id != commit_id
+        ):
+            self._chunk_commit_index = self.get_chunk_commit_index(node)
+            self._chunk_commit_index_commit_id = commit_id
+        return self._chunk_commit_index
+
+    def get_chunk_commit_index(self, node: CommitNode) -> ChunkCommitIndex:
+        """Gets the chunk commit index of a commit that is no longer a head. Indexes missing from storage, such as the
+        ones of commits made by older versions, are built in memory.
+        """
+        return load_chunk_commit_index(self.meta_cache, self.key, node)
 
     def _write_initialization(self):
         ffw_chunk_id_encoder(self.chunk_id_encoder)
@@ -696,8 +813,8 @@ class ChunkEngine:
             )  # first non empty sample
         if self._convert_to_list(samples):
             samples = list(samples)
-        if self._is_temp_label_tensor:
-            samples = verified_samples = convert_to_hash(samples, self._hash_label_map)
+        if self._transform_class_names is not None:
+            samples = verified_samples = self._convert_transform_class_labels(samples)
         elif tensor_meta.htype in ("image.gray", "image.rgb"):
             mode = "L" if tensor_meta.htype == "image.gray" else "RGB"
             converted = []
@@ -718,6 +835,28 @@ class ChunkEngine:
             ]
         return samples, verified_samples
 
+    def _convert_transform_class_labels(self, samples):
+        """Converts class labels in a transform worker, giving the class names that are not in the tensor yet provisional
+        indexes, see :func:`~deeplake.util.class_label.merge_class_labels`.
+
+        Raises:
+            ValueError: If the worker gets both new class names and labels given as indexes that are not below the number
+                of class names, since the provisional indexes of the new class names can't be told apart from them.
+        """
+        class_names = self._transform_class_names
+        num_known = self._transform_num_known_labels
+        if has_int_labels_from(samples, num_known):
+            self._transform_int_labels = True
+        labels, additions = convert_to_idx(samples, class_names)
+        class_names.extend(label for label, _ in additions)  # type: ignore
+        if self._transform_int_labels and len(class_names) > num_known:  # type: ignore
+            tensor_name = self.tensor_meta.name or self.key
+            raise ValueError(
+                f"Labels of {tensor_name} given as indexes >= {num_known}, the number of its class names, can't be "
+                "mixed with new class names in a transform. Add the class names to the tensor before the transform."
+            )
+        return labels
+
     def _convert_class_labels(self, samples):
         tensor_info_path = get_tensor_info_key(self.key, self.commit_id)
         try:
@@ -846,6 +985,7 @@ class ChunkEngine:
                 if not register:
                     updated_chunks.append(current_chunk.id)
             elif num_samples_added == PARTIAL_NUM_SAMPLES:
+                self._invalidate_chunk_stats(current_chunk.id)
                 num_samples_added, samples, lengths = self._handle_tiled_sample(
                     enc,
                     register,
@@ -874,6 +1014,14 @@ class ChunkEngine:
                 samples = list(samples)
             else:
                 current_chunk_full = True
+                if not register:
+                    self._invalidate_chunk_stats(current_chunk.id)
+                elif self._chunk_stats_enabled:
+                    self._update_chunk_stats(
+                        current_chunk,
+                        samples[: int(num_samples_added)],
+                        new_chunk=current_chunk.num_samples == num_samples_added,
+                    )
                 num_samples_added, samples, lengths = self._handle_one_or_more_samples(
                     enc,
                     register,
@@ -1143,6 +1291,13 @@ class ChunkEngine:
         except KeyError:
             pass
 
+        chunk_stats_key = get_tensor_chunk_stats_key(self.key, commit_id)
+        try:
+            self._chunk_stats = None
+            del self.cache[chunk_stats_key]
+        except KeyError:
+            pass
+
         seq_encoder_key = get_sequence_encoder_key(self.key, commit_id)
         try:
             self._sequence_encoder = None
@@ -1206,6 +1361,7 @@ class ChunkEngine:
             curr_shape = chunk.shapes_encoder[-1]
             assert curr_shape == tile.shape, (curr_shape, tile.shape)
             chunk.update_sample(0, tile)
+            self._invalidate_chunk_stats(chunk.id)
             if (
                 self.active_updated_chunk is not None
                 and self.active_updated_chunk.key != chunk.key  # type: ignore
@@ -1222,6 +1378,7 @@ class ChunkEngine:
 
         if len(index.values) <= 1 + int(self.is_sequence):
             chunk.update_sample(local_sample_index, sample)
+            self._update_chunk_stats(chunk, [sample])
         else:
             orig_sample = chunk.read_sample(local_sample_index, copy=True)
             sample = np.array(sample)
@@ -1230,6 +1387,7 @@ class ChunkEngine:
                 sample = np.expand_dims(sample, tuple(range(sample.ndim, lhs.ndim)))
             lhs[:] = sample
             chunk.update_sample(local_sample_index, orig_sample)
+            self._update_chunk_stats(chunk, [orig_sample])
         if (
             self.active_updated_chunk is not None
             and self.active_updated_chunk.key != chunk.key  # type: ignore
@@ -1431,6 +1589,7 @@ class ChunkEngine:
             register_creds=False,
         )
         self.chunk_id_encoder.delete_chunk_id(row=from_chunk_row)
+        self._invalidate_chunk_stats(from_chunk.id)
         try:
             del self.cache[from_chunk.key]  # type: ignore
         except KeyError:
@@ -1562,6 +1721,8 @@ class ChunkEngine:
         self.cached_data = None
         initial_autoflush = self.cache.autoflush
         self.cache.autoflush = False
+        # the updated indexes are recorded in the commit diff in one batch
+        num_updated = 0
         try:
             if operator is not None:
                 return self._update_with_operator(index, samples, operator)
@@ -1589,8 +1750,7 @@ class ChunkEngine:
                         global_sample_index, index, sample, nbytes_after_updates
                     )
                 self.update_creds(global_sample_index, sample)
-                if update_commit_diff:
-                    self.commit_diff.update_data(global_sample_index)
+                num_updated += 1
                 chunk_min, chunk_max = self.min_chunk_size, self.max_chunk_size
                 check_suboptimal_chunks(nbytes_after_updates, chunk_min, chunk_max)
 
@@ -1603,6 +1763,8 @@ class ChunkEngine:
                         flat=True if is_sequence else None,
                     )
         finally:
+            if update_commit_diff and num_updated:
+                self.commit_diff.update_data(global_sample_indices[:num_updated])
             self.cache.autoflush = initial_autoflush
             self.cache.maybe_flush()
         return verified_samples
@@ -1846,6 +2008,56 @@ class ChunkEngine:
 
         return chunk_id, row, worst_case_header_size
 
+    def prefetch_partial_chunks(
+        self, global_sample_indices: Sequence[int]
+    ) -> Dict[int, BaseChunk]:
+        """Plans the reads of a batch of samples from chunks that are partially read from remote storage.
+        The byte ranges of the samples are collected per chunk from its byte positions, and the ranges of each chunk are
+        fetched together, nearby ranges being merged into a single request.
+
+        Args:
+            global_sample_indices (Sequence[int]): Samples of the batch.
+
+        Returns:
+            Dict[int, BaseChunk]: The partially read chunks holding the samples, keyed by chunk id. Their data is
+            served to :meth:`get_basic_sample` without further requests.
+        """
+        if self.is_video or self.tensor_meta.is_link:
+            return {}
+        enc = self.chunk_id_encoder
+        num_samples = self.num_samples
+        plan: Dict[int, Tuple[int, int, List[int]]] = {}
+        for global_sample_index in global_sample_indices:
+            if global_sample_index >= num_samples or self._is_tiled_sample(
+                global_sample_index
+            ):
+                continue
+            chunk_id, _, worst_case_header_size = self.get_chunk_info(
+                global_sample_index, fetch_chunks=False
+            )
+            if not worst_case_header_size:
+                # the chunk is read whole by get_basic_sample
+                continue
+            local_sample_index = enc.translate_index_relative_to_chunks(
+                global_sample_index
+            )
+            chunk_id = int(chunk_id)
+            if chunk_id not in plan:
+                plan[chunk_id] = (global_sample_index, worst_case_header_size, [])
+            plan[chunk_id][2].append(local_sample_index)
+
+        chunks: Dict[int, BaseChunk] = {}
+        for chunk_id, (global_sample_index, header_size, local_indices) in plan.items():
+            try:
+                chunk = self.get_chunk_from_chunk_id(
+                    chunk_id, partial_chunk_bytes=header_size
+                )
+            except GetChunkError as e:
+                raise GetChunkError(e.chunk_key, global_sample_index, self.name) from e
+            chunk.prefetch_samples(local_indices)
+            chunks[chunk_id] = chunk
+        return chunks
+
     def get_basic_sample(
         self,
         global_sample_index,
@@ -1853,15 +2065,18 @@ class ChunkEngine:
         fetch_chunks=False,
         is_tile=False,
         decompress=True,
+        chunks: Optional[Dict[int, BaseChunk]] = None,
     ):
         enc = self.chunk_id_encoder
         chunk_id, row, worst_case_header_size = self.get_chunk_info(
             global_sample_index, fetch_chunks
         )
         local_sample_index = enc.translate_index_relative_to_chunks(global_sample_index)
-        chunk = self.get_chunk_from_chunk_id(
-            chunk_id, partial_chunk_bytes=worst_case_header_size
-        )
+        chunk = chunks.get(int(chunk_id)) if chunks else None
+        if chunk is None:
+            chunk = self.get_chunk_from_chunk_id(
+                chunk_id, partial_chunk_bytes=worst_case_header_size
+            )
         decompress = decompress or (
             isinstance(chunk, ChunkCompressedChunk) or len(index) > 1
         )
@@ -1876,14 +2091,23 @@ class ChunkEngine:
         return ret
 
     def get_non_tiled_sample(
-        self, global_sample_index, index, fetch_chunks=False, decompress=True
+        self,
+        global_sample_index,
+        index,
+        fetch_chunks=False,
+        decompress=True,
+        chunks: Optional[Dict[int, BaseChunk]] = None,
     ):
         if self.is_video:
             return self.get_video_sample(
                 global_sample_index, index, decompress=decompress
             )
         return self.get_basic_sample(
-            global_sample_index, index, fetch_chunks=fetch_chunks, decompress=decompress
+            global_sample_index,
+            index,
+            fetch_chunks=fetch_chunks,
+            decompress=decompress,
+            chunks=chunks,
         )
 
     def get_full_tiled_sample(self, global_sample_index, fetch_chunks=False):
@@ -1919,6 +2143,7 @@ class ChunkEngine:
         fetch_chunks=False,
         pad_tensor=False,
         decompress=True,
+        chunks: Optional[Dict[int, BaseChunk]] = None,
     ):
         if pad_tensor and global_sample_index >= self.tensor_length:
             sample = self.get_empty_sample()
@@ -1933,6 +2158,7 @@ class ChunkEngine:
                 index,
                 fetch_chunks=fetch_chunks,
                 decompress=decompress,
+                chunks=chunks,
             )
         elif len(index.values) == 1:
             sample = self.get_full_tiled_sample(
@@ -1980,17 +2206,28 @@ class ChunkEngine:
         ispolygon = self.tensor_meta.htype == "polygon"
         if ispolygon:
             aslist = True
+        if fetch_chunks and not aslist and self._can_read_bulk(index):
+            samples = self._numpy_bulk(index)
+            if samples is not None:
+                return samples
         if use_data_cache and self.is_data_cachable:
             samples = self.numpy_from_data_cache(index, length, aslist, pad_tensor)
         else:
             samples = []
-            for global_sample_index in index.values[0].indices(length):
+            global_sample_indices = list(index.values[0].indices(length))
+            chunks = (
+                None
+                if fetch_chunks or len(global_sample_indices) < 2
+                else self.prefetch_partial_chunks(global_sample_indices)
+            )
+            for global_sample_index in global_sample_indices:
                 try:
                     sample = self.get_single_sample(
                         global_sample_index,
                         index,
                         fetch_chunks=fetch_chunks,
                         pad_tensor=pad_tensor,
+                        chunks=chunks,
                     )
                 except GetChunkError as e:
                     raise GetChunkError(
@@ -2020,6 +2257,128 @@ class ChunkEngine:
             return samples
         return np.array(samples)
 
+    def _can_read_bulk(self, index: Index) -> bool:
+        tensor_meta = self.tensor_meta
+        return (
+            index.values[0].subscriptable()
+            and self.is_fixed_shape
+            and tensor_meta.dtype is not None
+            and tensor_meta.htype != "polygon"
+            and not self.is_video
+        )
+
+    def _numpy_bulk(self, index: Index) -> Optional[np.ndarray]:
+        """Reads samples of a fixed shape tensor a chunk at a time, straight into a single preallocated array.
+
+        The chunks holding the samples are fetched concurrently and each of them is decompressed once.
+        Samples of uncompressed and byte compressed chunks are copied out of the chunk buffer without being read one by one.
+
+        Returns:
+            Optional[np.ndarray]: The samples, or ``None`` if they can not be read this way because some of them are
+            out of bounds or tiled.
+        """
+        length = self.num_samples
+        indices = np.fromiter(index.values[0].indices(length), dtype=np.int64)
+        if not len(indices) or indices.min() < 0 or indices.max() >= length:
+            return None
+        if self.tile_encoder_exists:
+            tiled = list(self.tile_encoder.entries)
+            if tiled and np.isin(indices, tiled).any():
+                return None
+
+        dtype = np.dtype(self.tensor_meta.dtype)
+        sample_shape = tuple(self.tensor_meta.max_shape)
+        sub_index = tuple(entry.value for entry in index.values[1:])
+        # shape of a sample after sub indexing, without allocating one
+        out_shape = np.broadcast_to(np.empty((), dtype), sample_shape)[sub_index].shape
+        out = np.empty((len(indices),) + out_shape, dtype=dtype)
+
+        encoded = self.chunk_id_encoder.array
+        last_seen = encoded[:, LAST_SEEN_INDEX_COLUMN]
+        rows = np.searchsorted(last_seen, indices)
+        order = np.argsort(rows, kind="stable")
+        chunk_rows, starts = np.unique(rows[order], return_index=True)
+        positions = np.split(order, starts[1:])
+
+        chunk_keys = []
+        for row in chunk_rows:
+            chunk_name = ChunkIdEncoder.name_from_id(encoded[row, CHUNK_ID_COLUMN])  # type: ignore
+            commit_id, tkey = self.get_chunk_commit(chunk_name)
+            chunk_keys.append(get_chunk_key(tkey, chunk_name, commit_id))
+
+        num_chunks = len(chunk_keys)
+        with ThreadPoolExecutor(max_workers=BULK_READ_NUM_WORKERS) as executor:
+            # a bounded number of chunks is held at a time
+            futures = deque(
+                executor.submit(self.get_chunk, key)
+                for key in chunk_keys[:BULK_READ_NUM_WORKERS]
+            )
+            for i, row in enumerate(chunk_rows):
+                chunk_positions = positions[i]
+                global_indices = indices[chunk_positions]
+                try:
+                    chunk = futures.popleft().result()
+                except Exception as e:
+                    raise GetChunkError(
+                        chunk_keys[i], int(global_indices[0]), self.name
+                    ) from e
+                next_chunk = i + BULK_READ_NUM_WORKERS
+                if next_chunk < num_chunks:
+                    futures.append(
+                        executor.submit(self.get_chunk, chunk_keys[next_chunk])
+                    )
+                first = int(last_seen[row - 1]) + 1 if row else 0
+                num_chunk_samples = int(last_seen[row]) - first + 1
+                try:
+                    self._scatter_chunk(
+                        chunk,
+                        num_chunk_samples,
+                        global_indices - first,
+                        out,
+                        chunk_positions,
+                        sub_index,
+                    )
+                except Exception as e:
+                    raise ReadSampleFromChunkError(
+                        chunk_keys[i], int(global_indices[0]), self.name
+                    ) from e
+        return out
+
+    def _scatter_chunk(
+        self,
+        chunk: BaseChunk,
+        num_chunk_samples: int,
+        local_indices: np.ndarray,
+        out: np.ndarray,
+        positions: np.ndarray,
+        sub_index: tuple,
+    ):
+        """Copies samples of a chunk of a fixed shape tensor to the given positions of ``out``, casting them to its dtype."""
+        buffer = None
+        if isinstance(chunk, UncompressedChunk):
+            buffer = chunk.memoryview_data
+        elif isinstance(chunk, ChunkCompressedChunk) and chunk.is_byte_compression:
+            buffer = chunk.decompressed_bytes
+        if buffer is not None:
+            sample_shape = tuple(self.tensor_meta.max_shape)
+            arr = np.frombuffer(
+                buffer,
+                dtype=np.dtype(self.tensor_meta.dtype),
+                count=num_chunk_samples * int(np.prod(sample_shape)),
+            ).reshape((num_chunk_samples,) + sample_shape)
+            samples = arr[local_indices]
+            if all(isinstance(entry, slice) for entry in sub_index):
+                out[positions] = samples[(slice(None),) + sub_index]
+            else:
+                # numpy moves advanced indexes separated by a slice in front of the sample axis
+                for position, sample in zip(positions, samples):
+                    out[position] = sample[sub_index]
+            return
+        cast = self.tensor_meta.htype != "dicom"
+        for position, local_index in zip(positions, local_indices):
+            sample = chunk.read_sample(int(local_index), cast=cast)
+            out[position] = sample[sub_index] if sub_index else sample
+
     def numpy_from_data_cache(self, index, length, aslist, pad_tensor=False):
         samples = []
         enc = self.chunk_id_encoder
@@ -2212,6 +2571,7 @@ class ChunkEngine:
             self.active_updated_chunk = chunk_to_update
         if delete:
             for chunk_id in chunk_ids:
+                self._invalidate_chunk_stats(chunk_id)
                 chunk_name = ChunkIdEncoder.name_from_id(chunk_id)
                 commit_id, tkey = self.get_chunk_commit(chunk_name)
                 if commit_id == self.commit_id:
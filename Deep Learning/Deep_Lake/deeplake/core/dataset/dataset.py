@@ -57,6 +57,7 @@ from deeplake.core.storage import (
     LocalProvider,
     AzureProvider,
 )
+from deeplake.core.storage.chunk_cache import get_committed_ids
 from deeplake.core.tensor import Tensor, create_tensor, delete_tensor
 from deeplake.core.version_control.commit_node import CommitNode  # type: ignore
 from deeplake.core.version_control.dataset_diff import load_dataset_diff
@@ -68,7 +69,7 @@ from deeplake.htype import (
 from deeplake.integrations import dataset_to_tensorflow
 from deeplake.util.bugout_reporter import deeplake_reporter, feature_report_path
 from deeplake.util.dataset import try_flushing
-from deeplake.util.cache_chain import generate_chain
+from deeplake.util.cache_chain import generate_chain, get_cache_chain_options
 from deeplake.util.hash import hash_inputs
 from deeplake.util.htype import parse_complex_htype
 from deeplake.util.link import save_link_creds
@@ -121,7 +122,11 @@ from deeplake.util.keys import (
 )
 from deeplake.util.path import get_path_from_storage
 from deeplake.util.remove_cache import get_base_storage
-from deeplake.util.diff import get_all_changes_string, get_changes_and_messages
+from deeplake.util.diff import (
+    get_all_changes_string,
+    get_changes_and_messages,
+    index_ranges_to_sets,
+)
 from deeplake.util.version_control import (
     auto_checkout,
     checkout,
@@ -133,6 +138,7 @@ from deeplake.util.version_control import (
     save_version_info,
     replace_head,
     reset_and_checkout,
+    upgrade_version_control_metadata,
 )
 from deeplake.util.pretty_print import summary_dataset
 from deeplake.core.dataset.view_entry import ViewEntry
@@ -1368,6 +1374,12 @@ class Dataset:
         version_state["full_tensors"] = {}
         version_state["tensor_names"] = {}
         self.__dict__["version_state"] = version_state
+        self._mark_committed_chunks()
+
+    def _mark_committed_chunks(self):
+        """Lets the shared chunk cache of the storage chain store the chunks of the commits that can no longer change."""
+        if isinstance(self.storage, LRUCache):
+            self.storage.mark_committed(get_committed_ids(self.version_state))
 
     def _load_link_creds(self):
         if self.link_creds is not None:
@@ -1567,6 +1579,7 @@ class Dataset:
                 is_checkpoint=is_checkpoint,
                 total_samples_processed=total_samples_processed,
             )
+            self._mark_committed_chunks()
             if not flush_version_control_info:
                 self.__dict__["_vc_info_updated"] = True
             self._lock()
@@ -1751,8 +1764,8 @@ class Dataset:
         if as_dict:
             dataset_changes_1 = res[0]
             dataset_changes_2 = res[1]
-            tensor_changes_1 = res[2]
-            tensor_changes_2 = res[3]
+            tensor_changes_1 = index_ranges_to_sets(res[2])
+            tensor_changes_2 = index_ranges_to_sets(res[3])
             changes = {}
             if id_1 is None and id_2 is None:
                 changes["dataset"] = dataset_changes_1
@@ -1885,6 +1898,9 @@ class Dataset:
         transform_kwargs: Optional[Dict[str, Any]] = None,
         decode_method: Optional[Dict[str, str]] = None,
         cache_size: int = 32 * MB,
+        stream_batches: bool = False,
+        shuffle_window: int = 0,
+        seed: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -1906,7 +1922,7 @@ class Dataset:
                 Read torch.utils.data.DataLoader docs for more details.
             shuffle (bool): If ``True``, the data loader will shuffle the data indices. Default value is False. Details about how Deep Lake shuffles data can be found at `Shuffling in ds.pytorch() <https://docs.activeloop.ai/how-it-works/shuffling-in-ds.pytorch>`_
             buffer_size (int): The size of the buffer used to shuffle the data in MBs. Defaults to 2048 MB. Increasing the buffer_size will increase the extent of shuffling.
-            use_local_cache (bool): If ``True``, the data loader will use a local cache to store data. The default cache location is ~/.activeloop/cache, but it can be changed by setting the ``LOCAL_CACHE_PREFIX`` environment variable. This is useful when the dataset can fit on the machine and we don't want to fetch the data multiple times for each iteration. Default value is ``False``
+            use_local_cache (bool): If ``True``, chunks are read through a disk cache shared by all the processes of the machine, so that workers and later iterations don't fetch them again. The default cache location is ~/.activeloop/cache, but it can be changed by setting the ``LOCAL_CACHE_PREFIX`` environment variable. Its size is 10 GB, which can be changed by setting the ``DEEPLAKE_CHUNK_CACHE_SIZE`` environment variable in MB. Least recently used chunks are evicted when it is full. Default value is ``False``
             progressbar (bool): If ``True``, tqdm will be wrapped around the returned dataloader. Default value is True.
             return_index (bool): If ``True``, the returned dataloader will have a key "index" that contains the index of the sample(s) in the original dataset. Default value is True.
             pad_tensors (bool): If ``True``, shorter tensors will be padded to the length of the longest tensor. Default value is False.
@@ -1920,12 +1936,23 @@ class Dataset:
                     :'pil': Returns samples as PIL images. Especially useful when transformation use torchvision transforms, that
                             require PIL images as input. Only supported for tensors with ``sample_compression='jpeg'`` or ``'png'``.
             cache_size (int): The size of the cache per tensor in MBs. Defaults to max(maximum chunk size of tensor, 32 MB).
+            stream_batches (bool): If ``True``, batches are read and collated by the workers instead of sample by sample, which is much faster
+                for small fixed shape tensors such as labels and embeddings. Samples of fixed shape tensors are copied a chunk range at a time into
+                each batch, other tensors are read one by one and stacked when their shapes match, or returned as lists.
+                ``transform`` and ``collate_fn`` are then applied to whole batches. When shuffling, only the order of chunks and of samples within them
+                is shuffled, ``buffer_size`` is not used. Default value is ``False``.
+            shuffle_window (int): If > 0 and ``shuffle`` is ``True``, the samples of ``shuffle_window`` chunks picked in random order are shuffled together,
+                instead of shuffling samples through a buffer of ``buffer_size`` MBs of decoded samples. Only the chunks of the current and next window
+                are held in memory, so this shuffles well at a fraction of the memory of the buffer. ``buffer_size`` is then not used. Default value is 0.
+            seed (int, Optional): Seed of the shuffling. Each epoch is shuffled differently, but the same way across runs.
+                Can not be used with the shuffle buffer, i.e. when shuffling with ``num_workers > 0`` and without ``shuffle_window`` or ``stream_batches``.
 
         ..
             # noqa: DAR101
 
         Returns:
-            A torch.utils.data.DataLoader object.
+            A torch.utils.data.DataLoader object. Unless samples are shuffled through the shuffle buffer, its position can be saved with
+            ``state_dict()`` and restored with ``load_state_dict()`` to resume iterating where it stopped, e.g. when a training job restarts.
 
         Raises:
             EmptyTensorError: If one or more tensors being passed to pytorch are empty.
@@ -1951,6 +1978,9 @@ class Dataset:
                 "return_index": return_index,
                 "pad_tensors": pad_tensors,
                 "decode_method": decode_method,
+                "stream_batches": stream_batches,
+                "shuffle_window": shuffle_window,
+                "seed": seed,
             },
         )
 
@@ -1974,6 +2004,9 @@ class Dataset:
             pad_tensors=pad_tensors,
             decode_method=decode_method,
             cache_size=cache_size,
+            stream_batches=stream_batches,
+            shuffle_window=shuffle_window,
+            seed=seed,
             **kwargs,
         )
 
@@ -2048,7 +2081,7 @@ class Dataset:
 
     def filter(
         self,
-        function: Union[Callable, str],
+        function: Union[Callable, str, Dict],
         num_workers: int = 0,
         scheduler: str = "threaded",
         progressbar: bool = True,
@@ -2059,9 +2092,12 @@ class Dataset:
         """Filters the dataset in accordance of filter function ``f(x: sample) -> bool``
 
         Args:
-            function (Callable, str): Filter function that takes sample as argument and returns ``True`` / ``False``
+            function (Callable, str, dict): Filter function that takes sample as argument and returns ``True`` / ``False``
                 if sample should be included in result. Also supports simplified expression evaluations.
                 See :class:`deeplake.core.query.query.DatasetQuery` for more details.
+                A dict filter matches samples by value, e.g. ``{"labels": 2}``, ``{"metadata": {"key": "value"}}``
+                for json tensors or ``{"score": {"$gte": 0.5, "$lt": 1}}`` for ranges of numeric tensors. Dict filters
+                are answered with secondary indexes over the tensors, which are built on first use and stored with the dataset.
             num_workers (int): Level of parallelization of filter evaluations.
                 0 indicates in-place for-loop evaluation, multiprocessing is used otherwise.
             scheduler (str): Scheduler to use for multiprocessing evaluation.
@@ -2080,8 +2116,13 @@ class Dataset:
 
             >>> dataset.filter(lambda sample: sample.labels.numpy() == 2)
             >>> dataset.filter('labels == 2')
+            >>> dataset.filter({"labels": 2})
         """
-        from deeplake.core.query import filter_dataset, query_dataset
+        from deeplake.core.query import (
+            filter_dataset,
+            filter_dataset_by_dict,
+            query_dataset,
+        )
 
         deeplake_reporter.feature_report(
             feature_name="filter",
@@ -2093,7 +2134,12 @@ class Dataset:
             },
         )
 
-        fn = query_dataset if isinstance(function, str) else filter_dataset
+        if isinstance(function, str):
+            fn = query_dataset
+        elif isinstance(function, dict):
+            fn = filter_dataset_by_dict
+        else:
+            fn = filter_dataset
         ret = fn(
             self,
             function,
@@ -2300,6 +2346,7 @@ class Dataset:
         tensors: Optional[Sequence[str]] = None,
         tobytes: Union[bool, Sequence[str]] = False,
         fetch_chunks: bool = True,
+        offset: int = 0,
     ):
         """Converts the dataset into a tensorflow compatible format.
 
@@ -2309,6 +2356,8 @@ class Dataset:
             tensors (List, Optional): Optionally provide a list of tensor names in the ordering that your training script expects. For example, if you have a dataset that has "image" and "label" tensors, if ``tensors=["image", "label"]``, your training script should expect each batch will be provided as a tuple of (image, label).
             tobytes (bool): If ``True``, samples will not be decompressed and their raw bytes will be returned instead of numpy arrays. Can also be a list of tensors, in which case those tensors alone will not be decompressed.
             fetch_chunks: See fetch_chunks argument in deeplake.core.tensor.Tensor.numpy()
+            offset (int): Index of the first sample to return. Samples are returned in order, so a job that stopped after
+                ``n`` samples can resume with ``offset=n`` without reading the samples before it. Defaults to 0.
 
         Returns:
             tf.data.Dataset object that can be used for tensorflow training.
@@ -2319,12 +2368,17 @@ class Dataset:
                 "tensors": tensors,
                 "tobytes": tobytes,
                 "fetch_chunks": fetch_chunks,
+                "offset": offset,
             },
         )
 
         dataset_read(self)
         return dataset_to_tensorflow(
-            self, tensors=tensors, tobytes=tobytes, fetch_chunks=fetch_chunks
+            self,
+            tensors=tensors,
+            tobytes=tobytes,
+            fetch_chunks=fetch_chunks,
+            offset=offset,
         )
 
     @spinner
@@ -3692,7 +3746,7 @@ class Dataset:
         verbose=True,
         token=None,
     ):
-        """Loads a nested dataset. Internal.
+        """Loads a nested dataset, with caches configured like the ones of this dataset. Internal.
 
         Args:
             path (str): Path to sub directory
@@ -3727,6 +3781,7 @@ class Dataset:
                 sub_storage,
                 memory_cache_size * MB,
                 local_cache_size * MB,
+                **get_cache_chain_options(self.storage),
             ),
             path=path,
             token=token,
@@ -4016,6 +4071,28 @@ class Dataset:
         self.version_state["commit_node_map"] = version_info["commit_node_map"]
         self.version_state["branch_commit_map"] = version_info["branch_commit_map"]
 
+    def upgrade_vc_metadata(self) -> int:
+        """Rewrites the version control metadata of all the commits of the dataset, such as commit chunk maps and diffs,
+        that was written by older versions of deeplake in the current binary formats.
+
+        Metadata in the legacy formats can still be read, but is slower to load and is otherwise only rewritten once
+        it is modified. This only has to be called once per dataset.
+
+        Example:
+
+            >>> ds = deeplake.load("hub://username/dataset")
+            >>> ds.upgrade_vc_metadata()
+            12
+
+        Returns:
+            int: The number of rewritten objects.
+
+        Raises:
+            ReadOnlyModeError: If the dataset is in read-only mode.
+        """
+        self.storage.check_readonly()
+        return upgrade_version_control_metadata(self.storage, self.version_state)
+
     def connect(
         self,
         creds_key: str,
@@ -1,6 +1,19 @@
 from abc import abstractmethod, ABC
-from random import shuffle
-from typing import Dict, Iterator, List, Optional, Sequence, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from random import Random, shuffle
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from itertools import cycle
 from copy import copy
 from warnings import warn
@@ -20,7 +33,12 @@ from deeplake.core.storage import (
     LRUCache,
     MemoryProvider,
     StorageProvider,
-    LocalProvider,
+)
+from deeplake.core.storage.chunk_cache import (
+    SharedChunkCache,
+    get_chunk_commit_id,
+    get_committed_ids,
+    get_shared_chunk_cache,
 )
 from deeplake.core.tiling.deserialize import combine_chunks
 from deeplake.integrations.pytorch.common import (
@@ -33,12 +51,19 @@ from deeplake.integrations.pytorch.common import (
 from deeplake.util.exceptions import DatasetUnsupportedPytorch, ReadSampleFromChunkError
 from deeplake.util.keys import get_chunk_key, get_tensor_meta_key
 from deeplake.util.remove_cache import get_base_storage
-from deeplake.util.storage import get_pytorch_local_storage
 from PIL import Image  # type: ignore
 
 
 ChunkEngineMap = Dict[str, ChunkEngine]
-CachesMap = Dict[str, LRUCache]
+
+DEFAULT_PREFETCH_MEMORY = 256 * MB
+
+
+def _allocate_array(
+    shape: Tuple[int, ...], dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    arr = np.empty(shape, dtype=dtype)
+    return arr, arr
 
 
 class IOBlock:
@@ -50,11 +75,14 @@ class IOBlock:
         self._chunks: List[List[Optional[str]]] = chunks
         self._ind: List[int] = indexes
 
-    def shuffle(self):
+    def shuffle(self, rng: Optional[Random] = None):
         r"""
         Shuffle sequence in which indices would be read from the IOBlock
+
+        Args:
+            rng (Random, Optional): Random generator to shuffle with. Defaults to the global one.
         """
-        shuffle(self._ind)
+        (rng.shuffle if rng else shuffle)(self._ind)
 
     def chunk_names(self, tensor_index: int) -> List[Optional[str]]:
         return self._chunks[tensor_index]
@@ -82,14 +110,31 @@ class Schedule:
     def __init__(self, blocks: List[IOBlock]) -> None:
         self._blocks: List[IOBlock] = blocks
 
-    def shuffle(self) -> None:
+    def shuffle(self, rng: Optional[Random] = None) -> None:
         r"""
         Shuffle IOBlocks in the schedule as well as each IOBlock
+
+        Args:
+            rng (Random, Optional): Random generator to shuffle with. Defaults to the global one.
         """
-        shuffle(self._blocks)
+        (rng.shuffle if rng else shuffle)(self._blocks)
 
         for block in self._blocks:
-            block.shuffle()
+            block.shuffle(rng)
+
+    def copy(self) -> "Schedule":
+        return Schedule(
+            [IOBlock(block.chunks(), list(block.indices())) for block in self._blocks]
+        )
+
+    def skip(self, num_samples: int) -> "Schedule":
+        """Returns the schedule without its first ``num_samples`` samples."""
+        for i, block in enumerate(self._blocks):
+            if num_samples < len(block):
+                first = IOBlock(block.chunks(), block.indices()[num_samples:])
+                return Schedule([first] + self._blocks[i + 1 :])
+            num_samples -= len(block)
+        return Schedule([])
 
     def __iter__(self):
         return iter(self._blocks)
@@ -170,14 +215,16 @@ class MultiThreadedNaiveScheduler(Scheduler):
 
 
 class ShufflingSchedulerWrapper(Scheduler):
-    def __init__(self, other: Scheduler) -> None:
+    def __init__(self, other: Scheduler, seed: Optional[int] = None) -> None:
         super().__init__()
         self.other: Scheduler = other
+        self.seed = seed
 
     def schedule(self, jobs: List[IOBlock]) -> List[Schedule]:
         schedules = self.other.schedule(jobs)
+        rng = None if self.seed is None else Random(self.seed)
         for schedule in schedules:
-            schedule.shuffle()
+            schedule.shuffle(rng)
 
         return schedules
 
@@ -264,6 +311,93 @@ class Streaming(ABC):
         ...
 
 
+class ChunkReadAhead:
+    """Fetches the chunks of upcoming IOBlocks in background threads while the current block is being read.
+
+    At most ``max_blocks`` blocks, including the one being read, are fetched ahead. Blocks are only fetched ahead
+    while the chunks held for them fit in ``memory_budget`` bytes, though the block being read is always fetched.
+    Chunks are estimated at the max chunk size of their tensor. Chunks shared by consecutive blocks are fetched once.
+    """
+
+    def __init__(
+        self,
+        blocks: Sequence[IOBlock],
+        chunk_keys: Callable[[IOBlock], Dict[str, Tuple[str, int]]],
+        fetch: Callable[[str, str], BaseChunk],
+        max_blocks: int = 2,
+        memory_budget: int = DEFAULT_PREFETCH_MEMORY,
+        num_workers: int = 4,
+    ):
+        """
+        Args:
+            blocks (Sequence[IOBlock]): The blocks in the order they are read.
+            chunk_keys (Callable): Returns the keys of the chunks of a block mapped to their tensor and estimated size.
+            fetch (Callable): Fetches a chunk given its tensor and key. Called from the background threads.
+            max_blocks (int): Number of blocks held at a time, including the one being read.
+            memory_budget (int): Bytes of chunks held at a time.
+            num_workers (int): Number of concurrent fetches.
+        """
+        self._blocks = blocks
+        self._chunk_keys = chunk_keys
+        self._fetch = fetch
+        self.max_blocks = max(max_blocks, 1)
+        self.memory_budget = memory_budget
+        self._executor = ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="deeplake-read-ahead"
+        )
+        self._next = 0
+        self._held: Deque[Dict[str, Tuple[str, int]]] = deque()
+        self._futures: Dict[str, Future] = {}
+        self._refs: Dict[str, int] = {}
+        self._held_bytes = 0
+        self._fill()
+
+    def _fill(self):
+        while self._next < len(self._blocks) and len(self._held) < self.max_blocks:
+            keys = self._chunk_keys(self._blocks[self._next])
+            new_bytes = sum(
+                size for key, (_, size) in keys.items() if key not in self._futures
+            )
+            if self._held and self._held_bytes + new_bytes > self.memory_budget:
+                break
+            for key, (tensor, _) in keys.items():
+                if key not in self._futures:
+                    self._futures[key] = self._executor.submit(self._fetch, tensor, key)
+                    self._refs[key] = 0
+                self._refs[key] += 1
+            self._held_bytes += new_bytes
+            self._held.append(keys)
+            self._next += 1
+
+    def get(self, key: str) -> Optional[BaseChunk]:
+        """Returns the chunk at ``key`` if it was fetched ahead, waiting for the fetch to complete.
+
+        Raises:
+            Exception: The error the fetch failed with.
+        """
+        future = self._futures.get(key)
+        return None if future is None else future.result()
+
+    def advance(self):
+        """Releases the chunks of the block that was read and fetches ahead the next ones."""
+        if self._held:
+            for key, (_, size) in self._held.popleft().items():
+                self._refs[key] -= 1
+                if not self._refs[key]:
+                    del self._refs[key]
+                    del self._futures[key]
+                    self._held_bytes -= size
+        self._fill()
+
+    def close(self):
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._refs.clear()
+        self._held.clear()
+        self._executor.shutdown(wait=False)
+
+
 class SampleStreaming(Streaming):
     def __init__(
         self,
@@ -275,16 +409,27 @@ class SampleStreaming(Streaming):
         tobytes: Union[bool, Sequence[str]] = False,
         verbose: bool = True,
         cache_size: int = 32 * MB,
+        prefetch_blocks: int = 2,
+        prefetch_memory: int = DEFAULT_PREFETCH_MEMORY,
+        num_prefetch_workers: int = 4,
+        shuffle_window: int = 0,
+        seed: Optional[int] = None,
     ) -> None:
         super().__init__()
 
         self.dataset = dataset
-        self.local_storage: Optional[LocalProvider] = (
-            get_pytorch_local_storage(dataset) if use_local_cache else None
+        self.chunk_cache: Optional[SharedChunkCache] = (
+            get_shared_chunk_cache() if use_local_cache else None
         )
+        # only the chunks of these commits can be shared, the others may still be rewritten
+        self.committed_ids = get_committed_ids(dataset.version_state)
         self.cache_size = cache_size
+        self.prefetch_blocks = prefetch_blocks
+        self.prefetch_memory = prefetch_memory
+        self.num_prefetch_workers = num_prefetch_workers
+        self.shuffle_window = shuffle_window
+        self.seed = seed
 
-        # TODO: copy all meta/info to local_storage
         self.storage = get_base_storage(dataset.storage)
         if isinstance(self.storage, MemoryProvider):
             raise DatasetUnsupportedPytorch(
@@ -325,32 +470,283 @@ class SampleStreaming(Streaming):
 
         self.chunk_engines: ChunkEngineMap = self._map_chunk_engines(self.tensors)
 
-        self.local_caches: Optional[CachesMap] = (
-            (
-                {
-                    tensor: self._use_cache(
-                        self.local_storage,
-                        max(
-                            self.cache_size,
-                            self.dataset[tensor].meta.max_chunk_size or 0,
-                        ),
-                    )
-                    for tensor in self.tensors
-                }
-            )
-            if self.local_storage is not None
-            else None
-        )
         group_index_length = len(self.dataset.group_index)
         if group_index_length:
             group_index_length += 1  # add 1 for the forward slash
         self._group_index_length = group_index_length
 
-    def read(self, schedule: Schedule) -> Iterator:
-        for block in schedule._blocks:
-            yield from self.stream(block)
+    def _read_blocks(
+        self, schedule: Schedule, skip: int = 0
+    ) -> Iterator[Tuple[IOBlock, Optional[ChunkReadAhead]]]:
+        """Iterates over the blocks of a schedule along with the read ahead fetching their chunks, if enabled.
+        The chunks of a block are released when the next block is requested.
+
+        If ``shuffle_window`` is more than 1, the samples of every ``shuffle_window`` consecutive blocks are shuffled together
+        and yielded as single sample blocks, while the chunks of these blocks are held by the read ahead.
+        Windows are shuffled with generators seeded from ``seed`` and their position, if a seed is set.
+
+        Args:
+            schedule (Schedule): Schedule of IOBlocks to stream.
+            skip (int): Number of samples to skip from the start of the schedule, without reading them.
+        """
+        window = self.shuffle_window
+        blocks = schedule._blocks
+        first_window = 0
+        if window <= 1:
+            if skip:
+                blocks = schedule.skip(skip)._blocks
+        else:
+            # whole windows are skipped without shuffling them
+            while first_window * window < len(blocks):
+                start = first_window * window
+                num_samples = sum(map(len, blocks[start : start + window]))
+                if skip < num_samples:
+                    break
+                skip -= num_samples
+                first_window += 1
+            blocks = blocks[first_window * window :]
+
+        if self.prefetch_blocks <= 0 and window <= 1:
+            for block in blocks:
+                yield block, None
+            return
+
+        read_ahead = ChunkReadAhead(
+            blocks,
+            self._block_chunk_keys,
+            lambda key, c_key: self._get_chunk(key, c_key, from_storage=True),
+            # the next window is fetched while the current one is read
+            max_blocks=max(self.prefetch_blocks, 2 * window),
+            memory_budget=self.prefetch_memory,
+            num_workers=self.num_prefetch_workers,
+        )
+        try:
+            if window <= 1:
+                for block in blocks:
+                    yield block, read_ahead
+                    read_ahead.advance()
+                return
+            for i, start in enumerate(range(0, len(blocks), window)):
+                window_blocks = blocks[start : start + window]
+                samples = [
+                    (block, idx) for block in window_blocks for idx in block.indices()
+                ]
+                if self.seed is None:
+                    shuffle(samples)
+                else:
+                    Random(f"{self.seed}:{first_window + i}").shuffle(samples)
+                for block, idx in samples[skip:]:
+                    yield IOBlock(block.chunks(), [idx]), read_ahead
+                skip = 0
+                for _ in window_blocks:
+                    read_ahead.advance()
+        finally:
+            read_ahead.close()
+
+    def read(self, schedule: Schedule, skip: int = 0) -> Iterator:
+        for block, read_ahead in self._read_blocks(schedule, skip):
+            yield from self.stream(block, read_ahead)
+
+    def read_batches(
+        self,
+        schedule: Schedule,
+        batch_size: int,
+        drop_last: bool = False,
+        allocate: Optional[
+            Callable[[Tuple[int, ...], np.dtype], Tuple[np.ndarray, Any]]
+        ] = None,
+        skip: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """Streams the samples of a schedule in batches, already collated into one array per tensor.
+
+        Samples of fixed shape tensors are copied a chunk range at a time into the batch arrays, without being read one by one.
+        Samples of other tensors are read one by one and stacked if they have the same shape, otherwise they are returned as a list.
+        Batches span consecutive blocks of the schedule.
+
+        Args:
+            schedule (Schedule): Schedule of IOBlocks to stream.
+            batch_size (int): Number of samples per batch.
+            drop_last (bool): If True, the last batch is dropped if it is incomplete.
+            allocate (Callable, Optional): Allocates the array a column of a batch is written to, given its shape and dtype.
+                Returns the array to write to and the value to return in the batch, such as a tensor sharing its memory.
+                Defaults to allocating numpy arrays.
+            skip (int): Number of samples to skip from the start of the schedule, without reading them.
+
+        Yields:
+            Dict[str, Any]: Batches, keyed by tensor, along with an "index" column of shape (batch_size, 1).
+
+        Raises:
+            ValueError: If ``decode_method`` "data" is used for any tensor.
+
+        Note:
+            Corrupt samples raise an error instead of being skipped.
+        """
+        if self.data_tensors:
+            raise ValueError(
+                "decode_method 'data' is not supported when streaming batches."
+            )
+        if allocate is None:
+            allocate = _allocate_array
+        pending: List[Tuple[np.ndarray, Dict[str, Any], int, int]] = []
+        num_pending = 0
+        for block, read_ahead in self._read_blocks(schedule, skip):
+            indices, columns = self._block_columns(block, read_ahead)
+            start = 0
+            while start < len(indices):
+                stop = min(len(indices), start + batch_size - num_pending)
+                pending.append((indices, columns, start, stop))
+                num_pending += stop - start
+                start = stop
+                if num_pending == batch_size:
+                    yield self._collate_batch(pending, allocate)
+                    pending, num_pending = [], 0
+        if pending and not drop_last:
+            yield self._collate_batch(pending, allocate)
+
+    def _is_batchable(self, key: str, engine: ChunkEngine) -> bool:
+        tensor_meta = engine.tensor_meta
+        return (
+            key not in self.raw_tensors
+            and key not in self.pil_compressed_tensors
+            and not isinstance(engine, LinkedChunkEngine)
+            and engine.is_fixed_shape
+            and tensor_meta.dtype is not None
+            and np.dtype(tensor_meta.dtype).kind in "biuf"
+            and tensor_meta.htype != "polygon"
+            and not engine.is_video
+        )
+
+    def _block_columns(
+        self, block: IOBlock, read_ahead: Optional[ChunkReadAhead] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Reads the samples of a block column by column.
+
+        Returns:
+            The indices of the block, and for each tensor either the chunk holding its samples along with the index of the first
+            sample of the chunk and its number of samples, or a list of the samples read one by one.
+        """
+        indices = np.asarray(block.indices(), dtype=np.int64)
+        columns: Dict[str, Any] = {}
+        for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
+            chunks = self._read_chunks(block, keyid, key, engine, read_ahead)
+            if chunks is None:
+                columns[key] = [engine.get_empty_sample()] * len(indices)
+            elif len(chunks) == 1 and self._is_batchable(key, engine):
+                # all the samples of a block are in the same chunk
+                last_seen = engine.chunk_id_encoder.array[:, LAST_SEEN_INDEX_COLUMN]
+                row = int(np.searchsorted(last_seen, indices[0]))
+                first = int(last_seen[row - 1]) + 1 if row else 0
+                columns[key] = (chunks[0], first, int(last_seen[row]) - first + 1)
+            else:
+                columns[key] = [
+                    self._read_sample(key, engine, int(idx), chunks) for idx in indices
+                ]
+        return indices, columns
+
+    def _collate_batch(
+        self,
+        pending: List[Tuple[np.ndarray, Dict[str, Any], int, int]],
+        allocate: Callable,
+    ) -> Dict[str, Any]:
+        batch: Dict[str, Any] = {}
+        for key, engine in self.chunk_engines.items():
+            pieces = [
+                (indices[start:stop], columns[key], start, stop)
+                for indices, columns, start, stop in pending
+            ]
+            batch[key[self._group_index_length :]] = self._collate_column(
+                engine, pieces, allocate
+            )
+        indices = np.concatenate(
+            [indices[start:stop] for indices, _, start, stop in pending]
+        )
+        out, batch["index"] = allocate((len(indices), 1), indices.dtype)
+        out[:, 0] = indices
+        return batch
+
+    def _collate_column(self, engine: ChunkEngine, pieces: List, allocate: Callable):
+        tensor_meta = engine.tensor_meta
+        num_samples = sum(len(indices) for indices, *_ in pieces)
+        if not any(isinstance(column, list) for _, column, *_ in pieces):
+            shape = (num_samples,) + tuple(tensor_meta.max_shape)
+            out, ret = allocate(shape, np.dtype(tensor_meta.dtype))
+            offset = 0
+            for indices, (chunk, first, num_chunk_samples), _, _ in pieces:
+                positions = np.arange(offset, offset + len(indices))
+                engine._scatter_chunk(
+                    chunk, num_chunk_samples, indices - first, out, positions, ()
+                )
+                offset += len(indices)
+            return ret
+
+        values: List[Any] = []
+        for indices, column, start, stop in pieces:
+            if isinstance(column, list):
+                values.extend(column[start:stop])
+                continue
+            chunk, first, num_chunk_samples = column
+            samples = np.empty(
+                (len(indices),) + tuple(tensor_meta.max_shape),
+                dtype=np.dtype(tensor_meta.dtype),
+            )
+            engine._scatter_chunk(
+                chunk,
+                num_chunk_samples,
+                indices - first,
+                samples,
+                np.arange(len(indices)),
+                (),
+            )
+            values.extend(samples)
+        if all(isinstance(value, np.ndarray) for value in values) and (
+            len({(value.shape, value.dtype) for value in values}) == 1
+        ):
+            out, ret = allocate((len(values),) + values[0].shape, values[0].dtype)
+            np.stack(values, out=out)
+            return ret
+        return values
+
+    def _chunk_key(self, engine: ChunkEngine, c_name: str) -> str:
+        commit_id, tkey = engine.get_chunk_commit(c_name)
+        return get_chunk_key(tkey, c_name, commit_id)
+
+    def _block_chunk_keys(self, block: IOBlock) -> Dict[str, Tuple[str, int]]:
+        keys: Dict[str, Tuple[str, int]] = {}
+        for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
+            for c_name in block.chunk_names(keyid):
+                if c_name is not None:
+                    c_key = self._chunk_key(engine, c_name)
+                    keys[c_key] = (key, engine.max_chunk_size)
+        return keys
+
+    def _get_chunk(self, key: str, c_key: str, from_storage: bool = False) -> BaseChunk:
+        """Fetches a chunk, going through the shared chunk cache if there is one.
 
-    def stream(self, block: IOBlock):
+        Args:
+            key (str): The tensor the chunk belongs to.
+            c_key (str): The key of the chunk.
+            from_storage (bool): If True, the chunk is read from storage instead of the chunk engine's cache,
+                which is only used by the thread consuming the samples. Used by the read ahead threads.
+
+        Returns:
+            BaseChunk: The chunk. Chunk compressed chunks are decompressed when they are deserialized.
+        """
+        engine = self.chunk_engines[key]
+        if not from_storage:
+            return engine.get_chunk(c_key)
+        if (
+            self.chunk_cache is not None
+            and get_chunk_commit_id(c_key) in self.committed_ids
+        ):
+            buffer = self.chunk_cache.get_or_fetch(
+                SharedChunkCache.get_key(self.storage.root, c_key),
+                lambda: self.storage[c_key],
+            )
+        else:
+            buffer = self.storage[c_key]
+        return engine.chunk_class.frombuffer(buffer, engine.chunk_args)
+
+    def stream(self, block: IOBlock, read_ahead: Optional[ChunkReadAhead] = None):
         htype_dict, ndim_dict, tensor_info_dict = (
             self.htype_dict,
             self.ndim_dict,
@@ -362,49 +758,12 @@ class SampleStreaming(Streaming):
 
             for keyid, (key, engine) in enumerate(self.chunk_engines.items()):
                 rel_key = key[self._group_index_length :]
-                decompress = key not in self.raw_tensors
-                to_pil = key in self.pil_compressed_tensors
-                chunk_class = engine.chunk_class
                 try:
-                    chunks: List[BaseChunk] = []
-                    c_names = block.chunk_names(keyid)
-                    if c_names == [None]:
+                    chunks = self._read_chunks(block, keyid, key, engine, read_ahead)
+                    if chunks is None:
                         sample[rel_key] = engine.get_empty_sample()
                         continue
-                    for c_name in c_names:
-                        commit_id, tkey = engine.get_chunk_commit(c_name)
-                        c_key = get_chunk_key(
-                            tkey,
-                            c_name,  # type: ignore
-                            commit_id,
-                        )
-                        if self.local_caches is not None:
-                            local_cache = self.local_caches[key]
-
-                            if c_key in local_cache:
-                                chunk = local_cache.get_deeplake_object(c_key, chunk_class, meta=engine.chunk_args)  # type: ignore
-                            else:
-                                chunk = engine.get_chunk(c_key)
-                                local_cache[c_key] = chunk
-
-                                # send data to actual storage
-                                local_cache._forward(c_key)
-                        else:
-                            chunk = engine.get_chunk(c_key)
-                        chunks.append(chunk)
-                    if len(chunks) == 1:
-                        data = engine.read_sample_from_chunk(
-                            idx, chunk, decompress=decompress, to_pil=to_pil
-                        )
-                    else:
-                        if not decompress:
-                            raise NotImplementedError(
-                                "`tobytes=True` is not supported by tiled samples as it can cause recompression."
-                            )
-                        data = combine_chunks(chunks, idx, engine.tile_encoder)
-                        if to_pil:
-                            data = Image.fromarray(data)  # type: ignore
-
+                    data = self._read_sample(key, engine, idx, chunks)
                     if data is not None:
                         sample[rel_key] = data
                     else:
@@ -425,6 +784,47 @@ class SampleStreaming(Streaming):
                     )
                 yield sample
 
+    def _read_chunks(
+        self,
+        block: IOBlock,
+        keyid: int,
+        key: str,
+        engine: ChunkEngine,
+        read_ahead: Optional[ChunkReadAhead] = None,
+    ) -> Optional[List[BaseChunk]]:
+        """Returns the chunks of a tensor in a block, or ``None`` if the tensor has no samples in the block."""
+        c_names = block.chunk_names(keyid)
+        if c_names == [None]:
+            return None
+        chunks: List[BaseChunk] = []
+        for c_name in c_names:
+            c_key = self._chunk_key(engine, c_name)  # type: ignore
+            chunk = None
+            if read_ahead is not None:
+                chunk = read_ahead.get(c_key)
+            if chunk is None:
+                chunk = self._get_chunk(key, c_key)
+            chunks.append(chunk)
+        return chunks
+
+    def _read_sample(
+        self, key: str, engine: ChunkEngine, idx: int, chunks: List[BaseChunk]
+    ):
+        decompress = key not in self.raw_tensors
+        to_pil = key in self.pil_compressed_tensors
+        if len(chunks) == 1:
+            return engine.read_sample_from_chunk(
+                idx, chunks[0], decompress=decompress, to_pil=to_pil
+            )
+        if not decompress:
+            raise NotImplementedError(
+                "`tobytes=True` is not supported by tiled samples as it can cause recompression."
+            )
+        data = combine_chunks(chunks, idx, engine.tile_encoder)
+        if to_pil:
+            data = Image.fromarray(data)  # type: ignore
+        return data
+
     def _get_block_for_single_sample(self, idx):
         chunks = []
         for engine in self.chunk_engines.values():
@@ -537,7 +937,10 @@ class SampleStreaming(Streaming):
     def _use_cache(
         self, storage: Union[StorageProvider, LRUCache], cache_size
     ) -> LRUCache:
-        cache = LRUCache(MemoryProvider(), copy(storage), cache_size)
+        cache = LRUCache(
+            MemoryProvider(), copy(storage), cache_size, chunk_cache=self.chunk_cache
+        )
+        cache.mark_committed(self.committed_ids)
         cache.read_only = storage.read_only
         return cache
 
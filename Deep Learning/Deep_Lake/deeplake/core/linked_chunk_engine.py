@@ -208,7 +208,12 @@ class LinkedChunkEngine(ChunkEngine):
         return sample
 
     def get_basic_sample(
-        self, global_sample_index, index, fetch_chunks=False, decompress=True
+        self,
+        global_sample_index,
+        index,
+        fetch_chunks=False,
+        decompress=True,
+        chunks=None,
     ):
         sample = self.get_deeplake_read_sample(global_sample_index, fetch_chunks)
         if sample is None:
@@ -0,0 +1,173 @@
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple, Union
+from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+
+
+# (min, max, number of empty samples)
+ChunkStatsEntry = Tuple[float, float, int]
+
+_ENTRY_DTYPE = np.dtype(
+    [("id", "<u8"), ("min", "<f8"), ("max", "<f8"), ("num_empty", "<u8")]
+)
+
+
+def _lower_bound(value) -> float:
+    ret = float(value)
+    if isinstance(value, (int, np.integer)) and ret > value:
+        ret = float(np.nextafter(ret, -np.inf))
+    return ret
+
+
+def _upper_bound(value) -> float:
+    ret = float(value)
+    if isinstance(value, (int, np.integer)) and ret < value:
+        ret = float(np.nextafter(ret, np.inf))
+    return ret
+
+
+def _as_array(sample) -> Optional[np.ndarray]:
+    if not isinstance(sample, np.ndarray):
+        try:
+            sample = np.asarray(sample)
+        except Exception:
+            return None
+    if sample.dtype.kind not in "biuf":
+        return None
+    return sample
+
+
+def compute_stats(
+    samples: Union[np.ndarray, Sequence], dtype=None
+) -> Optional[ChunkStatsEntry]:
+    """Computes the (min, max, num_empty) statistics of a batch of numeric samples.
+
+    Args:
+        samples: Either a numpy array with one sample per row or a sequence of samples.
+        dtype: The dtype the samples are stored as. Bounds are rounded the way the samples are cast to it.
+
+    Returns:
+        The statistics, or ``None`` if they can not be computed for the given samples
+        (non numeric samples or NaNs).
+    """
+    if not isinstance(samples, np.ndarray) and (
+        len(samples) == 0 or isinstance(samples[0], (int, float, np.number))
+    ):
+        # a list of scalars is summarized in one go
+        arr = _as_array(samples)
+        if arr is not None and arr.ndim == 1:
+            samples = arr
+    lo = hi = None
+    num_empty = 0
+    if isinstance(samples, np.ndarray):
+        if samples.dtype.kind not in "biuf":
+            return None
+        if samples.ndim == 0:
+            samples = samples.reshape(1)
+        if samples.size == 0:
+            return (np.inf, -np.inf, len(samples))
+        lo, hi = samples.min(), samples.max()
+    else:
+        for sample in samples:
+            if sample is None:
+                num_empty += 1
+                continue
+            sample = _as_array(sample)
+            if sample is None:
+                return None
+            if sample.size == 0:
+                num_empty += 1
+                continue
+            s_lo, s_hi = sample.min(), sample.max()
+            lo = s_lo if lo is None else min(lo, s_lo)
+            hi = s_hi if hi is None else max(hi, s_hi)
+        if lo is None:
+            return (np.inf, -np.inf, num_empty)
+    if np.isnan(lo) or np.isnan(hi):
+        return None
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if dtype.kind in "iu":
+            lo, hi = np.floor(lo), np.ceil(hi)
+            if np.isinf(lo) or np.isinf(hi):
+                return None
+            lo, hi = int(lo), int(hi)
+        elif dtype.kind == "f":
+            lo, hi = dtype.type(lo), dtype.type(hi)
+    if isinstance(lo, (np.integer, np.bool_)):
+        lo, hi = int(lo), int(hi)
+    return (_lower_bound(lo), _upper_bound(hi), num_empty)
+
+
+def merge_stats(a: ChunkStatsEntry, b: ChunkStatsEntry) -> ChunkStatsEntry:
+    """Combines statistics of two sets of samples."""
+    return (min(a[0], b[0]), max(a[1], b[1]), a[2] + b[2])
+
+
+class ChunkStats(DeepLakeMemoryObject):
+    """Stores per chunk min / max / empty sample statistics of a tensor (zone maps).
+
+    The statistics are a superset of the values stored in a chunk: samples being
+    removed from a chunk leave its entry valid, while samples being added or updated widen it.
+    Chunks without an entry have unknown contents and can never be skipped.
+    """
+
+    def __init__(self, entries: Optional[Dict[int, ChunkStatsEntry]] = None):
+        self.is_dirty = False
+        self.entries: Dict[int, ChunkStatsEntry] = entries or {}
+
+    def __getitem__(self, chunk_id: int) -> Optional[ChunkStatsEntry]:
+        return self.entries.get(int(chunk_id))
+
+    def __contains__(self, chunk_id: int) -> bool:
+        return int(chunk_id) in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def set(self, chunk_id: int, stats: ChunkStatsEntry):
+        """Replaces the statistics of a chunk."""
+        self.entries[int(chunk_id)] = stats
+        self.is_dirty = True
+
+    def update(self, chunk_id: int, stats: ChunkStatsEntry):
+        """Widens the statistics of a chunk that already has an entry. Chunks with unknown contents are left as is."""
+        chunk_id = int(chunk_id)
+        current = self.entries.get(chunk_id)
+        if current is not None:
+            self.entries[chunk_id] = merge_stats(current, stats)
+            self.is_dirty = True
+
+    def invalidate(self, chunk_id: int):
+        """Marks the contents of a chunk as unknown."""
+        if self.entries.pop(int(chunk_id), None) is not None:
+            self.is_dirty = True
+
+    def combined(self, chunk_ids: Sequence[int]) -> Optional[ChunkStatsEntry]:
+        """Returns the statistics of the union of the given chunks, or ``None`` if any of them is unknown."""
+        ret = None
+        for chunk_id in chunk_ids:
+            stats = self.entries.get(int(chunk_id))
+            if stats is None:
+                return None
+            ret = stats if ret is None else merge_stats(ret, stats)
+        return ret
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.entries) * _ENTRY_DTYPE.itemsize
+
+    def tobytes(self) -> memoryview:
+        """Serializes the entries as a packed array of (chunk id, min, max, num_empty) records."""
+        arr = np.empty(len(self.entries), dtype=_ENTRY_DTYPE)
+        for i, (chunk_id, (lo, hi, num_empty)) in enumerate(self.entries.items()):
+            arr[i] = (chunk_id, lo, hi, num_empty)
+        return memoryview(arr.tobytes())
+
+    @classmethod
+    def frombuffer(cls, buffer: bytes):
+        arr = np.frombuffer(buffer, dtype=_ENTRY_DTYPE)
+        entries = {
+            int(chunk_id): (float(lo), float(hi), int(num_empty))
+            for chunk_id, lo, hi, num_empty in arr.tolist()
+        }
+        return cls(entries)
@@ -0,0 +1,37 @@
+import numpy as np
+from deeplake.core.meta.encode.chunk_stats import ChunkStats, compute_stats
+
+
+def test_compute_stats():
+    assert compute_stats(np.arange(10)) == (0, 9, 0)
+    assert compute_stats([3, 1, 2]) == (1, 3, 0)
+    assert compute_stats([np.array([1.5, 2.7]), None, np.zeros((0,))], "int32") == (
+        1,
+        3,
+        2,
+    )
+    assert compute_stats(np.zeros((4, 0))) == (np.inf, -np.inf, 4)
+
+    # bounds of large integers are rounded outwards
+    lo, hi, _ = compute_stats([2**63 - 1], "int64")
+    assert lo <= 2**63 - 1 <= hi
+
+    assert compute_stats(np.array([1.0, np.nan])) is None
+    assert compute_stats(["a", "b"]) is None
+
+
+def test_chunk_stats():
+    stats = ChunkStats()
+    stats.set(1, (0.0, 1.0, 0))
+    stats.set(2, (5.0, 6.0, 0))
+    stats.update(1, (-1.0, 0.0, 1))
+    stats.update(3, (0.0, 0.0, 0))
+    assert 3 not in stats
+    assert stats.combined([1, 2]) == (-1.0, 6.0, 1)
+
+    stats.invalidate(2)
+    assert stats.combined([1, 2]) is None
+
+    stats = ChunkStats.frombuffer(bytes(stats.tobytes()))
+    assert stats.entries == {1: (-1.0, 1.0, 1)}
+    assert stats.nbytes == len(stats.tobytes())
@@ -1,4 +1,11 @@
-from typing import Dict, Tuple
+from typing import Dict, Sequence, Tuple
+
+from deeplake.constants import MB
+from deeplake.util.byte_ranges import coalesce_byte_ranges
+
+
+# byte ranges of a chunk separated by at most this many bytes are fetched with one request
+PARTIAL_READ_COALESCE_GAP = 1 * MB
 
 
 class PartialReader:
@@ -21,5 +28,34 @@ class PartialReader:
             )
         return self.data_fetched[slice_tuple]
 
+    def prefetch(self, ranges: Sequence[Tuple[int, int]]):
+        """Fetches multiple byte ranges of the data ahead of them being sliced, with as few requests as possible.
+        Ranges separated by at most ``PARTIAL_READ_COALESCE_GAP`` bytes are fetched together.
+
+        Args:
+            ranges (Sequence[Tuple[int, int]]): ``(start, stop)`` pairs, relative to the start of the data.
+        """
+        offset = self.header_offset
+        required = list(
+            {
+                (start + offset, stop + offset)
+                for start, stop in ranges
+                if (start + offset, stop + offset) not in self.data_fetched
+            }
+        )
+        if not required:
+            return
+        merged = coalesce_byte_ranges(required, PARTIAL_READ_COALESCE_GAP)
+        buffers = self.cache.get_byte_ranges(
+            self.path, [(start, stop) for start, stop, _ in merged]
+        )
+        for (merged_start, _, indices), buffer in zip(merged, buffers):
+            buffer = memoryview(buffer)
+            for i in indices:
+                start, stop = required[i]
+                self.data_fetched[(start, stop)] = buffer[
+                    start - merged_start : stop - merged_start
+                ]
+
     def get_all_bytes(self) -> bytes:
         return self.cache.next_storage[self.path]
@@ -1,2 +1,2 @@
 from .query import DatasetQuery
-from .filter import filter_dataset, query_dataset
+from .filter import filter_dataset, filter_dataset_by_dict, query_dataset
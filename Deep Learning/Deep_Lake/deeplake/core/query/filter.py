@@ -12,6 +12,7 @@ from time import time
 
 import inspect
 import threading
+from functools import partial
 from queue import Queue
 from collections import defaultdict
 
@@ -380,10 +381,12 @@ def query_inplace(
 
     num_processed = {"value": 0}
 
-    def update_vds(idx, include):
+    def update_vds(num_rows, included):
         if vds:
-            vds_queue.put((idx, include))
-            num_processed["value"] += 1
+            included = set(included)
+            for idx in range(num_rows):
+                vds_queue.put((idx, idx in included))
+            num_processed["value"] += num_rows
             if _counter(query_id):
                 dataset._send_query_progress(
                     query_text=query,
@@ -411,9 +414,9 @@ def query_inplace(
 
             bar = tqdm(total=len(dataset))
 
-            def update(idx, include):
-                bar.update(1)
-                update_vds(idx, include)
+            def update(num_rows, included):
+                bar.update(num_rows)
+                update_vds(num_rows, included)
 
             try:
                 ds_query = DatasetQuery(dataset, query, update)
@@ -425,9 +428,9 @@ def query_inplace(
         return ret
 
     def pg_subquery(pg_callback, query_slice):
-        def update(idx, include):
-            update_vds(idx, include)
-            pg_callback(1)
+        def update(num_rows, included):
+            update_vds(num_rows, included)
+            pg_callback(num_rows)
 
         dataset = query_slice.slice_dataset()
         ds_query = DatasetQuery(dataset, query, progress_callback=update)
@@ -480,3 +483,42 @@ def query_inplace(
         vds.autoflush = True
         vds_thread.join()
     return index_map
+
+
+def filter_dataset_by_dict(
+    dataset: deeplake.Dataset,
+    filter: Dict,
+    num_workers: int = 0,
+    scheduler: str = "threaded",
+    progressbar: bool = True,
+    save_result: bool = False,
+    result_path: Optional[str] = None,
+    result_ds_args: Optional[Dict] = None,
+) -> deeplake.Dataset:
+    """Filters ``dataset`` with a dict ``filter`` like the ones of the vector store. Filters that the secondary
+    indexes can answer are looked up in them, the others are evaluated on every sample.
+    """
+    from deeplake.core.vectorstore.vector_search.filter.filter import (
+        dp_filter_python,
+        filter_rows,
+    )
+
+    rows = None if save_result else filter_rows(dataset, filter)
+    if rows is None:
+        return filter_dataset(
+            dataset,
+            partial(dp_filter_python, filter=filter),
+            num_workers=num_workers,
+            scheduler=scheduler,
+            progressbar=progressbar,
+            save_result=save_result,
+            result_path=result_path,
+            result_ds_args=result_ds_args,
+        )
+
+    ret = dataset[rows.tolist()]
+    ret._is_filtered_view = True
+    ret._query = str(filter)
+    ret._source_ds_idx = dataset.index.to_json()
+    ret._created_at = time()
+    return ret
@@ -2,6 +2,8 @@ from typing import Any, Callable, List, Union, Optional
 from deeplake.core.dataset import Dataset
 from deeplake.core.io import IOBlock, SampleStreaming
 from deeplake.core.index import Index
+from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
+from deeplake.core.query.vectorized import VectorizedQuery
 from deeplake.core.tensor import Tensor
 
 
@@ -17,8 +19,15 @@ class DatasetQuery:
         self,
         dataset,
         query: str,
-        progress_callback: Callable[[int, bool], None] = lambda *_: None,
+        progress_callback: Callable[[int, List[int]], None] = lambda *_: None,
     ):
+        """
+        Args:
+            dataset: The dataset to query.
+            query (str): The query.
+            progress_callback (Callable): Called once per block of rows evaluated, with the number of rows of the block
+                and the indexes of the rows matching the query, relative to the start of the block.
+        """
         self._dataset = dataset
         self._query = query
         self._pg_callback = progress_callback
@@ -34,12 +43,45 @@ class DatasetQuery:
         ]
         self._wrappers = self._export_tensors()
         self._groups = self._export_groups(self._wrappers)
+        self._vectorized = VectorizedQuery.create(
+            query,
+            self._tensors,
+            {
+                tensor: wrapper._classes_dict
+                for tensor, wrapper in self._wrappers.items()
+                if isinstance(wrapper, ClassLabelsTensor)
+            },
+        )
+        self._chunk_stats = [
+            _get_chunk_stats(dataset, tensor) for tensor in self._tensors
+        ]
 
     def execute(self) -> List[int]:
         idx_map: List[int] = list()
 
         for f, blk in zip(self._np_access, self._blocks):
+            if self._vectorized is not None and not self._vectorized.may_match(
+                self._block_bounds(blk)
+            ):
+                # the chunk statistics of the block rule out every row
+                self._pg_callback(len(blk), [])
+                continue
+
+            mask = (
+                self._vectorized.evaluate(f, len(blk))
+                if self._vectorized is not None
+                else None
+            )
+            if mask is not None:
+                indices = blk.indices()
+                included = np.flatnonzero(mask).tolist()
+                idx_map.extend(indices[local_idx] for local_idx in included)
+                self._pg_callback(len(blk), included)
+                continue
+
+            # expressions that can't be vectorized are evaluated row by row
             cache = {tensor: f(tensor) for tensor in self._tensors}
+            included = []
             for local_idx in range(len(blk)):
                 p = {
                     tensor: self._wrap_value(tensor, cache[tensor][local_idx])
@@ -49,11 +91,26 @@ class DatasetQuery:
                 if eval(self._cquery, p):
                     global_index = blk.indices()[local_idx]
                     idx_map.append(global_index)
-                    self._pg_callback(local_idx, True)
-                else:
-                    self._pg_callback(local_idx, False)
+                    included.append(local_idx)
+            self._pg_callback(len(blk), included)
         return idx_map
 
+    def _block_bounds(self, block: IOBlock):
+        bounds = {}
+        for i, (tensor, stats) in enumerate(zip(self._tensors, self._chunk_stats)):
+            if stats is None:
+                continue
+            names = block.chunk_names(i)
+            if None in names:
+                continue
+            entry = stats.combined(
+                [ChunkIdEncoder.id_from_name(name) for name in names]
+            )
+            # bounds say nothing about empty samples
+            if entry is not None and not entry[2]:
+                bounds[tensor] = entry[:2]
+        return bounds
+
     def _wrap_value(self, tensor, val):
         if tensor in self._wrappers:
             return self._wrappers[tensor].with_value(val)
@@ -95,6 +152,13 @@ def _get_np(dataset: Dataset, block: IOBlock) -> NP_ACCESS:
     return f
 
 
+def _get_chunk_stats(dataset: Dataset, tensor: str):
+    engine = dataset.tensors[tensor].chunk_engine
+    if not engine.chunk_stats_exists:
+        return None
+    return engine.chunk_stats
+
+
 def expand(dataset, tensor: List[str]) -> List[IOBlock]:
     return SampleStreaming(dataset, tensor).list_blocks()
 
@@ -3,6 +3,8 @@ import pytest
 import numpy as np
 
 from deeplake.core.query import DatasetQuery
+from deeplake.core.tensor import Tensor
+from deeplake.util.keys import get_tensor_chunk_stats_key
 from deeplake.util.exceptions import (
     DatasetViewSavingError,
     InvalidOperationError,
@@ -127,6 +129,124 @@ def test_query_scheduler(local_ds):
     np.testing.assert_array_equal(view1.labels.numpy(), view2.labels.numpy())
 
 
+@pytest.mark.parametrize(
+    "query",
+    [
+        "labels % 3 == 0",
+        "labels > 10 and not (values.max < 50)",
+        "values[0] + values[1] >= 100 or labels == 7",
+        "10 < labels <= 200",
+        "labels in [1, 2, 3] or 5 in values",
+        "values.mean > 50",
+    ],
+)
+def test_vectorized_query(local_ds, query):
+    with local_ds as ds:
+        ds.create_tensor("labels")
+        ds.create_tensor("values")
+        ds.labels.extend(np.arange(1000))
+        ds.values.extend(np.random.randint(0, 100, (1000, 4)))
+
+    dataset_query = DatasetQuery(ds, query)
+    assert dataset_query._vectorized is not None
+
+    # the same query on the row wise path
+    wrappers = dataset_query._wrappers
+    expected = [
+        i
+        for i in range(len(ds))
+        if eval(
+            query,
+            {t: wrappers[t].with_value(ds[t][i]) for t in ("labels", "values")},
+        )
+    ]
+    assert dataset_query.execute() == expected
+
+
+def test_vectorized_query_fallback(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("images")
+        ds.images.append(np.ones((2, 2)))
+        ds.images.append(np.ones((3, 2)))
+        ds.images.append(np.zeros((3, 2)))
+
+    # shape lookups and tensors with dynamic shapes are evaluated row by row
+    assert DatasetQuery(ds, "images.shape == (3, 2)").execute() == [1, 2]
+    assert DatasetQuery(ds, "images.max == 1").execute() == [0, 1]
+    assert DatasetQuery(ds, "len(images) == 3")._vectorized is None
+
+
+def test_query_chunk_stats(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("labels", dtype="int64", max_chunk_size=1024)
+        ds.labels.extend(np.arange(1000))
+        ds.create_tensor("classes", htype="class_label", class_names=class_names)
+        ds.classes.extend(np.zeros(1000, dtype="uint32"))
+
+    engine = ds.labels.chunk_engine
+    assert len(engine.chunk_stats) == engine.num_chunks > 1
+
+    def run(query):
+        skipped = []
+        dataset_query = DatasetQuery(ds, query)
+        for blk in dataset_query._blocks:
+            if not dataset_query._vectorized.may_match(
+                dataset_query._block_bounds(blk)
+            ):
+                skipped += blk.indices()
+        result = dataset_query.execute()
+        assert not set(result) & set(skipped)
+        return result, skipped
+
+    result, skipped = run("labels >= 990 or labels == 5")
+    assert result == [5] + list(range(990, 1000))
+    assert skipped
+    assert run("classes == 'fish'") == ([], list(range(1000)))
+    assert run("classes == 'dog' and labels < 3")[0] == [0, 1, 2]
+
+    # progress is reported once per block
+    calls = []
+    dataset_query = DatasetQuery(
+        ds, "labels >= 990 or labels == 5", lambda *args: calls.append(args)
+    )
+    dataset_query.execute()
+    assert [num_rows for num_rows, _ in calls] == [
+        len(blk) for blk in dataset_query._blocks
+    ]
+    starts = np.cumsum([0] + [num_rows for num_rows, _ in calls])
+    included = [start + i for start, (_, rows) in zip(starts, calls) for i in rows]
+    assert included == [5] + list(range(990, 1000))
+
+    # updates widen the statistics of a chunk
+    ds.labels[0] = 5000
+    assert run("labels > 4000")[0] == [0]
+    ds.labels[2] = -3
+    assert run("labels < 0")[0] == [2]
+
+
+def test_query_without_chunk_stats(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("labels", dtype="int64", max_chunk_size=1024)
+        ds.labels.extend(np.arange(1000))
+    # tensors written by older versions have no statistics
+    engine = ds.labels.chunk_engine
+    del engine.cache[get_tensor_chunk_stats_key("labels", ds.pending_commit_id)]
+    engine._chunk_stats = None
+    assert not engine.chunk_stats_exists
+
+    # invalidating chunks doesn't create statistics
+    for chunk_id in engine.chunk_id_encoder._encoded[:, 0]:
+        engine._invalidate_chunk_stats(chunk_id)
+    assert not engine.chunk_stats_exists
+    assert DatasetQuery(ds, "labels > 990").execute() == list(range(991, 1000))
+
+    # statistics created by another chunk engine of the tensor are kept valid by updates
+    Tensor("labels", ds).extend(np.arange(1000, 1300))
+    assert engine.chunk_stats_exists
+    ds.labels[1200] = -5
+    assert DatasetQuery(ds, "labels < 0").execute() == [1200]
+
+
 @pytest.mark.parametrize(
     "optimize,idx_subscriptable", [(True, True), (False, False), (True, False)]
 )
@@ -0,0 +1,482 @@
+import ast
+import operator
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class NotVectorizable(Exception):
+    """Raised when a query expression, or the data it runs on, can't be evaluated a block at a time."""
+
+
+_COMPARISONS: Dict[type, Callable] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+# ``3 < labels`` is evaluated by python as ``labels > 3``
+_REFLECTED = {
+    operator.eq: operator.eq,
+    operator.ne: operator.ne,
+    operator.lt: operator.gt,
+    operator.le: operator.ge,
+    operator.gt: operator.lt,
+    operator.ge: operator.le,
+}
+
+_BINARY_OPERATORS: Dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_REDUCTIONS = {"min": np.amin, "max": np.amax, "mean": np.mean}
+
+_SCALAR_TYPES = (bool, int, float, np.number, np.bool_)
+
+
+class Column:
+    """The values of a tensor, or of an expression on it, for every row of a block.
+
+    ``data`` holds one row per sample. Wrapped columns follow the semantics of
+    :class:`~deeplake.core.query.query.EvalObject` (``==`` tests membership, reductions are properties),
+    the others follow the semantics of the numpy values the ``EvalObject`` operators return.
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        wrapped: bool = False,
+        class_names: Optional[Dict[str, int]] = None,
+    ):
+        self.data = data
+        self.wrapped = wrapped
+        self.class_names = class_names
+
+    def __len__(self):
+        return len(self.data)
+
+
+def _operand(value):
+    if isinstance(value, Column):
+        return value.data
+    if not isinstance(value, _SCALAR_TYPES):
+        raise NotVectorizable(f"Unsupported operand {value!r}")
+    return value
+
+
+def _check_ranks(left, right):
+    # rows are broadcast against each other, which only matches the row-wise result for equal ranks
+    if (
+        isinstance(left, Column)
+        and isinstance(right, Column)
+        and left.data.ndim != right.data.ndim
+    ):
+        raise NotVectorizable("Operands of different ranks")
+
+
+def _rows(mask: np.ndarray) -> np.ndarray:
+    return mask.reshape(len(mask), -1)
+
+
+def _all_rows(column: Column, value: bool) -> Column:
+    return Column(np.full(len(column), value))
+
+
+def _equals(column: Column, other) -> Column:
+    """``EvalObject.__eq__``: membership of ``other`` in the row."""
+    if column.class_names is not None:
+        if isinstance(other, str):
+            if other not in column.class_names:
+                return _all_rows(column, False)
+            other = column.class_names[other]
+        elif isinstance(other, (list, tuple)):
+            raise NotVectorizable("Comparison with a list of labels")
+        elif not isinstance(other, int):
+            # ClassLabelsTensor normalizes other labels to None, which never matches
+            return _all_rows(column, False)
+    if isinstance(other, Column):
+        raise NotVectorizable("Membership of a tensor in a tensor")
+    # ndarray.__contains__ is (row == other).any()
+    return Column(_rows(column.data == _operand(other)).any(axis=1))
+
+
+def _compare_column(op: Callable, column: Column, other) -> Column:
+    _check_ranks(column, other)
+    if column.wrapped and op in (operator.eq, operator.ne):
+        result = _equals(column, other)
+        return result if op is operator.eq else Column(~result.data)
+    if column.class_names is not None and isinstance(other, str):
+        raise NotVectorizable("label class is not comparable")
+    return Column(op(column.data, _operand(other)))
+
+
+def _compare(op: Callable, left, right):
+    if isinstance(left, Column):
+        return _compare_column(op, left, right)
+    if isinstance(right, Column):
+        return _compare_column(_REFLECTED[op], right, left)
+    return op(left, right)
+
+
+def _contains(container, item):
+    """``item in container``"""
+    if isinstance(container, Column):
+        if isinstance(item, Column):
+            raise NotVectorizable("Membership of a tensor in a tensor")
+        if container.wrapped:
+            return _equals(container, item)
+        return Column(_rows(container.data == _operand(item)).any(axis=1))
+    if isinstance(item, Column) and isinstance(container, (list, tuple)):
+        # list.__contains__ compares every element, which python reflects to item.__eq__(element)
+        masks = [_truth(_compare(operator.eq, item, element)) for element in container]
+        return Column(np.logical_or.reduce(masks, axis=0))
+    if isinstance(item, Column):
+        raise NotVectorizable("Unsupported membership test")
+    return item in container
+
+
+def _truth(value, num_rows: Optional[int] = None) -> np.ndarray:
+    """Evaluates ``bool()`` of the value of every row."""
+    if not isinstance(value, Column):
+        return np.full(num_rows, bool(value))  # type: ignore
+    if value.wrapped:
+        # EvalObject has no __bool__
+        return np.ones(len(value), dtype=bool)
+    rows = _rows(value.data)
+    if rows.shape[1] == 1:
+        return rows[:, 0].astype(bool)
+    if rows.shape[1] == 0:
+        return np.zeros(len(rows), dtype=bool)
+    raise NotVectorizable("The truth value of an array with more than one element")
+
+
+def _getitem(value, item):
+    if not isinstance(value, Column):
+        raise NotVectorizable("Subscript of a constant")
+    if not isinstance(item, (int, slice)):
+        raise NotVectorizable(f"Unsupported index {item!r}")
+    # EvalObject.__getitem__ returns a plain EvalObject, class labels are not normalized anymore
+    return Column(value.data[:, item], wrapped=value.wrapped)
+
+
+def _reduce(value, name: str):
+    if not isinstance(value, Column) or not value.wrapped:
+        raise NotVectorizable(f"Unsupported attribute `{name}`")
+    return Column(_REDUCTIONS[name](_rows(value.data), axis=1))
+
+
+def _binary_op(op: Callable, left, right):
+    if isinstance(right, Column) and right.wrapped and not isinstance(left, Column):
+        # EvalObject doesn't implement reflected operators
+        raise NotVectorizable("Reflected operator")
+    if isinstance(left, Column) and left.wrapped and op is operator.truediv:
+        # EvalObject defines __div__, not __truediv__
+        raise NotVectorizable("Division of a tensor")
+    _check_ranks(left, right)
+    return Column(op(_operand(left), _operand(right)))
+
+
+def _compile(node: ast.AST, boolean: bool = False) -> Callable:
+    """Compiles ``node`` to a function of the environment mapping tensor names to columns.
+
+    ``boolean`` is True for nodes whose value is only used for its truth value. Those return boolean masks.
+    """
+    if isinstance(node, ast.BoolOp) and boolean:
+        values = [_compile(value, boolean=True) for value in node.values]
+        reduce = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return lambda env: reduce.reduce([value(env) for value in values], axis=0)
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _compile(node.operand, boolean=True)
+        if boolean:
+            return lambda env: ~operand(env)
+        return lambda env: Column(~operand(env))
+
+    if isinstance(node, ast.Compare):
+        if len(node.ops) > 1 and not boolean:
+            raise NotVectorizable("Chained comparison")
+        operands = [_compile(node.left)] + [_compile(c) for c in node.comparators]
+        ops = [_compile_comparison(op) for op in node.ops]
+
+        def compare(env):
+            values = [operand(env) for operand in operands]
+            results = [
+                op(left, right) for op, left, right in zip(ops, values, values[1:])
+            ]
+            if len(results) == 1:
+                return _truth(results[0], env["__len__"]) if boolean else results[0]
+            return np.logical_and.reduce([_truth(r, env["__len__"]) for r in results])
+
+        return compare
+
+    if boolean:
+        value = _compile(node)
+        return lambda env: _truth(value(env), env["__len__"])
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda env: _lookup(env, name)
+
+    if isinstance(node, (ast.Constant, ast.List, ast.Tuple, ast.UnaryOp)):
+        try:
+            constant = ast.literal_eval(node)
+        except ValueError:
+            raise NotVectorizable(ast.dump(node))
+        return lambda env: constant
+
+    if isinstance(node, ast.Attribute) and node.attr in _REDUCTIONS:
+        value, name = _compile(node.value), node.attr
+        return lambda env: _reduce(value(env), name)
+
+    if isinstance(node, ast.Subscript):
+        value = _compile(node.value)
+        item = _compile_index(node.slice)
+        return lambda env: _getitem(value(env), item)
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        op = _BINARY_OPERATORS[type(node.op)]
+        left, right = _compile(node.left), _compile(node.right)
+        return lambda env: _binary_op(op, left(env), right(env))
+
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "contains"
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        container, item = _compile(node.func.value), _compile(node.args[0])
+
+        def contains(env):
+            value = container(env)
+            if not isinstance(value, Column) or not value.wrapped:
+                raise NotVectorizable("Unsupported call")
+            return _contains(value, item(env))
+
+        return contains
+
+    raise NotVectorizable(ast.dump(node))
+
+
+def _compile_comparison(op: ast.cmpop) -> Callable:
+    if isinstance(op, ast.In):
+        return lambda left, right: _contains(right, left)
+    if isinstance(op, ast.NotIn):
+        return lambda left, right: _negate(_contains(right, left))
+    if type(op) in _COMPARISONS:
+        return lambda left, right, op=_COMPARISONS[type(op)]: _compare(op, left, right)
+    raise NotVectorizable(ast.dump(op))
+
+
+def _compile_index(node: ast.AST):
+    # python < 3.9 wraps indices in ast.Index
+    node = getattr(node, "value", node) if type(node).__name__ == "Index" else node
+    if isinstance(node, ast.Slice):
+        bounds = [
+            None if bound is None else ast.literal_eval(bound)
+            for bound in (node.lower, node.upper, node.step)
+        ]
+        return slice(*bounds)
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise NotVectorizable(ast.dump(node))
+
+
+def _negate(value):
+    if isinstance(value, Column):
+        return Column(~value.data)
+    return not value
+
+
+def _lookup(env, name: str):
+    if name not in env:
+        raise NotVectorizable(f"Unknown name `{name}`")
+    return env[name]
+
+
+Bounds = Tuple[float, float]
+
+
+def _bounds(node: ast.AST, bounds: Dict[str, Bounds]) -> Optional[Bounds]:
+    """Returns the range every element of the value of ``node`` lies in, if it is a tensor with known bounds."""
+    if isinstance(node, ast.Name):
+        return bounds.get(node.id)
+    if isinstance(node, ast.Attribute) and node.attr in _REDUCTIONS:
+        return _bounds(node.value, bounds)
+    if isinstance(node, ast.Subscript):
+        return _bounds(node.value, bounds)
+    return None
+
+
+def _constant(node: ast.AST):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+
+def _numbers(value) -> Optional[List[float]]:
+    values = value if isinstance(value, (list, tuple)) else [value]
+    if not values or not all(
+        isinstance(v, _SCALAR_TYPES) and not isinstance(v, (bool, np.bool_))
+        for v in values
+    ):
+        return None
+    return [float(v) for v in values]
+
+
+def _may_compare(op: ast.cmpop, left: ast.AST, right: ast.AST, env) -> bool:
+    bounds, class_names = env
+    if isinstance(op, ast.In):
+        # ``c in labels`` tests membership of the constant, ``labels in [a, b]`` compares to each element
+        op, left, right = ast.Eq(), right, left
+    if type(op) not in _COMPARISONS or isinstance(op, ast.NotEq):
+        return True
+    reflected = _bounds(left, bounds) is None
+    if reflected:
+        left, right = right, left
+    column = _bounds(left, bounds)
+    if column is None or _bounds(right, bounds) is not None:
+        return True
+    constant = _constant(right)
+    if isinstance(constant, str) and isinstance(left, ast.Name):
+        labels = class_names.get(left.id)
+        if labels is None:
+            return True
+        if constant not in labels:
+            # unknown labels never match
+            return not isinstance(op, ast.Eq)
+        constant = labels[constant]
+    values = _numbers(constant)
+    if values is None:
+        return True
+    lo, hi = column
+    if isinstance(op, ast.Eq):
+        return any(lo <= v <= hi for v in values)
+    if len(values) > 1:
+        return True
+    v = values[0]
+    if reflected:
+        op = {ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE}[
+            type(op)
+        ]()
+    if isinstance(op, ast.Lt):
+        return lo < v
+    if isinstance(op, ast.LtE):
+        return lo <= v
+    if isinstance(op, ast.Gt):
+        return hi > v
+    return hi >= v
+
+
+def _may_match(node: ast.AST, env) -> bool:
+    """Returns False only if no row whose tensors lie within the given bounds can match ``node``."""
+    if isinstance(node, ast.BoolOp):
+        results = (_may_match(value, env) for value in node.values)
+        return all(results) if isinstance(node.op, ast.And) else any(results)
+    if isinstance(node, ast.Compare):
+        operands = [node.left] + node.comparators
+        return all(
+            _may_compare(op, left, right, env)
+            for op, left, right in zip(node.ops, operands, operands[1:])
+        )
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "contains"
+        and len(node.args) == 1
+    ):
+        return _may_compare(ast.In(), node.args[0], node.func.value, env)
+    return True
+
+
+class VectorizedQuery:
+    """Evaluates a :class:`~deeplake.core.query.query.DatasetQuery` expression over all the rows of a block at once.
+
+    Tensors are decoded to one numpy array per block and every operator of the expression is applied to
+    the whole array, which gives the same result as evaluating the expression on every row with
+    ``EvalObject`` wrappers, without creating a tensor view per row.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        tensors: List[str],
+        class_names: Dict[str, Dict[str, int]],
+    ):
+        tree = ast.parse(query.strip(), mode="eval")
+        self._evaluate = _compile(tree.body, boolean=True)
+        self._tree = tree.body
+        names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+        self._tensors = [tensor for tensor in tensors if tensor in names]
+        self._class_names = class_names
+
+    @classmethod
+    def create(
+        cls,
+        query: str,
+        tensors: List[str],
+        class_names: Dict[str, Dict[str, int]],
+    ) -> Optional["VectorizedQuery"]:
+        """Returns None if ``query`` can't be vectorized."""
+        # grouped tensors are accessed through GroupTensor attributes
+        if any("/" in tensor for tensor in tensors):
+            return None
+        try:
+            return cls(query, tensors, class_names)
+        except (NotVectorizable, SyntaxError):
+            return None
+
+    def may_match(self, bounds: Dict[str, Bounds]) -> bool:
+        """Checks the query against the range of values of the tensors of a block, to skip blocks that can't match.
+
+        Args:
+            bounds (Dict[str, Tuple[float, float]]): Lower and upper bound of the values of tensors
+                of the block. Tensors with empty samples or unknown bounds must be left out.
+
+        Returns:
+            bool: False if no row of the block can match the query.
+        """
+        return _may_match(self._tree, (bounds, self._class_names))
+
+    def _column(self, tensor_view, tensor: str, num_rows: int) -> Column:
+        if tensor_view.is_dynamic:
+            raise NotVectorizable(f"Tensor `{tensor}` has dynamic shapes")
+        data = tensor_view.numpy(fetch_chunks=True)
+        if (
+            not isinstance(data, np.ndarray)
+            or data.dtype.kind not in "biuf"
+            or len(data) != num_rows
+        ):
+            raise NotVectorizable(f"Tensor `{tensor}` is not numeric")
+        return Column(data, wrapped=True, class_names=self._class_names.get(tensor))
+
+    def evaluate(
+        self, np_access: Callable[[str], Any], num_rows: int
+    ) -> Optional[np.ndarray]:
+        """Returns the mask of the rows of a block that match the query, or None if it has to be evaluated row by row.
+
+        Args:
+            np_access (Callable): Returns the view of a tensor on the rows of the block.
+            num_rows (int): Number of rows in the block.
+        """
+        try:
+            env: Dict[str, Any] = {
+                tensor: self._column(np_access(tensor), tensor, num_rows)
+                for tensor in self._tensors
+            }
+            env["__len__"] = num_rows
+            mask = self._evaluate(env)
+        except Exception:
+            # anything unexpected is left to the row-wise evaluation, which has the reference semantics
+            return None
+        return np.asarray(mask, dtype=bool)
@@ -17,7 +17,7 @@ from deeplake.util.casting import intelligent_cast
 from deeplake.util.json import HubJsonDecoder, HubJsonEncoder, validate_json_object
 from deeplake.core.sample import Sample, SampleValue  # type: ignore
 from deeplake.core.compression import compress_array, compress_bytes
-from typing import Optional, Sequence, Union, Tuple
+from typing import List, Optional, Sequence, Union, Tuple
 import deeplake
 import numpy as np
 import struct
@@ -433,6 +433,63 @@ def deserialize_sequence_or_creds_encoder(
     return version, enc
 
 
+def get_format_version(byts: Union[bytes, memoryview], magic: bytes) -> int:
+    """Returns the version of a binary metadata format from the header of a serialized object.
+
+    Binary metadata starts with a magic string followed by the format version as a little endian uint32.
+
+    Args:
+        byts: (bytes) Serialized object.
+        magic: (bytes) Magic string of the format.
+
+    Returns:
+        The format version, or 0 if the object doesn't start with the magic string and uses the legacy format.
+    """
+    byts = memoryview(byts)
+    header_size = len(magic) + 4
+    if len(byts) < header_size or bytes(byts[: len(magic)]) != magic:
+        return 0
+    return int.from_bytes(byts[len(magic) : header_size], "little")
+
+
+def serialize_string_table(strings: Sequence[str]) -> bytes:
+    """Serializes strings into their end offsets, as little endian uint64s, followed by the concatenated utf-8 strings.
+
+    Args:
+        strings: (Sequence[str]) Strings to serialize.
+
+    Returns:
+        Serialized string table as bytes.
+    """
+    encoded = [string.encode("utf-8") for string in strings]
+    ends = np.cumsum([len(b) for b in encoded], dtype="<u8")
+    return ends.tobytes() + b"".join(encoded)
+
+
+def deserialize_string_table(
+    byts: Union[bytes, memoryview], offset: int, count: int
+) -> Tuple[List[str], int]:
+    """Deserializes a string table serialized by `serialize_string_table`.
+
+    Args:
+        byts: (bytes) Buffer containing the table.
+        offset: (int) Position of the table in the buffer.
+        count: (int) Number of strings in the table.
+
+    Returns:
+        Tuple of: the strings and the position of the end of the table in the buffer.
+    """
+    ends = np.frombuffer(byts, dtype="<u8", count=count, offset=offset).tolist()
+    offset += 8 * count
+    blob = bytes(memoryview(byts)[offset : offset + (ends[-1] if count else 0)])
+    strings = []
+    start = 0
+    for end in ends:
+        strings.append(blob[start:end].decode("utf-8"))
+        start = end
+    return strings, offset + len(blob)
+
+
 def check_sample_shape(shape, num_dims):
     if shape is not None and len(shape) != num_dims:
         raise TensorInvalidSampleShapeError(shape, num_dims)
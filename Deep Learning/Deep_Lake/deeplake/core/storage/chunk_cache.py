@@ -0,0 +1,402 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from deeplake.constants import FIRST_COMMIT_ID, LOCAL_CACHE_PREFIX, MB
+
+try:
+    import fcntl  # type: ignore
+
+    msvcrt = None
+except ImportError:  # windows
+    fcntl = None  # type: ignore
+    import msvcrt  # type: ignore
+
+
+DEFAULT_CHUNK_CACHE_SIZE = 10 * 1024 * MB
+# eviction frees space down to this fraction of the budget, so that it doesn't run on every insertion
+CHUNK_CACHE_LOW_WATERMARK = 0.9
+# the index log is rewritten once it has this many times more records than there are objects
+INDEX_COMPACTION_FACTOR = 4
+# processes that only read check the size of the index log after this many reads
+READ_COMPACTION_INTERVAL = 1024
+# fetches of the same object by other processes are waited for at most this long, and considered crashed after it
+FETCH_TIMEOUT_SECONDS = 300
+FETCH_POLL_SECONDS = 0.02
+# temporary files older than this were left by crashed writers
+STALE_TMP_SECONDS = 3600
+
+_TMP_PREFIX = ".tmp"
+
+
+@contextmanager
+def _file_lock(path: str):
+    """Exclusive lock on a file, held against the other threads and processes of the machine."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after 10 seconds
+                    pass
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+def get_chunk_commit_id(path: str) -> str:
+    """Returns the id of the commit the chunk at ``path`` belongs to, following :func:`deeplake.util.keys.get_chunk_key`."""
+    parts = path.split("/", 2)
+    if len(parts) == 3 and parts[0] == "versions":
+        return parts[1]
+    return FIRST_COMMIT_ID
+
+
+def get_committed_ids(version_state) -> Set[str]:
+    """Returns the ids of the commits of a dataset that can no longer change, i.e. that are not the head of a branch."""
+    return {
+        commit_id
+        for commit_id, node in version_state["commit_node_map"].items()
+        if not node.is_head_node
+    }
+
+
+class SharedChunkCache:
+    """Cache of chunks on local disk, shared by every process of the machine that uses the same directory.
+
+    Objects are stored in files named after the hash of their full path, written atomically so that concurrent
+    readers never see partial files. Since the key doesn't change when an object is rewritten, callers must only store
+    objects that never change, such as the chunks of committed versions of a dataset.
+
+    The total size of the files is kept under a global byte budget by evicting the least recently read ones. Puts,
+    reads and removals are appended to an index log, that every process replays to keep the sizes and the recency
+    order of the objects in memory, so eviction never lists the directory. The log is rewritten when it grows too
+    large. Processes missing the same object wait for the first one to fetch it instead of fetching it again.
+    """
+
+    def __init__(self, root: str, size: int):
+        """
+        Args:
+            root (str): Directory of the cache.
+            size (int): Budget of the cache in bytes, shared by all the processes using it.
+        """
+        self.root = root
+        self.size = size
+        self._objects_dir = os.path.join(root, "objects")
+        self._locks_dir = os.path.join(root, "locks")
+        self._fetching_dir = os.path.join(root, "fetching")
+        self._index_lock = os.path.join(self._locks_dir, "index")
+        self._log_path = os.path.join(root, "index.log")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._locks_dir, exist_ok=True)
+        os.makedirs(self._fetching_dir, exist_ok=True)
+        # replayed state of the index log, only read and updated with the index lock held
+        self._lock = threading.Lock()
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        self._log_id: Optional[Tuple[int, int]] = None
+        self._log_offset = 0
+        self._log_records = 0
+        self._reads = 0
+
+    @staticmethod
+    def get_key(root: str, path: str) -> str:
+        """Key of the object at ``path`` of the storage at ``root``."""
+        return hashlib.sha256(f"{root}\0{path}".encode("utf-8")).hexdigest()
+
+    def _object_path(self, key: str) -> str:
+        return os.path.join(self._objects_dir, key[:2], key)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._object_path(key))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the object stored under ``key``, or ``None`` if it is not cached."""
+        return self.get_bytes(key)
+
+    def get_bytes(
+        self, key: str, start_byte: Optional[int] = None, end_byte: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Returns a byte range of the object stored under ``key``, or ``None`` if it is not cached."""
+        path = self._object_path(key)
+        try:
+            with open(path, "rb") as f:
+                if start_byte:
+                    f.seek(start_byte)
+                if end_byte is None:
+                    data = f.read()
+                else:
+                    data = f.read(max(0, end_byte - (start_byte or 0)))
+        except FileNotFoundError:
+            return None
+        # reads are recorded without the index lock, losing one only makes eviction less accurate
+        self._append_records([("get", key, 0)])
+        self._reads += 1
+        if self._reads >= READ_COMPACTION_INTERVAL:
+            # read records grow the log even when nothing is put
+            self._reads = 0
+            with self._locked_index():
+                self._sync()
+                self._maybe_compact()
+        return data
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], bytes]) -> bytes:
+        """Returns the object stored under ``key``, fetching it with ``fetch`` and storing it if it is not cached.
+        While a process fetches an object, the others missing it wait and read it from disk. No lock is held while
+        fetching.
+        """
+        while True:
+            data = self.get(key)
+            if data is not None:
+                return data
+            marker = os.path.join(self._fetching_dir, key)
+            if self._claim_fetch(marker):
+                try:
+                    data = fetch()
+                    self.put(key, data)
+                finally:
+                    _remove(marker)
+                return data
+            self._wait_for_fetch(key, marker)
+
+    @staticmethod
+    def _claim_fetch(marker: str) -> bool:
+        """Creates the marker of a fetch in progress. Returns False if another fetch of the object is in progress."""
+        try:
+            os.close(os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                stale = time.time() - os.stat(marker).st_mtime > FETCH_TIMEOUT_SECONDS
+            except OSError:
+                # the other fetch just completed
+                return False
+            if stale:
+                # left by a process that crashed while fetching
+                _remove(marker)
+            return False
+
+    def _wait_for_fetch(self, key: str, marker: str):
+        deadline = time.time() + FETCH_TIMEOUT_SECONDS
+        while os.path.exists(marker) and key not in self and time.time() < deadline:
+            time.sleep(FETCH_POLL_SECONDS)
+
+    def put(self, key: str, value: bytes):
+        """Stores an object, evicting the least recently read ones if the budget is exceeded.
+        Objects larger than the budget are not stored.
+        """
+        nbytes = len(value)
+        if nbytes > self.size:
+            return
+        path = self._object_path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=_TMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            with self._locked_index():
+                os.replace(tmp_path, path)
+                self._append_records([("put", key, nbytes)])
+                self._sync()
+                if self._total > self.size:
+                    self._evict(int(self.size * CHUNK_CACHE_LOW_WATERMARK))
+                self._maybe_compact()
+        except BaseException:
+            _remove(tmp_path)
+            raise
+
+    def invalidate(self, key: str):
+        """Removes the object stored under ``key``, if any."""
+        with self._locked_index():
+            if _remove(self._object_path(key)):
+                self._append_records([("del", key, 0)])
+                self._sync()
+
+    def clear(self):
+        """Removes all the objects of the cache."""
+        with self._locked_index():
+            for directory, _, files in os.walk(self._objects_dir):
+                for name in files:
+                    _remove(os.path.join(directory, name))
+            self._rewrite_log([])
+            self._sync()
+
+    @contextmanager
+    def _locked_index(self):
+        with self._lock, _file_lock(self._index_lock):
+            if not os.path.exists(self._log_path):
+                self._rebuild_log()
+            yield
+
+    def _append_records(self, records: Iterable[Tuple[str, str, int]]):
+        lines = "".join(f"{op} {key} {nbytes}\n" for op, key, nbytes in records)
+        try:
+            # the log is only created by _rebuild_log, which also records the objects already on disk
+            fd = os.open(self._log_path, os.O_WRONLY | os.O_APPEND)
+        except OSError:
+            return
+        try:
+            # appends of a few bytes are atomic, so records of concurrent writers don't interleave
+            os.write(fd, lines.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def _reset_index(self):
+        self._sizes = OrderedDict()
+        self._total = 0
+        self._log_offset = 0
+        self._log_records = 0
+
+    def _sync(self):
+        """Replays the records appended to the index log since the last call. Must be called with the index lock held."""
+        try:
+            stat = os.stat(self._log_path)
+        except OSError:
+            self._reset_index()
+            self._log_id = None
+            return
+        log_id = (stat.st_dev, stat.st_ino)
+        if log_id != self._log_id:
+            # the log was rewritten
+            self._reset_index()
+            self._log_id = log_id
+        with open(self._log_path, "rb") as f:
+            f.seek(self._log_offset)
+            data = f.read()
+        # a read record being appended concurrently may not be complete yet
+        data = data[: data.rfind(b"\n") + 1]
+        self._log_offset += len(data)
+        sizes = self._sizes
+        for line in data.decode("utf-8").splitlines():
+            op, key, nbytes = line.split(" ")
+            self._log_records += 1
+            if op == "put":
+                self._total += int(nbytes) - sizes.get(key, 0)
+                sizes[key] = int(nbytes)
+                sizes.move_to_end(key)
+            elif key in sizes:
+                if op == "get":
+                    sizes.move_to_end(key)
+                else:
+                    self._total -= sizes.pop(key)
+
+    def _evict(self, target: int):
+        """Removes the least recently read objects until their total size is at most ``target``.
+        Must be called with the index lock held.
+        """
+        removed = []
+        total = self._total
+        for key, nbytes in self._sizes.items():
+            if total <= target:
+                break
+            path = self._object_path(key)
+            if _remove(path) or not os.path.exists(path):
+                removed.append(("del", key, 0))
+                total -= nbytes
+            # else in use by a reader on windows
+        if removed:
+            self._append_records(removed)
+            self._sync()
+
+    def _maybe_compact(self):
+        if self._log_records > INDEX_COMPACTION_FACTOR * (len(self._sizes) + 256):
+            self._rewrite_log(self._sizes.items())
+            self._sync()
+            self._remove_stale_tmp_files()
+
+    def _rewrite_log(self, sizes: Iterable[Tuple[str, int]]):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=_TMP_PREFIX)
+        with os.fdopen(fd, "w") as f:
+            f.write("".join(f"put {key} {nbytes}\n" for key, nbytes in sizes))
+        os.replace(tmp_path, self._log_path)
+
+    def _rebuild_log(self):
+        """Writes the index log of the objects on disk, ordered by modification time, if it is missing."""
+        entries: List[Tuple[float, str, int]] = []
+        for directory, _, files in os.walk(self._objects_dir):
+            for name in files:
+                if name.startswith(_TMP_PREFIX):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, name, stat.st_size))
+        entries.sort()
+        self._rewrite_log((key, nbytes) for _, key, nbytes in entries)
+
+    def _remove_stale_tmp_files(self):
+        now = time.time()
+        for directory, _, files in os.walk(self._objects_dir):
+            for name in files:
+                if not name.startswith(_TMP_PREFIX):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    if now - os.stat(path).st_mtime > STALE_TMP_SECONDS:
+                        _remove(path)
+                except OSError:
+                    pass
+
+    def __getstate__(self) -> Dict:
+        return {"root": self.root, "size": self.size}
+
+    def __setstate__(self, state: Dict):
+        self.__init__(state["root"], state["size"])  # type: ignore
+
+
+_CHUNK_CACHES: Dict[Tuple[str, int], SharedChunkCache] = {}
+
+
+def get_chunk_cache_size() -> int:
+    """Budget of the shared chunk cache in bytes, set in MB by the ``DEEPLAKE_CHUNK_CACHE_SIZE`` environment variable.
+    Returns 0 if it is not set.
+    """
+    return int(float(os.getenv("DEEPLAKE_CHUNK_CACHE_SIZE", 0)) * MB)
+
+
+def get_shared_chunk_cache(size: Optional[int] = None) -> SharedChunkCache:
+    """Returns the chunk cache shared by the processes of the machine.
+    It is stored under the ``LOCAL_CACHE_PREFIX`` directory.
+
+    Args:
+        size (int, optional): Budget of the cache in bytes. Defaults to ``DEEPLAKE_CHUNK_CACHE_SIZE`` if set,
+            else ``DEFAULT_CHUNK_CACHE_SIZE``.
+
+    Returns:
+        SharedChunkCache: The cache.
+    """
+    size = size or get_chunk_cache_size() or DEFAULT_CHUNK_CACHE_SIZE
+    prefix = os.getenv("LOCAL_CACHE_PREFIX", default=LOCAL_CACHE_PREFIX)
+    root = os.path.join(os.path.expanduser(prefix), "shared_chunks")
+    try:
+        return _CHUNK_CACHES[(root, size)]
+    except KeyError:
+        cache = _CHUNK_CACHES[(root, size)] = SharedChunkCache(root, size)
+        return cache
@@ -0,0 +1,320 @@
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Dict, Iterator, MutableMapping, Tuple
+
+
+class EvictionPolicy(MutableMapping):
+    """Tracks the keys of a cache along with the size of their values, and decides which key is evicted next.
+
+    Setting a new key records its insertion, setting an existing key only updates its size.
+    Accesses are recorded with :meth:`touch`.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity (int): Size of the cache in bytes. Used by policies that size their queues relative to it.
+        """
+        self.capacity = capacity
+
+    @abstractmethod
+    def touch(self, key: str):
+        """Records an access to a key present in the cache."""
+
+    @abstractmethod
+    def evict(self) -> Tuple[str, int]:
+        """Removes the next key to be evicted and returns it along with its size.
+
+        Raises:
+            KeyError: If the cache is empty.
+        """
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evicts the least recently used key."""
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+
+    def __getitem__(self, key: str) -> int:
+        return self._sizes[key]
+
+    def __setitem__(self, key: str, size: int):
+        self._sizes[key] = size
+
+    def __delitem__(self, key: str):
+        del self._sizes[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sizes)
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, key) -> bool:
+        return key in self._sizes
+
+    def touch(self, key: str):
+        self._sizes.move_to_end(key)
+
+    def evict(self) -> Tuple[str, int]:
+        return self._sizes.popitem(last=False)
+
+    def clear(self):
+        self._sizes.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evicts the least frequently used key. Ties are broken in least recently used order."""
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._sizes: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        # count -> keys with that count, in lru order
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._min_count = 0
+
+    def __getitem__(self, key: str) -> int:
+        return self._sizes[key]
+
+    def __setitem__(self, key: str, size: int):
+        if key not in self._sizes:
+            self._counts[key] = 1
+            self._buckets.setdefault(1, OrderedDict())[key] = None
+            self._min_count = 1
+        self._sizes[key] = size
+
+    def __delitem__(self, key: str):
+        del self._sizes[key]
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sizes)
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, key) -> bool:
+        return key in self._sizes
+
+    def touch(self, key: str):
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def evict(self) -> Tuple[str, int]:
+        if not self._sizes:
+            raise KeyError("evict(): cache is empty")
+        if self._min_count not in self._buckets:
+            self._min_count = min(self._buckets)
+        key = next(iter(self._buckets[self._min_count]))
+        size = self._sizes[key]
+        del self[key]
+        return key, size
+
+    def clear(self):
+        self._sizes.clear()
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+
+class TwoQPolicy(EvictionPolicy):
+    """2Q: new keys enter a FIFO queue and are promoted to the main LRU queue when they are accessed again,
+    including shortly after having been evicted from the FIFO queue. Keys read once, such as those of a
+    sequential scan, are evicted before frequently used ones.
+    """
+
+    def __init__(self, capacity: int, in_ratio: float = 0.25, out_ratio: float = 0.5):
+        """
+        Args:
+            capacity (int): Size of the cache in bytes.
+            in_ratio (float): Fraction of the cache reserved for the FIFO queue of new keys.
+            out_ratio (float): Total size of the keys remembered after leaving the FIFO queue, relative to the cache size.
+        """
+        super().__init__(capacity)
+        self._in: "OrderedDict[str, int]" = OrderedDict()
+        self._main: "OrderedDict[str, int]" = OrderedDict()
+        self._out: "OrderedDict[str, int]" = OrderedDict()
+        self._in_bytes = 0
+        self._out_bytes = 0
+        self._max_in = capacity * in_ratio
+        self._max_out = capacity * out_ratio
+
+    def __getitem__(self, key: str) -> int:
+        if key in self._main:
+            return self._main[key]
+        return self._in[key]
+
+    def __setitem__(self, key: str, size: int):
+        if key in self._main:
+            self._main[key] = size
+        elif key in self._in:
+            self._in_bytes += size - self._in[key]
+            self._in[key] = size
+        elif key in self._out:
+            self._out_bytes -= self._out.pop(key)
+            self._main[key] = size
+        else:
+            self._in[key] = size
+            self._in_bytes += size
+
+    def __delitem__(self, key: str):
+        if key in self._main:
+            del self._main[key]
+        else:
+            self._in_bytes -= self._in.pop(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._in
+        yield from self._main
+
+    def __len__(self) -> int:
+        return len(self._in) + len(self._main)
+
+    def __contains__(self, key) -> bool:
+        return key in self._main or key in self._in
+
+    def touch(self, key: str):
+        if key in self._main:
+            self._main.move_to_end(key)
+        else:
+            self._in_bytes -= self._in[key]
+            self._main[key] = self._in.pop(key)
+
+    def evict(self) -> Tuple[str, int]:
+        if self._in and (self._in_bytes > self._max_in or not self._main):
+            key, size = self._in.popitem(last=False)
+            self._in_bytes -= size
+            self._out[key] = size
+            self._out_bytes += size
+            while self._out and self._out_bytes > self._max_out:
+                self._out_bytes -= self._out.popitem(last=False)[1]
+            return key, size
+        return self._main.popitem(last=False)
+
+    def clear(self):
+        self._in.clear()
+        self._main.clear()
+        self._out.clear()
+        self._in_bytes = self._out_bytes = 0
+
+
+class ARCPolicy(EvictionPolicy):
+    """Adaptive Replacement Cache: balances a queue of keys seen once against a queue of keys seen at least twice,
+    adapting the split to the workload using the keys recently evicted from each of them.
+    Sizes are accounted in bytes.
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._t1: "OrderedDict[str, int]" = OrderedDict()
+        self._t2: "OrderedDict[str, int]" = OrderedDict()
+        self._b1: "OrderedDict[str, int]" = OrderedDict()
+        self._b2: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = {"t1": 0, "b1": 0, "b2": 0}
+        # target size of t1 in bytes
+        self._p = 0.0
+
+    def __getitem__(self, key: str) -> int:
+        if key in self._t2:
+            return self._t2[key]
+        return self._t1[key]
+
+    def __setitem__(self, key: str, size: int):
+        if key in self._t2:
+            self._t2[key] = size
+        elif key in self._t1:
+            self._bytes["t1"] += size - self._t1[key]
+            self._t1[key] = size
+        elif key in self._b1:
+            ratio = max(self._bytes["b2"] / max(self._bytes["b1"], 1), 1)
+            self._p = min(float(self.capacity), self._p + ratio * size)
+            self._bytes["b1"] -= self._b1.pop(key)
+            self._t2[key] = size
+        elif key in self._b2:
+            ratio = max(self._bytes["b1"] / max(self._bytes["b2"], 1), 1)
+            self._p = max(0.0, self._p - ratio * size)
+            self._bytes["b2"] -= self._b2.pop(key)
+            self._t2[key] = size
+        else:
+            self._t1[key] = size
+            self._bytes["t1"] += size
+
+    def __delitem__(self, key: str):
+        if key in self._t2:
+            del self._t2[key]
+        else:
+            self._bytes["t1"] -= self._t1.pop(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._t1
+        yield from self._t2
+
+    def __len__(self) -> int:
+        return len(self._t1) + len(self._t2)
+
+    def __contains__(self, key) -> bool:
+        return key in self._t2 or key in self._t1
+
+    def touch(self, key: str):
+        if key in self._t1:
+            size = self._t1.pop(key)
+            self._bytes["t1"] -= size
+            self._t2[key] = size
+        else:
+            self._t2.move_to_end(key)
+
+    def _remember(self, ghost: str, key: str, size: int):
+        queue = self._b1 if ghost == "b1" else self._b2
+        queue[key] = size
+        self._bytes[ghost] += size
+        while queue and self._bytes[ghost] > self.capacity:
+            self._bytes[ghost] -= queue.popitem(last=False)[1]
+
+    def evict(self) -> Tuple[str, int]:
+        if self._t1 and (self._bytes["t1"] > self._p or not self._t2):
+            key, size = self._t1.popitem(last=False)
+            self._bytes["t1"] -= size
+            self._remember("b1", key, size)
+        else:
+            key, size = self._t2.popitem(last=False)
+            self._remember("b2", key, size)
+        return key, size
+
+    def clear(self):
+        for queue in (self._t1, self._t2, self._b1, self._b2):
+            queue.clear()
+        self._bytes = {"t1": 0, "b1": 0, "b2": 0}
+        self._p = 0.0
+
+
+EVICTION_POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "2q": TwoQPolicy,
+    "arc": ARCPolicy,
+}
+
+
+def get_eviction_policy(name: str, capacity: int) -> EvictionPolicy:
+    """Creates the eviction policy registered under ``name`` for a cache of ``capacity`` bytes."""
+    try:
+        policy = EVICTION_POLICIES[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown eviction policy '{name}'. Available policies: {list(EVICTION_POLICIES)}."
+        )
+    return policy(capacity)
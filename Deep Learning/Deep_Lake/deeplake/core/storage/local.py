@@ -1,9 +1,12 @@
+import mmap
 import os
 import pathlib
 import posixpath
 import shutil
+import tempfile
 from typing import Optional, Set
 
+from deeplake.constants import CHUNKS_FOLDER
 from deeplake.core.storage.provider import StorageProvider
 from deeplake.util.exceptions import (
     DirectoryAtPathException,
@@ -12,10 +15,21 @@ from deeplake.util.exceptions import (
 )
 
 
+def _get_file_mode() -> int:
+    # the umask can only be read by setting it
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# mode of the files created by open(), given to the temporary files of memory mapped writes
+_FILE_MODE = _get_file_mode()
+
+
 class LocalProvider(StorageProvider):
     """Provider class for using the local filesystem."""
 
-    def __init__(self, root: str):
+    def __init__(self, root: str, use_mmap: bool = False):
         """Initializes the LocalProvider.
 
         Example:
@@ -24,6 +38,10 @@ class LocalProvider(StorageProvider):
 
         Args:
             root (str): The root of the provider. All read/write request keys will be appended to root."
+            use_mmap (bool): If True, chunks are read as read-only memoryviews over memory mapped files instead of
+                being copied into memory. Files are then written to a temporary file that replaces the original one,
+                so that the contents of previous reads are left untouched. Not supported on Windows,
+                where mapped files can't be replaced. Defaults to False.
 
         Raises:
             FileAtPathException: If the root is a file instead of a directory.
@@ -31,6 +49,7 @@ class LocalProvider(StorageProvider):
         if os.path.isfile(root):
             raise FileAtPathException(root)
         self.root = root
+        self.use_mmap = use_mmap and os.name != "nt"
         self.files: Optional[Set[str]] = None
         self._all_keys()
 
@@ -39,7 +58,7 @@ class LocalProvider(StorageProvider):
         self.repository: Optional[str] = None
 
     def subdir(self, path: str, read_only: bool = False):
-        sd = self.__class__(os.path.join(self.root, path))
+        sd = self.__class__(os.path.join(self.root, path), use_mmap=self.use_mmap)
         if self.expiration:
             sd._set_hub_creds_info(
                 self.hub_path, self.expiration, self.db_engine, self.repository
@@ -68,6 +87,8 @@ class LocalProvider(StorageProvider):
         """
         try:
             full_path = self._check_is_file(path)
+            if self._is_mapped(path):
+                return self._map(full_path)
             with open(full_path, "rb") as file:
                 return file.read()
         except DirectoryAtPathException:
@@ -99,8 +120,22 @@ class LocalProvider(StorageProvider):
             raise FileAtPathException(directory)
         if not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-        with open(full_path, "wb") as file:
-            file.write(value)
+        if self.use_mmap:
+            # truncating a file that is mapped would invalidate the memoryviews handed out over it
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_")
+            try:
+                # mkstemp creates files readable by the owner only
+                os.fchmod(fd, _FILE_MODE)
+                with os.fdopen(fd, "wb") as file:
+                    file.write(value)
+                os.replace(tmp_path, full_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        else:
+            with open(full_path, "wb") as file:
+                file.write(value)
         if self.files is not None:
             self.files.add(path)
 
@@ -182,6 +217,27 @@ class LocalProvider(StorageProvider):
             self.files = key_set
         return self.files
 
+    def _is_mapped(self, path: str) -> bool:
+        return self.use_mmap and (
+            f"/{CHUNKS_FOLDER}/" in path or path.startswith(f"{CHUNKS_FOLDER}/")
+        )
+
+    def _map(self, full_path: str) -> memoryview:
+        """Returns a read-only memoryview over the memory mapped file. The file is unmapped once the memoryview and
+        every slice of it are garbage collected."""
+        with open(full_path, "rb") as file:
+            if not os.fstat(file.fileno()).st_size:
+                # empty files can't be mapped
+                return memoryview(b"")
+            try:
+                # don't keep a duplicate file descriptor open for as long as the file is mapped
+                mapped = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ, trackfd=False
+                )
+            except TypeError:  # python < 3.13
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return memoryview(mapped)
+
     def _check_is_file(self, path: str):
         """Checks if the path is a file. Returns the full_path to file if True.
 
@@ -225,10 +281,12 @@ class LocalProvider(StorageProvider):
         return os.path.exists(full_path)
 
     def __getstate__(self):
-        return self.root
+        return self.root, self.use_mmap
 
     def __setstate__(self, state):
-        self.__init__(state)
+        if isinstance(state, str):
+            state = (state, False)
+        self.__init__(*state)
 
     def get_presigned_url(self, key: str) -> str:
         return os.path.join(self.root, key)
@@ -244,6 +302,8 @@ class LocalProvider(StorageProvider):
     ):
         try:
             full_path = self._check_is_file(path)
+            if self._is_mapped(path):
+                return self._map(full_path)[start_byte:end_byte]
             with open(full_path, "rb") as file:
                 if start_byte is not None:
                     file.seek(start_byte)
@@ -1,9 +1,30 @@
 import sys
+import threading
+import zlib
 from collections import OrderedDict
+from deeplake.constants import CHUNKS_FOLDER
 from deeplake.core.partial_reader import PartialReader
+from deeplake.core.storage.chunk_cache import SharedChunkCache, get_chunk_commit_id
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.storage.eviction_policy import EvictionPolicy, get_eviction_policy
+from deeplake.core.storage.write_behind import (
+    DEFAULT_MAX_PENDING_BYTES,
+    WriteBehindFlusher,
+)
 from deeplake.core.chunk.base_chunk import BaseChunk
-from typing import Any, Dict, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from deeplake.core.storage.provider import StorageProvider
 
@@ -14,6 +35,10 @@ def _get_nbytes(obj: Union[bytes, memoryview, DeepLakeMemoryObject]):
     return len(obj)
 
 
+def _is_chunk_key(path: str) -> bool:
+    return f"/{CHUNKS_FOLDER}/" in path or path.startswith(f"{CHUNKS_FOLDER}/")
+
+
 def obj_to_bytes(obj):
     if isinstance(obj, DeepLakeMemoryObject):
         obj = obj.tobytes()
@@ -22,6 +47,56 @@ def obj_to_bytes(obj):
     return obj
 
 
+class _CacheShard:
+    """A slice of the keys of the cache with its own lock, eviction policy, dirty keys and share of the cache size."""
+
+    def __init__(self, eviction_policy: str, capacity: int):
+        self.lock = threading.RLock()
+        self.capacity = capacity
+        self.policy: EvictionPolicy = get_eviction_policy(eviction_policy, capacity)
+        self.dirty: Dict[str, None] = (
+            OrderedDict() if sys.version_info < (3, 7) else {}  # type: ignore
+        )  # keys present in cache but not next_storage. Using a dict instead of set to preserve order.
+        # values forwarded with write behind that are not queued yet, since queuing can block, it is done without the lock
+        self.forwarding: Dict[str, bytes] = {}
+        # held while the forwarded values are queued, so that values of the same key are queued in order
+        self.submit_lock = threading.Lock()
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class _CacheSizes(Mapping):
+    """Read only view of the sizes of the objects in all the shards of a cache."""
+
+    def __init__(self, cache: "LRUCache"):
+        self._cache = cache
+
+    def __getitem__(self, path: str) -> int:
+        shard = self._cache._shard(path)
+        with shard.lock:
+            return shard.policy[path]
+
+    def __contains__(self, path) -> bool:
+        shard = self._cache._shard(path)
+        with shard.lock:
+            return path in shard.policy
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._cache._shards:
+            with shard.lock:
+                keys = list(shard.policy)
+            yield from keys
+
+    def __len__(self) -> int:
+        total = 0
+        for shard in self._cache._shards:
+            with shard.lock:
+                total += len(shard.policy)
+        return total
+
+
 class LRUCache(StorageProvider):
     """LRU Cache that uses StorageProvider for caching"""
 
@@ -30,6 +105,13 @@ class LRUCache(StorageProvider):
         cache_storage: StorageProvider,
         next_storage: Optional[StorageProvider],
         cache_size: int,
+        eviction_policy: str = "lru",
+        num_shards: int = 1,
+        max_item_size: Optional[int] = None,
+        write_behind: bool = False,
+        max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES,
+        num_flush_workers: int = 8,
+        chunk_cache: Optional[SharedChunkCache] = None,
     ):
         """Initializes the LRUCache. It can be chained with other LRUCache objects to create multilayer caches.
 
@@ -43,27 +125,216 @@ class LRUCache(StorageProvider):
             cache_size (int): The total space that can be used from the cache_storage in bytes.
                 This number may be less than the actual space available on the cache_storage.
                 Setting it to a higher value than actually available space may lead to unexpected behaviors.
+            eviction_policy (str): The order in which objects are evicted from the cache. One of "lru", "lfu", "2q" and "arc".
+                "2q" and "arc" keep frequently used objects, such as metas, cached during sequential scans. Defaults to "lru".
+            num_shards (int): Number of independently locked partitions of the cache. Each of them is given an equal part of
+                `cache_size` and evicts on its own, which reduces lock contention when the cache is shared by threads. Defaults to 1.
+            max_item_size (int, optional): Objects larger than this that are read from `next_storage` are returned without being cached.
+                Defaults to the size of a shard.
+            write_behind (bool): If True, objects evicted from the cache and flushed are written to `next_storage` by background
+                threads, instead of blocking the caller. Chunks are written before the metadata that is flushed with them.
+                Objects being written are still served by the cache. Defaults to False.
+            max_pending_bytes (int): With `write_behind`, writes block while more than this many bytes are waiting to be written.
+            num_flush_workers (int): With `write_behind`, the number of concurrent writes to `next_storage`.
+            chunk_cache (SharedChunkCache, optional): Disk cache shared by the processes of the machine that chunks read
+                from `next_storage` go through. Only chunks of the commits passed to :meth:`mark_committed` are stored in it,
+                since chunks of the head of a branch are rewritten in place. Chunks written to `next_storage` are removed from it.
         """
         self.next_storage = next_storage
         self.cache_storage = cache_storage
         self.cache_size = cache_size
+        self.eviction_policy = eviction_policy
+        self.num_shards = num_shards
+        self.max_item_size = max_item_size
+        self._init_shards()
+        self.write_behind = write_behind
+        self.max_pending_bytes = max_pending_bytes
+        self.num_flush_workers = num_flush_workers
+        self._init_flusher()
+        self.chunk_cache = chunk_cache
+        self.committed_ids: Set[str] = set()
 
-        # tracks keys in lru order, stores size of value, only keys present in this exist in cache
-        self.lru_sizes: OrderedDict[str, int] = OrderedDict()
+        self.deeplake_objects: Dict[str, DeepLakeMemoryObject] = {}
 
-        self.dirty_keys: Dict[str, None] = (
-            OrderedDict() if sys.version_info < (3, 7) else {}  # type: ignore
-        )  # keys present in cache but not next_storage. Using a dict instead of set to preserve order.
+    def _init_shards(self):
+        if self.num_shards < 1:
+            raise ValueError(f"`num_shards` must be >= 1. Got: {self.num_shards}")
+        capacity = self.cache_size // self.num_shards
+        self._shards: List[_CacheShard] = [
+            _CacheShard(self.eviction_policy, capacity) for _ in range(self.num_shards)
+        ]
+
+    def _init_flusher(self):
+        self._flusher: Optional[WriteBehindFlusher] = None
+        if self.write_behind and self.next_storage is not None:
+            self._flusher = WriteBehindFlusher(
+                self.next_storage,
+                num_workers=self.num_flush_workers,
+                max_pending_bytes=self.max_pending_bytes,
+                on_write=self._on_flushed,
+                on_error=self._on_flush_error,
+            )
 
-        self.cache_used = 0
-        self.deeplake_objects: Dict[str, DeepLakeMemoryObject] = {}
-        # TODO: BRING THIS BACK AFTER ASYNC IS FIXED
-        # self.use_async = (
-        #     next_storage.async_supported()
-        #     if next_storage
-        #     else False and sys.version_info >= (3, 7) and sys.platform != "win32"
-        # )
-        self.use_async = False
+    def _pending_value(self, path: str):
+        """Value of a write of path to next_storage that hasn't completed yet, if any."""
+        if self._flusher is None:
+            return None
+        shard = self._shard(path)
+        with shard.lock:
+            value = shard.forwarding.get(path)
+        if value is not None:
+            return value
+        return self._flusher.get(path)
+
+    def _submit_forwarding(self, shard: _CacheShard):
+        """Queues the values forwarded in a shard with write behind. Must be called without the lock of the shard held,
+        since queuing blocks until there is space, and failed writes take the lock to mark their keys dirty again.
+        """
+        if self._flusher is None:
+            return
+        with shard.submit_lock:
+            with shard.lock:
+                items = dict(shard.forwarding)
+            if not items:
+                return
+            # metadata is written once the chunks it refers to are
+            for barrier in (False, True):
+                batch = {
+                    path: value
+                    for path, value in items.items()
+                    if _is_chunk_key(path) != barrier
+                }
+                # the chunk cache is invalidated by the flusher once the writes complete
+                self._flusher.submit(batch, barrier=barrier)
+                with shard.lock:
+                    for path, value in batch.items():
+                        if shard.forwarding.get(path) is value:
+                            del shard.forwarding[path]
+
+    def _submit_all_forwarding(self):
+        for shard in self._shards:
+            self._submit_forwarding(shard)
+
+    def mark_committed(self, commit_ids: Iterable[str]):
+        """Marks commits as immutable, so that their chunks go through the shared chunk cache of the cache chain."""
+        commit_ids = set(commit_ids)
+        self.committed_ids.update(commit_ids)
+        if isinstance(self.next_storage, LRUCache):
+            self.next_storage.mark_committed(commit_ids)
+
+    def _chunk_cache_key(self, path: str) -> Optional[str]:
+        """Key of the object at path in the shared chunk cache, None if it doesn't go through it."""
+        if (
+            self.chunk_cache is None
+            or not _is_chunk_key(path)
+            or get_chunk_commit_id(path) not in self.committed_ids
+        ):
+            return None
+        storage = self.next_storage
+        while isinstance(storage, LRUCache) and storage.next_storage is not None:
+            storage = storage.next_storage
+        return SharedChunkCache.get_key(storage.root, path)
+
+    def _read_next(self, path: str):
+        """Reads an object from next_storage, through the shared chunk cache for chunks."""
+        key = self._chunk_cache_key(path)
+        if key is None:
+            return self.next_storage[path]
+        return self.chunk_cache.get_or_fetch(key, lambda: self.next_storage[path])  # type: ignore
+
+    def _invalidate_chunk_cache(self, paths):
+        """Removes objects from the shared chunk cache. Called once they are written, so that they can't be fetched again
+        from the old version in between.
+        """
+        for path in paths:
+            key = self._chunk_cache_key(path)
+            if key is not None:
+                self.chunk_cache.invalidate(key)  # type: ignore
+
+    def _on_flushed(self, path: str):
+        self._invalidate_chunk_cache([path])
+
+    def _on_flush_error(self, path: str):
+        """Marks an object that write behind failed to write as dirty again, so that the next flush retries it."""
+        shard = self._shard(path)
+        with shard.lock:
+            if path in shard.policy:
+                shard.dirty[path] = None
+
+    def _shard(self, path: str) -> _CacheShard:
+        if self.num_shards == 1:
+            return self._shards[0]
+        return self._shards[zlib.crc32(path.encode("utf-8")) % self.num_shards]
+
+    @property
+    def dirty_keys(self) -> Dict[str, None]:
+        """Keys present in the cache_storage but not in the next storage. A snapshot, keys are marked and un-marked
+        under the locks of their shards.
+        """
+        keys: Dict[str, None] = {}
+        for shard in self._shards:
+            with shard.lock:
+                keys.update(shard.dirty)
+        return keys
+
+    def _mark_dirty(self, path: str):
+        shard = self._shard(path)
+        with shard.lock:
+            shard.dirty[path] = None
+
+    def _take_dirty(self, paths: Iterable[str]) -> Dict[str, bytes]:
+        """Un-marks the keys that are still dirty among paths and returns their values. Each value is read with its key
+        un-marked under the shard lock, so that a concurrent write of the key marks it again.
+        """
+        items: Dict[str, bytes] = {}
+        for path in paths:
+            shard = self._shard(path)
+            with shard.lock:
+                if path in shard.dirty:
+                    del shard.dirty[path]
+                    items[path] = obj_to_bytes(self.cache_storage[path])
+        return items
+
+    @property
+    def lru_sizes(self) -> Mapping[str, int]:
+        """Sizes of the objects present in the cache_storage, keyed by path."""
+        return _CacheSizes(self)
+
+    @property
+    def cache_used(self) -> int:
+        """Number of bytes of the cache_storage in use."""
+        used = 0
+        for shard in self._shards:
+            with shard.lock:
+                used += shard.used
+        return used
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Number of hits, misses and evictions of the cache since it was created."""
+        return {
+            "hits": sum(shard.hits for shard in self._shards),
+            "misses": sum(shard.misses for shard in self._shards),
+            "evictions": sum(shard.evictions for shard in self._shards),
+        }
+
+    def _touch(self, path: str) -> bool:
+        """Records an access to path. Returns whether it is present in the cache_storage."""
+        shard = self._shard(path)
+        with shard.lock:
+            if path in shard.policy:
+                shard.policy.touch(path)
+                shard.hits += 1
+                return True
+            shard.misses += 1
+            return False
+
+    def _admit(self, path: str, value) -> bool:
+        """Whether an object read from the next storage is kept in the cache."""
+        nbytes = _get_nbytes(value)
+        if self.max_item_size is not None and nbytes > self.max_item_size:
+            return False
+        return nbytes <= self._shard(path).capacity
 
     def register_deeplake_object(self, path: str, obj: DeepLakeMemoryObject):
         """Registers a new object in the cache."""
@@ -80,15 +351,32 @@ class LRUCache(StorageProvider):
     def update_used_cache_for_path(self, path: str, new_size: int):
         if new_size < 0:
             raise ValueError(f"`new_size` must be >= 0. Got: {new_size}")
-        if path in self.lru_sizes:
-            old_size = self.lru_sizes[path]
-            self.cache_used -= old_size
-        self.cache_used += new_size
-        self.lru_sizes[path] = new_size
-
-    def flush(self):
+        shard = self._shard(path)
+        with shard.lock:
+            if path in shard.policy:
+                shard.used -= shard.policy[path]
+            shard.used += new_size
+            shard.policy[path] = new_size
+
+    def remove_from_cache(self, path: str):
+        """Drops the object at path from the cache_storage without writing it to the next storage."""
+        shard = self._shard(path)
+        with shard.lock:
+            shard.dirty.pop(path, None)
+            if path in shard.policy:
+                shard.used -= shard.policy.pop(path)
+            try:
+                del self.cache_storage[path]
+            except KeyError:
+                pass
+
+    def flush(self, blocking: bool = True):
         """Writes data from cache_storage to next_storage. Only the dirty keys are written.
         This is a cascading function and leads to data being written to the final storage in case of a chained cache.
+
+        Args:
+            blocking (bool): With write behind enabled, whether to wait for the writes to complete. If False, the writes are
+                only queued and :meth:`wait` has to be called before the data can be read from the next storage.
         """
         self.check_readonly()
         initial_autoflush = self.autoflush
@@ -98,22 +386,71 @@ class LRUCache(StorageProvider):
                 self[path] = obj
                 obj.is_dirty = False
 
-        if self.dirty_keys:
-            if hasattr(self.next_storage, "set_items") and self.use_async:
-                d = {
-                    key: obj_to_bytes(self.cache_storage[key])
-                    for key in self.dirty_keys
-                }
-                self.next_storage.set_items(d)
-                self.dirty_keys.clear()
-            else:
-                for key in self.dirty_keys.copy():
-                    self._forward(key)
-                if self.next_storage is not None:
-                    self.next_storage.flush()
+        if self._flusher is not None:
+            self._submit_all_forwarding()
+            keys = list(self.dirty_keys)
+            # metadata is written once the chunks it refers to are
+            for batch, barrier in (
+                ([key for key in keys if _is_chunk_key(key)], False),
+                ([key for key in keys if not _is_chunk_key(key)], True),
+            ):
+                # un-marked before they are queued, a write that fails marks its key again
+                items = self._take_dirty(batch)
+                try:
+                    self._flusher.submit(items, barrier=barrier)
+                except Exception:
+                    # the error of an earlier write, nothing was queued
+                    for key in items:
+                        self._mark_dirty(key)
+                    raise
+            if blocking:
+                self.wait()
+        elif self.next_storage is not None:
+            keys = list(self.dirty_keys)
+            if keys:
+                # metadata is written once the chunks it refers to are
+                self._forward_items([key for key in keys if _is_chunk_key(key)])
+                self._forward_items([key for key in keys if not _is_chunk_key(key)])
+                self.next_storage.flush()
 
         self.autoflush = initial_autoflush
 
+    def wait(self):
+        """Blocks until all the writes queued by write behind have reached the next storage, and flushes it.
+
+        Raises:
+            Exception: The error of a queued write that failed.
+        """
+        if self._flusher is None:
+            return
+        self._submit_all_forwarding()
+        self._flusher.wait()
+        if self.next_storage is not None:
+            self.next_storage.flush()
+
+    def close(self):
+        """Waits for the writes queued by write behind and stops its threads. The cache keeps working, writing to the
+        next storage synchronously. Cascades to the next layers of the cache chain.
+
+        Raises:
+            Exception: The error of a queued write that failed.
+        """
+        if self._flusher is not None:
+            try:
+                self._submit_all_forwarding()
+                self._flusher.wait()
+            finally:
+                flusher, self._flusher = self._flusher, None
+                flusher.close()
+        if isinstance(self.next_storage, LRUCache):
+            self.next_storage.close()
+
+    def __del__(self):
+        flusher = getattr(self, "_flusher", None)
+        if flusher is not None:
+            # the queued writes still complete
+            flusher.close(wait=False)
+
     def get_deeplake_object(
         self,
         path: str,
@@ -142,13 +479,18 @@ class LRUCache(StorageProvider):
         """
         if partial_bytes != 0:
             assert issubclass(expected_class, BaseChunk)
-            if path in self.lru_sizes:
-                return self[path]
+            shard = self._shard(path)
+            with shard.lock:
+                if path in shard.policy and isinstance(
+                    self.cache_storage[path], expected_class
+                ):
+                    self._touch(path)
+                    return self.cache_storage[path]
             buff = self.get_bytes(path, 0, partial_bytes)
             obj = expected_class.frombuffer(buff, meta, partial=True)
             obj.data_bytes = PartialReader(self, path, header_offset=obj.header_bytes)
-            if obj.nbytes <= self.cache_size:
-                self._insert_in_cache(path, obj)
+            if self._admit(path, obj):
+                obj = self._insert_object(path, obj)
             return obj
         if url:
             from deeplake.util.remove_cache import get_base_storage
@@ -172,14 +514,20 @@ class LRUCache(StorageProvider):
             return item
 
         if isinstance(item, (bytes, memoryview)):
-            obj = (
-                expected_class.frombuffer(item)
-                if meta is None
-                else expected_class.frombuffer(item, meta)
-            )
+            if meta is None:
+                obj = expected_class.frombuffer(item)
+            elif (
+                issubclass(expected_class, BaseChunk)
+                and isinstance(item, memoryview)
+                and item.readonly
+            ):
+                # read-only buffers, such as memory mapped files, can't change under the chunk and need no copy
+                obj = expected_class.frombuffer(item, meta, copy=False)
+            else:
+                obj = expected_class.frombuffer(item, meta)
 
-            if obj.nbytes <= self.cache_size:
-                self._insert_in_cache(path, obj)
+            if self._admit(path, obj):
+                obj = self._insert_object(path, obj)
 
             return obj
 
@@ -199,21 +547,31 @@ class LRUCache(StorageProvider):
             bytes: The bytes of the object present at the path.
         """
         if path in self.deeplake_objects:
-            if path in self.lru_sizes:
-                self.lru_sizes.move_to_end(path)  # refresh position for LRU
+            self._touch(path)  # refresh position for eviction
             return self.deeplake_objects[path]
-        elif path in self.lru_sizes:
-            self.lru_sizes.move_to_end(path)  # refresh position for LRU
-            return self.cache_storage[path]
-        else:
-            if self.next_storage is not None:
+        with self._shard(path).lock:
+            # the lock keeps other threads from evicting the object before it is read
+            if self._touch(path):
+                return self.cache_storage[path]
+        if self.next_storage is not None:
+            result = self._pending_value(path)
+            if result is None:
                 # fetch from storage, may throw KeyError
-                result = self.next_storage[path]
-
-                if _get_nbytes(result) <= self.cache_size:  # insert in cache if it fits
-                    self._insert_in_cache(path, result)
-                return result
-            raise KeyError(path)
+                result = self._read_next(path)
+
+            if self._admit(path, result):  # insert in cache if it fits
+                self._insert_in_cache(path, result)
+                self._submit_forwarding(self._shard(path))
+            return result
+        raise KeyError(path)
+
+    def _is_fully_cached(self, path: str) -> bool:
+        """Whether the whole object at path is in the cache_storage. Called with the lock of the shard of path held."""
+        if path not in self._shard(path).policy:
+            return False
+        # if it is a partially read chunk in the cache, to get new bytes, we need to look at actual storage and not the cache
+        value = self.cache_storage[path]
+        return not (isinstance(value, BaseChunk) and value.is_partially_read_chunk)
 
     def get_bytes(
         self,
@@ -236,20 +594,51 @@ class LRUCache(StorageProvider):
             KeyError: If an object is not found at the path.
         """
         if path in self.deeplake_objects:
-            if path in self.lru_sizes:
-                self.lru_sizes.move_to_end(path)  # refresh position for LRU
+            self._touch(path)  # refresh position for eviction
             return self.deeplake_objects[path].tobytes()[start_byte:end_byte]
-        # if it is a partially read chunk in the cache, to get new bytes, we need to look at actual storage and not the cache
-        elif path in self.lru_sizes and not (
-            isinstance(self.cache_storage[path], BaseChunk)
-            and self.cache_storage[path].is_partially_read_chunk
+        with self._shard(path).lock:
+            if self._is_fully_cached(path):
+                self._touch(path)  # refresh position for eviction
+                return self.cache_storage[path][start_byte:end_byte]
+        pending = self._pending_value(path)
+        if pending is not None:
+            return pending[start_byte:end_byte]
+        if self.next_storage is not None:
+            key = self._chunk_cache_key(path)
+            if key is not None:
+                data = self.chunk_cache.get_bytes(key, start_byte, end_byte)  # type: ignore
+                if data is not None:
+                    return data
+            return self.next_storage.get_bytes(path, start_byte, end_byte)
+        raise KeyError(path)
+
+    def get_byte_ranges(
+        self, path: str, ranges: Sequence[Tuple[int, int]]
+    ) -> List[bytes]:
+        """Gets multiple byte ranges of the object present at the path.
+        Objects that are not fully cached are read from the next storage with a single bulk request.
+
+        Args:
+            path (str): The path relative to the root of the provider.
+            ranges (Sequence[Tuple[int, int]]): ``(start_byte, end_byte)`` pairs. Ranges may overlap and be unordered.
+
+        Returns:
+            List[bytes]: The bytes of each range, in the order of ``ranges``.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+        """
+        with self._shard(path).lock:
+            cached = path in self.deeplake_objects or self._is_fully_cached(path)
+        key = self._chunk_cache_key(path)
+        if (
+            cached
+            or self.next_storage is None
+            or self._pending_value(path) is not None
+            or (key is not None and key in self.chunk_cache)  # type: ignore
         ):
-            self.lru_sizes.move_to_end(path)  # refresh position for LRU
-            return self.cache_storage[path][start_byte:end_byte]
-        else:
-            if self.next_storage is not None:
-                return self.next_storage.get_bytes(path, start_byte, end_byte)
-            raise KeyError(path)
+            return super().get_byte_ranges(path, ranges)
+        return self.next_storage.get_byte_ranges(path, ranges)
 
     def __setitem__(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
         """Puts the item in the cache_storage (if possible), else writes to next_storage.
@@ -265,15 +654,17 @@ class LRUCache(StorageProvider):
         if path in self.deeplake_objects:
             self.deeplake_objects[path].is_dirty = False
 
-        if path in self.lru_sizes:
-            size = self.lru_sizes.pop(path)
-            self.cache_used -= size
+        shard = self._shard(path)
+        with shard.lock:
+            if path in shard.policy:
+                shard.used -= shard.policy.pop(path)
 
-        if _get_nbytes(value) <= self.cache_size:
-            self._insert_in_cache(path, value)
-            self.dirty_keys[path] = None
-        else:  # larger than cache, directly send to next layer
-            self._forward_value(path, value)
+            if _get_nbytes(value) <= shard.capacity:
+                self._insert_in_cache(path, value)
+                shard.dirty[path] = None
+            else:  # larger than cache, directly send to next layer
+                self._forward_value(path, value)
+        self._submit_forwarding(shard)
 
         self.maybe_flush()
 
@@ -289,17 +680,22 @@ class LRUCache(StorageProvider):
         """
         self.check_readonly()
         deleted_from_cache = False
+        self._submit_forwarding(self._shard(path))
+        if self._pending_value(path) is not None:
+            # the queued write would recreate the object
+            self.wait()
 
         if path in self.deeplake_objects:
             self.remove_deeplake_object(path)
             deleted_from_cache = True
 
-        if path in self.lru_sizes:
-            size = self.lru_sizes.pop(path)
-            self.cache_used -= size
-            del self.cache_storage[path]
-            self.dirty_keys.pop(path, None)
-            deleted_from_cache = True
+        shard = self._shard(path)
+        with shard.lock:
+            if path in shard.policy:
+                shard.used -= shard.policy.pop(path)
+                del self.cache_storage[path]
+                shard.dirty.pop(path, None)
+                deleted_from_cache = True
 
         try:
             if self.next_storage is not None:
@@ -309,6 +705,8 @@ class LRUCache(StorageProvider):
         except KeyError:
             if not deleted_from_cache:
                 raise
+        finally:
+            self._invalidate_chunk_cache([path])
 
     def clear_cache(self):
         """Flushes the content of all the cache layers if not in read mode and and then deletes contents of all the layers of it.
@@ -317,10 +715,15 @@ class LRUCache(StorageProvider):
         self._flush_if_not_read_only()
         self.clear_cache_without_flush()
 
+    def _clear_shards(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.policy.clear()
+                shard.dirty.clear()
+                shard.used = 0
+
     def clear_cache_without_flush(self):
-        self.cache_used = 0
-        self.lru_sizes.clear()
-        self.dirty_keys.clear()
+        self._clear_shards()
         self.cache_storage.clear()
         self.deeplake_objects.clear()
         if self.next_storage is not None and hasattr(self.next_storage, "clear_cache"):
@@ -331,20 +734,22 @@ class LRUCache(StorageProvider):
         This is an IRREVERSIBLE operation. Data once deleted can not be recovered.
         """
         self.check_readonly()
+        if self._flusher is not None:
+            self._submit_all_forwarding()
+            self._flusher.wait()
         if prefix:
             rm = [path for path in self.deeplake_objects if path.startswith(prefix)]
             for path in rm:
                 self.remove_deeplake_object(path)
 
-            rm = [path for path in self.lru_sizes if path.startswith(prefix)]
-            for path in rm:
-                size = self.lru_sizes.pop(path)
-                self.cache_used -= size
-                self.dirty_keys.pop(path, None)
+            for shard in self._shards:
+                with shard.lock:
+                    rm = [path for path in shard.policy if path.startswith(prefix)]
+                    for path in rm:
+                        shard.used -= shard.policy.pop(path)
+                        shard.dirty.pop(path, None)
         else:
-            self.cache_used = 0
-            self.lru_sizes.clear()
-            self.dirty_keys.clear()
+            self._clear_shards()
             self.deeplake_objects.clear()
 
         self.cache_storage.clear(prefix=prefix)
@@ -372,41 +777,73 @@ class LRUCache(StorageProvider):
         if self.next_storage is not None:
             self._forward_value(path, self.cache_storage[path])
 
+    def _forward_items(self, paths: List[str]):
+        """Forwards the values at the given paths to the next storage with bulk writes of at most
+        `max_pending_bytes` each, and un-marks their keys.
+        """
+        values = self._take_dirty(paths)
+        try:
+            items: Dict[str, bytes] = {}
+            nbytes = 0
+            for path, value in values.items():
+                if items and nbytes + len(value) > self.max_pending_bytes:
+                    self.next_storage.set_items(items)
+                    items, nbytes = {}, 0
+                items[path] = value
+                nbytes += len(value)
+            if items:
+                self.next_storage.set_items(items)
+        except Exception:
+            # marked again, so that the next flush retries them
+            for path in values:
+                self._mark_dirty(path)
+            raise
+        self._invalidate_chunk_cache(values)
+
     def _forward_value(self, path, value):
-        """Forwards a path-value pair to the next storage, and un-marks its key.
+        """Forwards a path-value pair to the next storage, and un-marks its key. With write behind, the value is only
+        queued by :meth:`_submit_forwarding`, which callers holding the lock of the shard of path call once they release it.
 
         Args:
             path (str): the path to the object relative to the root of the provider.
             value (bytes, DeepLakeMemoryObject): the value to send to the next storage.
         """
         if self.next_storage is not None:
-            self.dirty_keys.pop(path, None)
-
+            shard = self._shard(path)
+            with shard.lock:
+                shard.dirty.pop(path, None)
+                if self._flusher is not None:
+                    shard.forwarding[path] = obj_to_bytes(value)
+                    return
             if isinstance(value, DeepLakeMemoryObject):
                 self.next_storage[path] = value.tobytes()
             else:
                 self.next_storage[path] = value
+            self._invalidate_chunk_cache([path])
 
-    def _free_up_space(self, extra_size: int):
-        """Helper function that frees up space the requred space in cache.
-            No action is taken if there is sufficient space in the cache.
+    def _free_up_space(self, shard: _CacheShard, extra_size: int):
+        """Helper function that frees up space the requred space in a shard of the cache.
+            No action is taken if there is sufficient space in the shard.
 
         Args:
+            shard (_CacheShard): the shard the space is required in.
             extra_size (int): the space that needs is required in bytes.
         """
-        while self.cache_used > 0 and extra_size + self.cache_used > self.cache_size:
-            self._pop_from_cache()
+        while shard.used > 0 and extra_size + shard.used > shard.capacity:
+            self._pop_from_cache(shard)
 
-    def _pop_from_cache(self):
-        """Helper function that pops the least recently used key, value pair from the cache"""
-        key, itemsize = self.lru_sizes.popitem(last=False)
-        if key in self.dirty_keys:
+    def _pop_from_cache(self, shard: _CacheShard):
+        """Helper function that pops the key, value pair chosen by the eviction policy of the shard from the cache"""
+        key, itemsize = shard.policy.evict()
+        if key in shard.dirty:
             self._forward(key)
         del self.cache_storage[key]
-        self.cache_used -= itemsize
+        shard.used -= itemsize
+        shard.evictions += 1
 
     def _insert_in_cache(self, path: str, value: Union[bytes, DeepLakeMemoryObject]):
-        """Helper function that adds a key value pair to the cache.
+        """Helper function that adds a key value pair to the cache. With write behind, the dirty objects it evicts are
+        queued by :meth:`_submit_forwarding`, which callers call once they no longer hold the lock of the shard of path.
 
         Args:
             path (str): the path relative to the root of the underlying storage.
@@ -415,11 +852,26 @@ class LRUCache(StorageProvider):
         Raises:
             ReadOnlyError: If the provider is in read-only mode.
         """
+        shard = self._shard(path)
+        with shard.lock:
+            self._free_up_space(shard, _get_nbytes(value))
+            self.cache_storage[path] = value  # type: ignore
 
-        self._free_up_space(_get_nbytes(value))
-        self.cache_storage[path] = value  # type: ignore
+            self.update_used_cache_for_path(path, _get_nbytes(value))
 
-        self.update_used_cache_for_path(path, _get_nbytes(value))
+    def _insert_object(self, path: str, obj: DeepLakeMemoryObject):
+        """Adds an object read from the cache chain to the cache, unless a thread reading the same path concurrently
+        already did. Returns the object in the cache, so that all the readers share it.
+        """
+        shard = self._shard(path)
+        with shard.lock:
+            if self._is_fully_cached(path):
+                cached = self.cache_storage[path]
+                if type(cached) == type(obj):
+                    return cached
+            self._insert_in_cache(path, obj)
+        self._submit_forwarding(shard)
+        return obj
 
     def _all_keys(self):
         """Helper function that lists all the objects present in the cache and the underlying storage.
@@ -431,6 +883,11 @@ class LRUCache(StorageProvider):
         if self.next_storage is not None:
             key_set = self.next_storage._all_keys()  # type: ignore
         key_set = set().union(key_set, self.cache_storage._all_keys())
+        if self._flusher is not None:
+            for shard in self._shards:
+                with shard.lock:
+                    key_set.update(shard.forwarding)
+            key_set.update(self._flusher.pending_keys())
         for path, obj in self.deeplake_objects.items():
             if obj.is_dirty:
                 key_set.add(path)
@@ -451,6 +908,14 @@ class LRUCache(StorageProvider):
             "next_storage": self.next_storage,
             "cache_storage": self.cache_storage,
             "cache_size": self.cache_size,
+            "eviction_policy": self.eviction_policy,
+            "num_shards": self.num_shards,
+            "max_item_size": self.max_item_size,
+            "write_behind": self.write_behind,
+            "max_pending_bytes": self.max_pending_bytes,
+            "num_flush_workers": self.num_flush_workers,
+            "chunk_cache": self.chunk_cache,
+            "committed_ids": self.committed_ids,
         }
 
     def __setstate__(self, state: Dict[str, Any]):
@@ -469,9 +934,18 @@ class LRUCache(StorageProvider):
         self.next_storage = state["next_storage"]
         self.cache_storage = state["cache_storage"]
         self.cache_size = state["cache_size"]
-        self.lru_sizes = OrderedDict()
-        self.dirty_keys = OrderedDict()
-        self.cache_used = 0
+        self.eviction_policy = state.get("eviction_policy", "lru")
+        self.num_shards = state.get("num_shards", 1)
+        self.max_item_size = state.get("max_item_size")
+        self._init_shards()
+        self.write_behind = state.get("write_behind", False)
+        self.max_pending_bytes = state.get(
+            "max_pending_bytes", DEFAULT_MAX_PENDING_BYTES
+        )
+        self.num_flush_workers = state.get("num_flush_workers", 8)
+        self._init_flusher()
+        self.chunk_cache = state.get("chunk_cache")
+        self.committed_ids = set(state.get("committed_ids", ()))
         self.deeplake_objects = {}
 
     def get_object_size(self, key: str) -> int:
@@ -481,6 +955,9 @@ class LRUCache(StorageProvider):
         try:
             return self.cache_storage.get_object_size(key)
         except KeyError:
+            pending = self._pending_value(key)
+            if pending is not None:
+                return len(pending)
             if self.next_storage is not None:
                 return self.next_storage.get_object_size(key)
             raise
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
-from typing import Optional, Set, Sequence, Dict
+from typing import Optional, Set, Sequence, Dict, List, Tuple
 
 from deeplake.constants import BYTE_PADDING
 from deeplake.util.assert_byte_indexes import assert_byte_indexes
@@ -188,6 +188,46 @@ class StorageProvider(ABC, MutableMapping):
         for path in paths:
             del self[path]
 
+    def get_items(self, paths: Sequence[str]) -> Dict[str, bytes]:
+        """Gets the objects present at multiple paths.
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the provider.
+
+        Returns:
+            Dict[str, bytes]: The bytes of the objects, keyed by path.
+
+        Raises:
+            KeyError: If an object is not found at one of the paths.
+        """
+        return {path: self[path] for path in paths}
+
+    def set_items(self, items: Dict[str, bytes]):
+        """Sets the objects present at multiple paths.
+
+        Args:
+            items (Dict[str, bytes]): The values to be assigned, keyed by path.
+        """
+        for path, value in items.items():
+            self[path] = value
+
+    def get_byte_ranges(
+        self, path: str, ranges: Sequence[Tuple[int, int]]
+    ) -> List[bytes]:
+        """Gets multiple byte ranges of the object present at the path.
+
+        Args:
+            path (str): The path relative to the root of the provider.
+            ranges (Sequence[Tuple[int, int]]): ``(start_byte, end_byte)`` pairs. Ranges may overlap and be unordered.
+
+        Returns:
+            List[bytes]: The bytes of each range, in the order of ``ranges``.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+        """
+        return [self.get_bytes(path, start, end) for start, end in ranges]
+
     def empty(self) -> bool:
         lock_key = get_dataset_lock_key()
         return len(self) - int(lock_key in self) <= 0
@@ -208,6 +248,3 @@ class StorageProvider(ABC, MutableMapping):
 
     def get_object_size(self, key: str) -> int:
         raise NotImplementedError()
-
-    def async_supported(self) -> bool:
-        return False
@@ -4,11 +4,15 @@ import time
 import boto3
 import botocore  # type: ignore
 import posixpath
-from typing import Dict, Optional, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
 from datetime import datetime, timezone
+from botocore.config import Config
 from botocore.session import ComponentLocator
 from deeplake.client.client import DeepLakeBackendClient
+from deeplake.constants import MB
 from deeplake.core.storage.provider import StorageProvider
+from deeplake.util.byte_ranges import coalesce_byte_ranges
 from deeplake.util.exceptions import (
     S3GetAccessError,
     S3DeletionError,
@@ -43,15 +47,15 @@ try:
 except ImportError:
     pass
 
-try:
-    import aioboto3  # type: ignore
-    import asyncio  # type: ignore
-    import nest_asyncio  # type: ignore
-
-    nest_asyncio.apply()  # needed to run asyncio in jupyter notebook
-except Exception:
-    aioboto3 = None  # type: ignore
-    asyncio = None  # type: ignore
+# number of concurrent requests made by bulk operations
+S3_MAX_CONCURRENCY = 16
+# objects larger than this are uploaded in parts
+S3_MULTIPART_THRESHOLD = 16 * MB
+# size of the parts of multipart uploads, s3 requires at least 5MB
+S3_MULTIPART_CHUNKSIZE = 8 * MB
+S3_MAX_PARTS = 10000
+# byte ranges of an object separated by at most this many bytes are read with one request
+S3_RANGE_COALESCE_GAP = 1 * MB
 
 
 class S3ResetReloadCredentialsManager:
@@ -129,9 +133,7 @@ class S3Provider(StorageProvider):
         self._initialize_s3_parameters()
         self._presigned_urls: Dict[str, Tuple[str, float]] = {}
         self.creds_used: Optional[str] = None
-
-    def async_supported(self) -> bool:
-        return asyncio is not None
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def subdir(self, path: str, read_only: bool = False):
         sd = self.__class__(
@@ -149,7 +151,21 @@ class S3Provider(StorageProvider):
         sd.creds_used = self.creds_used
         return sd
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=S3_MAX_CONCURRENCY, thread_name_prefix="deeplake-s3"
+            )
+        return self._executor
+
+    def _map(self, fn: Callable, iterable: Iterable) -> List:
+        """Applies ``fn`` to the items of ``iterable`` concurrently. Must not be called from the executor's threads."""
+        return list(self._get_executor().map(fn, iterable))
+
     def _set(self, path, content):
+        if len(content) > S3_MULTIPART_THRESHOLD:
+            self._set_multipart(path, content)
+            return
         self.client.put_object(
             Bucket=self.bucket,
             Body=content,
@@ -157,6 +173,39 @@ class S3Provider(StorageProvider):
             ContentType="application/octet-stream",  # signifies binary data
         )
 
+    def _set_multipart(self, path, content):
+        part_size = max(S3_MULTIPART_CHUNKSIZE, ceil(len(content) / S3_MAX_PARTS))
+        upload_id = self.client.create_multipart_upload(
+            Bucket=self.bucket,
+            Key=path,
+            ContentType="application/octet-stream",
+        )["UploadId"]
+
+        def upload_part(part_number):
+            start = (part_number - 1) * part_size
+            resp = self.client.upload_part(
+                Bucket=self.bucket,
+                Key=path,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=content[start : start + part_size],
+            )
+            return {"ETag": resp["ETag"], "PartNumber": part_number}
+
+        try:
+            parts = self._map(upload_part, range(1, ceil(len(content) / part_size) + 1))
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=path,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket, Key=path, UploadId=upload_id
+            )
+            raise
+
     def __setitem__(self, path, content):
         """Sets the object present at the path with the value
 
@@ -459,6 +508,7 @@ class S3Provider(StorageProvider):
         assert set(state.keys()) == self._state_keys()
         self.__dict__.update(state)
         self.start_time = time.time()
+        self._executor = None
         self._initialize_s3_parameters()
 
     def _set_bucket_and_path(self):
@@ -551,20 +601,21 @@ class S3Provider(StorageProvider):
         session = boto3.session.Session(profile_name=self.profile_name)
         self.client = session.client("s3", **kwargs)
         self.resource = session.resource("s3", **kwargs)
-        if aioboto3 is not None:
-            self.async_session = aioboto3.session.Session(
-                profile_name=self.profile_name
-            )
 
     @property
     def s3_kwargs(self):
+        config = self.client_config
+        if config is None or (config.max_pool_connections or 0) < S3_MAX_CONCURRENCY:
+            # one connection per concurrent request of the bulk operations
+            pool_config = Config(max_pool_connections=S3_MAX_CONCURRENCY)
+            config = pool_config if config is None else config.merge(pool_config)
         return {
             "aws_access_key_id": self.aws_access_key_id,
             "aws_secret_access_key": self.aws_secret_access_key,
             "aws_session_token": self.aws_session_token,
             "region_name": self.aws_region,
             "endpoint_url": self.endpoint_url,
-            "config": self.client_config,
+            "config": config,
         }
 
     def need_to_reload_creds(self, err: botocore.exceptions.ClientError) -> bool:
@@ -643,42 +694,72 @@ class S3Provider(StorageProvider):
         except Exception as err:
             raise S3GetError(err) from err
 
-    def _set_items(self, items: dict):
-        async def set_items_async(items):
-            async with self.async_session.client("s3", **self.s3_kwargs) as client:
-                tasks = []
-                for k, v in items.items():
-                    tasks.append(
-                        asyncio.ensure_future(
-                            client.put_object(
-                                Bucket=self.bucket, Key=self.path + k, Body=v
-                            )
-                        )
-                    )
-                await asyncio.gather(*tasks)
+    def set_items(self, items: Dict[str, bytes]):
+        """Sets the objects present at multiple paths, making up to ``S3_MAX_CONCURRENCY`` requests at a time.
+        Objects larger than ``S3_MULTIPART_THRESHOLD`` are uploaded in parts.
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(set_items_async(items))
+        Args:
+            items (Dict[str, bytes]): The values to be assigned, keyed by path.
 
-    def set_items(self, items: dict):
-        try:
-            self._set_items(items)
-        except botocore.exceptions.ClientError as err:
-            with S3ResetReloadCredentialsManager(self, S3SetError):
-                self._set_items(items)
-        except CONNECTION_ERRORS as err:
-            tries = self.num_tries
-            for i in range(1, tries + 1):
-                always_warn(f"Encountered connection error, retry {i} out of {tries}")
-                try:
-                    self._set_items(items)
-                    always_warn(
-                        f"Connection re-established after {i} {['retries', 'retry'][i==1]}."
-                    )
-                    return
-                except Exception:
-                    pass
-            raise S3SetError(err) from err
-        except Exception as err:
-            raise S3SetError(err) from err
+        Raises:
+            S3SetError: Any S3 error encountered while setting the values.
+            ReadOnlyError: If the provider is in read-only mode.
+        """
+        self.check_readonly()
+        executor = self._get_executor()
+        futures = [
+            executor.submit(self.__setitem__, path, value)
+            for path, value in items.items()
+            if len(value) <= S3_MULTIPART_THRESHOLD
+        ]
+        # multipart uploads wait for their parts to be uploaded by the executor, so they are started from this thread
+        for path, value in items.items():
+            if len(value) > S3_MULTIPART_THRESHOLD:
+                self[path] = value
+        for future in futures:
+            future.result()
+
+    def get_items(self, paths: Sequence[str]) -> Dict[str, bytes]:
+        """Gets the objects present at multiple paths, making up to ``S3_MAX_CONCURRENCY`` requests at a time.
+
+        Args:
+            paths (Sequence[str]): The paths relative to the root of the S3Provider.
+
+        Returns:
+            Dict[str, bytes]: The bytes of the objects, keyed by path.
+
+        Raises:
+            KeyError: If an object is not found at one of the paths.
+            S3GetError: Any other error while retrieving the objects.
+        """
+        paths = list(paths)
+        return dict(zip(paths, self._map(self.get_bytes, paths)))
+
+    def get_byte_ranges(
+        self, path: str, ranges: Sequence[Tuple[int, int]]
+    ) -> List[bytes]:
+        """Gets multiple byte ranges of the object present at the path.
+        Ranges separated by at most ``S3_RANGE_COALESCE_GAP`` bytes are read with a single request,
+        and the resulting requests are made concurrently.
+
+        Args:
+            path (str): The path relative to the root of the S3Provider.
+            ranges (Sequence[Tuple[int, int]]): ``(start_byte, end_byte)`` pairs. Ranges may overlap and be unordered.
+
+        Returns:
+            List[bytes]: The bytes of each range, in the order of ``ranges``.
+
+        Raises:
+            KeyError: If an object is not found at the path.
+            S3GetError: Any other error while retrieving the object.
+        """
+        merged = coalesce_byte_ranges(ranges, S3_RANGE_COALESCE_GAP)
+        if len(merged) == 1:
+            buffers = [self.get_bytes(path, merged[0][0], merged[0][1])]
+        else:
+            buffers = self._map(lambda r: self.get_bytes(path, r[0], r[1]), merged)
+        ret: List[bytes] = [b""] * len(ranges)
+        for (start, _, indices), buffer in zip(merged, buffers):
+            for i in indices:
+                ret[i] = buffer[ranges[i][0] - start : ranges[i][1] - start]
+        return ret
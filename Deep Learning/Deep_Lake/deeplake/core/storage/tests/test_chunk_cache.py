@@ -0,0 +1,119 @@
+import os
+import time
+from multiprocessing import get_context
+
+from deeplake.constants import FIRST_COMMIT_ID
+from deeplake.core.storage import LRUCache, MemoryProvider
+from deeplake.core.storage.chunk_cache import (
+    INDEX_COMPACTION_FACTOR,
+    READ_COMPACTION_INTERVAL,
+    SharedChunkCache,
+    get_chunk_commit_id,
+)
+
+
+class CountingProvider(MemoryProvider):
+    def __init__(self, root=""):
+        super().__init__(root)
+        self.reads = 0
+
+    def __getitem__(self, path):
+        self.reads += 1
+        return super().__getitem__(path)
+
+
+def _fetch_once(args):
+    root, counter_dir = args
+    cache = SharedChunkCache(root, 1000)
+
+    def fetch():
+        # record the fetch, and give the other processes time to miss the object
+        open(os.path.join(counter_dir, str(os.getpid())), "w").close()
+        time.sleep(0.2)
+        return b"chunk"
+
+    return cache.get_or_fetch(SharedChunkCache.get_key("s3://bucket", "x"), fetch)
+
+
+def test_chunk_cache(tmp_path):
+    cache = SharedChunkCache(str(tmp_path / "cache"), 100)
+    keys = [SharedChunkCache.get_key("s3://bucket", f"x/chunks/{i}") for i in range(4)]
+    cache.put(keys[0], b"0123456789" * 3)
+    assert cache.get(keys[0]) == b"0123456789" * 3
+    assert cache.get_bytes(keys[0], 2, 5) == b"234"
+    assert cache.get(keys[1]) is None
+
+    cache.put(keys[1], bytes(30))
+    cache.get(keys[0])
+    # another process sees the objects and their recency through the index log
+    other = SharedChunkCache(str(tmp_path / "cache"), 100)
+    for key in keys[2:]:
+        other.put(key, bytes(30))
+    # the least recently read object is evicted to stay under the budget
+    assert keys[1] not in cache
+    assert all(key in cache for key in (keys[0], keys[2], keys[3]))
+
+    cache.invalidate(keys[2])
+    assert keys[2] not in cache
+    # objects larger than the budget are not stored
+    cache.put(keys[1], bytes(101))
+    assert keys[1] not in cache
+    cache.clear()
+    assert not any(key in cache for key in keys)
+
+
+def test_chunk_cache_compacts_on_reads(tmp_path):
+    cache = SharedChunkCache(str(tmp_path / "cache"), 100)
+    key = SharedChunkCache.get_key("s3://bucket", "x/chunks/0")
+    cache.put(key, bytes(10))
+    for _ in range(5 * READ_COMPACTION_INTERVAL):
+        assert cache.get(key) == bytes(10)
+    with open(os.path.join(cache.root, "index.log")) as f:
+        records = f.read().splitlines()
+    assert len(records) <= INDEX_COMPACTION_FACTOR * 257 + READ_COMPACTION_INTERVAL
+    # the rewritten log still has the object
+    assert SharedChunkCache(cache.root, 100).get(key) == bytes(10)
+
+
+def test_chunk_cache_single_fetch(tmp_path):
+    root = str(tmp_path / "cache")
+    counter_dir = tmp_path / "fetches"
+    counter_dir.mkdir()
+    with get_context("spawn").Pool(4) as pool:
+        results = pool.map(_fetch_once, [(root, str(counter_dir))] * 4)
+    assert results == [b"chunk"] * 4
+    assert len(os.listdir(counter_dir)) == 1
+
+
+def test_lru_cache_reads_through_chunk_cache(tmp_path):
+    chunk_cache = SharedChunkCache(str(tmp_path / "cache"), 1000)
+    next_storage = CountingProvider("mem://ds")
+    next_storage["x/chunks/a"] = b"hello world"
+    next_storage["x/tensor_meta.json"] = b"{}"
+
+    for _ in range(2):
+        cache = LRUCache(MemoryProvider(), next_storage, 100, chunk_cache=chunk_cache)
+        assert cache["x/chunks/a"] == b"hello world"
+    # chunks of the head of a branch may be rewritten, they are not shared
+    assert next_storage.reads == 2
+
+    for _ in range(2):
+        cache = LRUCache(MemoryProvider(), next_storage, 100, chunk_cache=chunk_cache)
+        cache.mark_committed([FIRST_COMMIT_ID])
+        assert cache["x/chunks/a"] == b"hello world"
+        assert cache["x/tensor_meta.json"] == b"{}"
+    # the second cache found the chunk on disk
+    assert next_storage.reads == 5
+    assert cache.get_bytes("x/chunks/a", 0, 5) == b"hello"
+
+    # writes remove the chunk from the shared cache
+    cache["x/chunks/a"] = b"bye"
+    cache.flush()
+    other = LRUCache(MemoryProvider(), next_storage, 100, chunk_cache=chunk_cache)
+    other.mark_committed([FIRST_COMMIT_ID])
+    assert other["x/chunks/a"] == b"bye"
+
+
+def test_get_chunk_commit_id():
+    assert get_chunk_commit_id("x/chunks/a") == FIRST_COMMIT_ID
+    assert get_chunk_commit_id("versions/abc/x/chunks/a") == "abc"
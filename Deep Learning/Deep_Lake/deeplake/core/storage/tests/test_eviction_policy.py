@@ -0,0 +1,119 @@
+import threading
+
+import pytest
+
+from deeplake.core.storage import LRUCache, MemoryProvider
+from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.storage.eviction_policy import (
+    EVICTION_POLICIES,
+    LFUPolicy,
+    get_eviction_policy,
+)
+
+
+def test_lfu_policy():
+    policy = LFUPolicy(100)
+    for key in "abc":
+        policy[key] = 1
+    policy.touch("a")
+    policy.touch("a")
+    policy.touch("c")
+    assert policy.evict() == ("b", 1)
+    assert policy.evict() == ("c", 1)
+    assert list(policy) == ["a"]
+
+
+@pytest.mark.parametrize("name", list(EVICTION_POLICIES))
+def test_eviction_policy(name):
+    policy = get_eviction_policy(name, 10)
+    policy["a"] = 1
+    policy["b"] = 2
+    policy["b"] = 3
+    assert dict(policy) == {"a": 1, "b": 3}
+    policy.touch("a")
+    assert policy.pop("b") == 3
+    assert policy.evict() == ("a", 1)
+    assert len(policy) == 0
+    with pytest.raises(KeyError):
+        policy.evict()
+
+    with pytest.raises(ValueError):
+        get_eviction_policy("fifo", 10)
+
+
+@pytest.mark.parametrize("name", ["lfu", "2q", "arc"])
+def test_scan_resistance(name):
+    next_storage = MemoryProvider()
+    for i in range(100):
+        next_storage[f"k{i}"] = b"0" * 10
+    cache = LRUCache(MemoryProvider(), next_storage, 200, eviction_policy=name)
+    hot = [f"k{i}" for i in range(5)]
+    for _ in range(3):
+        for key in hot:
+            cache[key]
+    for i in range(5, 100):
+        cache[f"k{i}"]
+    assert all(key in cache.lru_sizes for key in hot)
+    assert cache.stats["evictions"] > 0
+
+
+@pytest.mark.parametrize("name", list(EVICTION_POLICIES))
+def test_sharded_cache(name):
+    next_storage = MemoryProvider()
+    cache = LRUCache(
+        MemoryProvider(), next_storage, 1000, eviction_policy=name, num_shards=4
+    )
+
+    def work(start):
+        for i in range(start, 200, 4):
+            cache[f"k{i}"] = bytes(i % 20)
+            cache[f"k{start}"]
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    cache.flush()
+    assert cache.dirty_keys == {}
+    assert set(next_storage._all_keys()) == {f"k{i}" for i in range(200)}
+    assert cache.cache_used == sum(cache.lru_sizes[key] for key in cache.lru_sizes)
+    assert cache.cache_used <= 1000
+    assert set(cache.lru_sizes) == set(cache.cache_storage._all_keys())
+    for i in range(200):
+        assert cache[f"k{i}"] == bytes(i % 20)
+
+
+class _Counter(DeepLakeMemoryObject):
+    def __init__(self):
+        super().__init__()
+        self.value = 0
+
+    @property
+    def nbytes(self):
+        return 8
+
+
+def test_concurrent_object_reads():
+    next_storage = MemoryProvider()
+    for i in range(20):
+        next_storage[f"o{i}"] = _Counter().tobytes()
+    cache = LRUCache(MemoryProvider(), next_storage, 1000, num_shards=4)
+    results = [[] for _ in range(8)]
+
+    def work(out):
+        for i in range(20):
+            out.append(cache.get_deeplake_object(f"o{i}", _Counter))
+
+    threads = [threading.Thread(target=work, args=(out,)) for out in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # the readers of a path share the object in the cache
+    for i in range(20):
+        assert len({id(out[i]) for out in results}) == 1
+        assert cache[f"o{i}"] is results[0][i]
+    assert cache.cache_used == 20 * 8
@@ -9,7 +9,10 @@ from deeplake.tests.cache_fixtures import enabled_cache_chains
 from deeplake.core.storage.gcs import GCloudCredentials
 from deeplake.core.storage.google_drive import GDriveProvider
 from deeplake.core.storage.azure import AzureProvider
+from deeplake.core.storage.local import LocalProvider
+from deeplake.core.storage import s3
 from deeplake.util.exceptions import GCSDefaultCredsNotFoundError
+from deeplake.util.storage import storage_provider_from_path
 from google.oauth2.credentials import Credentials  # type: ignore
 import os
 import pytest
@@ -47,6 +50,22 @@ def check_storage_provider(storage):
     for _ in storage:
         pass
 
+    storage.set_items({FILE_1: b"hello world", FILE_2: b"0123456789"})
+    assert storage.get_items([FILE_2, FILE_1]) == {
+        FILE_1: b"hello world",
+        FILE_2: b"0123456789",
+    }
+    # unordered, overlapping, adjacent and empty ranges
+    assert storage.get_byte_ranges(
+        FILE_1, [(6, 11), (0, 5), (2, 7), (5, 6), (3, 3)]
+    ) == [
+        b"world",
+        b"hello",
+        b"llo w",
+        b" ",
+        b"",
+    ]
+
     del storage[FILE_1]
     del storage[FILE_2]
 
@@ -209,3 +228,56 @@ def test_read_from_full_url(storage, color_image_paths):
     storage["sample/samplejpg.jpg"] = byts
     data = storage.get_object_from_full_url(f"{storage.root}/sample/samplejpg.jpg")
     assert byts == data
+
+
+@pytest.mark.parametrize("storage", ["s3_storage"], indirect=True)
+def test_s3_multipart(storage, monkeypatch):
+    monkeypatch.setattr(s3, "S3_MULTIPART_THRESHOLD", 6 * MB)
+    monkeypatch.setattr(s3, "S3_MULTIPART_CHUNKSIZE", 5 * MB)
+    items = {f"{KEY}_{i}": os.urandom(12 * MB + i) for i in range(2)}
+    items[f"{KEY}_small"] = b"hello world"
+
+    storage.set_items(items)
+    assert storage.get_items(list(items)) == items
+    ranges = [(0, 10), (6 * MB, 6 * MB + 10), (10 * MB, 12 * MB)]
+    assert storage.get_byte_ranges(f"{KEY}_1", ranges) == [
+        items[f"{KEY}_1"][start:end] for start, end in ranges
+    ]
+    for key in items:
+        del storage[key]
+
+
+def test_local_mmap(local_path):
+    storage = LocalProvider(local_path, use_mmap=True)
+    check_storage_provider(storage)
+
+    key = "tensor/chunks/abc"
+    storage[key] = b"hello world"
+    value = storage[key]
+    assert isinstance(value, memoryview) and value.readonly
+    assert value == b"hello world"
+    assert storage.get_bytes(key, 2, 5) == b"llo"
+
+    # rewriting the file leaves previous reads untouched
+    storage[key] = b"bye"
+    assert value == b"hello world"
+    assert storage[key] == b"bye"
+
+    # files get the permissions of files written without memory mapping
+    LocalProvider(local_path)["tensor/chunks/def"] = b"hello"
+    modes = [
+        os.stat(os.path.join(local_path, path)).st_mode & 0o777
+        for path in (key, "tensor/chunks/def")
+    ]
+    assert modes[0] == modes[1]
+
+    # only chunks are mapped
+    storage["tensor/tensor_meta.json"] = b"{}"
+    assert storage["tensor/tensor_meta.json"] == b"{}"
+    assert not isinstance(storage["tensor/tensor_meta.json"], memoryview)
+
+    storage = pickle.loads(pickle.dumps(storage))
+    assert storage.use_mmap
+    assert isinstance(storage[key], memoryview)
+    assert storage_provider_from_path(local_path, use_mmap=True).use_mmap
+    storage.clear()
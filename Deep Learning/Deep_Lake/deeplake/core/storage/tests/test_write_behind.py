@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from deeplake.core.storage import LRUCache, MemoryProvider
+
+
+class RecordingProvider(MemoryProvider):
+    def __init__(self, root=""):
+        super().__init__(root)
+        self.writes = []
+        self.lock = threading.Lock()
+
+    def __setitem__(self, path, value):
+        if "/chunks/" in path:
+            # chunks are slower to write than metadata
+            time.sleep(0.01)
+        with self.lock:
+            self.writes.append(path)
+        super().__setitem__(path, value)
+
+
+class FailingProvider(MemoryProvider):
+    def __setitem__(self, path, value):
+        raise OSError(path)
+
+
+class SlowFailingProvider(MemoryProvider):
+    def __setitem__(self, path, value):
+        time.sleep(0.2)
+        raise OSError(path)
+
+
+def test_write_behind():
+    next_storage = RecordingProvider()
+    cache = LRUCache(
+        MemoryProvider(), next_storage, 100, write_behind=True, max_pending_bytes=50
+    )
+    for i in range(20):
+        cache[f"x/chunks/{i}"] = bytes([i]) * 20
+    # evicted objects are readable while they are being written
+    for i in range(20):
+        assert cache[f"x/chunks/{i}"] == bytes([i]) * 20
+        assert cache.get_bytes(f"x/chunks/{i}", 0, 2) == bytes([i]) * 2
+
+    cache["x/tensor_meta.json"] = b"{}"
+    cache["x/chunks/last"] = b"0"
+    cache.flush()
+    assert cache.dirty_keys == {}
+    writes = next_storage.writes
+    assert writes.index("x/tensor_meta.json") > writes.index("x/chunks/last")
+    for i in range(20):
+        assert next_storage[f"x/chunks/{i}"] == bytes([i]) * 20
+
+    cache["x/chunks/0"] = b"1"
+    cache.flush(blocking=False)
+    cache.wait()
+    assert next_storage["x/chunks/0"] == b"1"
+
+    # after close, the cache writes synchronously
+    cache.close()
+    cache["x/chunks/0"] = b"2"
+    cache.flush()
+    assert next_storage["x/chunks/0"] == b"2"
+
+
+def test_write_behind_error():
+    cache = LRUCache(MemoryProvider(), FailingProvider(), 100, write_behind=True)
+    cache["x/chunks/0"] = b"0"
+    with pytest.raises(OSError):
+        cache.flush()
+    # the failed write is retried by the next flush
+    assert "x/chunks/0" in cache.dirty_keys
+    with pytest.raises(OSError):
+        cache.flush()
+
+
+def test_write_behind_error_while_evicting():
+    cache = LRUCache(
+        MemoryProvider(),
+        SlowFailingProvider(),
+        100,
+        write_behind=True,
+        max_pending_bytes=40,
+    )
+
+    def write():
+        for path, nbytes in [
+            ("x/chunks/0", 20),
+            ("x/tensor_meta.json", 20),
+            ("x/chunks/1", 30),
+            ("x/chunks/2", 30),
+            ("x/chunks/3", 20),  # evicts x/chunks/0
+            ("x/chunks/4", 20),  # evicts the meta, whose write waits for x/chunks/0
+            ("x/chunks/5", 30),  # evicts x/chunks/1, waiting for space in the queue
+        ]:
+            try:
+                cache[path] = bytes(nbytes)
+            except OSError:
+                pass
+
+    # the wait for space doesn't hold the shard lock, which the failed write of the meta takes to mark it again
+    thread = threading.Thread(target=write, daemon=True)
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive()
@@ -0,0 +1,156 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from deeplake.constants import MB
+from deeplake.core.storage.provider import StorageProvider
+
+
+DEFAULT_MAX_PENDING_BYTES = 256 * MB
+
+
+class WriteBehindFlusher:
+    """Writes objects to a storage provider in background threads.
+
+    Writes of the same key land in the order they were submitted. Writes submitted with ``barrier=True`` only start
+    once every write submitted before them has completed, which is used to write metadata after the chunks it refers to.
+    Until a write completes, the value being written can be read back with :meth:`get`.
+    """
+
+    def __init__(
+        self,
+        storage: StorageProvider,
+        num_workers: int = 8,
+        max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES,
+        on_write: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Args:
+            storage (StorageProvider): The provider the objects are written to.
+            num_workers (int): Number of concurrent writes.
+            max_pending_bytes (int): Submitting writes blocks while more than this many bytes are waiting to be written.
+            on_write (Callable, optional): Called with the path of every object once it is written.
+            on_error (Callable, optional): Called with the path of every object that could not be written, including the
+                ones skipped because a write they depend on failed.
+        """
+        self.storage = storage
+        self.on_write = on_write
+        self.on_error = on_error
+        self.num_workers = num_workers
+        self.max_pending_bytes = max_pending_bytes
+        self._executor = ThreadPoolExecutor(
+            max_workers=num_workers, thread_name_prefix="deeplake-write-behind"
+        )
+        # reentrant, done callbacks run in the submitting thread when the write has already completed
+        self._lock = threading.RLock()
+        self._pending: Dict[str, Tuple[bytes, Future]] = {}
+        self._futures: Dict[Future, int] = {}
+        self._pending_bytes = 0
+        self._error: Optional[BaseException] = None
+
+    def _write(self, dependencies: List[Future], path: str, value: bytes):
+        for future in dependencies:
+            if future.exception() is not None:
+                # the write this one depends on failed, the error is reported by wait()
+                if self.on_error is not None:
+                    self.on_error(path)
+                return
+        self.storage[path] = value
+        if self.on_write is not None:
+            self.on_write(path)
+
+    def _done(self, path: str, future: Future):
+        with self._lock:
+            self._pending_bytes -= self._futures.pop(future)
+            if path in self._pending and self._pending[path][1] is future:
+                del self._pending[path]
+            if future.exception() is not None and self._error is None:
+                self._error = future.exception()
+        # outside of the lock, the callback may take locks of its own
+        if future.exception() is not None and self.on_error is not None:
+            self.on_error(path)
+
+    def _raise_error(self):
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _wait_for_space(self, nbytes: int):
+        while True:
+            with self._lock:
+                if (
+                    not self._futures
+                    or self._pending_bytes + nbytes <= self.max_pending_bytes
+                ):
+                    return
+                futures = list(self._futures)
+            wait(futures, return_when=FIRST_COMPLETED)
+
+    def submit(self, items: Dict[str, bytes], barrier: bool = False):
+        """Queues objects to be written.
+
+        Args:
+            items (Dict[str, bytes]): Objects to write, keyed by path.
+            barrier (bool): If True, the objects are written after every write submitted before them has completed.
+
+        Raises:
+            Exception: The error of a previously submitted write that failed.
+        """
+        self._raise_error()
+        if not items:
+            return
+        self._wait_for_space(sum(len(value) for value in items.values()))
+        with self._lock:
+            previous = list(self._futures) if barrier else []
+            for path, value in items.items():
+                dependencies = previous
+                if path in self._pending:
+                    dependencies = previous + [self._pending[path][1]]
+                future = self._executor.submit(self._write, dependencies, path, value)
+                self._pending[path] = (value, future)
+                self._futures[future] = len(value)
+                self._pending_bytes += len(value)
+                future.add_done_callback(lambda f, path=path: self._done(path, f))
+
+    def get(self, path: str) -> Optional[bytes]:
+        """Returns the value of a write of ``path`` that hasn't completed yet, if any."""
+        with self._lock:
+            entry = self._pending.get(path)
+        return None if entry is None else entry[0]
+
+    def pending_keys(self) -> List[str]:
+        with self._lock:
+            return list(self._pending)
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    def wait(self):
+        """Blocks until every submitted write has completed.
+
+        Raises:
+            Exception: The error of a write that failed.
+        """
+        while True:
+            with self._lock:
+                futures = list(self._futures)
+            if not futures:
+                break
+            wait(futures)
+        self._raise_error()
+
+    def close(self, wait: bool = True):
+        """Stops the threads once the submitted writes have completed.
+
+        Args:
+            wait (bool): Whether to block until then.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __del__(self):
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
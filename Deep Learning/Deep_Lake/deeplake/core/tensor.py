@@ -28,6 +28,7 @@ from deeplake.util.keys import (
     get_tensor_commit_diff_key,
     get_tensor_meta_key,
     get_tensor_tile_encoder_key,
+    get_tensor_chunk_stats_key,
     get_sequence_encoder_key,
     tensor_exists,
     get_tensor_info_key,
@@ -67,6 +68,17 @@ import warnings
 import webbrowser
 
 
+# hooks called with the dataset and the tensor after the data of a tensor changes, by id
+_TENSOR_WRITE_HOOKS: Dict[str, Callable] = {}
+
+
+def add_tensor_write_hook(hook: Callable, id: str):
+    """Registers a function called with the dataset and the tensor every time the data of a tensor changes.
+    Registering another function with the same ``id`` replaces it.
+    """
+    _TENSOR_WRITE_HOOKS[id] = hook
+
+
 def create_tensor(
     key: str,
     storage: StorageProvider,
@@ -175,6 +187,12 @@ def delete_tensor(key: str, dataset):
     except KeyError:
         pass
 
+    chunk_stats_key = get_tensor_chunk_stats_key(key, commit_id)
+    try:
+        del storage[chunk_stats_key]
+    except KeyError:
+        pass
+
     seq_encoder_key = get_sequence_encoder_key(key, commit_id)
     try:
         del storage[seq_encoder_key]
@@ -320,6 +338,7 @@ class Tensor:
         )
         dataset_written(self.dataset)
         self.invalidate_libdeeplake_dataset()
+        self._tensor_written()
 
     @invalid_view_op
     def _extend_with_paths(
@@ -338,6 +357,7 @@ class Tensor:
         )
         dataset_written(self.dataset)
         self.invalidate_libdeeplake_dataset()
+        self._tensor_written()
 
     @property
     def info(self) -> Info:
@@ -412,6 +432,7 @@ class Tensor:
         except TensorDoesNotExistError:
             pass
         self.invalidate_libdeeplake_dataset()
+        self._tensor_written()
 
     def modified_samples(
         self, target_id: Optional[str] = None, return_indexes: Optional[bool] = False
@@ -736,6 +757,7 @@ class Tensor:
             )
         dataset_written(self.dataset)
         self.invalidate_libdeeplake_dataset()
+        self._tensor_written()
 
     def __iter__(self):
         for i in range(len(self)):
@@ -1085,6 +1107,7 @@ class Tensor:
             sample_id=sample_id,
         )
         self.invalidate_libdeeplake_dataset()
+        self._tensor_written()
 
     def _pop_links(self, global_sample_index: int):
         # meta.links contain tensor keys not names
@@ -1365,3 +1388,8 @@ class Tensor:
     def invalidate_libdeeplake_dataset(self):
         """Invalidates the libdeeplake dataset object."""
         self.dataset.libdeeplake_dataset = None
+
+    def _tensor_written(self):
+        """Calls the hooks registered with :func:`add_tensor_write_hook`, after the data of the tensor changed."""
+        for hook in list(_TENSOR_WRITE_HOOKS.values()):
+            hook(self.dataset, self)
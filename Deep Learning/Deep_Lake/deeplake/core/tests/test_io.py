@@ -1,7 +1,9 @@
+import threading
 from typing import Iterator
 
 from deeplake.util.testing import assert_array_equal
 from deeplake.core.io import (
+    ChunkReadAhead,
     IOBlock,
     Streaming,
     Schedule,
@@ -28,3 +30,47 @@ def test_sequential_scheduler():
     assert_array_equal([b.indices() for b in result[1]._blocks], [[2, 6, 10]])
     assert_array_equal([b.indices() for b in result[2]._blocks], [[3, 7], [11]])
     assert_array_equal([b.indices() for b in result[3]._blocks], [[4, 8], [12]])
+
+
+def test_chunk_read_ahead():
+    blocks = [
+        IOBlock([["a"]], [0, 1]),
+        IOBlock([["a", "b"]], [2]),
+        IOBlock([["c"]], [3]),
+        IOBlock([["d"]], [4]),
+    ]
+    fetched = []
+    lock = threading.Lock()
+
+    def fetch(tensor, key):
+        with lock:
+            fetched.append(key)
+        return key.upper()
+
+    read_ahead = ChunkReadAhead(
+        blocks,
+        lambda block: {key: ("t", 10) for key in block.chunk_names(0)},
+        fetch,
+        max_blocks=3,
+        memory_budget=20,
+    )
+    try:
+        assert read_ahead.get("a") == "A"
+        assert read_ahead.get("b") == "B"
+        # "c" would exceed the memory budget
+        assert read_ahead.get("c") is None
+
+        read_ahead.advance()
+        # "a" is still held for the second block
+        assert read_ahead.get("a") == "A"
+        assert read_ahead.get("c") is None
+
+        read_ahead.advance()
+        assert read_ahead.get("a") is None
+        assert read_ahead.get("c") == "C"
+        assert read_ahead.get("d") == "D"
+    finally:
+        read_ahead.close()
+
+    # chunks shared by blocks are fetched once
+    assert sorted(fetched) == ["a", "b", "c", "d"]
@@ -18,10 +18,13 @@ from deeplake.util.exceptions import (
     TransformError,
 )
 from deeplake.tests.common import parametrize_num_workers
-from deeplake.util.transform import get_pbar_description
+from deeplake.util.transform import create_slices, get_pbar_description
 import deeplake
 import gc
 import re
+import threading
+import time
+from collections import Counter
 from deeplake.tests.common import get_dummy_data_path
 
 
@@ -1633,6 +1636,45 @@ def test_no_corruption(local_ds):
     assert ds.labels.numpy().shape == (40, 1)
 
 
+def test_transform_units_per_worker(local_ds):
+    data_in = list(range(32))
+    slices, offsets = create_slices(data_in, TRANSFORM_TEST_NUM_WORKERS)
+    assert offsets == [0, 16]
+    slices, offsets = create_slices(data_in, TRANSFORM_TEST_NUM_WORKERS, 4)
+    assert offsets == list(range(0, 32, 4))
+    assert slices == [data_in[i : i + 4] for i in offsets]
+
+    workers = {}
+
+    @deeplake.compute
+    def upload(i, ds):
+        # the first unit is much slower than the rest
+        if i < 4:
+            time.sleep(0.25)
+        workers[i] = threading.get_ident()
+        ds.abc.append(i)
+
+    with local_ds as ds:
+        ds.create_tensor("abc")
+
+    upload().eval(
+        data_in,
+        ds,
+        num_workers=TRANSFORM_TEST_NUM_WORKERS,
+        units_per_worker=4,
+        disable_rechunk=True,
+    )
+    assert ds.abc.numpy().reshape(-1).tolist() == data_in
+
+    # each unit is processed by a single worker
+    unit_workers = [{workers[i] for i in data_in[o : o + 4]} for o in offsets]
+    assert all(len(unit) == 1 for unit in unit_workers)
+    units = Counter(unit.pop() for unit in unit_workers)
+    assert sum(units.values()) == 8
+    # the other worker takes the units queued behind the slow one
+    assert units[workers[0]] < 4
+
+
 def test_ds_append_empty(local_ds):
     @deeplake.compute
     def upload(stuff, ds):
@@ -1682,3 +1724,115 @@ def test_catch_value_error(local_path):
         )
         assert e.index == 20
         assert e.sample == 10
+
+
+@pytest.mark.parametrize("checkpoint_interval", [0, 8])
+def test_transform_stream_input(local_ds, checkpoint_interval):
+    @deeplake.compute
+    def upload(i, ds):
+        if i == 21:
+            raise Exception("test")
+        ds.abc.append(i)
+
+    def gen(n):
+        yield from range(n)
+
+    async def agen(n):
+        for i in range(n):
+            yield i
+
+    with local_ds as ds:
+        ds.create_tensor("abc")
+
+    upload().eval(
+        gen(20),
+        ds,
+        num_workers=TRANSFORM_TEST_NUM_WORKERS,
+        checkpoint_interval=checkpoint_interval,
+    )
+    assert ds.abc.numpy(aslist=True) == list(range(20))
+
+    ds.abc.clear()
+    upload().eval(agen(20), ds, num_workers=0, checkpoint_interval=checkpoint_interval)
+    assert ds.abc.numpy(aslist=True) == list(range(20))
+
+    # empty input, no checkpoint is committed
+    commit_id = ds.commit_id
+    upload().eval(
+        gen(0),
+        ds,
+        num_workers=TRANSFORM_TEST_NUM_WORKERS,
+        checkpoint_interval=checkpoint_interval,
+    )
+    assert len(ds.abc) == 20
+    assert ds.commit_id == commit_id
+
+    ds.abc.clear()
+    with pytest.raises(TransformError) as e:
+        upload().eval(
+            gen(30),
+            ds,
+            num_workers=TRANSFORM_TEST_NUM_WORKERS,
+            checkpoint_interval=checkpoint_interval,
+        )
+    # the index is relative to the start of the input
+    assert e.value.index == 21
+    if checkpoint_interval:
+        assert len(ds.abc) == 16
+        assert e.value.samples_processed == 16
+
+
+def test_class_label_merge(local_ds):
+    @deeplake.compute
+    def upload(label, ds):
+        ds.label.append(label)
+
+    with local_ds as ds:
+        ds.create_tensor("label", htype="class_label", class_names=["a"])
+
+    data = ["b", "c", "a", "c", "d", "b", "e", "a"] * 2
+    upload().eval(data, ds, num_workers=TRANSFORM_TEST_NUM_WORKERS)
+
+    class_names = ds.label.info.class_names
+    assert class_names[0] == "a"
+    assert sorted(class_names) == ["a", "b", "c", "d", "e"]
+    labels = ds.label.numpy().reshape(-1).tolist()
+    assert [class_names[label] for label in labels] == data
+    # labels are written once, without hidden temporary tensors
+    assert not any(tensor.startswith("__temp") for tensor in ds._tensors())
+
+
+def test_class_label_merge_ragged(local_ds):
+    @deeplake.compute
+    def upload(labels, ds):
+        ds.labels.append(labels)
+
+    with local_ds as ds:
+        ds.create_tensor("labels", htype="class_label", class_names=["a"])
+
+    data = [["b"], ["c", "a"], [], ["d", "b", "e"]] * 4
+    upload().eval(data, ds, num_workers=TRANSFORM_TEST_NUM_WORKERS)
+
+    class_names = ds.labels.info.class_names
+    assert sorted(class_names) == ["a", "b", "c", "d", "e"]
+    labels = ds.labels.numpy(aslist=True)
+    assert [[class_names[i] for i in sample] for sample in labels] == data
+
+
+def test_class_label_merge_int_labels(local_ds):
+    @deeplake.compute
+    def upload(label, ds):
+        ds.label.append(label)
+
+    with local_ds as ds:
+        ds.create_tensor("label", htype="class_label", class_names=["a", "b"])
+
+    # indexes of existing class names can be mixed with new class names
+    upload().eval(["c", 1, "a", 0, "d"] * 2, ds, num_workers=TRANSFORM_TEST_NUM_WORKERS)
+    class_names = ds.label.info.class_names
+    labels = ds.label.numpy().reshape(-1).tolist()
+    assert [class_names[label] for label in labels] == ["c", "b", "a", "a", "d"] * 2
+
+    # indexes that new class names may get can't
+    with pytest.raises(TransformError):
+        upload().eval(["e", 7] * 4, ds, num_workers=TRANSFORM_TEST_NUM_WORKERS)
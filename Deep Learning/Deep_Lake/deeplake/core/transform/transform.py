@@ -13,10 +13,13 @@ from deeplake.util.transform import (
     check_transform_ds_out,
     close_states,
     create_slices,
+    DEFAULT_STREAM_BATCH_SIZE,
     delete_overwritten_chunks,
     get_lengths_generated,
     get_old_chunk_paths,
     get_pbar_description,
+    is_stream_input,
+    iterate_batches,
     prepare_data_in,
     process_transform_result,
     reload_and_rechunk,
@@ -34,11 +37,9 @@ from deeplake.util.exceptions import (
 )
 from deeplake.hooks import dataset_written, dataset_read
 from deeplake.util.version_control import auto_checkout
-from deeplake.util.class_label import sync_labels
+from deeplake.util.class_label import merge_class_labels
 from deeplake.constants import DEFAULT_TRANSFORM_SAMPLE_CACHE_SIZE
 
-import posixpath
-
 
 class ComputeFunction:
     def __init__(self, func, args, kwargs, name: Optional[str] = None):
@@ -62,12 +63,14 @@ class ComputeFunction:
         cache_size: int = DEFAULT_TRANSFORM_SAMPLE_CACHE_SIZE,
         checkpoint_interval: int = 0,
         ignore_errors: bool = False,
+        units_per_worker: int = 1,
         **kwargs,
     ):
         """Evaluates the ComputeFunction on data_in to produce an output dataset ds_out.
 
         Args:
             data_in: Input passed to the transform to generate output dataset. Should support \__getitem__ and \__len__. Can be a Deep Lake dataset.
+                Can also be an iterable without a length, such as a generator or an async generator, which is consumed in batches of ``checkpoint_interval`` samples, or 1000 samples if checkpointing is disabled.
             ds_out (Dataset, optional): The dataset object to which the transform will get written. If this is not provided, data_in will be overwritten if it is a Deep Lake dataset, otherwise error will be raised.
                 It should have all keys being generated in output already present as tensors. It's initial state should be either:-
                 - Empty i.e. all tensors have no samples. In this case all samples are added to the dataset.
@@ -87,6 +90,8 @@ class ComputeFunction:
             checkpoint_interval (int): If > 0, the transform will be checkpointed with a commit every ``checkpoint_interval`` input samples to avoid restarting full transform due to intermitten failures. If the transform is interrupted, the intermediate data is deleted and the dataset is reset to the last commit.
                 If <= 0, no checkpointing is done. Checkpoint interval should be a multiple of num_workers if num_workers > 0. Defaults to 0.
             ignore_errors (bool): If ``True``, input samples that causes transform to fail will be skipped and the errors will be ignored **if possible**.
+            units_per_worker (int): If > 1, the input is split into ``num_workers * units_per_worker`` slices which are handed out to the workers as they become free,
+                instead of one slice per worker. This keeps workers busy when some samples are much slower to process than others, at the cost of writing more, smaller chunks. Defaults to 1.
             **kwargs: Additional arguments.
 
         Raises:
@@ -111,6 +116,7 @@ class ComputeFunction:
             cache_size,
             checkpoint_interval,
             ignore_errors,
+            units_per_worker=units_per_worker,
             **kwargs,
         )
 
@@ -141,12 +147,14 @@ class Pipeline:
         checkpoint_interval: int = 0,
         ignore_errors: bool = False,
         verbose: bool = True,
+        units_per_worker: int = 1,
         **kwargs,
     ):
         """Evaluates the pipeline on ``data_in`` to produce an output dataset ``ds_out``.
 
         Args:
             data_in: Input passed to the transform to generate output dataset. Should support \__getitem__ and \__len__. Can be a Deep Lake dataset.
+                Can also be an iterable without a length, such as a generator or an async generator, which is consumed in batches of ``checkpoint_interval`` samples, or 1000 samples if checkpointing is disabled.
             ds_out (Dataset, optional): - The dataset object to which the transform will get written. If this is not provided, ``data_in`` will be overwritten if it is a Deep Lake dataset, otherwise error will be raised.
                 - It should have all keys being generated in output already present as tensors. It's initial state should be either:
                 - **Empty**, i.e., all tensors have no samples. In this case all samples are added to the dataset.
@@ -167,6 +175,8 @@ class Pipeline:
                 If <= 0, no checkpointing is done. Checkpoint interval should be a multiple of num_workers if num_workers > 0. Defaults to 0.
             ignore_errors (bool): If ``True``, input samples that causes transform to fail will be skipped and the errors will be ignored **if possible**.
             verbose (bool): If ``True``, prints additional information about the transform.
+            units_per_worker (int): If > 1, the input is split into ``num_workers * units_per_worker`` slices which are handed out to the workers as they become free,
+                instead of one slice per worker. This keeps workers busy when some samples are much slower to process than others, at the cost of writing more, smaller chunks. Defaults to 1.
             **kwargs: Additional arguments.
 
         Raises:
@@ -233,7 +243,8 @@ class Pipeline:
             skip_ok = True
 
         checkpointing_enabled = checkpoint_interval > 0
-        total_samples = len(data_in)
+        streaming = is_stream_input(data_in)
+        total_samples = None if streaming else len(data_in)
         if checkpointing_enabled:
             check_checkpoint_interval(
                 data_in,
@@ -242,39 +253,69 @@ class Pipeline:
                 overwrite,
                 verbose,
             )
+        if streaming:
+            # samples are pulled from the input a batch at a time, the length of the input is unknown
+            datas_in = iterate_batches(
+                data_in, checkpoint_interval or DEFAULT_STREAM_BATCH_SIZE
+            )
+        elif checkpointing_enabled:
             datas_in = [
-                data_in[i : i + checkpoint_interval]
+                (
+                    data_in[i : i + checkpoint_interval],
+                    i + checkpoint_interval >= len(data_in),
+                )
                 for i in range(0, len(data_in), checkpoint_interval)
             ]
-
         else:
-            datas_in = [data_in]
+            datas_in = [(data_in, True)]
 
         samples_processed = 0
         desc = get_pbar_description(self.functions)
         if progressbar:
-            pbar = get_progress_bar(len(data_in), desc)
+            pbar = get_progress_bar(total_samples, desc)
             pqueue = compute_provider.create_queue()
         else:
             pbar, pqueue = None, None
         desc = desc.split()[1]
         completed = False
         progress = 0.0
-        for data_in in datas_in:
+        for data_in, end in datas_in:
+            if streaming and not data_in:
+                # the iterable was empty, there is nothing to run or checkpoint
+                target_ds._send_compute_progress(
+                    compute_id=compute_id, progress=100.0, end=True, status="success"
+                )
+                reload_and_rechunk(
+                    overwrite,
+                    original_data_in,
+                    target_ds,
+                    initial_autoflush,
+                    pad_data_in,
+                    initial_padding_state,
+                    kwargs,
+                    True,
+                )
+                break
             if checkpointing_enabled:
+                progress_desc = (
+                    f"{samples_processed} samples"
+                    if streaming
+                    else f"{progress}% progress"
+                )
                 target_ds._commit(
-                    f"Auto-commit during deeplake.compute of {desc} after {progress}% progress",
+                    f"Auto-commit during deeplake.compute of {desc} after {progress_desc}",
                     None,
                     False,
                     is_checkpoint=True,
                     total_samples_processed=samples_processed,
                 )
-            progress = round(
-                (samples_processed + len(data_in)) / total_samples * 100, 2
-            )
-            end = progress == 100
+            if streaming:
+                progress = 100.0 if end else 0.0
+            else:
+                progress = round(
+                    (samples_processed + len(data_in)) / total_samples * 100, 2  # type: ignore
+                )
             progress_args = {"compute_id": compute_id, "progress": progress, "end": end}
-
             try:
                 self.run(
                     data_in,
@@ -290,6 +331,7 @@ class Pipeline:
                     pbar,
                     pqueue,
                     ignore_errors,
+                    units_per_worker=units_per_worker,
                     **kwargs,
                 )
                 target_ds._send_compute_progress(**progress_args, status="success")
@@ -306,7 +348,7 @@ class Pipeline:
                 index, sample = None, None
                 if isinstance(e, TransformError):
                     index, sample = e.index, e.sample
-                    if checkpointing_enabled and isinstance(index, int):
+                    if (checkpointing_enabled or streaming) and isinstance(index, int):
                         index = samples_processed + index
                     e = e.__cause__  # type: ignore
                 if isinstance(e, AllSamplesSkippedError):
@@ -345,6 +387,7 @@ class Pipeline:
         pbar=None,
         pqueue=None,
         ignore_errors: bool = False,
+        units_per_worker: int = 1,
         **kwargs,
     ):
         """Runs the pipeline on the input data to produce output samples and stores in the dataset.
@@ -352,45 +395,26 @@ class Pipeline:
         """
         if isinstance(data_in, deeplake.Dataset):
             dataset_read(data_in)
-        slices, offsets = create_slices(data_in, num_workers)
+        if scheduler == "serial":
+            units_per_worker = 1
+        slices, offsets = create_slices(data_in, num_workers, units_per_worker)
         storage = get_base_storage(target_ds.storage)
-        class_label_tensors = (
-            [
-                tensor.key
+        # labels are converted by each worker with its own copy of the class names, which are merged afterwards
+        class_label_names = (
+            {
+                tensor.key: list(tensor.info.class_names)
                 for tensor in target_ds.tensors.values()
-                if tensor.base_htype == "class_label"
-                and not read_only
-                and not tensor.meta._disable_temp_transform
-            ]
+                if tensor.base_htype == "class_label" and not read_only
+            }
             if not kwargs.get("disable_label_sync")
-            else []
+            else {}
         )
-        label_temp_tensors = {}
 
         visible_tensors = list(target_ds.tensors)
         visible_tensors = [target_ds[t].key for t in visible_tensors]
 
-        if not read_only:
-            for tensor in class_label_tensors:
-                actual_tensor = target_ds[tensor]
-                temp_tensor = f"__temp{posixpath.relpath(tensor, target_ds.group_index)}_{uuid4().hex[:4]}"
-                with target_ds:
-                    temp_tensor_obj = target_ds.create_tensor(
-                        temp_tensor,
-                        htype="class_label",
-                        dtype=actual_tensor.dtype,
-                        hidden=True,
-                        create_sample_info_tensor=False,
-                        create_shape_tensor=False,
-                        create_id_tensor=False,
-                    )
-                    temp_tensor_obj.meta._disable_temp_transform = True
-                    label_temp_tensors[tensor] = temp_tensor_obj.key
-                target_ds.flush()
-
         tensors = list(target_ds._tensors())
         tensors = [target_ds[t].key for t in tensors]
-        tensors = list(set(tensors) - set(class_label_tensors))
 
         group_index = target_ds.group_index
         version_state = target_ds.version_state
@@ -403,7 +427,7 @@ class Pipeline:
             group_index,
             tensors,
             visible_tensors,
-            label_temp_tensors,
+            class_label_names,
             self,
             version_state,
             target_ds.link_creds,
@@ -413,23 +437,18 @@ class Pipeline:
             ignore_errors,
         )
         map_inp = zip(slices, offsets, storages, repeat(args))
-        try:
-            if progressbar:
-                desc = get_pbar_description(self.functions)
-                result = compute.map_with_progress_bar(
-                    store_data_slice_with_pbar,
-                    map_inp,
-                    total_length=len(data_in),
-                    desc=desc,
-                    pbar=pbar,
-                    pqueue=pqueue,
-                )
-            else:
-                result = compute.map(store_data_slice, map_inp)
-        except Exception:
-            for tensor in label_temp_tensors.values():
-                target_ds.delete_tensor(tensor)
-            raise
+        if progressbar:
+            desc = get_pbar_description(self.functions)
+            result = compute.map_with_progress_bar(
+                store_data_slice_with_pbar,
+                map_inp,
+                total_length=len(data_in),
+                desc=desc,
+                pbar=pbar,
+                pqueue=pqueue,
+            )
+        else:
+            result = compute.map(store_data_slice, map_inp)
 
         if read_only:
             return
@@ -450,18 +469,19 @@ class Pipeline:
         merge_all_meta_info(
             target_ds, storage, generated_tensors, overwrite, all_num_samples, result
         )
-        delete_overwritten_chunks(old_chunk_paths, storage, overwrite)
-        dataset_written(target_ds)
-
-        if label_temp_tensors:
-            sync_labels(
+        if class_label_names:
+            merge_class_labels(
                 target_ds,
-                label_temp_tensors,
-                result["hash_label_maps"],
-                num_workers=num_workers,
-                scheduler=scheduler,
+                storage,
+                result["class_names"],
+                result["chunk_id_encoders"],
                 verbose=progressbar,
             )
+        delete_overwritten_chunks(old_chunk_paths, storage, overwrite)
+        dataset_written(target_ds)
+        full_tensors = target_ds.version_state["full_tensors"]
+        for tensor in generated_tensors:
+            full_tensors[tensor]._tensor_written()
 
         for res in result["error"]:
             if res is not None:
@@ -483,6 +503,7 @@ def compose(functions: List[ComputeFunction]):  # noqa: DAR101, DAR102, DAR201,
     - ``data_in``: Input passed to the transform to generate output dataset.
 
         - It should support ``__getitem__`` and ``__len__``. This can be a Deep Lake dataset.
+        - It can also be an iterable without a length, such as a generator or an async generator, in which case it is consumed in batches.
 
     - ``ds_out (Dataset, optional)``: The dataset object to which the transform will get written.
 
@@ -567,6 +588,7 @@ def compute(
     - ``data_in``: Input passed to the transform to generate output dataset.
 
         - It should support ``__getitem__`` and ``__len__``. This can be a Deep Lake dataset.
+        - It can also be an iterable without a length, such as a generator or an async generator, in which case it is consumed in batches.
 
     - ``ds_out (Dataset, optional)``: The dataset object to which the transform will get written.
 
@@ -598,6 +620,10 @@ def compute(
 
     - ``ignore_errors (bool)``: If ``True``, input samples that causes transform to fail will be skipped and the errors will be ignored **if possible**.
 
+    - ``units_per_worker (int)``: If > 1, the input is split into ``num_workers * units_per_worker`` slices handed out to the workers as they become free. Defaults to 1.
+
+        - This keeps workers busy when some samples are much slower to process than others, at the cost of writing more, smaller chunks.
+
     Note:
         ``pad_data_in`` is only applicable if ``data_in`` is a Deep Lake dataset.
 
@@ -19,7 +19,6 @@ class TransformDataset:
         tensors,
         all_chunk_engines=None,
         group_index="",
-        label_temp_tensors=None,
         idx=slice(None, None, None),
         cache_size=16,
     ):
@@ -27,7 +26,6 @@ class TransformDataset:
         self.data = {tensor: TransformTensor(self, tensor) for tensor in tensors}
         self.all_chunk_engines = all_chunk_engines
         self.group_index = group_index
-        self.label_temp_tensors = label_temp_tensors
         self.cache_size = cache_size * MB
         self.cache_used = 0
         self.idx = idx
@@ -144,13 +142,11 @@ class TransformDataset:
 
     def flush(self):
         all_chunk_engines = self.all_chunk_engines
-        label_temp_tensors = self.label_temp_tensors
         updated_tensors = {}
         try:
             for name, tensor in self.data.items():
                 if not tensor.is_group:
                     name = posixpath.join(self.group_index, name)
-                    name = label_temp_tensors.get(name, name)
                     updated_tensors[name] = 0
                     chunk_engine = all_chunk_engines[name]
                     callback = chunk_engine._transform_callback
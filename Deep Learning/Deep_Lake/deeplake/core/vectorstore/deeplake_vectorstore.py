@@ -15,10 +15,14 @@ import deeplake
 from deeplake.constants import (
     DEFAULT_VECTORSTORE_TENSORS,
 )
+from deeplake.core import vectorstore
 from deeplake.core.vectorstore import utils
 from deeplake.core.vectorstore.vector_search import vector_search
 from deeplake.core.vectorstore.vector_search import dataset as dataset_utils
 from deeplake.core.vectorstore.vector_search import filter as filter_utils
+from deeplake.core.vectorstore.vector_search.filter import secondary_index
+from deeplake.core.vectorstore.vector_search.python import ivf_index
+from deeplake.core.vectorstore.vector_search.python import quantization
 
 from deeplake.util.bugout_reporter import (
     feature_report_path,
@@ -45,6 +49,7 @@ class VectorStore:
         verbose: bool = True,
         runtime: Optional[Dict] = None,
         creds: Optional[Union[Dict, str]] = None,
+        index_params: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> None:
         """Creates an empty VectorStore or loads an existing one if it exists at the specified ``path``.
@@ -72,6 +77,15 @@ class VectorStore:
             ...                        ]
             ... )
 
+            >>> # Create a vector store that stores product quantized embeddings
+            >>> data = VectorStore(
+            ...        path = "./my_vector_store",
+            ...        tensor_params = [{"name": "text", "htype": "text"},
+            ...                         {"name": "embedding", "htype": "embedding", "quantization": {"type": "pq", "pq_m": 16}},
+            ...                         {"name": "metadata", "htype": "json"}
+            ...                        ]
+            ... )
+
         Args:
             path (str, pathlib.Path): - The full path for storing to the Deep Lake Vector Store. It can be:
                 - a Deep Lake cloud path of the form ``hub://org_id/dataset_name``. Requires registration with Deep Lake.
@@ -79,6 +93,12 @@ class VectorStore:
                 - a local file system path of the form ``./path/to/dataset`` or ``~/path/to/dataset`` or ``path/to/dataset``.
                 - a memory path of the form ``mem://path/to/dataset`` which doesn't save the dataset but keeps it in memory instead. Should be used only for testing as it does not persist.
             tensor_params (List[Dict[str, dict]], optional): List of dictionaries that contains information about tensors that user wants to create. See ``create_tensor`` in Deep Lake API docs for more information. Defaults to ``DEFAULT_VECTORSTORE_TENSORS``.
+                Embedding tensors accept an additional ``quantization`` key to store compressed embeddings, which are searched without decompression by ``exec_option="python"``:
+                - ``type`` - ``"float16"`` (half the size), ``"int8"`` (a quarter of the size, per dimension scale) or ``"pq"`` (product quantization, ``pq_m`` bytes per embedding).
+                - ``pq_m`` - Number of sub-quantizers of ``"pq"``. Must divide the embedding dimension. Defaults to 8.
+                - ``training_size`` - Maximum number of embeddings the ``"int8"`` ranges and ``"pq"`` codebooks are trained on. Training happens on the first ``add``. Defaults to 65536.
+                - ``store_full_precision`` - Also store the float32 embeddings in a hidden tensor, and re-rank the best ``k * rerank_factor`` candidates of every search on them. Defaults to False.
+                - ``rerank_factor`` - Defaults to 4.
             embedding_function (Optional[callable], optional): Function that converts the embeddable data into embeddings. Defaults to None.
             read_only (bool, optional):  Opens dataset in read-only mode if True. Defaults to False.
             num_workers (int): Number of workers to use for parallel ingestion.
@@ -96,6 +116,11 @@ class VectorStore:
                 - It supports 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token', 'endpoint_url', 'aws_region', 'profile_name' as keys.
                 - If 'ENV' is passed, credentials are fetched from the environment variables. This is also the case when creds is not passed for cloud datasets. For datasets connected to hub cloud, specifying 'ENV' will override the credentials fetched from Activeloop and use local ones.
             runtime (Dict, optional): Parameters for creating the Vector Store in Deep Lake's Managed Tensor Database. Not applicable when loading an existing Vector Store. To create a Vector Store in the Managed Tensor Database, set `runtime = {"tensor_db": True}`.
+            index_params (Dict, optional): Parameters of the approximate nearest neighbour (IVF) index used by ``exec_option="python"``. The index is built from the embedding tensor once it has at least ``threshold`` rows, stored next to the dataset and kept up to date by ``add``, ``delete`` and ``update_embedding``. Defaults to None, which disables the index.
+                - ``nlist`` - Number of clusters. Defaults to the square root of the number of rows.
+                - ``nprobe`` - Number of clusters visited per query. Larger values increase recall and latency. Defaults to 8.
+                - ``distance_metric`` - Metric the clusters are trained for. Defaults to ``"cos"``.
+                - ``threshold`` - Minimum number of rows before the index is built. Smaller Vector Stores are searched exhaustively. Defaults to 100000.
 
             **kwargs (Any): Additional keyword arguments.
 
@@ -121,6 +146,7 @@ class VectorStore:
                 "token": token,
                 "verbose": verbose,
                 "runtime": runtime,
+                "index_params": index_params,
             },
             token=token,
         )
@@ -150,6 +176,13 @@ class VectorStore:
         )
         self.verbose = verbose
         self.tensor_params = tensor_params
+        self.index_params = (
+            ivf_index.parse_index_params(index_params)
+            if index_params is not None
+            else None
+        )
+        self._vector_indexes: Dict[str, ivf_index.IVFIndex] = {}
+        self._quantizers: Dict[str, quantization.Quantizer] = {}
 
     def add(
         self,
@@ -279,7 +312,12 @@ class VectorStore:
         assert id is not None
         utils.check_length_of_each_tensor(processed_tensors)
 
+        num_rows_before = len(self.dataset)
+        vector_indexes = self._load_vector_indexes()
+        secondary_indexes = self._load_secondary_indexes()
+
         dataset_utils.extend_or_ingest_dataset(
+            quantizers=self._get_quantizers(processed_tensors),
             processed_tensors=processed_tensors,
             dataset=self.dataset,
             embedding_function=embedding_function,
@@ -292,6 +330,19 @@ class VectorStore:
         )
 
         self.dataset.commit(allow_empty=True)
+        self._update_vector_indexes(
+            vector_indexes,
+            lambda index, tensor: index.add(
+                self.dataset[tensor][num_rows_before:].numpy()
+            ),
+        )
+        self._update_secondary_indexes(
+            secondary_indexes,
+            lambda index, tensor, kind: index.add(
+                secondary_index.tensor_values(self.dataset[tensor], index.num_rows),
+                kind,
+            ),
+        )
         if self.verbose:
             self.dataset.summary()
 
@@ -351,7 +402,7 @@ class VectorStore:
             query (Optional[str]):  TQL Query string for direct evaluation, without application of additional filters or vector search.
             filter (Union[Dict, Callable], optional): Additional filter evaluated prior to the embedding search.
 
-                - ``Dict`` - Key-value search on tensors of htype json, evaluated on an AND basis (a sample must satisfy all key-value filters to be True) Dict = {"tensor_name_1": {"key": value}, "tensor_name_2": {"key": value}}
+                - ``Dict`` - Key-value search on tensors of htype json, evaluated on an AND basis (a sample must satisfy all key-value filters to be True) Dict = {"tensor_name_1": {"key": value}, "tensor_name_2": {"key": value}}. Text, class_label and numeric tensors are compared with a single value instead, e.g. {"label": "cat"}, or with a range, e.g. {"score": {"$gte": 0.5, "$lt": 1}}. Dict filters are answered with secondary indexes, which are built on first use and stored with the dataset.
                 - ``Function`` - Any function that is compatible with :meth:`Dataset.filter <deeplake.core.dataset.Dataset.filter>`.
 
             exec_option (Optional[str]): Method for search execution. It could be either ``"python"``, ``"compute_engine"`` or ``"tensor_db"``. Defaults to ``None``, which inherits the option from the Vector Store initialization.
@@ -433,6 +484,18 @@ class VectorStore:
                     query_emb.ndim == 1 or query_emb.shape[0] == 1
                 ), "Query embedding must be 1-dimensional. Please consider using another embedding function for converting query string to embedding."
 
+        vector_index = None
+        if exec_option == "python" and query_emb is not None and filter is None:
+            vector_index = self._get_vector_index(embedding_tensor)
+
+        quantizer = None
+        if query_emb is not None:
+            quantizer = self._get_quantizer(embedding_tensor)
+            if quantizer is not None and exec_option != "python":
+                raise ValueError(
+                    f"Embedding tensor `{embedding_tensor}` stores quantized embeddings, which can only be searched using exec_option='python'."
+                )
+
         return vector_search.search(
             query=query,
             logger=logger,
@@ -445,6 +508,124 @@ class VectorStore:
             embedding_tensor=embedding_tensor,
             return_tensors=return_tensors,
             return_view=return_view,
+            vector_index=vector_index,
+            quantizer=quantizer,
+        )
+
+    def search_batch(
+        self,
+        embedding_data=None,
+        embedding_function: Optional[Callable] = None,
+        embedding: Optional[Union[List[List[float]], np.ndarray]] = None,
+        k: int = 4,
+        distance_metric: str = "COS",
+        filter: Optional[Union[Dict, Callable]] = None,
+        embedding_tensor: str = "embedding",
+        return_tensors: Optional[List[str]] = None,
+        return_view: bool = False,
+        block_size: Optional[int] = None,
+    ) -> Union[List[Dict], List[deeplake.core.dataset.Dataset]]:
+        """Searches the Vector Store for several query embeddings at once. Runs on the client (``exec_option="python"``).
+
+        The distances of all the queries are computed as one matrix product per block of ``block_size`` embeddings,
+        and only the top ``k`` rows of every query are kept, so memory stays bounded for large Vector Stores.
+
+        Examples:
+            >>> # Search using a (Q, D) matrix of embeddings
+            >>> results = vector_store.search_batch(
+            ...        embedding = np.ones((32, 3)),
+            ...        k = 10,
+            ... )
+            >>> results[0]["score"]
+
+            >>> # Search using an embedding function and a list of queries
+            >>> results = vector_store.search_batch(
+            ...        embedding_data = ["What does this chatbot do?", "Who made it?"],
+            ...        embedding_function = query_embedding_fn,
+            ... )
+
+        Args:
+            embedding_data: List of queries that will be embedded using the ``embedding_function``. Defaults to None. The ``embedding_data`` and ``embedding`` cannot both be specified.
+            embedding_function (Optional[Callable], optional): function for converting ``embedding_data`` into embeddings. Only valid if ``embedding_data`` is specified.
+            embedding (Union[np.ndarray, List[List[float]]], optional): Query matrix of shape (Q, D). Defaults to None.
+            k (int): Number of elements to return for every query. Defaults to 4.
+            distance_metric (str): Type of distance metric to use for sorting the data. Avaliable options are: ``"L1", "L2", "COS", "MAX"``. Defaults to ``"COS"``.
+            filter (Union[Dict, Callable], optional): Additional filter evaluated prior to the embedding search, same as in :meth:`search`.
+            embedding_tensor (str): Name of tensor with embeddings. Defaults to "embedding".
+            return_tensors (Optional[List[str]]): List of tensors to return data for. Defaults to None, which returns data for all tensors except the embedding tensor.
+            return_view (bool): Return a Deep Lake dataset view per query, instead of a dictionary with data. Defaults to False.
+            block_size (Optional[int]): Number of embeddings scored at a time. Defaults to None, which uses 65536.
+
+        Raises:
+            ValueError: When invalid parameters are specified.
+
+        Returns:
+            Union[List[Dict], List[Dataset]]: One result per query, in the same format as :meth:`search`.
+        """
+        deeplake_reporter.feature_report(
+            feature_name="vs.search_batch",
+            parameters={
+                "embedding_data": True if embedding_data is not None else False,
+                "embedding_function": True if embedding_function is not None else False,
+                "k": k,
+                "distance_metric": distance_metric,
+                "filter": True if filter is not None else False,
+                "embedding_tensor": embedding_tensor,
+                "embedding": True if embedding is not None else False,
+                "return_tensors": return_tensors,
+                "return_view": return_view,
+            },
+        )
+
+        utils.parse_search_args(
+            embedding_data=embedding_data,
+            embedding_function=embedding_function,
+            initial_embedding_function=self.embedding_function,
+            embedding=embedding,
+            k=k,
+            distance_metric=distance_metric,
+            query=None,
+            filter=filter,
+            exec_option="python",
+            embedding_tensor=embedding_tensor,
+            return_tensors=return_tensors,
+        )
+
+        return_tensors = utils.parse_return_tensors(
+            self.dataset, return_tensors, embedding_tensor, return_view
+        )
+
+        query_embs = dataset_utils.get_embedding(
+            embedding,
+            embedding_data,
+            embedding_function=embedding_function or self.embedding_function,
+        )
+        if query_embs is None:
+            raise ValueError(
+                "Either an `embedding` or `embedding_data` with an `embedding_function` must be specified."
+            )
+        query_embs = np.atleast_2d(query_embs)
+        if query_embs.ndim != 2:
+            raise ValueError(
+                f"Query embeddings must be a 2D matrix of shape (Q, D), got shape {query_embs.shape}."
+            )
+
+        vector_index = None
+        if filter is None:
+            vector_index = self._get_vector_index(embedding_tensor)
+
+        return vectorstore.python_batch_vector_search(
+            query_embs=query_embs,
+            dataset=self.dataset,
+            filter=filter,
+            embedding_tensor=embedding_tensor,
+            distance_metric=distance_metric,
+            k=k,
+            return_tensors=return_tensors,
+            return_view=return_view,
+            vector_index=vector_index,
+            block_size=block_size,
+            quantizer=self._get_quantizer(embedding_tensor),
         )
 
     def delete(
@@ -477,7 +658,7 @@ class VectorStore:
             ids (Optional[List[str]]): List of unique ids. Defaults to None.
             row_ids (Optional[List[str]]): List of absolute row indices from the dataset. Defaults to None.
             filter (Union[Dict, Callable], optional): Filter for finding samples for deletion.
-                - ``Dict`` - Key-value search on tensors of htype json, evaluated on an AND basis (a sample must satisfy all key-value filters to be True) Dict = {"tensor_name_1": {"key": value}, "tensor_name_2": {"key": value}}
+                - ``Dict`` - Key-value search on tensors of htype json, evaluated on an AND basis (a sample must satisfy all key-value filters to be True) Dict = {"tensor_name_1": {"key": value}, "tensor_name_2": {"key": value}}. Text, class_label and numeric tensors are compared with a single value instead, e.g. {"label": "cat"}, or with a range, e.g. {"score": {"$gte": 0.5, "$lt": 1}}. Dict filters are answered with secondary indexes, which are built on first use and stored with the dataset.
                 - ``Function`` - Any function that is compatible with `deeplake.filter`.
             query (Optional[str]):  TQL Query string for direct evaluation for finding samples for deletion, without application of additional filters.
             exec_option (Optional[str]): Method for search execution. It could be either ``"python"``, ``"compute_engine"`` or ``"tensor_db"``. Defaults to ``None``, which inherits the option from the Vector Store initialization.
@@ -527,9 +708,23 @@ class VectorStore:
             delete_all,
         )
         if dataset_deleted:
+            self._vector_indexes = {}
+            secondary_index.secondary_indexes.invalidate(self.dataset.path)
+            # quantizers are retrained on the next add, the hidden tensors are not copied with the dataset
+            self._quantizers = {}
+            for tensor in utils.find_embedding_tensors(self.dataset):
+                quantization.create_full_precision_tensor(self.dataset, tensor)
             return True
 
+        vector_indexes = self._load_vector_indexes()
+        secondary_indexes = self._load_secondary_indexes()
         dataset_utils.delete_and_commit(self.dataset, row_ids)
+        self._update_vector_indexes(
+            vector_indexes, lambda index, tensor: index.remove(row_ids)
+        )
+        self._update_secondary_indexes(
+            secondary_indexes, lambda index, tensor, kind: index.remove(row_ids)
+        )
         return True
 
     def update_embedding(
@@ -578,7 +773,7 @@ class VectorStore:
             ids (Optional[List[str]], optional): hash ids of the elements for replacement.
                 Defaults to None.
             filter (Optional[Union[Dict, Callable]], optional): Filter for finding samples for replacement.
-                - ``Dict`` - Key-value search on tensors of htype json, evaluated on an AND basis (a sample must satisfy all key-value filters to be True) Dict = {"tensor_name_1": {"key": value}, "tensor_name_2": {"key": value}}
+                - ``Dict`` - Key-value search on tensors of htype json, evaluated on an AND basis (a sample must satisfy all key-value filters to be True) Dict = {"tensor_name_1": {"key": value}, "tensor_name_2": {"key": value}}. Text, class_label and numeric tensors are compared with a single value instead, e.g. {"label": "cat"}, or with a range, e.g. {"score": {"$gte": 0.5, "$lt": 1}}. Dict filters are answered with secondary indexes, which are built on first use and stored with the dataset.
                 - ``Function`` - Any function that is compatible with `deeplake.filter`
             query (Optional[str], optional): TQL Query string for direct evaluation for finding samples for deletion, without application of additional filters.
                 Defaults to None.
@@ -631,8 +826,129 @@ class VectorStore:
             row_ids=row_ids,
         )
 
-        self.dataset[row_ids].update(embedding_tensor_data)
+        vector_indexes = self._load_vector_indexes(list(embedding_tensor_data))
+        update_data = dict(embedding_tensor_data)
+        for tensor, quantizer in self._get_quantizers(embedding_tensor_data).items():
+            quantization.train_quantizer(
+                self.dataset, tensor, quantizer, embedding_tensor_data[tensor]
+            )
+            update_data.update(
+                quantization.quantize_embeddings(
+                    quantizer, tensor, embedding_tensor_data[tensor]
+                )
+            )
+        self.dataset[row_ids].update(update_data)
         self.dataset.commit(allow_empty=True)
+        self._update_vector_indexes(
+            vector_indexes,
+            lambda index, tensor: index.update(row_ids, update_data[tensor]),
+        )
+
+    def _get_vector_index(self, embedding_tensor: str):
+        """Returns an up to date vector index for ``embedding_tensor``, building it if needed.
+        Returns None if indexing is disabled or the tensor is too small to be worth indexing.
+        """
+        if self.index_params is None:
+            return None
+
+        index = self._vector_indexes.get(embedding_tensor)
+        if index is not None and ivf_index.index_is_up_to_date(
+            index, self.dataset, embedding_tensor
+        ):
+            return index
+
+        quantizer = self._get_quantizer(embedding_tensor)
+        index = ivf_index.load_index(self.dataset, embedding_tensor, quantizer)
+        if index is None:
+            if len(self.dataset[embedding_tensor]) < self.index_params["threshold"]:
+                return None
+            index = ivf_index.IVFIndex.build(
+                dataset_utils.fetch_embeddings(self.dataset, embedding_tensor),
+                self.index_params,
+                quantizer,
+            )
+            ivf_index.save_index(self.dataset, embedding_tensor, index)
+
+        self._vector_indexes[embedding_tensor] = index
+        return index
+
+    def _load_vector_indexes(self, tensors: Optional[List[str]] = None) -> Dict:
+        """Returns the up to date vector indexes of ``tensors`` (all embedding tensors by default)."""
+        if self.index_params is None:
+            return {}
+
+        if tensors is None:
+            tensors = utils.find_embedding_tensors(self.dataset)
+
+        vector_indexes = {}
+        for tensor in tensors:
+            index = self._vector_indexes.get(tensor)
+            if index is None or not ivf_index.index_is_up_to_date(
+                index, self.dataset, tensor
+            ):
+                index = ivf_index.load_index(
+                    self.dataset, tensor, self._get_quantizer(tensor)
+                )
+            if index is not None:
+                vector_indexes[tensor] = index
+        return vector_indexes
+
+    def _update_vector_indexes(self, vector_indexes: Dict, update_fn: Callable):
+        """Applies ``update_fn(index, tensor)`` to the indexes returned by :meth:`_load_vector_indexes` and persists them.
+
+        Tensors without an index are skipped, their index is built on the next search once they are large enough.
+        Indexes of tensors whose quantizer was refitted are dropped, and rebuilt on the next search as well.
+        The updated indexes are saved for the new head node, the ones saved for the commit that was just made
+        predate its modification and are deleted.
+        """
+        if self.index_params is not None:
+            for tensor in utils.find_embedding_tensors(self.dataset):
+                ivf_index.discard_index(self.dataset, self.dataset.commit_id, tensor)
+        for tensor, index in vector_indexes.items():
+            if not index.quantizer_is_current:
+                self._vector_indexes.pop(tensor, None)
+                continue
+            update_fn(index, tensor)
+            ivf_index.save_index(self.dataset, tensor, index)
+            self._vector_indexes[tensor] = index
+
+    def _load_secondary_indexes(self) -> Dict:
+        """Returns the secondary indexes of the dataset that are loaded and up to date, by ``(tensor, kind)``."""
+        return secondary_index.secondary_indexes.loaded(self.dataset)
+
+    def _update_secondary_indexes(self, indexes: Dict, update_fn: Callable):
+        """Applies ``update_fn(index, tensor, kind)`` to the indexes returned by :meth:`_load_secondary_indexes` and stores them.
+
+        Indexes that were not loaded are skipped, they are built the next time a filter needs them.
+        """
+        for (tensor, kind), index in indexes.items():
+            update_fn(index, tensor, kind)
+            secondary_index.secondary_indexes.put(self.dataset, tensor, kind, index)
+
+    def _get_quantizer(self, embedding_tensor: str):
+        """Returns the quantizer of ``embedding_tensor``, or None if it stores float32 embeddings."""
+        quantizer = self._quantizers.get(embedding_tensor)
+        # another version of the dataset may have been checked out since the quantizer was loaded
+        if (
+            quantizer is None
+            or quantizer.commit_id
+            != quantization.quantizer_commit_id(self.dataset, embedding_tensor)
+        ):
+            self._quantizers[embedding_tensor] = quantization.load_quantizer(
+                self.dataset, embedding_tensor
+            )
+        return self._quantizers[embedding_tensor]
+
+    def _get_quantizers(self, tensors: Iterable[str]) -> Dict:
+        """Returns the quantizers of the quantized embedding tensors among ``tensors``."""
+        embedding_tensors = utils.find_embedding_tensors(self.dataset)
+        quantizers = {}
+        for tensor in tensors:
+            if tensor in embedding_tensors:
+                quantizer = self._get_quantizer(tensor)
+                if quantizer is not None:
+                    quantizers[tensor] = quantizer
+        return quantizers
 
     @staticmethod
     def delete_by_path(
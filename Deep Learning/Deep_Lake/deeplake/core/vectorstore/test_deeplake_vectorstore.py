@@ -22,6 +22,7 @@ from deeplake.util.exceptions import (
     TensorDoesNotExistError,
 )
 from deeplake.core.vectorstore.vector_search import dataset as dataset_utils
+from deeplake.core.vectorstore.vector_search.python import ivf_index
 
 
 EMBEDDING_DIM = 100
@@ -1769,3 +1770,351 @@ def test_uuid_fix(local_path):
     vector_store.add(text=texts, id=ids, embedding=embeddings, metadata=metadatas)
 
     assert vector_store.dataset.id.data()["value"] == list(map(str, ids))
+
+
+def test_vector_index(local_path):
+    index_params = {"nlist": 4, "nprobe": 4, "distance_metric": "l2", "threshold": 5}
+    vector_store = VectorStore(
+        local_path, overwrite=True, verbose=False, index_params=index_params
+    )
+    vector_store.add(text=texts, embedding=embeddings, metadata=metadatas, id=ids)
+
+    # every cluster is probed, so the index must match the exhaustive search
+    data = vector_store.search(
+        embedding=query_embedding, exec_option="python", distance_metric="l2", k=3
+    )
+    assert "embedding" in vector_store._vector_indexes
+    expected = np.argsort(np.linalg.norm(embeddings - query_embedding, axis=1))[:3]
+    assert data["id"] == [ids[i] for i in expected]
+
+    # the index is persisted next to the dataset and updated incrementally
+    vector_store.add(
+        text=texts[:2], embedding=embeddings[:2] + 1, metadata=metadatas[:2]
+    )
+    vector_store.delete(row_ids=[0, 1])
+    assert vector_store._vector_indexes["embedding"].num_rows == NUMBER_OF_DATA
+    data = vector_store.search(
+        embedding=embeddings[0] + 1, exec_option="python", distance_metric="l2", k=1
+    )
+    assert data["text"] == [texts[0]]
+
+    vector_store = VectorStore(local_path, verbose=False, index_params=index_params)
+    data = vector_store.search(
+        embedding=embeddings[5], exec_option="python", distance_metric="l2", k=1
+    )
+    assert data["id"] == [ids[5]]
+    index = vector_store._vector_indexes["embedding"]
+    assert index.num_rows == NUMBER_OF_DATA
+    assert index.commit_id == vector_store.dataset.pending_commit_id
+
+    # filtered searches don't use the index
+    data = vector_store.search(
+        embedding=embeddings[5],
+        exec_option="python",
+        filter={"metadata": {"abc": 5}},
+        k=1,
+    )
+    assert data["id"] == [ids[5]]
+
+
+def test_vector_index_versions(local_path, monkeypatch):
+    index_params = {"nlist": 4, "nprobe": 4, "distance_metric": "l2", "threshold": 5}
+    vector_store = VectorStore(
+        local_path, overwrite=True, verbose=False, index_params=index_params
+    )
+    vector_store.add(text=texts, embedding=embeddings, id=ids)
+    vector_store.search(embedding=query_embedding, exec_option="python", k=1)
+    dataset = vector_store.dataset
+    dataset.checkout("other", create=True)
+    vector_store.add(text=texts[:2], embedding=embeddings[:2] + 1, id=ids[:2])
+    vector_store.search(embedding=query_embedding, exec_option="python", k=1)
+
+    # switching branches reuses the index built for each of them
+    def build(*args, **kwargs):
+        raise AssertionError("the index was rebuilt")
+
+    monkeypatch.setattr(ivf_index.IVFIndex, "build", build)
+    for branch, num_rows in (("main", NUMBER_OF_DATA), ("other", NUMBER_OF_DATA + 2)):
+        dataset.checkout(branch)
+        data = vector_store.search(
+            embedding=embeddings[5], exec_option="python", distance_metric="l2", k=1
+        )
+        assert data["id"] == [ids[5]]
+        assert vector_store._vector_indexes["embedding"].num_rows == num_rows
+
+
+def test_search_batch(local_path):
+    vector_store = VectorStore(local_path, overwrite=True, verbose=False)
+    vector_store.add(text=texts, embedding=embeddings, metadata=metadatas, id=ids)
+
+    results = vector_store.search_batch(
+        embedding=embeddings[[2, 7]], distance_metric="l2", k=3
+    )
+    assert len(results) == 2
+    for query_id, result in zip(["2", "7"], results):
+        single = vector_store.search(
+            embedding=embeddings[int(query_id)],
+            exec_option="python",
+            distance_metric="l2",
+            k=3,
+        )
+        assert result["id"][0] == query_id
+        assert result["id"] == single["id"]
+        assert result["text"] == single["text"]
+        np.testing.assert_allclose(result["score"], single["score"], atol=1e-3)
+
+    views = vector_store.search_batch(
+        embedding=embeddings[:4].tolist(), k=2, return_view=True
+    )
+    assert len(views) == 4
+    assert all(len(view) == 2 for view in views)
+
+    results = vector_store.search_batch(
+        embedding_data=texts[:3],
+        embedding_function=embedding_fn,
+        filter={"metadata": {"abc": 1}},
+        k=2,
+    )
+    assert [result["id"] for result in results] == [["1"]] * 3
+
+    with pytest.raises(ValueError):
+        vector_store.search_batch(filter={"metadata": {"abc": 1}})
+
+
+@pytest.mark.parametrize("quantization_type", ["float16", "int8", "pq"])
+def test_quantized_embeddings(local_path, quantization_type):
+    quantization = {"type": quantization_type, "pq_m": 10}
+    vector_store = VectorStore(
+        local_path,
+        overwrite=True,
+        verbose=False,
+        tensor_params=[
+            {"name": "text", "htype": "text"},
+            {"name": "embedding", "htype": "embedding", "quantization": quantization},
+            {"name": "metadata", "htype": "json"},
+        ],
+    )
+    vector_store.add(text=texts, embedding=embeddings, metadata=metadatas, id=ids)
+    assert (
+        vector_store.dataset.embedding.dtype.name
+        == {
+            "float16": "float16",
+            "int8": "int8",
+            "pq": "uint8",
+        }[quantization_type]
+    )
+
+    for row in (2, 7):
+        data = vector_store.search(
+            embedding=embeddings[row], exec_option="python", distance_metric="l2", k=2
+        )
+        assert data["id"][0] == ids[row]
+
+    results = vector_store.search_batch(embedding=embeddings[[2, 7]], k=1)
+    assert [result["id"] for result in results] == [[ids[2]], [ids[7]]]
+
+    # the quantizer is persisted next to the dataset
+    vector_store = VectorStore(local_path, verbose=False)
+    vector_store.add(
+        text=texts[:1], embedding=embeddings[:1] + 1, metadata=metadatas[:1]
+    )
+    data = vector_store.search(embedding=embeddings[3], exec_option="python", k=1)
+    assert data["id"] == [ids[3]]
+
+    with pytest.raises(ValueError):
+        VectorStore(
+            local_path,
+            overwrite=True,
+            verbose=False,
+            tensor_params=[{"name": "text", "htype": "text", "quantization": "int8"}],
+        )
+
+
+def test_quantized_embeddings_rerank(local_path):
+    quantization = {"type": "pq", "pq_m": 2, "store_full_precision": True}
+    vector_store = VectorStore(
+        local_path,
+        overwrite=True,
+        verbose=False,
+        tensor_params=[
+            {"name": "text", "htype": "text"},
+            {"name": "embedding", "htype": "embedding", "quantization": quantization},
+        ],
+    )
+    vector_store.add(text=texts, embedding=embeddings, id=ids)
+    assert "_embedding_full_precision" not in vector_store.tensors()
+
+    # scores are exact after re-ranking
+    data = vector_store.search(
+        embedding=query_embedding, exec_option="python", distance_metric="l2", k=3
+    )
+    distances = np.linalg.norm(embeddings - query_embedding, axis=1)
+    expected = np.argsort(distances)[:3]
+    np.testing.assert_allclose(data["score"], distances[expected], rtol=1e-4)
+
+    vector_store.delete(row_ids=[0])
+    dataset = vector_store.dataset
+    assert len(dataset["_embedding_full_precision"]) == NUMBER_OF_DATA - 1
+    np.testing.assert_array_equal(
+        dataset["_embedding_full_precision"][0].numpy(), embeddings[1]
+    )
+
+    vector_store.delete(delete_all=True)
+    vector_store.add(text=texts, embedding=embeddings, id=ids)
+    data = vector_store.search(embedding=embeddings[4], exec_option="python", k=1)
+    assert data["id"] == [ids[4]]
+
+
+def test_quantized_embeddings_rerank_ingestion(local_path, monkeypatch):
+    # more rows than the extend threshold are ingested with a transform
+    monkeypatch.setattr(dataset_utils.dataset, "VECTORSTORE_EXTEND_MAX_SIZE", 4)
+    quantization = {"type": "int8", "store_full_precision": True}
+    vector_store = VectorStore(
+        local_path,
+        overwrite=True,
+        verbose=False,
+        tensor_params=[
+            {"name": "text", "htype": "text"},
+            {"name": "embedding", "htype": "embedding", "quantization": quantization},
+        ],
+    )
+    vector_store.add(text=texts, embedding=embeddings, id=ids)
+    vector_store.add(
+        text=texts,
+        embedding_function=get_embedding_function(3),
+        embedding_data=texts,
+        id=ids,
+    )
+    dataset = vector_store.dataset
+    assert len(dataset) == 2 * NUMBER_OF_DATA
+    assert dataset.embedding.dtype == np.int8
+    np.testing.assert_array_equal(
+        dataset["_embedding_full_precision"].numpy(),
+        np.concatenate((embeddings, np.full((NUMBER_OF_DATA, EMBEDDING_DIM), 3))),
+    )
+
+
+def test_quantizer_refit(local_path):
+    index_params = {"nlist": 2, "nprobe": 2, "distance_metric": "l2", "threshold": 5}
+    quantization = {"type": "int8", "store_full_precision": True}
+    vector_store = VectorStore(
+        local_path,
+        overwrite=True,
+        verbose=False,
+        index_params=index_params,
+        tensor_params=[
+            {"name": "text", "htype": "text"},
+            {"name": "embedding", "htype": "embedding", "quantization": quantization},
+        ],
+    )
+    vector_store.add(text=texts, embedding=embeddings, id=ids)
+    assert len(vector_store.dataset["_embedding_full_precision"]) == NUMBER_OF_DATA
+    data = vector_store.search(embedding=embeddings[3], exec_option="python", k=1)
+    assert data["id"] == [ids[3]]
+    quantizer = vector_store._quantizers["embedding"]
+    assert quantizer.num_training_rows == NUMBER_OF_DATA
+
+    # doubling the tensor refits the quantizer on all the rows, out of range embeddings are no longer clipped
+    new_embeddings = embeddings * 10
+    new_ids = [f"new_{i}" for i in ids]
+    vector_store.add(text=texts, embedding=new_embeddings, id=new_ids)
+    assert quantizer.num_training_rows == 2 * NUMBER_OF_DATA
+    assert "embedding" not in vector_store._vector_indexes
+
+    decoded = quantizer.decode(vector_store.dataset.embedding.numpy())
+    np.testing.assert_allclose(
+        decoded, np.concatenate((embeddings, new_embeddings)), atol=1
+    )
+    for row in (3, 7):
+        for query, expected in ((embeddings, ids), (new_embeddings, new_ids)):
+            data = vector_store.search(
+                embedding=query[row], exec_option="python", distance_metric="l2", k=1
+            )
+            assert data["id"] == [expected[row]]
+
+    # the rebuilt vector index stores the codes
+    index = vector_store._vector_indexes["embedding"]
+    assert index.vectors.dtype == np.int8
+    assert index.quantizer is quantizer
+
+
+def test_quantizer_versions(local_path):
+    vector_store = VectorStore(
+        local_path,
+        overwrite=True,
+        verbose=False,
+        tensor_params=[
+            {"name": "text", "htype": "text"},
+            {"name": "embedding", "htype": "embedding", "quantization": "int8"},
+        ],
+    )
+    vector_store.add(text=texts, embedding=embeddings, id=ids)
+    dataset = vector_store.dataset
+    dataset.checkout("refit", create=True)
+    vector_store.add(text=texts, embedding=embeddings * 10, id=ids)
+    assert (
+        vector_store._get_quantizer("embedding").num_training_rows == 2 * NUMBER_OF_DATA
+    )
+
+    # the main branch keeps decoding its codes with the quantizer they were encoded with
+    dataset.checkout("main")
+    quantizer = vector_store._get_quantizer("embedding")
+    assert quantizer.num_training_rows == NUMBER_OF_DATA
+    np.testing.assert_allclose(
+        quantizer.decode(dataset.embedding.numpy()),
+        embeddings,
+        atol=quantizer.scale.max(),
+    )
+    data = vector_store.search(embedding=embeddings[3], exec_option="python", k=1)
+    assert data["id"] == [ids[3]]
+
+    dataset.checkout("refit")
+    assert (
+        vector_store._get_quantizer("embedding").num_training_rows == 2 * NUMBER_OF_DATA
+    )
+
+
+def test_secondary_indexes(local_path):
+    from deeplake.core.vectorstore.vector_search.filter.secondary_index import (
+        secondary_indexes,
+    )
+
+    vector_store = VectorStore(local_path, overwrite=True, verbose=False)
+    vector_store.add(
+        text=texts,
+        embedding=embeddings,
+        metadata=[{"parity": i % 2} for i in range(NUMBER_OF_DATA)],
+        id=ids,
+    )
+
+    data = vector_store.search(
+        embedding=query_embedding,
+        exec_option="python",
+        filter={"metadata": {"parity": 1}},
+        k=NUMBER_OF_DATA,
+    )
+    assert sorted(data["id"]) == sorted(ids[1::2])
+    metadata_index = secondary_indexes.get(vector_store.dataset, "metadata", "json")
+
+    # indexes are kept up to date by add and delete instead of being rebuilt
+    vector_store.delete(ids=[ids[1], ids[4]])
+    vector_store.add(
+        text=texts[:1], embedding=embeddings[:1], metadata=[{"parity": 1}], id=["x"]
+    )
+    assert (
+        secondary_indexes.get(vector_store.dataset, "metadata", "json")
+        is metadata_index
+    )
+
+    data = vector_store.search(
+        embedding=query_embedding,
+        exec_option="python",
+        filter={"metadata": {"parity": 1}},
+        k=NUMBER_OF_DATA,
+    )
+    assert sorted(data["id"]) == sorted(
+        [id for id in ids[1::2] if id != ids[1]] + ["x"]
+    )
+
+    vector_store.delete(filter={"metadata": {"parity": 0}})
+    assert len(vector_store) == NUMBER_OF_DATA // 2
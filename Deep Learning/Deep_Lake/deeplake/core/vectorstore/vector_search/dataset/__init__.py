@@ -3,6 +3,7 @@ from deeplake.core.vectorstore.vector_search.dataset.dataset import (
     delete_and_commit,
     delete_all_samples_if_specified,
     fetch_embeddings,
+    fetch_embedding_blocks,
     get_embedding,
     preprocess_tensors,
     create_elements,
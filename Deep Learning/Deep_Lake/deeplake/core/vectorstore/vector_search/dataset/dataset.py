@@ -14,7 +14,12 @@ except ImportError:  # pragma: no cover
 import deeplake
 from deeplake.constants import MB
 from deeplake.core.vectorstore.vector_search import utils
+from deeplake.core.vectorstore.vector_search import filter as filter_utils
 from deeplake.core.vectorstore.vector_search.ingestion import ingest_data
+from deeplake.core.vectorstore.vector_search.python import quantization
+from deeplake.core.vectorstore.vector_search.python.embedding_cache import (
+    embedding_cache,
+)
 from deeplake.constants import (
     DEFAULT_VECTORSTORE_DEEPLAKE_PATH,
     VECTORSTORE_EXTEND_MAX_SIZE,
@@ -210,15 +215,26 @@ def create_tensors(tensor_params, dataset, logger, embedding_function):
 
     with dataset:
         for tensor_args in tensor_params:
-            dataset.create_tensor(**tensor_args)
+            tensor_args = dict(tensor_args)
+            quantization_params = tensor_args.pop("quantization", None)
+            if quantization_params is not None:
+                quantization.create_quantized_tensor(
+                    dataset, tensor_args, quantization_params
+                )
+            else:
+                dataset.create_tensor(**tensor_args)
 
         update_embedding_info(logger, dataset, embedding_function)
 
 
 def delete_and_commit(dataset, ids):
+    # hidden tensors are not popped by dataset.pop
+    full_precision_tensors = quantization.find_full_precision_tensors(dataset)
     with dataset:
         for id in sorted(ids)[::-1]:
             dataset.pop(id)
+            for tensor in full_precision_tensors:
+                dataset[tensor].pop(id)
         dataset.commit(f"deleted {len(ids)} samples", allow_empty=True)
 
 
@@ -236,7 +252,22 @@ def delete_all_samples_if_specified(dataset, delete_all):
 
 
 def fetch_embeddings(view, embedding_tensor: str = "embedding"):
-    return view[embedding_tensor].numpy()
+    return embedding_cache.get(view, embedding_tensor)
+
+
+def fetch_embedding_blocks(
+    view, embedding_tensor: str = "embedding", block_size: int = 65536
+):
+    """Yields the embeddings of ``view`` in consecutive blocks of at most ``block_size`` rows."""
+    tensor = view[embedding_tensor]
+    cached = embedding_cache.get_cached(view, embedding_tensor)
+    if cached is not None and tensor.index.is_trivial():
+        for start in range(0, len(cached), block_size):
+            yield cached[start : start + block_size]
+        return
+
+    for start in range(0, len(tensor), block_size):
+        yield tensor[start : start + block_size].numpy()
 
 
 def get_embedding(embedding, embedding_data, embedding_function=None):
@@ -388,8 +419,10 @@ def extend_or_ingest_dataset(
     num_workers,
     total_samples_processed,
     logger,
+    quantizers=None,
 ):
     first_item = next(iter(processed_tensors))
+    quantizers = quantizers or {}
 
     htypes = [
         dataset[item].meta.htype for item in dataset.tensors
@@ -415,7 +448,22 @@ def extend_or_ingest_dataset(
 
                 processed_tensors[tensor] = embedded_data
 
-        dataset.extend(processed_tensors)
+        full_precision_data = {}
+        for tensor, quantizer in quantizers.items():
+            if tensor not in processed_tensors:
+                continue
+            embeddings = np.asarray(processed_tensors[tensor], dtype=np.float32)
+            quantization.train_quantizer(dataset, tensor, quantizer, embeddings)
+            quantized = quantization.quantize_embeddings(quantizer, tensor, embeddings)
+            processed_tensors[tensor] = quantized.pop(tensor)
+            full_precision_data.update(quantized)
+
+        with dataset:
+            dataset.extend(processed_tensors)
+            # hidden tensors can't be extended through dataset.extend
+            hidden_tensors = dataset._tensors(include_hidden=True)
+            for tensor, embeddings in full_precision_data.items():
+                hidden_tensors[tensor].extend(embeddings)
     else:
         elements = create_elements(processed_tensors)
 
@@ -428,15 +476,98 @@ def extend_or_ingest_dataset(
             )
             num_workers = min(num_workers_auto, num_workers)
 
-        ingest_data.run_data_ingestion(
-            elements=elements,
-            dataset=dataset,
-            embedding_function=embedding_function,
-            embedding_tensor=embedding_tensor,
-            ingestion_batch_size=ingestion_batch_size,
-            num_workers=num_workers,
-            total_samples_processed=total_samples_processed,
-            logger=logger,
+        (
+            full_precision_data,
+            embedding_function,
+            embedding_tensor,
+        ) = embed_full_precision_tensors(
+            quantizers,
+            elements,
+            embedding_function,
+            embedding_tensor,
+            ingestion_batch_size,
+        )
+
+        train_quantizers(
+            dataset, quantizers, elements, embedding_function, embedding_tensor
+        )
+
+        num_rows = {tensor: len(dataset[tensor]) for tensor in full_precision_data}
+        try:
+            ingest_data.run_data_ingestion(
+                elements=elements,
+                dataset=dataset,
+                embedding_function=embedding_function,
+                embedding_tensor=embedding_tensor,
+                ingestion_batch_size=ingestion_batch_size,
+                num_workers=num_workers,
+                total_samples_processed=total_samples_processed,
+                logger=logger,
+                quantizers=quantizers,
+            )
+        finally:
+            # hidden tensors are not part of the transform, they get the rows it ingested
+            hidden_tensors = dataset._tensors(include_hidden=True)
+            with dataset:
+                for tensor, embeddings in full_precision_data.items():
+                    start = total_samples_processed
+                    end = start + len(dataset[tensor]) - num_rows[tensor]
+                    hidden_tensors[
+                        quantization.get_full_precision_tensor(tensor)
+                    ].extend(embeddings[start:end])
+
+
+def embed_full_precision_tensors(
+    quantizers, elements, embedding_function, embedding_tensor, ingestion_batch_size
+):
+    """Computes the float32 embeddings of the quantized tensors that keep a full precision copy.
+
+    The embeddings are stored in ``elements`` so the ingestion only quantizes them, and the tensors are removed
+    from the ones the ingestion embeds. Returns the embeddings by tensor and the remaining embedding functions
+    and tensors.
+    """
+    full_precision_data = {}
+    for tensor, quantizer in quantizers.items():
+        if not quantizer.params["store_full_precision"] or tensor not in elements[0]:
+            continue
+        data = [element[tensor] for element in elements]
+        if embedding_function and tensor in embedding_tensor:
+            i = embedding_tensor.index(tensor)
+            func = embedding_function[i]
+            embedding_function = embedding_function[:i] + embedding_function[i + 1 :]
+            embedding_tensor = embedding_tensor[:i] + embedding_tensor[i + 1 :]
+            data = [
+                embedding
+                for start in range(0, len(data), ingestion_batch_size)
+                for embedding in func(data[start : start + ingestion_batch_size])
+            ]
+        try:
+            embeddings = np.array(data, dtype=np.float32)
+        except ValueError:
+            raise IncorrectEmbeddingShapeError()
+        for element, embedding in zip(elements, embeddings):
+            element[tensor] = embedding
+        full_precision_data[tensor] = embeddings
+    return full_precision_data, embedding_function or None, embedding_tensor or None
+
+
+def train_quantizers(
+    dataset, quantizers, elements, embedding_function, embedding_tensor
+):
+    """Trains or refits ``quantizers`` on the first rows of ``elements`` before they are ingested in parallel."""
+    for tensor, quantizer in quantizers.items():
+        if tensor not in elements[0] or not quantization.needs_training(
+            dataset, tensor, quantizer, len(elements)
+        ):
+            continue
+        training_data = [
+            element[tensor] for element in elements[: quantizer.params["training_size"]]
+        ]
+        if embedding_function and tensor in embedding_tensor:
+            func = embedding_function[embedding_tensor.index(tensor)]
+            training_data = func(training_data)
+        quantization.train_quantizer(
+            dataset, tensor, quantizer, np.array(training_data, dtype=np.float32)
         )
 
 
@@ -457,7 +588,7 @@ def convert_id_to_row_id(ids, dataset, search_fn, query, exec_option, filter):
         if "ids" in tensors:
             id_tensor = "ids"
 
-        delete_view = dataset.filter(lambda x: x[id_tensor].data()["value"] in ids)
+        return filter_utils.get_id_rows(dataset, ids, id_tensor)
 
     row_ids = list(delete_view.sample_indices)
     return row_ids
@@ -0,0 +1,49 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class DatasetCache:
+    """Base class of the in-process caches of data derived from datasets.
+
+    Entries are keyed by tuples starting with ``(dataset path, commit id)``. Subclasses define what is
+    stored and how the entries of a commit are carried over to the new head node after a commit.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self._entries: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _matches(key: Tuple, path: Optional[str], commit_id: Optional[str]) -> bool:
+        return (path is None or key[0] == path) and (
+            commit_id is None or key[1] == commit_id
+        )
+
+    def _drop(self, key: Tuple):
+        del self._entries[key]
+
+    def invalidate(self, path: Optional[str] = None, commit_id: Optional[str] = None):
+        """Drops the entries of the dataset at ``path`` (all datasets if None), optionally only those of ``commit_id``."""
+        with self._lock:
+            for key in list(self._entries):
+                if self._matches(key, path, commit_id):
+                    self._drop(key)
+
+    def clear(self):
+        self.invalidate()
+
+    def _on_commit(self, dataset):
+        committed_id = dataset.commit_id
+        with self._lock:
+            committed = [
+                (key, entry)
+                for key, entry in self._entries.items()
+                if key[:2] == (dataset.path, committed_id)
+            ]
+        if committed:
+            self._carry_to_head(dataset, committed)
+
+    def _carry_to_head(self, dataset, committed: List[Tuple[Tuple, Any]]):
+        """Stores the ``(key, entry)`` pairs of the commit that was just made for the new head node of ``dataset``."""
+        raise NotImplementedError
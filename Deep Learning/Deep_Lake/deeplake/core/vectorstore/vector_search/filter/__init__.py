@@ -4,6 +4,9 @@ from deeplake.core.vectorstore.vector_search.filter.filter import (
     attribute_based_filtering_tql,
     exact_text_search,
     get_id_indices,
+    get_id_rows,
+    filter_rows,
+    sample_equals,
     get_ids_that_does_not_exist,
     get_filtered_ids,
     get_converted_ids,
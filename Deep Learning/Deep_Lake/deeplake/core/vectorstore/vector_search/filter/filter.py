@@ -1,4 +1,8 @@
 from deeplake.constants import MB
+from deeplake.core.vectorstore.vector_search.filter import secondary_index
+from deeplake.core.vectorstore.vector_search.filter.secondary_index import (
+    secondary_indexes,
+)
 from deeplake.util.warnings import always_warn
 
 import numpy as np
@@ -8,12 +12,49 @@ from functools import partial
 from typing import Optional, Any, Iterable, List, Dict, Callable, Union
 
 
+# operators of the range filters of numeric and class_label tensors, e.g. {"score": {"$gte": 0.5, "$lt": 1}}
+RANGE_OPERATORS = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+
+TQL_RANGE_OPERATORS = {"$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+
+
+def is_range_filter(sample_tensor, value) -> bool:
+    """Whether ``value`` is a range filter of a tensor that is not a json tensor.
+
+    Raises:
+        ValueError: If a bound of the range filter is not a number.
+    """
+    if (
+        not isinstance(value, dict)
+        or not value
+        or not set(value) <= set(RANGE_OPERATORS)
+        or sample_tensor.base_htype == "json"
+    ):
+        return False
+    for bound in value.values():
+        if not isinstance(bound, (bool, int, float, np.number)):
+            raise ValueError(f"Range filter bounds must be numbers, got {bound!r}.")
+    return True
+
+
 def dp_filter_python(x: dict, filter: Dict) -> bool:
     """Filter helper function for Deep Lake"""
 
     result = True
 
     for tensor in filter.keys():
+        if is_range_filter(x[tensor], filter[tensor]):
+            result = result and sample_in_range(x[tensor], filter[tensor])
+            continue
+        if not isinstance(filter[tensor], dict):
+            result = result and sample_equals(x[tensor], filter[tensor])
+            continue
         metadata = x[tensor].data()["value"]
         result = result and all(
             k in metadata and v == metadata[k] for k, v in filter[tensor].items()
@@ -22,15 +63,136 @@ def dp_filter_python(x: dict, filter: Dict) -> bool:
     return result
 
 
+def sample_equals(sample, value) -> bool:
+    """Whether a single sample of a text, json or numeric tensor is equal to ``value``.
+    Class labels can be compared with their class names.
+    """
+    if sample.base_htype in ("text", "json"):
+        return sample.data()["value"] == value
+    if isinstance(value, str):
+        class_names = sample.info.class_names if sample.htype == "class_label" else []
+        if value not in class_names:
+            return False
+        value = class_names.index(value)
+    array = sample.numpy()
+    return array.size == 1 and array.item() == value
+
+
+def sample_in_range(sample, value: Dict) -> bool:
+    """Whether a single sample of a numeric tensor satisfies every bound of the range filter ``value``."""
+    if sample.base_htype == "text":
+        return False
+    array = sample.numpy()
+    if array.size != 1 or array.dtype.kind not in "biuf":
+        return False
+    return all(
+        RANGE_OPERATORS[operator](array.item(), bound)
+        for operator, bound in value.items()
+    )
+
+
+def _range_lookup(value: Dict):
+    low = high = None
+    include_low = include_high = True
+    for operator, bound in value.items():
+        bound = float(bound)
+        if bound != bound:
+            return "numeric", lambda index: np.empty(0, dtype=np.int64)
+        if operator in ("$gt", "$gte"):
+            # the tightest of repeated lower bounds
+            if low is None or bound > low or (bound == low and operator == "$gt"):
+                low, include_low = bound, operator == "$gte"
+        elif high is None or bound < high or (bound == high and operator == "$lt"):
+            high, include_high = bound, operator == "$lte"
+    return "numeric", lambda index: index.lookup_range(
+        low, high, include_low, include_high
+    )
+
+
+def _filter_index_lookup(dataset, tensor: str, value):
+    """Returns the kind of secondary index that answers the filter ``{tensor: value}`` and a function of
+    the index that returns the matching rows. Returns None if no index can answer it.
+    """
+    if tensor not in dataset.tensors:
+        return None
+    sample_tensor = dataset[tensor]
+
+    if is_range_filter(sample_tensor, value):
+        if sample_tensor.base_htype == "text":
+            return "text", lambda index: np.empty(0, dtype=np.int64)
+        return _range_lookup(value)
+
+    if isinstance(value, dict):
+        keys = []
+        for key, item in value.items():
+            canonical = secondary_index.canonical_value(item)
+            if canonical is None:
+                return None
+            keys.append(secondary_index.json_entry_key(key, canonical))
+        if not keys:
+            return None
+        return "json", lambda index: index.lookup_all(keys)
+
+    if sample_tensor.base_htype == "text":
+        if not isinstance(value, str):
+            return "text", lambda index: np.empty(0, dtype=np.int64)
+        return "text", lambda index: index.lookup(value)
+
+    if sample_tensor.base_htype == "json":
+        return None
+
+    if isinstance(value, str):
+        class_names = (
+            sample_tensor.info.class_names
+            if sample_tensor.htype == "class_label"
+            else []
+        )
+        if value not in class_names:
+            return "numeric", lambda index: np.empty(0, dtype=np.int64)
+        value = class_names.index(value)
+    if not isinstance(value, (bool, int, float, np.number)):
+        return None
+    value = float(value)
+    if value != value:
+        return "numeric", lambda index: np.empty(0, dtype=np.int64)
+    return "numeric", lambda index: index.lookup(value)
+
+
+def filter_rows(dataset, filter: Dict) -> Optional[np.ndarray]:
+    """Returns the sorted rows of ``dataset`` that match a dict ``filter``, found with secondary indexes.
+
+    Returns None if the filter can't be answered by the indexes, in which case it has to be evaluated
+    with :func:`dp_filter_python` on every sample.
+    """
+    if not dataset.index.is_trivial():
+        return None
+
+    lookups = []
+    for tensor, value in filter.items():
+        lookup = _filter_index_lookup(dataset, tensor, value)
+        if lookup is None or not secondary_index.index_applies(
+            dataset[tensor], lookup[0]
+        ):
+            return None
+        lookups.append((tensor, *lookup))
+
+    rows = None
+    for tensor, kind, lookup_fn in lookups:
+        index = secondary_indexes.get(dataset, tensor, kind)
+        if index is None:
+            return None
+        tensor_rows = lookup_fn(index)
+        rows = tensor_rows if rows is None else np.intersect1d(rows, tensor_rows)
+    return rows
+
+
 def attribute_based_filtering_python(
     view, filter: Optional[Union[Dict, Callable]] = None
 ):
     if len(view) == 0:
         raise ValueError("specified dataset is empty")
     if filter is not None:
-        if isinstance(filter, dict):
-            filter = partial(dp_filter_python, filter=filter)
-
+        # dict filters are answered with the secondary indexes by Dataset.filter
         view = view.filter(filter)
 
     return view
@@ -44,6 +206,17 @@ def attribute_based_filtering_tql(
     if filter is not None:
         if isinstance(filter, dict):
             for tensor in filter.keys():
+                if is_range_filter(view[tensor], filter[tensor]):
+                    for operator, bound in filter[tensor].items():
+                        tql_filter += (
+                            f"{tensor} {TQL_RANGE_OPERATORS[operator]} {bound} and "
+                        )
+                    continue
+                if not isinstance(filter[tensor], dict):
+                    value = filter[tensor]
+                    val_str = f"'{value}'" if type(value) == str else f"{value}"
+                    tql_filter += f"{tensor} == {val_str} and "
+                    continue
                 for key, value in filter[tensor].items():
                     val_str = f"'{value}'" if type(value) == str else f"{value}"
                     tql_filter += f"{tensor}['{key}'] == {val_str} and "
@@ -54,8 +227,34 @@ def attribute_based_filtering_tql(
     return view, tql_filter
 
 
+def _text_search_rows(view, query) -> Optional[np.ndarray]:
+    """Rows of ``view`` whose text contains ``query``, found with the trigram index of the ``text`` tensor.
+    Returns None if the index can't be used.
+    """
+    if (
+        not isinstance(query, str)
+        or len(query) < secondary_index.TRIGRAM_LENGTH
+        or not view.index.is_trivial()
+    ):
+        return None
+    index = secondary_indexes.get(view, "text", "trigram")
+    if index is None:
+        return None
+
+    # every row containing the query contains all of its trigrams, the candidates only need to be confirmed
+    candidates = index.lookup_all(secondary_index.trigram_keys(query))
+    if len(candidates) == 0:
+        return candidates
+    texts = view.text[candidates.tolist()].data(fetch_chunks=True)["value"]
+    return candidates[[query in text for text in texts]]
+
+
 def exact_text_search(view, query):
-    view = view.filter(lambda x: query in x["text"].data()["value"])
+    rows = _text_search_rows(view, query)
+    if rows is not None:
+        view = view[rows.tolist()]
+    else:
+        view = view.filter(lambda x: query in x["text"].data()["value"])
     scores = [1.0] * len(view)
 
     if len(view) == 0:
@@ -68,10 +267,20 @@ def exact_text_search(view, query):
     return (view, scores, index)
 
 
+def get_id_rows(dataset, ids, id_tensor: str = "ids") -> List[int]:
+    """Returns the sorted rows of ``dataset`` whose ``id_tensor`` value is in ``ids``."""
+    index = None
+    if dataset.index.is_trivial():
+        index = secondary_indexes.get(dataset, id_tensor, "text")
+    if index is None:
+        view = dataset.filter(lambda x: x[id_tensor].data()["value"] in ids)
+        return list(view.sample_indices)
+    # text samples are only ever equal to strings
+    return index.lookup_any([id for id in ids if isinstance(id, str)]).tolist()
+
+
 def get_id_indices(dataset, ids):
-    filtered_ids = None
-    view = dataset.filter(lambda x: x["ids"].data()["value"] in ids)
-    filtered_ids = list(view.sample_indices)
+    filtered_ids = get_id_rows(dataset, ids)
 
     if len(filtered_ids) != len(ids):
         ids_that_doesnt_exist = get_ids_that_does_not_exist(ids, filtered_ids)
@@ -90,9 +299,12 @@ def get_ids_that_does_not_exist(ids, filtered_ids):
 
 
 def get_filtered_ids(dataset, filter):
-    filtered_ids = None
-    view = dataset.filter(partial(dp_filter_python, filter=filter))
-    filtered_ids = list(view.sample_indices)
+    rows = filter_rows(dataset, filter)
+    if rows is not None:
+        filtered_ids = rows.tolist()
+    else:
+        view = dataset.filter(partial(dp_filter_python, filter=filter))
+        filtered_ids = list(view.sample_indices)
     if len(filtered_ids) == 0:
         raise ValueError(f"{filter} does not exist in the dataset.")
     return filtered_ids
@@ -0,0 +1,407 @@
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from deeplake.core.vectorstore.vector_search.dataset_cache import DatasetCache
+from deeplake.core.vectorstore.vector_search.index_storage import (
+    arrays_frombuffer,
+    arrays_tobytes,
+    write_to_storage,
+)
+from deeplake.core.tensor import add_tensor_write_hook
+from deeplake.hooks import add_commit_dataset_hook
+
+
+SECONDARY_INDEX_FOLDER = "_secondary_index"
+MANIFEST_FILENAME = "manifest.json"
+
+# substrings shorter than this can't be looked up in the trigram index
+TRIGRAM_LENGTH = 3
+
+
+def get_manifest_key(commit_id: str) -> str:
+    return "/".join((SECONDARY_INDEX_FOLDER, commit_id, MANIFEST_FILENAME))
+
+
+def get_secondary_index_key(commit_id: str, tensor_key: str, kind: str) -> str:
+    return "/".join((SECONDARY_INDEX_FOLDER, commit_id, tensor_key, f"{kind}.npz"))
+
+
+def canonical_value(value: Any) -> Optional[str]:
+    """Returns a string that is equal for two scalars if and only if they compare equal in python.
+
+    Returns None for values that are not indexed (lists, dicts, NaN).
+    """
+    if isinstance(value, str):
+        return "s" + value
+    if value is None:
+        return "n"
+    if isinstance(value, (bool, int, np.bool_, np.integer)):
+        return "i" + str(int(value))
+    if isinstance(value, (float, np.floating)):
+        if value != value:
+            return None
+        if float(value).is_integer():
+            return "i" + str(int(value))
+        return "f" + repr(float(value))
+    return None
+
+
+def json_entry_key(key: str, canonical: str) -> str:
+    return key + "\x00" + canonical
+
+
+def _text_keys(value) -> List[str]:
+    return [value] if isinstance(value, str) else []
+
+
+def trigram_keys(value) -> List[str]:
+    if not isinstance(value, str):
+        return []
+    return list(
+        {value[i : i + TRIGRAM_LENGTH] for i in range(len(value) - TRIGRAM_LENGTH + 1)}
+    )
+
+
+def _json_keys(value) -> List[str]:
+    if not isinstance(value, dict):
+        return []
+    keys = []
+    for key, item in value.items():
+        canonical = canonical_value(item)
+        if canonical is not None:
+            keys.append(json_entry_key(key, canonical))
+    return keys
+
+
+def _numeric_keys(value) -> List[float]:
+    value = np.asarray(value)
+    if value.size != 1 or value.dtype.kind not in "biuf":
+        return []
+    value = float(value.reshape(-1)[0])
+    return [] if value != value else [value]
+
+
+# kind -> (function returning the keys of a sample, dtype of the keys)
+INDEX_KINDS: Dict[str, Tuple[Callable, Any]] = {
+    "text": (_text_keys, str),
+    "trigram": (trigram_keys, str),
+    "json": (_json_keys, str),
+    "numeric": (_numeric_keys, np.float64),
+}
+
+
+class SecondaryIndex:
+    """Maps the keys of the samples of a tensor to the rows that contain them.
+
+    ``(key, row)`` pairs are kept sorted by key, so the rows of a key are found with a binary search.
+    Which keys a sample has depends on the kind of index:
+
+    - ``text`` - The string of a text sample, used for ``ids`` lookups.
+    - ``trigram`` - Every substring of length 3 of a text sample, used for substring search.
+    - ``json`` - Every ``(key, value)`` pair of a json sample with a scalar value.
+    - ``numeric`` - The value of a numeric sample with a single element.
+    """
+
+    def __init__(
+        self,
+        keys: np.ndarray,
+        rows: np.ndarray,
+        num_rows: int,
+        commit_id: Optional[str] = None,
+    ):
+        self.keys = keys
+        self.rows = rows
+        self.num_rows = num_rows
+        self.commit_id = commit_id
+
+    @staticmethod
+    def _flatten(keys_per_row: Iterable[List], dtype, offset: int = 0):
+        keys: List = []
+        rows: List[int] = []
+        for row, row_keys in enumerate(keys_per_row, offset):
+            keys.extend(row_keys)
+            rows.extend([row] * len(row_keys))
+        keys_array = np.array(keys, dtype=dtype)
+        if len(keys) == 0 and dtype is str:
+            keys_array = np.empty(0, dtype="<U1")
+        return keys_array, np.array(rows, dtype=np.int64)
+
+    def _sort(self):
+        order = np.lexsort((self.rows, self.keys))
+        self.keys = self.keys[order]
+        self.rows = self.rows[order]
+
+    @classmethod
+    def build(cls, values: List, kind: str):
+        """Builds an index of ``kind`` from the samples of a tensor."""
+        key_fn, dtype = INDEX_KINDS[kind]
+        keys, rows = cls._flatten(map(key_fn, values), dtype)
+        index = cls(keys, rows, num_rows=len(values))
+        index._sort()
+        return index
+
+    def lookup(self, key) -> np.ndarray:
+        """Returns the sorted rows that contain ``key``."""
+        start = np.searchsorted(self.keys, key, side="left")
+        stop = np.searchsorted(self.keys, key, side="right")
+        return self.rows[start:stop]
+
+    def lookup_range(
+        self,
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> np.ndarray:
+        """Returns the sorted rows whose key is between ``low`` and ``high``. Bounds that are None are open."""
+        start = 0
+        stop = len(self.keys)
+        if low is not None:
+            start = np.searchsorted(
+                self.keys, low, side="left" if include_low else "right"
+            )
+        if high is not None:
+            stop = np.searchsorted(
+                self.keys, high, side="right" if include_high else "left"
+            )
+        return np.sort(self.rows[start:stop])
+
+    def lookup_any(self, keys: Iterable) -> np.ndarray:
+        """Returns the sorted rows that contain at least one key of ``keys``."""
+        # not cast to the dtype of the index, which would truncate longer strings
+        keys = np.asarray(list(keys))
+        if len(keys) == 0:
+            return np.empty(0, dtype=np.int64)
+        starts = np.searchsorted(self.keys, keys, side="left")
+        stops = np.searchsorted(self.keys, keys, side="right")
+        return np.unique(
+            np.concatenate(
+                [self.rows[start:stop] for start, stop in zip(starts, stops)]
+            )
+        )
+
+    def lookup_all(self, keys: Iterable) -> np.ndarray:
+        """Returns the sorted rows that contain every key of ``keys``."""
+        rows = None
+        for key in keys:
+            key_rows = self.lookup(key)
+            rows = key_rows if rows is None else np.intersect1d(rows, key_rows)
+            if len(rows) == 0:
+                break
+        return np.empty(0, dtype=np.int64) if rows is None else rows
+
+    def add(self, values: List, kind: str):
+        """Appends samples to the end of the index."""
+        key_fn, dtype = INDEX_KINDS[kind]
+        keys, rows = self._flatten(map(key_fn, values), dtype, offset=self.num_rows)
+        self.keys = np.concatenate((self.keys, keys))
+        self.rows = np.concatenate((self.rows, rows))
+        self.num_rows += len(values)
+        self._sort()
+
+    def remove(self, row_ids):
+        """Removes rows from the index and shifts the rows after them down."""
+        removed = np.unique(np.asarray(row_ids, dtype=np.int64))
+        keep = ~np.isin(self.rows, removed)
+        self.keys = self.keys[keep]
+        self.rows = self.rows[keep]
+        self.rows -= np.searchsorted(removed, self.rows)
+        self.num_rows -= len(removed)
+
+    def tobytes(self) -> bytes:
+        meta = {"num_rows": self.num_rows, "commit_id": self.commit_id}
+        return arrays_tobytes(meta, keys=self.keys, rows=self.rows)
+
+    @classmethod
+    def frombuffer(cls, buffer: bytes):
+        meta, arrays = arrays_frombuffer(buffer)
+        return cls(keys=arrays["keys"], rows=arrays["rows"], **meta)
+
+
+def index_applies(tensor, kind: str) -> bool:
+    """Whether an index of ``kind`` can be built for ``tensor``."""
+    if tensor.htype == "class_label":
+        return kind == "numeric"
+    if kind == "numeric":
+        return (
+            tensor.base_htype == "generic"
+            and tensor.dtype is not None
+            and np.dtype(tensor.dtype).kind in "biuf"
+        )
+    if kind == "json":
+        return tensor.base_htype == "json"
+    return tensor.base_htype == "text"
+
+
+def tensor_values(tensor, start: int = 0) -> List:
+    """Returns the samples of ``tensor`` from row ``start`` onwards, in the form the filters compare them."""
+    tensor = tensor[start:]
+    if tensor.base_htype in ("text", "json"):
+        return tensor.data(fetch_chunks=True)["value"]
+    return tensor.numpy(aslist=True, fetch_chunks=True)
+
+
+class SecondaryIndexes(DatasetCache):
+    """Secondary indexes of the tensors of datasets, loaded in memory and persisted next to the data.
+
+    Indexes are stored per commit, under ``_secondary_index/<commit id>/``. A manifest lists the indexes
+    that are up to date for the commit. Indexes of past commits never change. When an indexed tensor of
+    the head node is written to, :meth:`invalidate_tensor` removes its indexes from the manifest, so they
+    are never served for data they don't describe, and they are rebuilt the next time they are needed.
+    Writers that keep their indexes up to date, like
+    :class:`~deeplake.core.vectorstore.deeplake_vectorstore.VectorStore`, save them again after every
+    modification.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # (dataset path, commit id, tensor key, kind) -> index
+        self._entries: Dict[Tuple[str, str, str, str], SecondaryIndex] = {}
+        # (dataset path, commit id) -> manifest, an empty manifest if the commit has no indexes
+        self._manifests: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+
+    @staticmethod
+    def _key(dataset, tensor_key: str, kind: str):
+        return (dataset.path, dataset.pending_commit_id, tensor_key, kind)
+
+    def _read_manifest(
+        self, dataset, commit_id: str, cached: bool = True
+    ) -> Dict[str, Dict]:
+        key = (dataset.path, commit_id)
+        if cached and key in self._manifests:
+            return self._manifests[key]
+        try:
+            manifest = json.loads(
+                bytes(dataset.base_storage[get_manifest_key(commit_id)]).decode("utf-8")
+            )
+        except KeyError:
+            manifest = {}
+        self._manifests[key] = manifest
+        return manifest
+
+    def _write_manifest(self, dataset, commit_id: str, manifest: Dict[str, Dict]):
+        self._manifests[(dataset.path, commit_id)] = manifest
+        write_to_storage(
+            dataset,
+            {
+                get_manifest_key(commit_id): json.dumps(manifest).encode("utf-8")
+                if manifest
+                else None
+            },
+        )
+
+    def _load(self, dataset, tensor, kind: str) -> Optional[SecondaryIndex]:
+        manifest = self._read_manifest(dataset, dataset.pending_commit_id)
+        entry = manifest.get(f"{tensor.key}/{kind}")
+        if entry is None or entry["num_rows"] != tensor.num_samples:
+            return None
+        try:
+            return SecondaryIndex.frombuffer(dataset.base_storage[entry["key"]])
+        except KeyError:
+            return None
+
+    def _save(self, dataset, tensor_key: str, kind: str, index: SecondaryIndex):
+        commit_id = dataset.pending_commit_id
+        index_key = get_secondary_index_key(commit_id, tensor_key, kind)
+        # re-read, other processes may have saved indexes of other tensors
+        manifest = dict(self._read_manifest(dataset, commit_id, cached=False))
+        manifest[f"{tensor_key}/{kind}"] = {
+            "key": index_key,
+            "num_rows": index.num_rows,
+        }
+        write_to_storage(dataset, {index_key: index.tobytes()})
+        self._write_manifest(dataset, commit_id, manifest)
+
+    def get(self, dataset, tensor_name: str, kind: str) -> Optional[SecondaryIndex]:
+        """Returns an up to date index of ``kind`` over all the rows of ``tensor_name``, building it if needed.
+
+        Returns None if indexing is disabled or the tensor can't be indexed this way.
+        """
+        if not self.enabled or tensor_name not in dataset.tensors:
+            return None
+        tensor = dataset.version_state["full_tensors"][dataset[tensor_name].key]
+        if not index_applies(tensor, kind):
+            return None
+
+        key = self._key(dataset, tensor.key, kind)
+        with self._lock:
+            index = self._entries.get(key)
+        if index is not None and index.num_rows == tensor.num_samples:
+            return index
+
+        index = self._load(dataset, tensor, kind)
+        if index is None:
+            index = SecondaryIndex.build(tensor_values(tensor), kind)
+            index.commit_id = dataset.pending_commit_id
+            if not dataset.read_only:
+                self._save(dataset, tensor.key, kind, index)
+        with self._lock:
+            self._entries[key] = index
+        return index
+
+    def loaded(self, dataset) -> Dict[Tuple[str, str], SecondaryIndex]:
+        """Returns the up to date indexes of the head node that are in memory, by ``(tensor key, kind)``.
+
+        Must be called before the dataset is modified, since modifications invalidate them.
+        """
+        path, commit_id = dataset.path, dataset.pending_commit_id
+        with self._lock:
+            return {
+                key[2:]: index
+                for key, index in self._entries.items()
+                if key[:2] == (path, commit_id)
+            }
+
+    def put(self, dataset, tensor_key: str, kind: str, index: SecondaryIndex):
+        """Stores an index that was kept up to date by the writer of the dataset, for its current head node."""
+        index.commit_id = dataset.pending_commit_id
+        if not dataset.read_only:
+            self._save(dataset, tensor_key, kind, index)
+        with self._lock:
+            self._entries[self._key(dataset, tensor_key, kind)] = index
+
+    def invalidate(self, path: Optional[str] = None, commit_id: Optional[str] = None):
+        """Drops the in-memory indexes and manifests of the dataset at ``path`` (all datasets if None), optionally only those of ``commit_id``."""
+        super().invalidate(path, commit_id)
+        with self._lock:
+            for key in list(self._manifests):
+                if self._matches(key, path, commit_id):
+                    del self._manifests[key]
+
+    def invalidate_tensor(self, dataset, tensor):
+        """Drops the indexes of ``tensor`` in the head node of ``dataset``, after its data changed.
+
+        Registered with :func:`~deeplake.core.tensor.add_tensor_write_hook`. Tensors that can't be indexed are
+        skipped, and the manifest of a dataset is only read once per commit to find out which tensors are indexed.
+        """
+        if not any(index_applies(tensor, kind) for kind in INDEX_KINDS):
+            return
+        path, commit_id = dataset.path, dataset.pending_commit_id
+        with self._lock:
+            for key in list(self._entries):
+                if key[:3] == (path, commit_id, tensor.key):
+                    del self._entries[key]
+        manifest = self._read_manifest(dataset, commit_id)
+        stale = [name for name in manifest if name.rpartition("/")[0] == tensor.key]
+        if stale:
+            manifest = {
+                name: entry for name, entry in manifest.items() if name not in stale
+            }
+            self._write_manifest(dataset, commit_id, manifest)
+
+    def _carry_to_head(self, dataset, committed):
+        head_id = dataset.pending_commit_id
+        manifest = self._read_manifest(dataset, dataset.commit_id)
+        if manifest and not dataset.read_only:
+            self._write_manifest(dataset, head_id, dict(manifest))
+        with self._lock:
+            for key, index in committed:
+                self._entries[(dataset.path, head_id) + key[2:]] = index
+
+
+secondary_indexes = SecondaryIndexes()
+
+add_commit_dataset_hook(secondary_indexes._on_commit, "secondary_indexes_commit")
+add_tensor_write_hook(secondary_indexes.invalidate_tensor, "secondary_indexes_write")
@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+
+import deeplake
+from deeplake.core.vectorstore.vector_search import filter as filter_utils
+from deeplake.core.vectorstore.vector_search.filter.secondary_index import (
+    SecondaryIndex,
+    SecondaryIndexes,
+    get_manifest_key,
+    secondary_indexes,
+)
+
+
+@pytest.fixture
+def indexed_ds():
+    ds = deeplake.empty("mem://test_secondary_index", overwrite=True)
+    ds.create_tensor("ids", htype="text")
+    ds.create_tensor("text", htype="text")
+    ds.create_tensor("metadata", htype="json")
+    ds.create_tensor("label", htype="class_label", class_names=["cat", "dog"])
+    ds.ids.extend(["a", "b", "c", "d"])
+    ds.text.extend(["hello world", "say hello", "bye", "worldly"])
+    ds.metadata.extend([{"k": 1, "s": "x"}, {"k": 1.0}, {"k": 2}, {"k": [1]}])
+    ds.label.extend([0, 1, 1, 0])
+    ds.create_tensor("score", dtype="float32")
+    ds.score.extend([0.5, 2.0, -1.0, 1.0])
+    return ds
+
+
+def test_secondary_index():
+    index = SecondaryIndex.build(["a", "b", "a", "c"], "text")
+    assert index.lookup("a").tolist() == [0, 2]
+    assert index.lookup("aa").tolist() == []
+    assert index.lookup_any(["a", "c", "x"]).tolist() == [0, 2, 3]
+
+    index.remove([0])
+    assert index.lookup("a").tolist() == [1]
+    assert index.lookup("c").tolist() == [2]
+
+    index.add(["a"], "text")
+    index = SecondaryIndex.frombuffer(index.tobytes())
+    assert index.lookup("a").tolist() == [1, 3]
+    assert index.num_rows == 4
+
+
+def test_secondary_index_range():
+    index = SecondaryIndex.build([3, 1, np.nan, 2, 1], "numeric")
+    assert index.lookup_range(1, 2).tolist() == [1, 3, 4]
+    assert index.lookup_range(1, 2, include_low=False).tolist() == [3]
+    assert index.lookup_range(high=2, include_high=False).tolist() == [1, 4]
+    assert index.lookup_range(low=2.5).tolist() == [0]
+    assert index.lookup_range().tolist() == [0, 1, 3, 4]
+
+
+def test_filters_use_indexes(indexed_ds):
+    ds = indexed_ds
+    assert filter_utils.get_id_indices(ds, ["d", "b"]) == [1, 3]
+    assert filter_utils.filter_rows(ds, {"metadata": {"k": 1}}).tolist() == [0, 1]
+    assert filter_utils.filter_rows(
+        ds, {"metadata": {"k": 1}, "label": "dog"}
+    ).tolist() == [1]
+    assert filter_utils.get_filtered_ids(ds, {"label": 0}) == [0, 3]
+    # lists are not indexed
+    assert filter_utils.filter_rows(ds, {"metadata": {"k": [1]}}) is None
+
+    view, scores, index = filter_utils.exact_text_search(ds, "hello")
+    assert index == [0, 1]
+    assert filter_utils.exact_text_search(ds, "rld")[2] == [0, 3]
+
+    for tensor, kind in (
+        ("ids", "text"),
+        ("text", "trigram"),
+        ("metadata", "json"),
+        ("label", "numeric"),
+    ):
+        assert secondary_indexes.get(ds, tensor, kind) is not None
+
+
+@pytest.mark.parametrize(
+    "filter",
+    [
+        {"metadata": {"k": 1}},
+        {"metadata": {"k": 2, "s": "x"}},
+        {"label": "cat"},
+        {"label": 1, "ids": "c"},
+        {"ids": "e"},
+        {"score": {"$gte": 0.5}},
+        {"score": {"$gt": -1, "$lte": 1}},
+        {"score": {"$lt": 1}, "label": 1},
+        {"label": {"$gte": 1}},
+        {"ids": {"$gt": 0}},
+    ],
+)
+def test_indexed_filter_matches_scan(indexed_ds, filter):
+    rows = filter_utils.filter_rows(indexed_ds, filter)
+    expected = [
+        i
+        for i in range(len(indexed_ds))
+        if filter_utils.dp_filter_python(indexed_ds[i], filter)
+    ]
+    assert rows.tolist() == expected
+    assert list(indexed_ds.filter(filter).sample_indices) == expected
+
+
+def test_indexes_are_versioned(indexed_ds):
+    ds = indexed_ds
+    cache = SecondaryIndexes()
+    index = cache.get(ds, "ids", "text")
+    assert get_manifest_key(ds.pending_commit_id) in ds.base_storage
+
+    first_commit = ds.commit()
+    cache._on_commit(ds)
+    # the new head is served the index of the commit that was just made
+    assert cache.get(ds, "ids", "text") is index
+
+    cache.get(ds, "label", "numeric")
+    ds.ids[0] = "e"
+    cache.invalidate_tensor(ds, ds.ids)
+    # only the indexes of the written tensor are dropped
+    manifest = cache._read_manifest(ds, ds.pending_commit_id, cached=False)
+    assert list(manifest) == [f"{ds.label.key}/numeric"]
+    assert cache.get(ds, "ids", "text").lookup("e").tolist() == [0]
+
+    ds.checkout(first_commit)
+    other_cache = SecondaryIndexes()
+    # indexes of past commits are loaded from storage
+    assert other_cache.get(ds, "ids", "text").lookup("a").tolist() == [0]
+
+
+def test_writes_invalidate_indexed_tensors(indexed_ds):
+    ds = indexed_ds
+    secondary_indexes.clear()
+    manifest_key = get_manifest_key(ds.pending_commit_id)
+
+    # datasets without indexes are not touched by writes
+    ds.ids[3] = "e"
+    assert manifest_key not in ds.base_storage
+
+    assert list(ds.filter({"ids": "e"}).sample_indices) == [3]
+    view = ds.filter({"score": {"$gt": 1}})
+    assert view.score.numpy().reshape(-1).tolist() == [2.0]
+    assert manifest_key in ds.base_storage
+
+    ds.score[1] = 0.0
+    ds.text[0] = "x"
+    assert list(secondary_indexes.loaded(ds)) == [(ds.ids.key, "text")]
+    assert len(ds.filter({"score": {"$gt": 1}})) == 0
+
+    ds.ids[2] = "f"
+    assert (ds.ids.key, "text") not in secondary_indexes.loaded(ds)
+    assert list(ds.filter({"ids": "f"}).sample_indices) == [2]
@@ -0,0 +1,40 @@
+import json
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+def arrays_tobytes(meta: Dict[str, Any], **arrays: np.ndarray) -> bytes:
+    """Serializes ``arrays`` and the json serializable ``meta`` to the bytes of a ``.npz`` file."""
+    buffer = BytesIO()
+    np.savez(
+        buffer,
+        meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+        **arrays,
+    )
+    return buffer.getvalue()
+
+
+def arrays_frombuffer(buffer: bytes) -> Tuple[Dict[str, Any], Any]:
+    """Reads the bytes written by :func:`arrays_tobytes`. Returns the meta and the arrays, by name."""
+    arrays = np.load(BytesIO(buffer), allow_pickle=False)
+    return json.loads(arrays["meta"].tobytes().decode("utf-8")), arrays
+
+
+def write_to_storage(dataset, items: Dict[str, Optional[bytes]]):
+    """Writes ``items`` to the base storage of ``dataset``, even if it is read only. Keys with a None value are deleted."""
+    read_only = dataset.base_storage.read_only
+    dataset.base_storage.disable_readonly()
+    try:
+        for key, value in items.items():
+            if value is None:
+                try:
+                    del dataset.base_storage[key]
+                except KeyError:
+                    pass
+            else:
+                dataset.base_storage[key] = value
+    finally:
+        if read_only:
+            dataset.base_storage.enable_readonly()
@@ -5,6 +5,7 @@ import numpy as np
 import deeplake
 from deeplake.core.dataset import Dataset as DeepLakeDataset
 from deeplake.core.vectorstore.vector_search import utils
+from deeplake.core.vectorstore.vector_search.python import quantization
 from deeplake.util.exceptions import (
     TransformError,
     FailedIngestionError,
@@ -28,6 +29,7 @@ class DataIngestion:
         retry_attempt: int,
         total_samples_processed: int,
         logger,
+        quantizers: Optional[Dict[str, Any]] = None,
     ):
         self.elements = elements
         self.dataset = dataset
@@ -38,6 +40,7 @@ class DataIngestion:
         self.total_samples_processed = total_samples_processed
         self.embedding_tensor = embedding_tensor
         self.logger = logger
+        self.quantizers = quantizers
 
     def collect_batched_data(self, ingestion_batch_size=None):
         ingestion_batch_size = ingestion_batch_size or self.ingestion_batch_size
@@ -103,6 +106,7 @@ class DataIngestion:
             ingest(
                 embedding_function=self.embedding_function,
                 embedding_tensor=self.embedding_tensor,
+                quantizers=self.quantizers,
             ).eval(
                 batched,
                 self.dataset,
@@ -150,6 +154,7 @@ class DataIngestion:
                 total_samples_processed=self.total_samples_processed,
                 logger=self.logger,
                 embedding_tensor=self.embedding_tensor,
+                quantizers=self.quantizers,
             )
             data_ingestion.run()
 
@@ -160,6 +165,7 @@ def ingest(
     sample_out: list,
     embedding_function,
     embedding_tensor,
+    quantizers=None,
 ) -> None:
     embeds: List[Optional[np.ndarray]] = [None] * len(sample_in)
     if embedding_function:
@@ -180,6 +186,7 @@ def ingest(
                 raise IncorrectEmbeddingShapeError()
             embeds.append(embedding)
 
+    samples = []
     for s, emb in zip(sample_in, embeds):
         sample_in_i = {tensor_name: s[tensor_name] for tensor_name in s}
 
@@ -187,4 +194,17 @@ def ingest(
             for tensor in embedding_tensor:
                 sample_in_i[tensor] = np.array(emb, dtype=np.float32)
 
-        sample_out.append(sample_in_i)
+        samples.append(sample_in_i)
+
+    # quantized embedding tensors store codes, the whole batch is encoded at once. The full precision copies
+    # are hidden tensors, which are written after the transform
+    for tensor, quantizer in (quantizers or {}).items():
+        if samples and tensor in samples[0]:
+            codes = quantization.quantize_embeddings(
+                quantizer, tensor, [sample[tensor] for sample in samples]
+            )[tensor]
+            for sample, code in zip(samples, codes):
+                sample[tensor] = code
+
+    for sample in samples:
+        sample_out.append(sample)
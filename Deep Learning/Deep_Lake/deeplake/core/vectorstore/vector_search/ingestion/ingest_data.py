@@ -19,6 +19,7 @@ def run_data_ingestion(
     retry_attempt: int = 0,
     total_samples_processed: int = 0,
     logger: Optional[logging.Logger] = None,
+    quantizers: Optional[Dict[str, Any]] = None,
 ):
     """Running data ingestion into deeplake dataset.
 
@@ -33,6 +34,7 @@ def run_data_ingestion(
         retry_attempt (int): The number of retry attempts already passed.
         total_samples_processed (int): The number of samples processed before transforms stopped. Defaults to 0.
         logger (Optional[logging.Logger]): logger where all warnings are logged. Defaults to None.
+        quantizers (Optional[Dict[str, Any]]): Trained quantizers of the quantized embedding tensors, used to encode their embeddings. Defaults to None.
     """
 
     data_ingestion = DataIngestion(
@@ -45,6 +47,7 @@ def run_data_ingestion(
         retry_attempt=retry_attempt,
         total_samples_processed=total_samples_processed,
         logger=logger,
+        quantizers=quantizers,
     )
 
     data_ingestion.run()
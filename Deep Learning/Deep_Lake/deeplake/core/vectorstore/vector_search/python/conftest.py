@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def clustered_data():
+    """Returns a function generating float32 embeddings drawn around random cluster centers."""
+
+    def generate(num_rows, dim=32, num_clusters=50, scale=10, seed=0):
+        rng = np.random.default_rng(seed)
+        centers = rng.normal(size=(num_clusters, dim)) * scale
+        labels = rng.integers(0, num_clusters, size=num_rows)
+        return (centers[labels] + rng.normal(size=(num_rows, dim))).astype(np.float32)
+
+    return generate
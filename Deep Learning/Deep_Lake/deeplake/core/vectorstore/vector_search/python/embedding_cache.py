@@ -0,0 +1,196 @@
+import atexit
+import hashlib
+import itertools
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+
+import numpy as np
+
+from deeplake.core.vectorstore.vector_search.dataset_cache import DatasetCache
+from deeplake.hooks import add_commit_dataset_hook, add_write_dataset_hook
+
+
+DEFAULT_EMBEDDING_CACHE_SIZE = 256 * 1024**2
+
+
+def _remove_files(paths: Set[str]):
+    for path in list(paths):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        paths.discard(path)
+
+
+class EmbeddingCache(DatasetCache):
+    """In-process cache of decoded embedding matrices used by the python vector search.
+
+    Entries are keyed by ``(dataset path, commit id, tensor key)``. Matrices of the head node are
+    dropped whenever the dataset is written to and are only served to the dataset object that
+    decoded them, so a search never sees stale embeddings. Matrices of past commits are immutable
+    and stay valid until they are evicted.
+
+    If ``memmap_dir`` is set, decoded matrices are written to ``.npy`` files in that directory and
+    memory-mapped, so they are paged in by the OS instead of being held in process memory. Files of
+    past commits are reused across processes, files of the head node are private to the process and
+    are deleted when their entry is dropped and at exit.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+        memmap_dir: Optional[str] = None,
+    ):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.memmap_dir = memmap_dir
+        # key -> (embeddings, weakref to the chunk engine of the head node or None for past commits)
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple]" = OrderedDict()
+        self._nbytes = 0
+        self._head_files: Set[str] = set()
+        self._head_file_ids = itertools.count()
+
+    @staticmethod
+    def _key(dataset, tensor) -> Tuple[str, str, str]:
+        return (dataset.path, dataset.pending_commit_id, tensor.key)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _memmap_path(self, key: Tuple[str, str, str], is_head: bool) -> str:
+        name = hashlib.sha1("/".join(key).encode("utf-8")).hexdigest()
+        if is_head:
+            # the head node can still change, so its files are private to this process and never reused
+            name = f"{name}.head.{os.getpid()}.{next(self._head_file_ids)}"
+        return os.path.abspath(os.path.join(self.memmap_dir, f"{name}.npy"))  # type: ignore
+
+    def _decode(self, tensor, key, is_head: bool) -> np.ndarray:
+        if self.memmap_dir is None:
+            return tensor.numpy()
+
+        os.makedirs(self.memmap_dir, exist_ok=True)
+        path = self._memmap_path(key, is_head)
+        if not is_head and os.path.exists(path):
+            return np.load(path, mmap_mode="r")
+
+        embeddings = tensor.numpy()
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        memmap = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=embeddings.dtype, shape=embeddings.shape
+        )
+        memmap[:] = embeddings
+        memmap.flush()
+        del memmap
+        os.replace(tmp_path, path)
+        if is_head:
+            with self._lock:
+                if not self._head_files:
+                    atexit.register(_remove_files, self._head_files)
+                self._head_files.add(path)
+        return np.load(path, mmap_mode="r")
+
+    def _drop(self, key):
+        embeddings = self._entries.pop(key)[0]
+        self._nbytes -= self._entry_nbytes(embeddings)
+        filename = getattr(embeddings, "filename", None)
+        if filename in self._head_files and not any(
+            getattr(entry[0], "filename", None) == filename
+            for entry in self._entries.values()
+        ):
+            _remove_files({filename})
+            self._head_files.discard(filename)
+
+    def _put(self, key, entry: Tuple):
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = entry
+        self._nbytes += self._entry_nbytes(entry[0])
+        while self._nbytes > self.max_bytes and len(self._entries) > 1:
+            self._drop(next(iter(self._entries)))
+
+    def _lookup(self, dataset, key, full_tensor) -> Optional[np.ndarray]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        embeddings, engine_ref = entry
+        if len(embeddings) != full_tensor.num_samples or (
+            engine_ref is not None and engine_ref() is not full_tensor.chunk_engine
+        ):
+            return None
+        self._entries.move_to_end(key)
+        return embeddings
+
+    @staticmethod
+    def _entry_nbytes(embeddings: np.ndarray) -> int:
+        # memory-mapped matrices live in the page cache, not in the process
+        return 0 if isinstance(embeddings, np.memmap) else embeddings.nbytes
+
+    def get(self, dataset, tensor_name: str) -> np.ndarray:
+        """Returns the embeddings of ``tensor_name`` for the rows of ``dataset`` (which can be a view).
+
+        The matrix of the whole tensor is decoded once and cached, views are served by indexing into it.
+        The returned array must not be modified.
+        """
+        tensor = dataset[tensor_name]
+        if not self.enabled:
+            return tensor.numpy()
+
+        full_tensor = dataset.version_state["full_tensors"][tensor.key]
+        key = self._key(dataset, tensor)
+        with self._lock:
+            embeddings = self._lookup(dataset, key, full_tensor)
+
+        if embeddings is None:
+            is_head = dataset.version_state["commit_node"].is_head_node
+            embeddings = self._decode(full_tensor, key, is_head)
+            if not isinstance(embeddings, np.memmap):
+                embeddings.setflags(write=False)
+            engine_ref = weakref.ref(full_tensor.chunk_engine) if is_head else None
+            with self._lock:
+                self._put(key, (embeddings, engine_ref))
+
+        if tensor.index.is_trivial():
+            return embeddings
+        rows = list(tensor.index.values[0].indices(full_tensor.num_samples))
+        return embeddings[rows]
+
+    def get_cached(self, dataset, tensor_name: str) -> Optional[np.ndarray]:
+        """Returns the cached matrix of the whole tensor if it is present and up to date, without decoding it otherwise."""
+        if not self.enabled:
+            return None
+        tensor = dataset[tensor_name]
+        full_tensor = dataset.version_state["full_tensors"][tensor.key]
+        with self._lock:
+            return self._lookup(dataset, self._key(dataset, tensor), full_tensor)
+
+    def _on_write(self, dataset):
+        self.invalidate(dataset.path, dataset.pending_commit_id)
+
+    def _carry_to_head(self, dataset, committed):
+        head_id = dataset.pending_commit_id
+        full_tensors = dataset.version_state["full_tensors"]
+        with self._lock:
+            for key, (embeddings, engine_ref) in committed:
+                if self._entries.get(key, (None,))[0] is not embeddings:
+                    continue
+                # the committed matrix is immutable from now on
+                self._entries[key] = (embeddings, None)
+                if engine_ref is not None and key[2] in full_tensors:
+                    head_engine = full_tensors[key[2]].chunk_engine
+                    self._put(
+                        (key[0], head_id, key[2]),
+                        (embeddings, weakref.ref(head_engine)),
+                    )
+
+
+embedding_cache = EmbeddingCache()
+
+add_write_dataset_hook(embedding_cache._on_write, "embedding_cache_write")
+add_commit_dataset_hook(embedding_cache._on_commit, "embedding_cache_commit")
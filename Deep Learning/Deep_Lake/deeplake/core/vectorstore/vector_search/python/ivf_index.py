@@ -0,0 +1,352 @@
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from deeplake.core.vectorstore.vector_search.index_storage import (
+    arrays_frombuffer,
+    arrays_tobytes,
+    write_to_storage,
+)
+from deeplake.core.vectorstore.vector_search.python.search_algorithm import (
+    distance_metric_map,
+    top_k,
+)
+
+
+VECTOR_INDEX_FOLDER = "_vector_index"
+IVF_INDEX_FILENAME = "ivf_index.npz"
+
+DEFAULT_INDEX_PARAMS: Dict[str, Any] = {
+    "type": "ivf",
+    "nlist": None,  # number of clusters, inferred from the number of rows if None
+    "nprobe": 8,  # number of clusters visited per query
+    "distance_metric": "cos",  # metric the coarse quantizer is trained for
+    "threshold": 100_000,  # minimum number of rows before an index is built
+    "kmeans_iterations": 10,
+    "seed": 0,
+}
+
+KMEANS_MAX_POINTS_PER_CENTROID = 256
+ASSIGNMENT_BATCH_SIZE = 65536
+
+
+def get_vector_index_key(commit_id: str, embedding_tensor: str) -> str:
+    return "/".join(
+        (VECTOR_INDEX_FOLDER, commit_id, embedding_tensor, IVF_INDEX_FILENAME)
+    )
+
+
+def parse_index_params(index_params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merges user specified ``index_params`` with the defaults and validates them."""
+    params = dict(DEFAULT_INDEX_PARAMS)
+    if index_params:
+        unknown = set(index_params) - set(DEFAULT_INDEX_PARAMS)
+        if unknown:
+            raise ValueError(
+                f"Invalid index_params: {sorted(unknown)}. Valid keys are {list(DEFAULT_INDEX_PARAMS)}."
+            )
+        params.update(index_params)
+
+    if params["type"] != "ivf":
+        raise ValueError(
+            f"Unsupported vector index type `{params['type']}`. Supported types are: `ivf`."
+        )
+    params["distance_metric"] = params["distance_metric"].lower()
+    if params["distance_metric"] not in distance_metric_map:
+        raise ValueError(
+            f"Unsupported distance metric `{params['distance_metric']}` for the vector index."
+        )
+    return params
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Returns the index of the closest (l2) centroid for every row in ``vectors``."""
+    centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGNMENT_BATCH_SIZE):
+        block = vectors[start : start + ASSIGNMENT_BATCH_SIZE]
+        # ||x||^2 is constant per row, so it does not affect the argmin
+        distances = centroid_norms - 2 * block @ centroids.T
+        assignments[start : start + len(block)] = np.argmin(distances, axis=1)
+    return assignments
+
+
+def _kmeans(vectors: np.ndarray, nlist: int, iterations: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    max_points = nlist * KMEANS_MAX_POINTS_PER_CENTROID
+    if len(vectors) > max_points:
+        vectors = vectors[np.sort(rng.choice(len(vectors), max_points, replace=False))]
+
+    centroids = vectors[rng.choice(len(vectors), nlist, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = _assign(vectors, centroids)
+        counts = np.bincount(assignments, minlength=nlist)
+        non_empty = counts > 0
+        order = np.argsort(assignments, kind="stable")
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        sums = np.add.reduceat(vectors[order], offsets[non_empty], axis=0)
+        centroids[non_empty] = sums / counts[non_empty, None]
+        num_empty = nlist - int(non_empty.sum())
+        if num_empty:
+            # re-seed empty clusters with random points so that every list is used
+            centroids[~non_empty] = vectors[rng.choice(len(vectors), num_empty)]
+    return centroids.astype(np.float32)
+
+
+class IVFIndex:
+    """Inverted file (IVF-flat) index over the rows of an embedding tensor.
+
+    Rows are clustered around ``nlist`` centroids with k-means. A query only scores the rows
+    of the ``nprobe`` clusters closest to it, so the cost of a search is roughly ``nprobe / nlist``
+    of a brute force search. Vectors and cluster assignments are kept aligned with the row
+    numbers of the dataset, which keeps incremental appends, pops and updates cheap.
+
+    The vectors are the data stored in the embedding tensor. For a quantized tensor these are the
+    codes of its ``quantizer``, which are decoded to assign them to clusters and scored directly.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        assignments: np.ndarray,
+        vectors: np.ndarray,
+        distance_metric: str = "cos",
+        nprobe: int = 8,
+        commit_id: Optional[str] = None,
+        quantizer=None,
+        quantizer_training_rows: int = 0,
+    ):
+        self.centroids = centroids
+        self.assignments = assignments
+        self.vectors = vectors
+        self.distance_metric = distance_metric
+        self.nprobe = nprobe
+        self.commit_id = commit_id
+        self.quantizer = quantizer
+        self.quantizer_training_rows = quantizer_training_rows
+        self._order: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+
+    @classmethod
+    def build(
+        cls, vectors: np.ndarray, index_params: Optional[Dict] = None, quantizer=None
+    ):
+        """Trains the coarse quantizer on ``vectors`` and assigns every row to a cluster.
+        ``vectors`` are codes of ``quantizer`` if it is specified.
+        """
+        params = parse_index_params(index_params)
+        if quantizer is None:
+            vectors = np.array(vectors, dtype=np.float32)
+        else:
+            vectors = np.array(vectors)
+        if vectors.ndim != 2 or len(vectors) == 0:
+            raise ValueError(
+                "A vector index can only be built from a non-empty 2D array."
+            )
+
+        nlist = params["nlist"] or max(1, int(np.sqrt(len(vectors))))
+        nlist = min(nlist, len(vectors))
+
+        index = cls(
+            centroids=np.empty((0, vectors.shape[1]), dtype=np.float32),
+            assignments=np.empty(0, dtype=np.int32),
+            vectors=vectors,
+            distance_metric=params["distance_metric"],
+            nprobe=params["nprobe"],
+            quantizer=quantizer,
+            quantizer_training_rows=quantizer.num_training_rows if quantizer else 0,
+        )
+        embeddings = vectors if quantizer is None else quantizer.decode(vectors)
+        index.centroids = _kmeans(
+            index._quantizer_input(embeddings),
+            nlist,
+            params["kmeans_iterations"],
+            params["seed"],
+        )
+        index.assignments = _assign(index._quantizer_input(embeddings), index.centroids)
+        return index
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.vectors)
+
+    @property
+    def quantizer_is_current(self) -> bool:
+        """Whether the stored codes were encoded by the current state of the quantizer, which changes when it is refitted."""
+        return (
+            self.quantizer is None
+            or self.quantizer.num_training_rows == self.quantizer_training_rows
+        )
+
+    def _quantizer_input(self, vectors: np.ndarray) -> np.ndarray:
+        if self.distance_metric == "cos":
+            return _normalize(vectors)
+        return vectors
+
+    def _invalidate(self):
+        self._order = None
+        self._offsets = None
+
+    def _inverted_lists(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._order is None:
+            self._order = np.argsort(self.assignments, kind="stable")
+            self._offsets = np.searchsorted(
+                self.assignments[self._order], np.arange(self.nlist + 1)
+            )
+        return self._order, self._offsets  # type: ignore
+
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        k: int = 4,
+        distance_metric: str = "l2",
+        nprobe: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate k nearest neighbour search.
+
+        Args:
+            query_embedding (np.ndarray): 1D query vector.
+            k (int): Number of neighbours to return.
+            distance_metric (str): Metric used to score the candidate rows. One of ``"l2"``, ``"l1"``, ``"max"``, ``"cos"``.
+            nprobe (int, optional): Number of clusters to visit. Defaults to the ``nprobe`` the index was created with.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Row indices of the neighbours and their scores, best first.
+        """
+        query_embedding = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+
+        quantizer_query = self._quantizer_input(query_embedding[None, :])[0]
+        centroid_distances = np.linalg.norm(self.centroids - quantizer_query, axis=1)
+        if nprobe < self.nlist:
+            probe = np.argpartition(centroid_distances, nprobe - 1)[:nprobe]
+        else:
+            probe = np.arange(self.nlist)
+
+        order, offsets = self._inverted_lists()
+        candidates = np.concatenate(
+            [order[offsets[list_id] : offsets[list_id + 1]] for list_id in probe]
+        )
+        if len(candidates) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        if self.quantizer is not None:
+            distances = self.quantizer.distances(
+                query_embedding, self.vectors[candidates], distance_metric
+            )
+        else:
+            distances = distance_metric_map[distance_metric](
+                query_embedding, self.vectors[candidates]
+            )
+        positions, distances = top_k(distances, k, distance_metric)
+        return candidates[positions], distances
+
+    def _as_stored(self, vectors: np.ndarray) -> np.ndarray:
+        if self.quantizer is not None:
+            return np.asarray(vectors, dtype=self.vectors.dtype)
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Closest clusters of stored ``vectors``, which are decoded first if they are codes."""
+        if self.quantizer is not None:
+            vectors = self.quantizer.decode(vectors)
+        return _assign(self._quantizer_input(vectors), self.centroids)
+
+    def add(self, vectors: np.ndarray):
+        """Appends rows to the end of the index."""
+        vectors = self._as_stored(vectors)
+        if len(vectors) == 0:
+            return
+        self.assignments = np.concatenate((self.assignments, self._assign(vectors)))
+        self.vectors = np.concatenate((self.vectors, vectors))
+        self._invalidate()
+
+    def remove(self, row_ids):
+        """Removes the vectors of ``row_ids``, renumbering the rows that follow them."""
+        mask = np.ones(self.num_rows, dtype=bool)
+        mask[np.asarray(row_ids, dtype=np.int64)] = False
+        self.assignments = self.assignments[mask]
+        self.vectors = self.vectors[mask]
+        self._invalidate()
+
+    def update(self, row_ids, vectors: np.ndarray):
+        """Replaces the vectors at ``row_ids`` and reassigns them to their closest clusters."""
+        row_ids = np.asarray(row_ids, dtype=np.int64)
+        vectors = self._as_stored(vectors)
+        self.vectors[row_ids] = vectors
+        self.assignments[row_ids] = self._assign(vectors)
+        self._invalidate()
+
+    def tobytes(self) -> bytes:
+        meta = {
+            "distance_metric": self.distance_metric,
+            "nprobe": self.nprobe,
+            "commit_id": self.commit_id,
+            "quantizer_training_rows": self.quantizer_training_rows,
+        }
+        return arrays_tobytes(
+            meta,
+            centroids=self.centroids,
+            assignments=self.assignments,
+            vectors=self.vectors,
+        )
+
+    @classmethod
+    def frombuffer(cls, buffer: bytes, quantizer=None):
+        meta, arrays = arrays_frombuffer(buffer)
+        return cls(
+            centroids=arrays["centroids"],
+            assignments=arrays["assignments"],
+            vectors=arrays["vectors"],
+            quantizer=quantizer,
+            **meta,
+        )
+
+
+def load_index(dataset, embedding_tensor: str, quantizer=None) -> Optional[IVFIndex]:
+    """Loads the index of ``embedding_tensor`` from the dataset's storage. Returns None if there is no up to date index.
+    ``quantizer`` is the quantizer of the tensor if it stores quantized embeddings.
+
+    Indexes are stored per commit, so every branch and commit that was searched keeps its own index.
+    """
+    try:
+        buffer = dataset.base_storage[
+            get_vector_index_key(dataset.pending_commit_id, embedding_tensor)
+        ]
+    except KeyError:
+        return None
+    index = IVFIndex.frombuffer(buffer, quantizer)
+    if not index_is_up_to_date(index, dataset, embedding_tensor):
+        return None
+    return index
+
+
+def save_index(dataset, embedding_tensor: str, index: IVFIndex):
+    index.commit_id = dataset.pending_commit_id
+    write_to_storage(
+        dataset,
+        {get_vector_index_key(index.commit_id, embedding_tensor): index.tobytes()},
+    )
+
+
+def discard_index(dataset, commit_id: str, embedding_tensor: str):
+    """Deletes the stored index of ``embedding_tensor`` in ``commit_id``, if there is one."""
+    write_to_storage(dataset, {get_vector_index_key(commit_id, embedding_tensor): None})
+
+
+def index_is_up_to_date(index: IVFIndex, dataset, embedding_tensor: str) -> bool:
+    return (
+        index.commit_id == dataset.pending_commit_id
+        and index.num_rows == len(dataset[embedding_tensor])
+        and index.quantizer_is_current
+    )
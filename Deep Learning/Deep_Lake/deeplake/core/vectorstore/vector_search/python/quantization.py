@@ -0,0 +1,484 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from deeplake.core.vectorstore.vector_search import utils
+from deeplake.core.vectorstore.vector_search.index_storage import (
+    arrays_frombuffer,
+    arrays_tobytes,
+    write_to_storage,
+)
+from deeplake.core.vectorstore.vector_search.python.ivf_index import (
+    VECTOR_INDEX_FOLDER,
+    _assign,
+    _kmeans,
+)
+from deeplake.core.vectorstore.vector_search.python.search_algorithm import (
+    distance_metric_map,
+    top_k,
+)
+
+
+QUANTIZER_FILENAME = "quantizer.npz"
+# tensor info key of the commit whose quantizer decodes the codes of the tensor
+QUANTIZER_COMMIT_INFO_KEY = "quantizer_commit_id"
+
+DEFAULT_QUANTIZATION_PARAMS: Dict[str, Any] = {
+    "type": None,  # one of "float16", "int8", "pq"
+    "pq_m": 8,  # number of sub-quantizers of "pq", must divide the embedding dimension
+    "training_size": 65536,  # maximum number of rows the int8 ranges and pq codebooks are trained on
+    "kmeans_iterations": 10,
+    "seed": 0,
+    "store_full_precision": False,  # keep a float32 copy in a hidden tensor for exact re-ranking
+    "rerank_factor": 4,  # k * rerank_factor candidates are re-ranked on the float32 copy
+}
+
+CODE_DTYPES = {"float16": "float16", "int8": "int8", "pq": "uint8"}
+
+PQ_NUM_CENTROIDS = 256
+DISTANCE_BLOCK_SIZE = 65536
+REFIT_GROWTH_FACTOR = 2
+
+
+def get_quantizer_key(commit_id: str, embedding_tensor: str) -> str:
+    return "/".join(
+        (VECTOR_INDEX_FOLDER, commit_id, embedding_tensor, QUANTIZER_FILENAME)
+    )
+
+
+def get_full_precision_tensor(embedding_tensor: str) -> str:
+    return f"_{embedding_tensor}_full_precision"
+
+
+def parse_quantization_params(quantization: Dict[str, Any]) -> Dict[str, Any]:
+    """Merges user specified ``quantization`` params with the defaults and validates them."""
+    if isinstance(quantization, str):
+        quantization = {"type": quantization}
+
+    unknown = set(quantization) - set(DEFAULT_QUANTIZATION_PARAMS)
+    if unknown:
+        raise ValueError(
+            f"Invalid quantization params: {sorted(unknown)}. Valid keys are {list(DEFAULT_QUANTIZATION_PARAMS)}."
+        )
+    params = dict(DEFAULT_QUANTIZATION_PARAMS)
+    params.update(quantization)
+
+    if params["type"] not in CODE_DTYPES:
+        raise ValueError(
+            f"Unsupported quantization type `{params['type']}`. Supported types are: {list(CODE_DTYPES)}."
+        )
+    if params["rerank_factor"] < 1:
+        raise ValueError("`rerank_factor` should be a positive integer.")
+    return params
+
+
+class Quantizer:
+    """Compressed representation of the rows of an embedding tensor.
+
+    The embedding tensor stores the codes returned by :meth:`encode`, and the python search scores a
+    query against those codes with :meth:`distances`, without materializing the float32 matrix.
+    """
+
+    type = ""
+
+    def __init__(self, params: Dict[str, Any]):
+        self.params = params
+        self.num_training_rows = 0
+        # commit the quantizer was saved in, None if it was never saved
+        self.commit_id: Optional[str] = None
+
+    @property
+    def is_trained(self) -> bool:
+        return True
+
+    def train(self, vectors: np.ndarray):
+        pass
+
+    def needs_refit(self, num_rows: int) -> bool:
+        """Whether the quantizer should be retrained once the tensor holds ``num_rows`` rows.
+
+        Quantizers fitted on a small first batch are retrained every time the tensor grows by
+        ``REFIT_GROWTH_FACTOR``, until they were trained on ``training_size`` rows.
+        """
+        return (
+            0 < self.num_training_rows < self.params["training_size"]
+            and num_rows >= REFIT_GROWTH_FACTOR * self.num_training_rows
+        )
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def distances(
+        self, query_embedding: np.ndarray, codes: np.ndarray, distance_metric: str
+    ) -> np.ndarray:
+        """Scores ``query_embedding`` against every row of ``codes``.
+
+        Codes are decoded a block at a time, so the temporary float32 memory is bounded by the block size.
+        """
+        query_embedding = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        distances = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), DISTANCE_BLOCK_SIZE):
+            block = self.decode(codes[start : start + DISTANCE_BLOCK_SIZE])
+            distances[start : start + len(block)] = distance_metric_map[
+                distance_metric
+            ](query_embedding, block)
+        return distances
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {}
+
+    def _load_arrays(self, arrays):
+        pass
+
+    def tobytes(self) -> bytes:
+        meta = {"params": self.params, "num_training_rows": self.num_training_rows}
+        return arrays_tobytes(meta, **self._arrays())
+
+    @staticmethod
+    def frombuffer(buffer: bytes) -> "Quantizer":
+        meta, arrays = arrays_frombuffer(buffer)
+        quantizer = create_quantizer(meta["params"])
+        quantizer.num_training_rows = meta["num_training_rows"]
+        quantizer._load_arrays(arrays)
+        return quantizer
+
+
+class Float16Quantizer(Quantizer):
+    """Stores embeddings as float16, halving their size."""
+
+    type = "float16"
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        return np.asarray(vectors, dtype=np.float32).astype(np.float16)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return np.asarray(codes, dtype=np.float32)
+
+
+class Int8Quantizer(Quantizer):
+    """Scalar quantization of every dimension to an int8, a quarter of the float32 size.
+
+    Every dimension has its own center and scale, fitted to the range of the training rows.
+    Values outside of that range are clipped.
+    """
+
+    type = "int8"
+
+    def __init__(self, params: Dict[str, Any]):
+        super().__init__(params)
+        self.center: Optional[np.ndarray] = None
+        self.scale: Optional[np.ndarray] = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self.scale is not None
+
+    def train(self, vectors: np.ndarray):
+        vectors = _training_sample(vectors, self.params)
+        self.num_training_rows = len(vectors)
+        low, high = vectors.min(axis=0), vectors.max(axis=0)
+        self.center = ((low + high) / 2).astype(np.float32)
+        scale = ((high - low) / 254).astype(np.float32)
+        scale[scale == 0] = 1
+        self.scale = scale
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        codes = np.rint((vectors - self.center) / self.scale)
+        return np.clip(codes, -127, 127).astype(np.int8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return codes.astype(np.float32) * self.scale + self.center
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {"center": self.center, "scale": self.scale}  # type: ignore
+
+    def _load_arrays(self, arrays):
+        self.center = arrays["center"]
+        self.scale = arrays["scale"]
+
+
+class PQQuantizer(Quantizer):
+    """Product quantization: every embedding is split into ``pq_m`` sub-vectors, each stored as the
+    uint8 id of its closest centroid in a per sub-space codebook of 256 centroids.
+
+    A ``D`` dimensional float32 embedding shrinks from ``4 * D`` to ``pq_m`` bytes. Queries are scored with
+    asymmetric distance computation: the distances between the query sub-vectors and all the centroids
+    are computed once, and the distance to a row is the sum of ``pq_m`` table lookups.
+    """
+
+    type = "pq"
+
+    def __init__(self, params: Dict[str, Any]):
+        super().__init__(params)
+        self.codebooks: Optional[np.ndarray] = None  # (pq_m, num_centroids, dim / pq_m)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.codebooks is not None
+
+    @property
+    def m(self) -> int:
+        return self.params["pq_m"]
+
+    def train(self, vectors: np.ndarray):
+        vectors = _training_sample(vectors, self.params)
+        if vectors.shape[1] % self.m:
+            raise ValueError(
+                f"The embedding dimension {vectors.shape[1]} is not divisible by pq_m={self.m}."
+            )
+        self.num_training_rows = len(vectors)
+        num_centroids = min(PQ_NUM_CENTROIDS, len(vectors))
+        self.codebooks = np.stack(
+            [
+                _kmeans(
+                    np.ascontiguousarray(sub_vectors),
+                    num_centroids,
+                    self.params["kmeans_iterations"],
+                    self.params["seed"],
+                )
+                for sub_vectors in np.split(vectors, self.m, axis=1)
+            ]
+        )
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        codes = np.empty((len(vectors), self.m), dtype=np.uint8)
+        for i, sub_vectors in enumerate(np.split(vectors, self.m, axis=1)):
+            codes[:, i] = _assign(sub_vectors, self.codebooks[i])  # type: ignore
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        codes = codes.reshape(len(codes), self.m)
+        return np.concatenate(
+            [self.codebooks[i][codes[:, i]] for i in range(self.m)], axis=1  # type: ignore
+        )
+
+    def distances(
+        self, query_embedding: np.ndarray, codes: np.ndarray, distance_metric: str
+    ) -> np.ndarray:
+        codes = codes.reshape(len(codes), self.m)
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(self.m, -1)
+        codebooks = self.codebooks
+
+        # every metric is a reduction over the sub-spaces, so it is computed from (pq_m, num_centroids) tables
+        if distance_metric == "cos":
+            dots = _lookup(np.einsum("mkd,md->mk", codebooks, query), codes, np.add)
+            norms = _lookup(
+                np.einsum("mkd,mkd->mk", codebooks, codebooks), codes, np.add
+            )
+            return dots / (np.linalg.norm(query) * np.sqrt(norms))
+
+        differences = codebooks - query[:, None, :]  # type: ignore
+        if distance_metric == "l2":
+            return np.sqrt(
+                _lookup(
+                    np.einsum("mkd,mkd->mk", differences, differences), codes, np.add
+                )
+            )
+        if distance_metric == "l1":
+            return _lookup(np.abs(differences).sum(axis=-1), codes, np.add)
+        return _lookup(np.abs(differences).max(axis=-1), codes, np.maximum)
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {"codebooks": self.codebooks}  # type: ignore
+
+    def _load_arrays(self, arrays):
+        self.codebooks = arrays["codebooks"]
+
+
+QUANTIZERS = {
+    quantizer.type: quantizer
+    for quantizer in (Float16Quantizer, Int8Quantizer, PQQuantizer)
+}
+
+
+def _training_sample(vectors: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim != 2 or len(vectors) == 0:
+        raise ValueError("A quantizer can only be trained on a non-empty 2D array.")
+    if len(vectors) > params["training_size"]:
+        rng = np.random.default_rng(params["seed"])
+        rows = rng.choice(len(vectors), params["training_size"], replace=False)
+        vectors = vectors[np.sort(rows)]
+    return vectors
+
+
+def _lookup(tables: np.ndarray, codes: np.ndarray, reduce) -> np.ndarray:
+    result = tables[0][codes[:, 0]].astype(np.float32)
+    for i in range(1, len(tables)):
+        reduce(result, tables[i][codes[:, i]], out=result)
+    return result
+
+
+def create_quantizer(params: Dict[str, Any]) -> Quantizer:
+    return QUANTIZERS[params["type"]](params)
+
+
+def create_quantized_tensor(dataset, tensor_args: Dict[str, Any], quantization):
+    """Creates an embedding tensor that stores the codes of ``quantization`` instead of float32 embeddings."""
+    params = parse_quantization_params(quantization)
+    if tensor_args.get("htype") != "embedding":
+        raise ValueError(
+            f"Quantization is only supported for tensors of htype `embedding`, got `{tensor_args.get('htype')}`."
+        )
+    tensor = dataset.create_tensor(
+        **{**tensor_args, "dtype": CODE_DTYPES[params["type"]]}
+    )
+    tensor.info["quantization"] = params
+    create_full_precision_tensor(dataset, tensor_args["name"])
+
+
+def create_full_precision_tensor(dataset, embedding_tensor: str):
+    """Creates the hidden float32 tensor used for re-ranking, if ``embedding_tensor`` needs one and it is missing."""
+    params = dataset[embedding_tensor].info.get("quantization")
+    name = get_full_precision_tensor(embedding_tensor)
+    if params and params["store_full_precision"] and name not in dataset._tensors():
+        dataset.create_tensor(
+            name,
+            htype="generic",
+            dtype="float32",
+            hidden=True,
+            create_id_tensor=False,
+            create_sample_info_tensor=False,
+            create_shape_tensor=False,
+        )
+
+
+def find_full_precision_tensors(dataset) -> List[str]:
+    """Returns the hidden float32 tensors of the quantized embedding tensors of ``dataset``."""
+    return [
+        get_full_precision_tensor(tensor)
+        for tensor in utils.find_embedding_tensors(dataset)
+        if (dataset[tensor].info.get("quantization") or {}).get("store_full_precision")
+    ]
+
+
+def quantizer_commit_id(dataset, embedding_tensor: str) -> Optional[str]:
+    """Returns the commit whose quantizer encoded the rows of ``embedding_tensor`` in the current version."""
+    return dataset[embedding_tensor].info.get(QUANTIZER_COMMIT_INFO_KEY)
+
+
+def load_quantizer(dataset, embedding_tensor: str) -> Optional[Quantizer]:
+    """Returns the quantizer of ``embedding_tensor``, or None if the tensor stores float32 embeddings.
+    The quantizer is untrained if no embeddings were added yet.
+
+    Quantizers are stored per commit, and the version controlled info of the tensor records the commit of the
+    quantizer its codes were encoded with, so past commits and other branches are not affected by refits.
+    """
+    params = dataset[embedding_tensor].info.get("quantization")
+    if not params:
+        return None
+    commit_id = quantizer_commit_id(dataset, embedding_tensor)
+    if commit_id is None:
+        return create_quantizer(dict(params))
+    try:
+        buffer = dataset.base_storage[get_quantizer_key(commit_id, embedding_tensor)]
+    except KeyError:
+        return create_quantizer(dict(params))
+    quantizer = Quantizer.frombuffer(buffer)
+    quantizer.commit_id = commit_id
+    return quantizer
+
+
+def save_quantizer(dataset, embedding_tensor: str, quantizer: Quantizer):
+    commit_id = dataset.pending_commit_id
+    write_to_storage(
+        dataset, {get_quantizer_key(commit_id, embedding_tensor): quantizer.tobytes()}
+    )
+    quantizer.commit_id = commit_id
+    if quantizer_commit_id(dataset, embedding_tensor) != commit_id:
+        dataset[embedding_tensor].info[QUANTIZER_COMMIT_INFO_KEY] = commit_id
+
+
+def _stored_embeddings(dataset, embedding_tensor: str, quantizer: Quantizer):
+    """Float32 embeddings of the rows already in ``embedding_tensor``, exact if a full precision copy is stored."""
+    if quantizer.params["store_full_precision"]:
+        return dataset[get_full_precision_tensor(embedding_tensor)].numpy()
+    return quantizer.decode(dataset[embedding_tensor].numpy())
+
+
+def needs_training(
+    dataset, embedding_tensor: str, quantizer: Quantizer, num_new_rows: int
+) -> bool:
+    """Whether :func:`train_quantizer` has to (re)train ``quantizer`` before ``num_new_rows`` rows are added."""
+    if not quantizer.is_trained:
+        return True
+    return quantizer.needs_refit(len(dataset[embedding_tensor]) + num_new_rows)
+
+
+def train_quantizer(
+    dataset, embedding_tensor: str, quantizer: Quantizer, embeddings: np.ndarray
+):
+    """Trains ``quantizer`` on the ``embeddings`` about to be added to ``embedding_tensor`` and persists it.
+
+    An untrained quantizer is trained on ``embeddings``. A trained one is refitted on the stored rows and
+    ``embeddings`` when :meth:`Quantizer.needs_refit`, and the stored rows are re-encoded with it, since codes
+    are only meaningful for the quantizer they were encoded with.
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if not needs_training(dataset, embedding_tensor, quantizer, len(embeddings)):
+        return
+    num_rows = len(dataset[embedding_tensor]) if quantizer.is_trained else 0
+    if num_rows:
+        stored = _stored_embeddings(dataset, embedding_tensor, quantizer)
+        quantizer.train(np.concatenate((stored, embeddings)))
+        dataset[embedding_tensor][:num_rows] = quantizer.encode(stored)
+    else:
+        quantizer.train(embeddings)
+    save_quantizer(dataset, embedding_tensor, quantizer)
+
+
+def quantize_embeddings(
+    quantizer: Quantizer, embedding_tensor: str, embeddings
+) -> Dict[str, np.ndarray]:
+    """Returns the data to write for ``embeddings``: their codes and, if enabled, the float32 copy."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    data = {embedding_tensor: quantizer.encode(embeddings)}
+    if quantizer.params["store_full_precision"]:
+        data[get_full_precision_tensor(embedding_tensor)] = embeddings
+    return data
+
+
+def search(
+    deeplake_dataset,
+    query_embedding: np.ndarray,
+    codes: np.ndarray,
+    quantizer: Quantizer,
+    embedding_tensor: str,
+    distance_metric: str = "l2",
+    k: int = 4,
+) -> Tuple[Any, List]:
+    """Vector search on the codes of a quantized embedding tensor.
+
+    If the float32 embeddings are stored, the best ``k * rerank_factor`` rows according to the codes
+    are re-ranked on their exact embeddings.
+
+    Returns:
+        Tuple(DeepLakeDataset, List): A tuple containing the dataset view and scores for the embedding search.
+    """
+    if len(codes) == 0:
+        return deeplake_dataset[0:0], []
+
+    query_embedding = np.asarray(query_embedding, dtype=np.float32)
+    if len(query_embedding.shape) > 1:
+        query_embedding = query_embedding[0]
+
+    distances = quantizer.distances(query_embedding, codes, distance_metric)
+    if quantizer.params["store_full_precision"]:
+        candidates, _ = top_k(
+            distances, k * quantizer.params["rerank_factor"], distance_metric
+        )
+        full_precision = deeplake_dataset[get_full_precision_tensor(embedding_tensor)]
+        distances = distance_metric_map[distance_metric](
+            query_embedding, full_precision[candidates.tolist()].numpy()
+        )
+        positions, distances = top_k(distances, k, distance_metric)
+        positions = candidates[positions]
+    else:
+        positions, distances = top_k(distances, k, distance_metric)
+
+    return deeplake_dataset[positions.tolist()], distances.tolist()
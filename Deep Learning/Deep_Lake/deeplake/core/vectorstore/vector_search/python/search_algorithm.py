@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 from deeplake.core.dataset import Dataset as DeepLakeDataset
 
 import numpy as np
@@ -13,6 +13,103 @@ distance_metric_map = {
 }
 
 
+def _batch_l2(queries: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
+    # ||q - e||^2 = ||q||^2 - 2 q.e + ||e||^2, so all the distances come from a single matrix product
+    squared = (
+        np.einsum("ij,ij->i", queries, queries)[:, None]
+        - 2 * queries @ embeddings.T
+        + np.einsum("ij,ij->i", embeddings, embeddings)[None, :]
+    )
+    return np.sqrt(np.maximum(squared, 0))
+
+
+def _batch_cos(queries: np.ndarray, embeddings: np.ndarray) -> np.ndarray:
+    query_norms = np.linalg.norm(queries, axis=1)
+    embedding_norms = np.linalg.norm(embeddings, axis=1)
+    return (queries @ embeddings.T) / (query_norms[:, None] * embedding_norms[None, :])
+
+
+def _batch_per_query(metric: str):
+    # l1 and max have no matrix product form, broadcasting all the queries at once would need Q x N x D memory
+    return lambda queries, embeddings: np.stack(
+        [distance_metric_map[metric](query, embeddings) for query in queries]
+    )
+
+
+batch_distance_metric_map = {
+    "l2": _batch_l2,
+    "l1": _batch_per_query("l1"),
+    "max": _batch_per_query("max"),
+    "cos": _batch_cos,
+}
+
+
+def top_k(
+    distances: np.ndarray, k: int, distance_metric: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Selects the ``k`` best entries along the last axis of ``distances`` without fully sorting it.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Positions of the best entries and their distances, best first.
+    """
+    # cosine is a similarity, larger is better
+    keys = -distances if distance_metric == "cos" else distances
+    k = min(k, keys.shape[-1])
+    if k < keys.shape[-1]:
+        positions = np.argpartition(keys, k - 1, axis=-1)[..., :k]
+    else:
+        positions = np.broadcast_to(np.arange(k), keys.shape[:-1] + (k,))
+    order = np.argsort(np.take_along_axis(keys, positions, axis=-1), axis=-1)
+    positions = np.take_along_axis(positions, order, axis=-1)
+    return positions, np.take_along_axis(distances, positions, axis=-1)
+
+
+def batch_search(
+    query_embeddings: np.ndarray,
+    embedding_blocks: Iterable[np.ndarray],
+    distance_metric: str = "l2",
+    k: int = 4,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Exhaustive vector search for several queries at once.
+
+    Embeddings are consumed block by block and only the running top ``k`` of every query is kept,
+    so memory is bounded by the block size rather than by the number of embeddings.
+
+    Args:
+        query_embeddings (np.ndarray): Query matrix of shape (Q, D).
+        embedding_blocks (Iterable[np.ndarray]): Consecutive blocks of the embeddings to search, each of shape (B, D).
+        distance_metric (str): distance function 'l2' for Euclidean, 'l1' for Nuclear, 'max' l-infinity distance, 'cos' for cosine similarity.
+        k (int): number of nearest neighbors per query.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Row indices and distances of the nearest neighbours of every query, each of shape (Q, min(k, N)), best first.
+    """
+    query_embeddings = np.asarray(query_embeddings, dtype=np.float32)
+    if query_embeddings.ndim == 1:
+        query_embeddings = query_embeddings[None, :]
+
+    num_queries = len(query_embeddings)
+    best_indices = np.empty((num_queries, 0), dtype=np.int64)
+    best_distances = np.empty((num_queries, 0), dtype=np.float32)
+
+    offset = 0
+    for block in embedding_blocks:
+        if len(block) == 0:
+            continue
+        distances = batch_distance_metric_map[distance_metric](
+            query_embeddings, np.asarray(block, dtype=np.float32)
+        )
+        positions, distances = top_k(distances, k, distance_metric)
+
+        candidate_indices = np.concatenate((best_indices, positions + offset), axis=1)
+        candidate_distances = np.concatenate((best_distances, distances), axis=1)
+        positions, best_distances = top_k(candidate_distances, k, distance_metric)
+        best_indices = np.take_along_axis(candidate_indices, positions, axis=1)
+        offset += len(block)
+
+    return best_indices, best_distances
+
+
 def search(
     deeplake_dataset: DeepLakeDataset,
     query_embedding: np.ndarray,
@@ -42,15 +139,9 @@ def search(
 
         # Calculate the distance between the query_vector and all data_vectors
         distances = distance_metric_map[distance_metric](query_embedding, embeddings)
-        nearest_indices = np.argsort(distances)
-
-        nearest_indices = (
-            nearest_indices[::-1][:k]
-            if distance_metric in ["cos"]
-            else nearest_indices[:k]
-        )
+        nearest_indices, nearest_distances = top_k(distances, k, distance_metric)
 
         return (
             deeplake_dataset[nearest_indices.tolist()],
-            distances[nearest_indices].tolist(),
+            nearest_distances.tolist(),
         )
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+import deeplake
+from deeplake.core.vectorstore.vector_search.python.embedding_cache import (
+    EmbeddingCache,
+)
+
+
+@pytest.fixture
+def embedding_ds():
+    ds = deeplake.empty("mem://test_embedding_cache", overwrite=True)
+    ds.create_tensor("embedding", htype="embedding", dtype=np.float32)
+    ds.embedding.extend(np.arange(20, dtype=np.float32).reshape(10, 2))
+    return ds
+
+
+def test_cache_hit(embedding_ds):
+    cache = EmbeddingCache()
+    embeddings = cache.get(embedding_ds, "embedding")
+    np.testing.assert_array_equal(embeddings, embedding_ds.embedding.numpy())
+    assert not embeddings.flags.writeable
+    assert cache.get(embedding_ds, "embedding") is embeddings
+    assert cache.get_cached(embedding_ds, "embedding") is embeddings
+    assert len(cache) == 1
+    assert cache.nbytes == embeddings.nbytes
+
+    view = embedding_ds[[7, 2, 3]]
+    np.testing.assert_array_equal(
+        cache.get(view, "embedding"), embedding_ds.embedding.numpy()[[7, 2, 3]]
+    )
+    assert len(cache) == 1
+
+
+def test_cache_invalidation(embedding_ds):
+    cache = EmbeddingCache()
+    cache.get(embedding_ds, "embedding")
+
+    cache._on_write(embedding_ds)
+    assert cache.get_cached(embedding_ds, "embedding") is None
+
+    embedding_ds.embedding.pop(0)
+    # a different number of rows is never served
+    assert len(cache.get(embedding_ds, "embedding")) == 9
+
+    embedding_ds.embedding[0] = np.array([100, 100], dtype=np.float32)
+    cache._on_write(embedding_ds)
+    assert cache.get(embedding_ds, "embedding")[0].tolist() == [100, 100]
+
+    cache.invalidate(embedding_ds.path)
+    assert len(cache) == 0
+
+
+def test_cache_write_hook(embedding_ds):
+    from deeplake.core.vectorstore.vector_search.python.embedding_cache import (
+        embedding_cache,
+    )
+
+    embedding_cache.get(embedding_ds, "embedding")
+    embedding_ds.embedding[0] = np.array([-1, -1], dtype=np.float32)
+    assert embedding_cache.get_cached(embedding_ds, "embedding") is None
+    assert embedding_cache.get(embedding_ds, "embedding")[0].tolist() == [-1, -1]
+
+
+def test_cache_commit(embedding_ds):
+    cache = EmbeddingCache()
+    embeddings = cache.get(embedding_ds, "embedding")
+    first_commit = embedding_ds.commit()
+    cache._on_commit(embedding_ds)
+
+    # the new head is served from the matrix of the commit that was just made
+    assert cache.get_cached(embedding_ds, "embedding") is embeddings
+
+    embedding_ds.embedding.extend(np.zeros((2, 2), dtype=np.float32))
+    cache._on_write(embedding_ds)
+    assert len(cache.get(embedding_ds, "embedding")) == 12
+
+    embedding_ds.checkout(first_commit)
+    assert cache.get(embedding_ds, "embedding") is embeddings
+
+
+def test_cache_eviction(embedding_ds):
+    cache = EmbeddingCache(max_bytes=100)
+    embeddings = cache.get(embedding_ds, "embedding")
+    embedding_ds.commit()
+    cache.get(embedding_ds, "embedding")
+    # 2 matrices of 80 bytes don't fit, the least recently used one is evicted
+    assert len(cache) == 1
+    assert cache.nbytes == embeddings.nbytes
+
+
+def test_cache_memmap(embedding_ds, tmp_path):
+    cache = EmbeddingCache(memmap_dir=str(tmp_path))
+    embeddings = cache.get(embedding_ds, "embedding")
+    assert isinstance(embeddings, np.memmap)
+    np.testing.assert_array_equal(embeddings, embedding_ds.embedding.numpy())
+    assert cache.nbytes == 0
+
+    commit_id = embedding_ds.commit()
+    embedding_ds.checkout(commit_id)
+
+    # files of past commits are shared between caches
+    embeddings = cache.get(embedding_ds, "embedding")
+    other_cache = EmbeddingCache(memmap_dir=str(tmp_path))
+    other_embeddings = other_cache.get(embedding_ds, "embedding")
+    assert other_embeddings.filename == embeddings.filename
+
+
+def test_cache_memmap_head_files(embedding_ds, tmp_path):
+    cache = EmbeddingCache(memmap_dir=str(tmp_path))
+    cache.get(embedding_ds, "embedding")
+    assert len(list(tmp_path.glob("*.head.*"))) == 1
+
+    embedding_ds.embedding[0] = np.array([1, 1], dtype=np.float32)
+    cache._on_write(embedding_ds)
+    assert cache.get(embedding_ds, "embedding")[0].tolist() == [1, 1]
+    # the file of the dropped entry is deleted
+    assert len(list(tmp_path.glob("*.head.*"))) == 1
+    cache.clear()
+    assert not list(tmp_path.glob("*.head.*"))
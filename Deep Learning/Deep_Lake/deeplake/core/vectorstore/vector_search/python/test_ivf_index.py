@@ -0,0 +1,161 @@
+import time
+
+import numpy as np
+import pytest
+
+from deeplake.core.vectorstore.vector_search.python import search_algorithm
+from deeplake.core.vectorstore.vector_search.python.ivf_index import (
+    IVFIndex,
+    parse_index_params,
+)
+from deeplake.core.vectorstore.vector_search.python.quantization import (
+    create_quantizer,
+    parse_quantization_params,
+)
+
+
+def brute_force(embeddings, query, k, distance_metric):
+    distances = search_algorithm.distance_metric_map[distance_metric](query, embeddings)
+    order = np.argsort(distances)
+    if distance_metric == "cos":
+        order = order[::-1]
+    return order[:k]
+
+
+def recall(index, embeddings, queries, k, distance_metric, nprobe):
+    hits = 0
+    for query in queries:
+        expected = brute_force(embeddings, query, k, distance_metric)
+        found, _ = index.search(
+            query, k=k, distance_metric=distance_metric, nprobe=nprobe
+        )
+        hits += len(np.intersect1d(expected, found))
+    return hits / (k * len(queries))
+
+
+@pytest.mark.parametrize("distance_metric", ["l2", "cos"])
+def test_ivf_recall(distance_metric, clustered_data):
+    embeddings = clustered_data(5000)
+    queries = clustered_data(20, seed=1)
+    index = IVFIndex.build(
+        embeddings, {"nlist": 50, "distance_metric": distance_metric}
+    )
+
+    assert index.nlist == 50
+    assert index.num_rows == 5000
+    assert recall(index, embeddings, queries, 10, distance_metric, nprobe=8) >= 0.9
+    # visiting every cluster is an exhaustive search
+    assert recall(index, embeddings, queries, 10, distance_metric, nprobe=50) == 1.0
+
+
+def test_ivf_scores_sorted(clustered_data):
+    embeddings = clustered_data(1000)
+    index = IVFIndex.build(embeddings, {"nlist": 10, "distance_metric": "l2"})
+
+    indices, scores = index.search(embeddings[3], k=5, distance_metric="l2")
+    assert indices[0] == 3
+    assert np.all(np.diff(scores) >= 0)
+
+    indices, scores = index.search(embeddings[3], k=5, distance_metric="cos")
+    assert np.all(np.diff(scores) <= 0)
+
+    indices, _ = index.search(embeddings[3], k=5000, distance_metric="l2", nprobe=10)
+    assert len(indices) == 1000
+
+
+def test_ivf_incremental_updates(clustered_data):
+    embeddings = clustered_data(2000)
+    index = IVFIndex.build(embeddings[:1000], {"nlist": 20, "distance_metric": "l2"})
+
+    index.add(embeddings[1000:])
+    assert index.num_rows == 2000
+    indices, _ = index.search(embeddings[1500], k=1, distance_metric="l2")
+    assert indices[0] == 1500
+
+    index.remove([0, 1, 2])
+    assert index.num_rows == 1997
+    # rows after the removed ones are shifted down
+    indices, _ = index.search(embeddings[1500], k=1, distance_metric="l2")
+    assert indices[0] == 1497
+
+    new_vector = np.full((1, embeddings.shape[1]), 1000, dtype=np.float32)
+    index.update([10], new_vector)
+    indices, _ = index.search(new_vector[0], k=1, distance_metric="l2")
+    assert indices[0] == 10
+
+
+def test_ivf_serialization(clustered_data):
+    embeddings = clustered_data(500)
+    index = IVFIndex.build(embeddings, {"nlist": 8, "nprobe": 2})
+    index.commit_id = "abc"
+
+    loaded = IVFIndex.frombuffer(index.tobytes())
+    assert loaded.commit_id == "abc"
+    assert loaded.nprobe == 2
+    assert loaded.distance_metric == "cos"
+    np.testing.assert_array_equal(loaded.centroids, index.centroids)
+    np.testing.assert_array_equal(loaded.assignments, index.assignments)
+    np.testing.assert_array_equal(loaded.vectors, index.vectors)
+
+    query = embeddings[7]
+    np.testing.assert_array_equal(
+        loaded.search(query, k=4)[0], index.search(query, k=4)[0]
+    )
+
+
+def test_ivf_quantized(clustered_data):
+    embeddings = clustered_data(2000)
+    quantizer = create_quantizer(parse_quantization_params({"type": "int8"}))
+    quantizer.train(embeddings)
+    codes = quantizer.encode(embeddings)
+
+    # the index keeps the codes, not the float32 embeddings
+    index = IVFIndex.build(codes[:1500], {"nlist": 16}, quantizer)
+    index.add(codes[1500:])
+    assert index.vectors.dtype == np.int8
+    assert index.vectors.nbytes == codes.nbytes
+    assert recall(index, embeddings, embeddings[:20] + 0.01, 5, "l2", 16) >= 0.9
+
+    loaded = IVFIndex.frombuffer(index.tobytes(), quantizer)
+    assert loaded.quantizer_is_current
+    np.testing.assert_array_equal(loaded.vectors, codes)
+
+    quantizer.train(embeddings[:1000])
+    assert not loaded.quantizer_is_current
+
+
+def test_parse_index_params():
+    assert parse_index_params(None)["nprobe"] == 8
+    assert parse_index_params({"distance_metric": "L2"})["distance_metric"] == "l2"
+
+    with pytest.raises(ValueError):
+        parse_index_params({"type": "hnsw"})
+
+    with pytest.raises(ValueError):
+        parse_index_params({"bad_param": 1})
+
+    with pytest.raises(ValueError):
+        parse_index_params({"distance_metric": "dot"})
+
+
+@pytest.mark.parametrize("nprobe", [1, 4, 16, 64])
+def test_ivf_recall_vs_latency_benchmark(benchmark, nprobe, clustered_data):
+    """Recall@10 and latency of the IVF index compared to the brute force python search."""
+    embeddings = clustered_data(50_000, dim=64, num_clusters=200)
+    queries = clustered_data(50, dim=64, num_clusters=200, seed=1)
+    index = IVFIndex.build(embeddings, {"nlist": 256, "distance_metric": "l2"})
+
+    start = time.perf_counter()
+    for query in queries:
+        brute_force(embeddings, query, 10, "l2")
+    brute_force_latency = (time.perf_counter() - start) / len(queries)
+
+    def run_queries():
+        for query in queries:
+            index.search(query, k=10, distance_metric="l2", nprobe=nprobe)
+
+    benchmark(run_queries)
+    benchmark.extra_info["recall@10"] = recall(
+        index, embeddings, queries, 10, "l2", nprobe
+    )
+    benchmark.extra_info["brute_force_latency_s"] = brute_force_latency
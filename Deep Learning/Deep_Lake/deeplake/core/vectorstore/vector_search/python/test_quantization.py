@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from deeplake.core.vectorstore.vector_search.python import search_algorithm
+from deeplake.core.vectorstore.vector_search.python.quantization import (
+    Quantizer,
+    create_quantizer,
+    parse_quantization_params,
+)
+
+
+def trained_quantizer(quantization_type, embeddings):
+    quantizer = create_quantizer(
+        parse_quantization_params({"type": quantization_type, "pq_m": 8})
+    )
+    quantizer.train(embeddings)
+    return quantizer
+
+
+@pytest.mark.parametrize("quantization_type", ["float16", "int8", "pq"])
+@pytest.mark.parametrize("distance_metric", ["l2", "l1", "max", "cos"])
+def test_distances_on_codes(quantization_type, distance_metric, clustered_data):
+    embeddings = clustered_data(3000)
+    query = embeddings[5] + 0.01
+    quantizer = trained_quantizer(quantization_type, embeddings)
+    codes = quantizer.encode(embeddings)
+
+    # scoring the codes is the same as scoring the decoded embeddings
+    expected = search_algorithm.distance_metric_map[distance_metric](
+        query, quantizer.decode(codes)
+    )
+    distances = quantizer.distances(query, codes, distance_metric)
+    np.testing.assert_allclose(distances, expected, rtol=1e-3, atol=1e-3)
+
+    exact = search_algorithm.distance_metric_map[distance_metric](query, embeddings)
+    best, _ = search_algorithm.top_k(exact, 10, distance_metric)
+    candidates, _ = search_algorithm.top_k(distances, 40, distance_metric)
+    assert len(np.intersect1d(best, candidates)) >= 8
+
+
+def test_code_sizes(clustered_data):
+    embeddings = clustered_data(1000, dim=64)
+    sizes = {
+        quantization_type: trained_quantizer(quantization_type, embeddings)
+        .encode(embeddings)
+        .nbytes
+        for quantization_type in ("float16", "int8", "pq")
+    }
+    assert sizes == {
+        "float16": embeddings.nbytes // 2,
+        "int8": embeddings.nbytes // 4,
+        "pq": 1000 * 8,
+    }
+
+
+@pytest.mark.parametrize("quantization_type", ["float16", "int8", "pq"])
+def test_quantizer_serialization(quantization_type, clustered_data):
+    embeddings = clustered_data(500)
+    quantizer = trained_quantizer(quantization_type, embeddings)
+
+    loaded = Quantizer.frombuffer(quantizer.tobytes())
+    assert type(loaded) is type(quantizer)
+    assert loaded.is_trained
+    assert loaded.params == quantizer.params
+    np.testing.assert_array_equal(
+        loaded.encode(embeddings), quantizer.encode(embeddings)
+    )
+
+
+def test_needs_refit(clustered_data):
+    quantizer = trained_quantizer("int8", clustered_data(100))
+    assert quantizer.num_training_rows == 100
+    assert not quantizer.needs_refit(199)
+    assert quantizer.needs_refit(200)
+    assert Quantizer.frombuffer(quantizer.tobytes()).needs_refit(200)
+
+    # quantizers trained on training_size rows are never refitted
+    quantizer.params["training_size"] = 100
+    assert not quantizer.needs_refit(10000)
+    assert not trained_quantizer("float16", clustered_data(100)).needs_refit(10000)
+
+
+def test_int8_clipping():
+    quantizer = trained_quantizer("int8", np.array([[0, -1], [2, 1]], np.float32))
+    codes = quantizer.encode(np.array([[1, 0], [10, -10]], np.float32))
+    assert codes.tolist() == [[0, 0], [127, -127]]
+    np.testing.assert_allclose(quantizer.decode(codes), [[1, 0], [2, -1]])
+
+
+def test_parse_quantization_params(clustered_data):
+    assert parse_quantization_params("int8")["type"] == "int8"
+    assert not parse_quantization_params({"type": "pq"})["store_full_precision"]
+
+    with pytest.raises(ValueError):
+        parse_quantization_params({"type": "int4"})
+
+    with pytest.raises(ValueError):
+        parse_quantization_params({"type": "pq", "bad_param": 1})
+
+    with pytest.raises(ValueError):
+        trained_quantizer("pq", clustered_data(100, dim=30))
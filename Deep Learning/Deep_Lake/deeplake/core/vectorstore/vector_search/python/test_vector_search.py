@@ -4,6 +4,7 @@ import numpy as np
 
 import deeplake
 from deeplake.core.vectorstore.vector_search.python import vector_search
+from deeplake.core.vectorstore.vector_search.python import search_algorithm
 from deeplake.core.dataset import Dataset as DeepLakeDataset
 
 
@@ -66,3 +67,71 @@ def test_vector_search():
             return_tensors=[],
             return_view=True,
         )
+
+
+@pytest.mark.parametrize("distance_metric", ["l2", "l1", "max", "cos"])
+def test_batch_search(distance_metric):
+    embeddings = np.random.uniform(-10, 10, size=(1000, 16)).astype(np.float32)
+    queries = np.random.uniform(-10, 10, size=(7, 16)).astype(np.float32)
+    blocks = (embeddings[i : i + 128] for i in range(0, len(embeddings), 128))
+
+    indices, distances = search_algorithm.batch_search(
+        queries, blocks, distance_metric=distance_metric, k=5
+    )
+    assert indices.shape == (7, 5)
+    assert distances.shape == (7, 5)
+
+    for query, query_indices, query_distances in zip(queries, indices, distances):
+        expected = search_algorithm.distance_metric_map[distance_metric](
+            query, embeddings
+        )
+        order = np.argsort(expected)
+        order = order[::-1][:5] if distance_metric == "cos" else order[:5]
+        np.testing.assert_array_equal(query_indices, order)
+        np.testing.assert_allclose(query_distances, expected[order], rtol=1e-4)
+
+    # k larger than the number of embeddings
+    indices, _ = search_algorithm.batch_search(
+        queries, [embeddings[:3]], distance_metric=distance_metric, k=5
+    )
+    assert indices.shape == (7, 3)
+
+
+def test_batch_vector_search():
+    ds = deeplake.empty("mem://test_batch_vector_search")
+    ds.create_tensor("embedding", htype="embedding", dtype=np.float32)
+    ds.create_tensor("text", htype="text")
+    ds.embedding.extend(np.arange(20, dtype=np.float32).reshape(10, 2))
+    ds.text.extend([f"{i}" for i in range(10)])
+
+    queries = np.array([[0, 1], [18, 19], [8.9, 9.9]], dtype=np.float32)
+    results = vector_search.batch_vector_search(
+        query_embs=queries,
+        dataset=ds,
+        filter=None,
+        embedding_tensor="embedding",
+        distance_metric="l2",
+        k=2,
+        return_tensors=["text"],
+        return_view=False,
+        block_size=3,
+    )
+    assert [result["text"] for result in results] == [
+        ["0", "1"],
+        ["9", "8"],
+        ["4", "5"],
+    ]
+    assert results[0]["score"][0] == 0
+
+    views = vector_search.batch_vector_search(
+        query_embs=queries,
+        dataset=ds,
+        filter=None,
+        embedding_tensor="embedding",
+        distance_metric="l2",
+        k=2,
+        return_tensors=[],
+        return_view=True,
+    )
+    assert len(views) == 3
+    assert list(views[1].sample_indices) == [9, 8]
@@ -2,8 +2,14 @@ from deeplake.core import vectorstore
 from deeplake.core.vectorstore.vector_search import dataset as dataset_utils
 from deeplake.core.vectorstore.vector_search import filter as filter_utils
 from deeplake.core.vectorstore.vector_search import utils
+from deeplake.core.vectorstore.vector_search.python import quantization
 from deeplake.core.dataset import Dataset as DeepLakeDataset
-from typing import Union, Dict
+from typing import Union, Dict, List
+
+import numpy as np
+
+
+DEFAULT_SEARCH_BLOCK_SIZE = 65536
 
 
 def vector_search(
@@ -18,6 +24,8 @@ def vector_search(
     k,
     return_tensors,
     return_view,
+    vector_index=None,
+    quantizer=None,
 ) -> Union[Dict, DeepLakeDataset]:
     if query is not None:
         raise NotImplementedError(
@@ -28,20 +36,46 @@ def vector_search(
 
     return_data = {}
 
+    # The vector index covers all rows of the dataset, so it can't be used on a filtered view
+    if query_emb is not None and vector_index is not None and filter is None:
+        if len(query_emb.shape) > 1:
+            query_emb = query_emb[0]
+
+        indices, scores = vector_index.search(
+            query_embedding=query_emb,
+            k=k,
+            distance_metric=distance_metric.lower(),
+        )
+        view = view[indices.tolist()]
+
+        return_data["score"] = scores.tolist()
+
     # Only fetch embeddings and run the search algorithm if an embedding query is specified
-    if query_emb is not None:
+    elif query_emb is not None:
         embeddings = dataset_utils.fetch_embeddings(
             view=view,
             embedding_tensor=embedding_tensor,
         )
 
-        view, scores = vectorstore.python_search_algorithm(
-            deeplake_dataset=view,
-            query_embedding=query_emb,
-            embeddings=embeddings,
-            distance_metric=distance_metric.lower(),
-            k=k,
-        )
+        # quantized tensors are scored directly on their codes
+        if quantizer is not None:
+            view, scores = quantization.search(
+                deeplake_dataset=view,
+                query_embedding=query_emb,
+                codes=embeddings,
+                quantizer=quantizer,
+                embedding_tensor=embedding_tensor,
+                distance_metric=distance_metric.lower(),
+                k=k,
+            )
+        else:
+            view, scores = vectorstore.python_search_algorithm(
+                deeplake_dataset=view,
+                query_embedding=query_emb,
+                embeddings=embeddings,
+                distance_metric=distance_metric.lower(),
+                k=k,
+            )
 
         return_data["score"] = scores
 
@@ -51,3 +85,66 @@ def vector_search(
         for tensor in return_tensors:
             return_data[tensor] = utils.parse_tensor_return(view[tensor])
         return return_data
+
+
+def batch_vector_search(
+    query_embs,
+    dataset,
+    filter,
+    embedding_tensor,
+    distance_metric,
+    k,
+    return_tensors,
+    return_view,
+    vector_index=None,
+    block_size=None,
+    quantizer=None,
+) -> Union[List[Dict], List[DeepLakeDataset]]:
+    """Runs the python vector search for every row of ``query_embs`` and returns one result per query."""
+    block_size = block_size or DEFAULT_SEARCH_BLOCK_SIZE
+    view = filter_utils.attribute_based_filtering_python(dataset, filter)
+    distance_metric = distance_metric.lower()
+
+    # The vector index covers all rows of the dataset, so it can't be used on a filtered view
+    if vector_index is not None and filter is None:
+        indices, scores = [], []
+        for query_emb in query_embs:
+            query_indices, query_scores = vector_index.search(
+                query_embedding=query_emb, k=k, distance_metric=distance_metric
+            )
+            indices.append(query_indices)
+            scores.append(query_scores)
+    else:
+        embedding_blocks = dataset_utils.fetch_embedding_blocks(
+            view=view,
+            embedding_tensor=embedding_tensor,
+            block_size=block_size,
+        )
+        if quantizer is not None:
+            embedding_blocks = map(quantizer.decode, embedding_blocks)
+        indices, scores = vectorstore.python_batch_search_algorithm(
+            query_embeddings=query_embs,
+            embedding_blocks=embedding_blocks,
+            distance_metric=distance_metric,
+            k=k,
+        )
+
+    if return_view:
+        return [view[query_indices.tolist()] for query_indices in indices]
+
+    # Fetch the data of the rows matched by all the queries in one pass
+    rows = np.unique(np.concatenate([np.empty(0, dtype=np.int64), *indices]))
+    rows_view = view[rows.tolist()]
+    tensor_data = {
+        tensor: utils.parse_tensor_return(rows_view[tensor]) if len(rows) else []
+        for tensor in return_tensors
+    }
+
+    results = []
+    for query_indices, query_scores in zip(indices, scores):
+        positions = np.searchsorted(rows, query_indices)
+        return_data = {"score": query_scores.tolist()}
+        for tensor, data in tensor_data.items():
+            return_data[tensor] = [data[position] for position in positions]
+        results.append(return_data)
+    return results
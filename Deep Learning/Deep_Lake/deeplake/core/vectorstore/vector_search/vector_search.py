@@ -28,6 +28,8 @@ def search(
     query_embedding: Optional[Union[List[float], np.ndarray]] = None,
     embedding_tensor: str = "embedding",
     return_view: bool = False,
+    vector_index=None,
+    quantizer=None,
 ) -> Union[Dict, DeepLakeDataset]:
     """Searching function
     Args:
@@ -37,7 +39,7 @@ def search(
         k (int) - number of samples to return after searching
         distance_metric (str, optional): Type of distance metric to use for sorting the data. Avaliable options are: "L1", "L2", "COS", "MAX".
         filter (Union[Dict, Callable], optional): Additional filter evaluated prior to the embedding search.
-                - ``Dict`` - Key-value search on tensors of htype json, evaluated on an AND basis (a sample must satisfy all key-value filters to be True) Dict = {"tensor_name_1": {"key": value}, "tensor_name_2": {"key": value}}
+                - ``Dict`` - Key-value search on tensors of htype json, evaluated on an AND basis (a sample must satisfy all key-value filters to be True) Dict = {"tensor_name_1": {"key": value}, "tensor_name_2": {"key": value}}. Text, class_label and numeric tensors are compared with a single value instead, e.g. {"label": "cat"}, or with a range, e.g. {"score": {"$gte": 0.5, "$lt": 1}}. Dict filters are answered with secondary indexes, which are built on first use and stored with the dataset.
                 - ``Function`` - Any function that is compatible with `deeplake.filter`.
         exec_option (str, optional): Type of query execution. It could be either "python", "compute_engine" or "tensor_db". Defaults to "python".
             ``python`` - runs on the client and can be used for any data stored anywhere. WARNING: using this option with big datasets is discouraged, because it can lead to some memory issues.
@@ -47,7 +49,14 @@ def search(
         return_tensors (List[str]): List of tensors to return data for.
         embedding_tensor (str): name of the tensor in the dataset with `htype="embedding"`. Defaults to "embedding".
         return_view (Bool): Return a Deep Lake dataset view that satisfied the search parameters, instead of a dictinary with data. Defaults to False.
+        vector_index (IVFIndex, optional): Approximate nearest neighbour index over ``embedding_tensor``. Only used when ``exec_option="python"``.
+        quantizer (Quantizer, optional): Quantizer of ``embedding_tensor`` if it stores quantized embeddings. Only used when ``exec_option="python"``.
     """
+    kwargs = {}
+    if exec_option == "python":
+        kwargs["vector_index"] = vector_index
+        kwargs["quantizer"] = quantizer
+
     return EXEC_OPTION_TO_SEARCH_TYPE[exec_option](
         query=query,
         query_emb=query_embedding,
@@ -60,4 +69,5 @@ def search(
         k=k,
         return_tensors=return_tensors,
         return_view=return_view,
+        **kwargs,
     )
@@ -0,0 +1,204 @@
+import numpy as np
+from typing import List, Optional, Tuple
+from deeplake.constants import FIRST_COMMIT_ID
+from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
+from deeplake.core.serialize import (
+    get_format_version,
+    serialize_string_table,
+    deserialize_string_table,
+)
+from deeplake.core.version_control.commit_chunk_map import CommitChunkMap, NO_SOURCE
+from deeplake.util.keys import (
+    get_tensor_chunk_commit_index_key,
+    get_tensor_commit_chunk_map_key,
+)
+
+
+_MAGIC = b"\xffDCI"
+_FORMAT_VERSION = 1
+
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u4"),
+        ("num_chunks", "<u8"),
+        ("num_sources", "<u8"),
+    ]
+)
+
+# (commit id, tensor key), the key is ``None`` for chunks stored under the key of the tensor itself
+ChunkSource = Tuple[str, Optional[str]]
+
+
+class ChunkCommitIndex(DeepLakeMemoryObject):
+    """Maps every chunk of a tensor visible from a commit to the commit (and tensor key) that stores it.
+
+    This flattens the commit chunk maps of a commit and all its ancestors, so that the location of a chunk is
+    resolved with a single lookup instead of walking the version history. Indexes are only built for commits
+    that can no longer change.
+
+    The index is stored as a header followed by the sorted chunk ids, the position of the source of each chunk
+    in the source table, and the source table itself.
+    """
+
+    def __init__(
+        self,
+        ids: Optional[np.ndarray] = None,
+        refs: Optional[np.ndarray] = None,
+        sources: Optional[List[ChunkSource]] = None,
+    ):
+        self.is_dirty = False
+        self.ids = np.zeros(0, dtype="<u8") if ids is None else ids
+        self.refs = np.zeros(0, dtype="<u4") if refs is None else refs
+        self.sources: List[ChunkSource] = sources or []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get(self, chunk_name: str) -> Optional[ChunkSource]:
+        """Returns the ``(commit id, key)`` storing the chunk, or ``None`` if it isn't in the index."""
+        chunk_id = np.uint64(ChunkIdEncoder.id_from_name(chunk_name))
+        pos = int(np.searchsorted(self.ids, chunk_id))
+        if pos == len(self.ids) or self.ids[pos] != chunk_id:
+            return None
+        return self.sources[int(self.refs[pos])]
+
+    @classmethod
+    def build(
+        cls,
+        chunk_map: CommitChunkMap,
+        commit_id: str,
+        parent: Optional["ChunkCommitIndex"] = None,
+    ) -> "ChunkCommitIndex":
+        """Builds the index of a commit.
+
+        Args:
+            chunk_map (CommitChunkMap): The commit chunk map of the commit.
+            commit_id (str): The commit.
+            parent (ChunkCommitIndex, optional): The index of the parent commit. Chunks of the commit take precedence
+                over the ones of the parent.
+
+        Returns:
+            ChunkCommitIndex: The index.
+        """
+        ids, map_refs, map_sources = chunk_map.columns()
+        sources: List[ChunkSource] = list(parent.sources) if parent else []
+        positions = {source: i for i, source in enumerate(sources)}
+        # position of the sources of the map in the sources of the index, chunks without a source are the last one
+        remap = np.zeros(len(map_sources) + 1, dtype="<u4")
+        for i, (source_commit_id, key) in enumerate(map_sources + [(commit_id, "")]):
+            source = (source_commit_id, key or None)
+            ref = positions.get(source)
+            if ref is None:
+                ref = positions[source] = len(sources)
+                sources.append(source)
+            remap[i] = ref
+        refs = remap[np.where(map_refs == NO_SOURCE, len(map_sources), map_refs)]
+        if parent is not None and len(parent):
+            keep = ~np.isin(parent.ids, ids)
+            ids = np.concatenate([ids, parent.ids[keep]])
+            refs = np.concatenate([refs, parent.refs[keep]])
+            order = np.argsort(ids, kind="stable")
+            ids, refs = ids[order], refs[order]
+        return cls(ids, refs, sources)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            _HEADER_DTYPE.itemsize
+            + self.ids.nbytes
+            + self.refs.nbytes
+            + sum(
+                len(commit_id) + len(key or "") + 16 for commit_id, key in self.sources
+            )
+        )
+
+    def tobytes(self) -> memoryview:
+        header = np.array(
+            [(_MAGIC, _FORMAT_VERSION, len(self.ids), len(self.sources))],
+            dtype=_HEADER_DTYPE,
+        )
+        return memoryview(
+            b"".join(
+                (
+                    header.tobytes(),
+                    self.ids.astype("<u8", copy=False).tobytes(),
+                    self.refs.astype("<u4", copy=False).tobytes(),
+                    serialize_string_table(
+                        [
+                            s
+                            for source in self.sources
+                            for s in (source[0], source[1] or "")
+                        ]
+                    ),
+                )
+            )
+        )
+
+    @classmethod
+    def frombuffer(cls, buffer: bytes):
+        if not buffer:
+            return cls()
+        version = get_format_version(buffer, _MAGIC)
+        if not 0 < version <= _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported chunk commit index format version: {version}."
+            )
+        header = np.frombuffer(buffer, dtype=_HEADER_DTYPE, count=1)[0]
+        num_chunks = int(header["num_chunks"])
+        offset = _HEADER_DTYPE.itemsize
+        ids = np.frombuffer(buffer, dtype="<u8", count=num_chunks, offset=offset)
+        offset += ids.nbytes
+        refs = np.frombuffer(buffer, dtype="<u4", count=num_chunks, offset=offset)
+        offset += refs.nbytes
+        strings, _ = deserialize_string_table(
+            buffer, offset, 2 * int(header["num_sources"])
+        )
+        sources = [
+            (commit_id, key or None)
+            for commit_id, key in zip(strings[::2], strings[1::2])
+        ]
+        return cls(ids, refs, sources)
+
+
+def load_chunk_commit_index(
+    storage, key: str, node, write: bool = False
+) -> ChunkCommitIndex:
+    """Gets the chunk commit index of a tensor at a commit that is no longer a head.
+
+    Indexes missing from storage are built from the index of the closest ancestor that has one.
+
+    Args:
+        storage (LRUCache): The cache of the dataset.
+        key (str): The key of the tensor.
+        node (CommitNode): The commit.
+        write (bool): Whether to store the indexes that are built. Reads keep them in memory only, indexes are stored
+            when commits are made.
+
+    Returns:
+        ChunkCommitIndex: The index.
+    """
+    missing = []
+    index: Optional[ChunkCommitIndex] = None
+    cur_node = node
+    while cur_node is not None and cur_node.commit_id != FIRST_COMMIT_ID:
+        index_key = get_tensor_chunk_commit_index_key(key, cur_node.commit_id)
+        try:
+            index = storage.get_deeplake_object(index_key, ChunkCommitIndex)
+            break
+        except Exception:
+            missing.append(cur_node)
+            cur_node = cur_node.parent
+    for cur_node in reversed(missing):
+        commit_id = cur_node.commit_id
+        try:
+            chunk_map = storage.get_deeplake_object(
+                get_tensor_commit_chunk_map_key(key, commit_id), CommitChunkMap
+            )
+        except Exception:
+            chunk_map = CommitChunkMap()
+        index = ChunkCommitIndex.build(chunk_map, commit_id, index)
+        if write:
+            storage[get_tensor_chunk_commit_index_key(key, commit_id)] = index
+    return index or ChunkCommitIndex()
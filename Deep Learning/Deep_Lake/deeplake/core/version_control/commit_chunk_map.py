@@ -1,14 +1,85 @@
-from typing import Dict, Optional, Tuple
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
+from deeplake.core.serialize import (
+    get_format_version,
+    serialize_string_table,
+    deserialize_string_table,
+)
 from collections import defaultdict
 
 
+_MAGIC = b"\xffDCM"
+_FORMAT_VERSION = 1
+
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u4"),
+        ("num_chunks", "<u8"),
+        ("num_sources", "<u8"),
+    ]
+)
+
+# reference of chunks stored in the commit the map belongs to
+NO_SOURCE = np.iinfo(np.uint32).max
+
+
 class CommitChunkMap(DeepLakeMemoryObject):
     """Stores set of chunks stored for a particular tensor in a commit."""
 
     def __init__(self) -> None:
         self.is_dirty = False
-        self.chunks: Dict[str, Dict] = {}
+        self.legacy_format = False
+        self._chunks: Optional[Dict[str, Dict]] = {}
+        # columns of a map read from storage, turned into a dict on the first modification
+        self._ids: Optional[np.ndarray] = None
+        self._refs: Optional[np.ndarray] = None
+        self._sources: List[Tuple[str, str]] = []
+
+    @property
+    def chunks(self) -> Dict[str, Dict]:
+        if self._chunks is None:
+            sources = [
+                {"commit_id": commit_id, "key": key}
+                if key
+                else {"commit_id": commit_id}
+                for commit_id, key in self._sources
+            ]
+            self._chunks = {
+                ChunkIdEncoder.name_from_id(chunk_id): (
+                    {} if ref == NO_SOURCE else dict(sources[ref])
+                )
+                for chunk_id, ref in zip(self._ids.tolist(), self._refs.tolist())  # type: ignore
+            }
+            self._ids = self._refs = None
+        return self._chunks
+
+    @chunks.setter
+    def chunks(self, chunks: Dict[str, Dict]):
+        self._chunks = chunks
+        self._ids = self._refs = None
+
+    def __len__(self) -> int:
+        if self._chunks is None:
+            return len(self._ids)  # type: ignore
+        return len(self._chunks)
+
+    def get(self, chunk_name: str) -> Optional[Dict]:
+        """Returns the entry of a chunk, or ``None`` if the chunk isn't stored in the commit."""
+        if self._chunks is not None:
+            return self._chunks.get(chunk_name)
+        chunk_id = ChunkIdEncoder.id_from_name(chunk_name)
+        ids = self._ids
+        pos = int(np.searchsorted(ids, chunk_id))  # type: ignore
+        if pos == len(ids) or ids[pos] != chunk_id:  # type: ignore
+            return None
+        ref = self._refs[pos]  # type: ignore
+        if ref == NO_SOURCE:
+            return {}
+        commit_id, key = self._sources[ref]
+        return {"commit_id": commit_id, "key": key} if key else {"commit_id": commit_id}
 
     @staticmethod
     def _serialize_entry(kv):
@@ -32,25 +103,87 @@ class CommitChunkMap(DeepLakeMemoryObject):
             pass
         return k, v
 
-    def tobytes(self) -> bytes:
-        """Dumps self.chunks in csv format."""
-        return bytes(",".join(map(self._serialize_entry, self.chunks.items())), "utf-8")
+    def columns(self) -> Tuple[np.ndarray, np.ndarray, List[Tuple[str, str]]]:
+        """Returns the sorted chunk ids, the position of the source of each chunk in the source table and the
+        source table of (commit id, tensor key) pairs. Chunks stored in the commit of the map have no source
+        and the position ``NO_SOURCE``.
+        """
+        if self._chunks is None:
+            return self._ids, self._refs, self._sources  # type: ignore
+        sources: List[Tuple[str, str]] = []
+        positions: Dict[Tuple[str, str], int] = {}
+        num_chunks = len(self._chunks)
+        ids = np.zeros(num_chunks, dtype="<u8")
+        refs = np.full(num_chunks, NO_SOURCE, dtype="<u4")
+        for i, (chunk_name, v) in enumerate(self._chunks.items()):
+            ids[i] = ChunkIdEncoder.id_from_name(chunk_name)
+            if v:
+                source = (v["commit_id"], v.get("key") or "")
+                ref = positions.get(source)
+                if ref is None:
+                    ref = positions[source] = len(sources)
+                    sources.append(source)
+                refs[i] = ref
+        order = np.argsort(ids, kind="stable")
+        return ids[order], refs[order], sources
+
+    def tobytes(self) -> memoryview:
+        """Dumps the chunks as a header followed by the sorted chunk ids, the position of the commit storing each
+        chunk in the source table, and the source table of (commit id, tensor key) strings.
+        """
+        ids, refs, sources = self.columns()
+        header = np.array(
+            [(_MAGIC, _FORMAT_VERSION, len(ids), len(sources))], dtype=_HEADER_DTYPE
+        )
+        return memoryview(
+            b"".join(
+                (
+                    header.tobytes(),
+                    ids.tobytes(),
+                    refs.tobytes(),
+                    serialize_string_table([s for source in sources for s in source]),
+                )
+            )
+        )
 
     @classmethod
     def frombuffer(cls, buffer: bytes):
-        """Loads a CommitChunkMap from a buffer."""
+        """Loads a CommitChunkMap from a buffer, in the binary format or the legacy csv format."""
         instance = cls()
         if buffer:
-            entries = buffer.decode("utf-8").split(",")
-            instance.chunks = dict(map(cls._deserialize_entry, entries))
+            version = get_format_version(buffer, _MAGIC)
+            if version > _FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported commit chunk map format version: {version}."
+                )
+            if version == 0:
+                entries = bytes(buffer).decode("utf-8").split(",")
+                instance.chunks = dict(map(cls._deserialize_entry, entries))
+                instance.legacy_format = True
+            else:
+                header = np.frombuffer(buffer, dtype=_HEADER_DTYPE, count=1)[0]
+                num_chunks = int(header["num_chunks"])
+                offset = _HEADER_DTYPE.itemsize
+                ids = np.frombuffer(
+                    buffer, dtype="<u8", count=num_chunks, offset=offset
+                )
+                offset += ids.nbytes
+                refs = np.frombuffer(
+                    buffer, dtype="<u4", count=num_chunks, offset=offset
+                )
+                offset += refs.nbytes
+                strings, _ = deserialize_string_table(
+                    buffer, offset, 2 * int(header["num_sources"])
+                )
+                instance._chunks = None
+                instance._ids, instance._refs = ids, refs
+                instance._sources = list(zip(strings[::2], strings[1::2]))
         instance.is_dirty = False
         return instance
 
     @property
     def nbytes(self) -> int:
-        if not self.chunks:
-            return 0
-        return 16 + ((len(self.chunks) - 1) * 17)
+        return _HEADER_DTYPE.itemsize + 12 * len(self)
 
     def add(
         self,
@@ -1,27 +1,148 @@
-from typing import Set, List
+import numpy as np
+from typing import Sequence, Set, List, Union
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
+from deeplake.core.serialize import get_format_version
+from deeplake.core.version_control.index_ranges import IndexRanges
+
+
+_MAGIC = b"\xffDCD"
+# version 1 stored data_updated and data_deleted as index arrays, version 2 stores them as ranges
+_FORMAT_VERSION = 2
+
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u4"),
+        ("created", "u1"),
+        ("info_updated", "u1"),
+        ("data_transformed", "u1"),
+        ("cleared", "u1"),
+        ("reserved", "<u4"),
+        ("data_added", "<u8", (2,)),
+        ("num_updated", "<u8"),
+        ("num_deleted", "<u8"),
+        ("num_deleted_ids", "<u8"),
+    ]
+)
+
+
+def _index_set(name: str):
+    """Set of indices of a commit diff read from storage as an array, turned into a set on first access."""
+    attr = f"_{name}"
+
+    def fget(self) -> Set[int]:
+        value = getattr(self, attr)
+        if isinstance(value, np.ndarray):
+            value = set(value.tolist())
+            setattr(self, attr, value)
+        return value
+
+    def fset(self, value: Set[int]):
+        setattr(self, attr, value)
+
+    return property(fget, fset)
+
+
+def _read_ranges(data, count: int, offset: int) -> IndexRanges:
+    bounds = np.frombuffer(data, dtype="<u8", count=2 * count, offset=offset)
+    bounds = bounds.astype(np.int64).reshape(-1, 2)
+    return IndexRanges.from_ranges(bounds[:, 0], bounds[:, 1])
+
+
+def _ranges_tobytes(indexes: IndexRanges) -> bytes:
+    return np.stack([indexes.starts, indexes.ends], axis=1).astype("<u8").tobytes()
 
 
 class CommitDiff(DeepLakeMemoryObject):
     """Stores set of diffs stored for a particular tensor in a commit."""
 
+    data_deleted_ids = _index_set("data_deleted_ids")
+
     def __init__(self, first_index=0, created=False) -> None:
         self.is_dirty = created  # only put as dirty during init if created
         self.created = created
         self.data_added: List[int] = [first_index, first_index]
-        self.data_updated: Set[int] = set()
-        self.data_deleted: Set[int] = set()
+        self.data_updated = IndexRanges()
+        self.data_deleted = IndexRanges()
         self.data_deleted_ids: Set[int] = set()
         self.info_updated = False
         self.cleared = False
 
         # this is stored for in place transforms in which we no longer need to considered older diffs about added/updated data
         self.data_transformed = False
+        self.legacy_format = False
 
-    def tobytes(self) -> bytes:
+    def tobytes(self) -> memoryview:
         """Returns bytes representation of the commit diff
 
-        The format stores the following information in order:
+        The format stores a header with the flags of the diff, the two elements of the data_added list and the
+        number of ranges of data_updated and data_deleted and of elements of data_deleted_ids, followed by the
+        (start, end) pairs of the ranges of data_updated and data_deleted and the sorted elements of
+        data_deleted_ids, as little endian uint64 arrays.
+        """
+        deleted_ids = self._data_deleted_ids
+        if not isinstance(deleted_ids, np.ndarray):
+            deleted_ids = np.sort(
+                np.fromiter(deleted_ids, dtype="<u8", count=len(deleted_ids))
+            )
+        header = np.zeros(1, dtype=_HEADER_DTYPE)
+        header["magic"] = _MAGIC
+        header["version"] = _FORMAT_VERSION
+        header["created"] = self.created
+        header["info_updated"] = self.info_updated
+        header["data_transformed"] = self.data_transformed
+        header["cleared"] = self.cleared
+        header["data_added"] = self.data_added
+        header["num_updated"] = len(self.data_updated.starts)
+        header["num_deleted"] = len(self.data_deleted.starts)
+        header["num_deleted_ids"] = len(deleted_ids)
+        return memoryview(
+            b"".join(
+                (
+                    header.tobytes(),
+                    _ranges_tobytes(self.data_updated),
+                    _ranges_tobytes(self.data_deleted),
+                    deleted_ids.tobytes(),
+                )
+            )
+        )
+
+    @classmethod
+    def frombuffer(cls, data: bytes) -> "CommitDiff":
+        """Creates a CommitDiff object from bytes, in the binary format or the legacy format."""
+        version = get_format_version(data, _MAGIC)
+        if version == 0:
+            return cls._frombuffer_legacy(bytes(data))
+        if version > _FORMAT_VERSION:
+            raise ValueError(f"Unsupported commit diff format version: {version}.")
+        commit_diff = cls()
+        header = np.frombuffer(data, dtype=_HEADER_DTYPE, count=1)[0]
+        commit_diff.created = bool(header["created"])
+        commit_diff.info_updated = bool(header["info_updated"])
+        commit_diff.data_transformed = bool(header["data_transformed"])
+        commit_diff.cleared = bool(header["cleared"])
+        commit_diff.data_added = [int(i) for i in header["data_added"]]
+        offset = _HEADER_DTYPE.itemsize
+        for name in ("updated", "deleted"):
+            count = int(header[f"num_{name}"])
+            if version == 1:
+                arr = np.frombuffer(data, dtype="<u8", count=count, offset=offset)
+                indexes = IndexRanges(arr.astype(np.int64))
+                offset += arr.nbytes
+            else:
+                indexes = _read_ranges(data, count, offset)
+                offset += 16 * count
+            setattr(commit_diff, f"data_{name}", indexes)
+        commit_diff._data_deleted_ids = np.frombuffer(
+            data, dtype="<u8", count=int(header["num_deleted_ids"]), offset=offset
+        )
+        commit_diff.is_dirty = False
+        return commit_diff
+
+    @classmethod
+    def _frombuffer_legacy(cls, data: bytes) -> "CommitDiff":
+        """Creates a CommitDiff object from bytes of the legacy format, stored in order:
+
         1. The first byte is a boolean value indicating whether the tensor was created in the commit or not.
         2. The second byte is a boolean value indicating whether the info has been updated or not.
         3. The third byte is a boolean value indicating whether the data has been transformed using an inplace transform or not.
@@ -33,27 +154,8 @@ class CommitDiff(DeepLakeMemoryObject):
         9. The next 8 * n bytes are the elements of the data_deleted set.
         9. The next 8 * n bytes are the elements of the data_deleted_ids set.
         """
-        return b"".join(
-            [
-                self.created.to_bytes(1, "big"),
-                self.info_updated.to_bytes(1, "big"),
-                self.data_transformed.to_bytes(1, "big"),
-                self.data_added[0].to_bytes(8, "big"),
-                self.data_added[1].to_bytes(8, "big"),
-                len(self.data_updated).to_bytes(8, "big"),
-                *(idx.to_bytes(8, "big") for idx in self.data_updated),
-                self.cleared.to_bytes(1, "big"),
-                len(self.data_deleted).to_bytes(8, "big"),
-                *(idx.to_bytes(8, "big") for idx in self.data_deleted),
-                *(idx.to_bytes(8, "big") for idx in self.data_deleted_ids),
-            ]
-        )
-
-    @classmethod
-    def frombuffer(cls, data: bytes) -> "CommitDiff":
-        """Creates a CommitDiff object from bytes"""
         commit_diff = cls()
-
+        commit_diff.legacy_format = True
         commit_diff.created = bool(int.from_bytes(data[:1], "big"))
         commit_diff.info_updated = bool(int.from_bytes(data[1:2], "big"))
         commit_diff.data_transformed = bool(int.from_bytes(data[2:3], "big"))
@@ -62,35 +164,41 @@ class CommitDiff(DeepLakeMemoryObject):
             int.from_bytes(data[11:19], "big"),
         ]
         num_updates = int.from_bytes(data[19:27], "big")
-        commit_diff.data_updated = {
-            int.from_bytes(data[27 + i * 8 : 35 + i * 8], "big")
-            for i in range(num_updates)
-        }
+        commit_diff.data_updated = IndexRanges(
+            np.frombuffer(data, dtype=">u8", count=num_updates, offset=27).astype(
+                np.int64
+            )
+        )
         pos = 35 + (num_updates - 1) * 8
         commit_diff.cleared = bool(int.from_bytes(data[pos : pos + 1], "big"))
         commit_diff.is_dirty = False
         pos += 1
-        commit_diff.data_deleted = set()
         commit_diff.data_deleted_ids = set()
         if len(data) > pos:
             num_deletes = int.from_bytes(data[pos : pos + 8], "big")
             pos += 8
-            commit_diff.data_deleted = {
-                int.from_bytes(data[pos + i * 8 : pos + i * 8 + 8], "big")
-                for i in range(num_deletes)
-            }
+            commit_diff.data_deleted = IndexRanges(
+                np.frombuffer(data, dtype=">u8", count=num_deletes, offset=pos).astype(
+                    np.int64
+                )
+            )
             pos += num_deletes * 8
             if len(data) > pos:
-                commit_diff.data_deleted_ids = {
-                    int.from_bytes(data[pos + i * 8 : pos + i * 8 + 8], "big")
-                    for i in range(num_deletes)
-                }
+                commit_diff.data_deleted_ids = set(
+                    np.frombuffer(
+                        data, dtype=">u8", count=num_deletes, offset=pos
+                    ).tolist()
+                )
         return commit_diff
 
     @property
     def nbytes(self):
         """Returns number of bytes required to store the commit diff"""
-        return 36 + 8 * (len(self.data_updated) + len(self.data_deleted))
+        return (
+            _HEADER_DTYPE.itemsize
+            + 16 * (len(self.data_updated.starts) + len(self.data_deleted.starts))
+            + 8 * len(self._data_deleted_ids)
+        )
 
     @property
     def num_samples_added(self) -> int:
@@ -107,18 +215,26 @@ class CommitDiff(DeepLakeMemoryObject):
         self.data_added[1] += count
         self.is_dirty = True
 
-    def update_data(self, global_index: int) -> None:
-        """Adds new indexes to data updated"""
-        global_index = self.translate_index(global_index)
-        if global_index not in range(*self.data_added):
-            self.data_updated.add(global_index)
+    def update_data(self, global_index: Union[int, Sequence[int]]) -> None:
+        """Adds new indexes to data updated. Accepts a single index or a sequence of indexes."""
+        if isinstance(global_index, (int, np.integer)):
+            global_index = self.translate_index(global_index)
+            if global_index not in range(*self.data_added):
+                self.data_updated.add(global_index)
+                self.is_dirty = True
+            return
+        indexes = self.translate_index(np.asarray(global_index, dtype=np.int64))
+        start, end = self.data_added
+        indexes = indexes[(indexes < start) | (indexes >= end)]
+        if len(indexes):
+            self.data_updated.update(indexes)
             self.is_dirty = True
 
     def clear_data(self):
         """Clears data"""
         self.data_added = [0, 0]
-        self.data_updated = set()
-        self.data_deleted = set()
+        self.data_updated = IndexRanges()
+        self.data_deleted = IndexRanges()
         self.info_updated = False
         self.cleared = True
         self.is_dirty = True
@@ -135,12 +251,7 @@ class CommitDiff(DeepLakeMemoryObject):
             self.data_added[0] -= 1
         self.data_added[1] -= 1
 
-        if index in self.data_updated:
-            self.data_updated.remove(index)
-
-        self.data_updated = {
-            idx - 1 if idx > index else idx for idx in self.data_updated
-        }
+        self.data_updated.delete(index)
         if id is not None:
             self.data_deleted_ids.add(id)
         self.is_dirty = True
@@ -148,5 +259,7 @@ class CommitDiff(DeepLakeMemoryObject):
     def translate_index(self, index):
         if not self.data_deleted:
             return index
-        offset = sum(i < index for i in self.data_deleted)
-        return index + offset
+        offset = self.data_deleted.count_below(index)
+        if isinstance(index, np.ndarray):
+            return index + offset
+        return index + int(offset)
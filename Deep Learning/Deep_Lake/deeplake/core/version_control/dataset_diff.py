@@ -1,21 +1,81 @@
 from deeplake.core.storage.deeplake_memory_object import DeepLakeMemoryObject
 from deeplake.core.storage import LRUCache
+from deeplake.core.serialize import (
+    get_format_version,
+    serialize_string_table,
+    deserialize_string_table,
+)
 from deeplake.util.keys import get_dataset_diff_key
+import numpy as np
 import typing
 from collections import OrderedDict
 
 
+_MAGIC = b"\xffDDD"
+_FORMAT_VERSION = 1
+
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S4"),
+        ("version", "<u4"),
+        ("info_updated", "u1"),
+        ("reserved", "u1", (7,)),
+        ("num_renamed", "<u8"),
+        ("num_deleted", "<u8"),
+    ]
+)
+
+
 class DatasetDiff(DeepLakeMemoryObject):
     def __init__(self) -> None:
         self.is_dirty = False
         self.info_updated = False
         self.renamed: typing.OrderedDict = OrderedDict()
         self.deleted: typing.List[str] = []
+        self.legacy_format = False
 
-    def tobytes(self) -> bytes:
+    def tobytes(self) -> memoryview:
         """Returns bytes representation of the dataset diff
 
-        The format stores the following information in order:
+        The format stores a header with whether the Dataset info was modified and the number of renamed and deleted
+        tensors, followed by a string table of the old and new names of the renamed tensors and the names of the
+        deleted tensors.
+        """
+        header = np.zeros(1, dtype=_HEADER_DTYPE)
+        header["magic"] = _MAGIC
+        header["version"] = _FORMAT_VERSION
+        header["info_updated"] = self.info_updated
+        header["num_renamed"] = len(self.renamed)
+        header["num_deleted"] = len(self.deleted)
+        names = [name for item in self.renamed.items() for name in item]
+        names.extend(self.deleted)
+        return memoryview(header.tobytes() + serialize_string_table(names))
+
+    @classmethod
+    def frombuffer(cls, data: bytes) -> "DatasetDiff":
+        """Creates a DatasetDiff object from bytes, in the binary format or the legacy format."""
+        version = get_format_version(data, _MAGIC)
+        if version == 0:
+            return cls._frombuffer_legacy(bytes(data))
+        if version > _FORMAT_VERSION:
+            raise ValueError(f"Unsupported dataset diff format version: {version}.")
+        dataset_diff = cls()
+        header = np.frombuffer(data, dtype=_HEADER_DTYPE, count=1)[0]
+        dataset_diff.info_updated = bool(header["info_updated"])
+        num_renamed = int(header["num_renamed"])
+        names, _ = deserialize_string_table(
+            data, _HEADER_DTYPE.itemsize, 2 * num_renamed + int(header["num_deleted"])
+        )
+        dataset_diff.renamed = OrderedDict(
+            zip(names[: 2 * num_renamed : 2], names[1 : 2 * num_renamed : 2])
+        )
+        dataset_diff.deleted = names[2 * num_renamed :]
+        return dataset_diff
+
+    @classmethod
+    def _frombuffer_legacy(cls, data: bytes) -> "DatasetDiff":
+        """Creates a DatasetDiff object from bytes of the legacy format, stored in order:
+
         1. The first byte is a boolean value indicating whether the Dataset info was modified or not.
         2. The next 8 bytes give the number of renamed tensors, let's call this m.
         3. Next, there will be m blocks of bytes with the following format:
@@ -27,35 +87,8 @@ class DatasetDiff(DeepLakeMemoryObject):
             1. 8 bytes giving the length of the name of the deleted tensor, let's call this z.
             2. n bytes of name of the deleted tensor.
         """
-        return b"".join(
-            [
-                self.info_updated.to_bytes(1, "big"),
-                len(self.renamed).to_bytes(8, "big"),
-                *(
-                    b"".join(
-                        [
-                            len(old_name).to_bytes(8, "big"),
-                            len(new_name).to_bytes(8, "big"),
-                            (old_name + new_name),
-                        ]
-                    )
-                    for old_name, new_name in map(
-                        lambda n: (n[0].encode("utf-8"), n[1].encode("utf-8")),
-                        self.renamed.items(),
-                    )
-                ),
-                len(self.deleted).to_bytes(8, "big"),
-                *(
-                    b"".join([len(name).to_bytes(8, "big"), name.encode("utf-8")])
-                    for name in self.deleted
-                ),
-            ]
-        )
-
-    @classmethod
-    def frombuffer(cls, data: bytes) -> "DatasetDiff":
-        """Creates a DatasetDiff object from bytes"""
         dataset_diff = cls()
+        dataset_diff.legacy_format = True
         dataset_diff.info_updated = bool(int.from_bytes(data[:1], "big"))
         len_renamed = int.from_bytes(data[1:9], "big")
         pos = 9
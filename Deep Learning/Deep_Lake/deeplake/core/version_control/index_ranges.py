@@ -0,0 +1,223 @@
+import numpy as np
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+def _normalize(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Merges overlapping and adjacent half-open ranges into sorted disjoint ones."""
+    keep = starts < ends
+    starts, ends = starts[keep], ends[keep]
+    if not len(starts):
+        return _EMPTY, _EMPTY
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    max_ends = np.maximum.accumulate(ends)
+    new_run = np.ones(len(starts), dtype=bool)
+    new_run[1:] = starts[1:] > max_ends[:-1]
+    run_rows = np.flatnonzero(new_run)
+    return starts[run_rows], np.maximum.reduceat(ends, run_rows)
+
+
+def _ranges_from_indexes(indexes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    indexes = np.unique(np.asarray(indexes, dtype=np.int64).reshape(-1))
+    if not len(indexes):
+        return _EMPTY, _EMPTY
+    breaks = np.flatnonzero(np.diff(indexes) != 1) + 1
+    starts = indexes[np.concatenate([[0], breaks])]
+    ends = indexes[np.concatenate([breaks - 1, [len(indexes) - 1]])] + 1
+    return starts, ends
+
+
+def _covers(starts: np.ndarray, ends: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Whether each point is inside one of the sorted disjoint ranges."""
+    return np.searchsorted(starts, points, side="right") > np.searchsorted(
+        ends, points, side="right"
+    )
+
+
+class IndexRanges:
+    """Set of sample indexes stored as sorted, disjoint half-open ranges.
+
+    It can be used like a set of ints (membership, iteration, ``len``, comparison with sets), while unions,
+    intersections and differences are computed with numpy on the range boundaries. Indexes added one at a time
+    are buffered and merged in bulk.
+    """
+
+    def __init__(self, indexes: Optional[Iterable[int]] = None):
+        self._starts: np.ndarray = _EMPTY
+        self._ends: np.ndarray = _EMPTY
+        self._pending: List[int] = []
+        if indexes is not None:
+            self.update(indexes)
+
+    @classmethod
+    def from_ranges(cls, starts, ends) -> "IndexRanges":
+        """Creates the set of the indexes of the half-open ranges ``[starts[i], ends[i])``."""
+        ret = cls()
+        ret._starts, ret._ends = _normalize(
+            np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)
+        )
+        return ret
+
+    @classmethod
+    def _from_sorted_ranges(cls, starts: np.ndarray, ends: np.ndarray):
+        ret = cls()
+        ret._starts, ret._ends = starts, ends
+        return ret
+
+    def _flush(self):
+        if self._pending:
+            starts, ends = _ranges_from_indexes(np.array(self._pending))
+            self._pending = []
+            self._starts, self._ends = _normalize(
+                np.concatenate([self._starts, starts]),
+                np.concatenate([self._ends, ends]),
+            )
+
+    @property
+    def starts(self) -> np.ndarray:
+        self._flush()
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        self._flush()
+        return self._ends
+
+    def intervals(self) -> List[Tuple[int, int]]:
+        """Returns the ranges as a list of half-open ``(start, end)`` intervals."""
+        return list(zip(self.starts.tolist(), self.ends.tolist()))
+
+    def to_array(self) -> np.ndarray:
+        """Returns the sorted indexes."""
+        starts, ends = self.starts, self.ends
+        lengths = ends - starts
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return np.arange(len(offsets), dtype=np.int64) + offsets
+
+    def __len__(self) -> int:
+        return int((self.ends - self.starts).sum())
+
+    def __bool__(self) -> bool:
+        return bool(self._pending) or bool(len(self._starts))
+
+    def __contains__(self, index) -> bool:
+        starts = self.starts
+        pos = int(np.searchsorted(starts, index, side="right")) - 1
+        return pos >= 0 and index < self._ends[pos]
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in self.intervals():
+            yield from range(start, end)
+
+    def count_below(self, indexes):
+        """Returns the number of indexes of the set that are smaller than each of the given ones."""
+        starts, ends = self.starts, self.ends
+        indexes = np.asarray(indexes, dtype=np.int64)
+        if not len(starts):
+            return np.zeros_like(indexes)
+        lengths = ends - starts
+        before = np.cumsum(lengths) - lengths
+        # the last range starting below each index
+        row = np.searchsorted(starts, indexes) - 1
+        last = np.maximum(row, 0)
+        count = before[last] + np.minimum(ends[last], indexes) - starts[last]
+        return np.where(row >= 0, count, 0)
+
+    def add(self, index: int):
+        self._pending.append(int(index))
+
+    def update(self, indexes: Union["IndexRanges", Iterable[int]]):
+        """Adds all the given indexes."""
+        if isinstance(indexes, IndexRanges):
+            starts, ends = indexes.starts, indexes.ends
+        else:
+            if not isinstance(indexes, np.ndarray):
+                indexes = np.fromiter(indexes, dtype=np.int64)
+            starts, ends = _ranges_from_indexes(indexes)
+        self._flush()
+        self._starts, self._ends = _normalize(
+            np.concatenate([self._starts, starts]), np.concatenate([self._ends, ends])
+        )
+
+    def discard(self, index: int):
+        if index in self:
+            self._starts, self._ends = self._combine(
+                IndexRanges.from_ranges([index], [index + 1]),
+                lambda a, b: a & ~b,
+            )
+
+    def remove(self, index: int):
+        if index not in self:
+            raise KeyError(index)
+        self.discard(index)
+
+    def delete(self, index: int):
+        """Removes an index and shifts the larger ones down by one, the way popping a sample shifts the ones after it."""
+        self.discard(index)
+        starts, ends = self._starts, self._ends
+        self._starts, self._ends = _normalize(
+            np.where(starts > index, starts - 1, starts),
+            np.where(ends > index, ends - 1, ends),
+        )
+
+    def _combine(
+        self, other: "IndexRanges", op: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        a_starts, a_ends = self.starts, self.ends
+        b_starts, b_ends = other.starts, other.ends
+        points = np.unique(np.concatenate([a_starts, a_ends, b_starts, b_ends]))
+        if len(points) < 2:
+            return _EMPTY, _EMPTY
+        # the segments between consecutive boundaries are either fully inside or fully outside each set
+        left, right = points[:-1], points[1:]
+        keep = op(_covers(a_starts, a_ends, left), _covers(b_starts, b_ends, left))
+        return _normalize(left[keep], right[keep])
+
+    @staticmethod
+    def _as_index_ranges(other) -> "IndexRanges":
+        return other if isinstance(other, IndexRanges) else IndexRanges(other)
+
+    def union(self, other) -> "IndexRanges":
+        ret = self.copy()
+        ret.update(other)
+        return ret
+
+    def intersection(self, other) -> "IndexRanges":
+        return self._from_sorted_ranges(
+            *self._combine(self._as_index_ranges(other), lambda a, b: a & b)
+        )
+
+    def difference(self, other) -> "IndexRanges":
+        return self._from_sorted_ranges(
+            *self._combine(self._as_index_ranges(other), lambda a, b: a & ~b)
+        )
+
+    __or__ = __ror__ = union
+    __and__ = __rand__ = intersection
+    __sub__ = difference
+
+    def __rsub__(self, other) -> "IndexRanges":
+        # sets and other iterables on the left, e.g. ``{0} - ranges``
+        return self._as_index_ranges(other).difference(self)
+
+    def copy(self) -> "IndexRanges":
+        return self._from_sorted_ranges(self.starts, self.ends)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (set, frozenset)):
+            if len(other) != len(self):
+                return False
+            other = IndexRanges(other)
+        if not isinstance(other, IndexRanges):
+            return NotImplemented
+        return np.array_equal(self.starts, other.starts) and np.array_equal(
+            self.ends, other.ends
+        )
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"IndexRanges({self.intervals()})"
@@ -0,0 +1,71 @@
+import numpy as np
+from deeplake.core.version_control.commit_chunk_map import CommitChunkMap
+from deeplake.core.version_control.commit_diff import CommitDiff, _HEADER_DTYPE
+
+
+def test_commit_chunk_map():
+    cmap = CommitChunkMap()
+    cmap.add("ff")
+    cmap.add("a1", "abc")
+    cmap.add("3", "abc", "old_key")
+    legacy = b"ff,a1:abc,3:abc:old_key"
+
+    for buffer in (legacy, cmap.tobytes()):
+        loaded = CommitChunkMap.frombuffer(buffer)
+        assert loaded.legacy_format == (buffer is legacy)
+        assert loaded.get("ff") == {}
+        assert loaded.get("a1") == {"commit_id": "abc"}
+        assert loaded.get("3") == {"commit_id": "abc", "key": "old_key"}
+        assert loaded.get("4") is None
+        assert loaded.chunks == cmap.chunks
+
+    loaded = CommitChunkMap.frombuffer(cmap.tobytes())
+    loaded.add("4")
+    assert len(CommitChunkMap.frombuffer(loaded.tobytes())) == 4
+    assert len(CommitChunkMap.frombuffer(CommitChunkMap().tobytes())) == 0
+
+
+def test_commit_diff():
+    diff = CommitDiff(5, created=True)
+    diff.add_data(10)
+    for i in (3, 1, 4):
+        diff.update_data(i)
+    diff.pop(0, 12345)
+    diff.modify_info()
+
+    legacy = b"".join(
+        [
+            diff.created.to_bytes(1, "big"),
+            diff.info_updated.to_bytes(1, "big"),
+            diff.data_transformed.to_bytes(1, "big"),
+            diff.data_added[0].to_bytes(8, "big"),
+            diff.data_added[1].to_bytes(8, "big"),
+            len(diff.data_updated).to_bytes(8, "big"),
+            *(idx.to_bytes(8, "big") for idx in diff.data_updated),
+            diff.cleared.to_bytes(1, "big"),
+            len(diff.data_deleted).to_bytes(8, "big"),
+            *(idx.to_bytes(8, "big") for idx in diff.data_deleted),
+            *(idx.to_bytes(8, "big") for idx in diff.data_deleted_ids),
+        ]
+    )
+    # version 1 stored the updated and deleted indexes as arrays instead of ranges
+    header = np.frombuffer(bytes(diff.tobytes()), dtype=_HEADER_DTYPE, count=1).copy()
+    header["version"] = 1
+    header["num_updated"] = len(diff.data_updated)
+    header["num_deleted"] = len(diff.data_deleted)
+    version_1 = b"".join(
+        [
+            header.tobytes(),
+            diff.data_updated.to_array().astype("<u8").tobytes(),
+            diff.data_deleted.to_array().astype("<u8").tobytes(),
+            np.array(sorted(diff.data_deleted_ids), dtype="<u8").tobytes(),
+        ]
+    )
+    for buffer in (legacy, version_1, diff.tobytes()):
+        loaded = CommitDiff.frombuffer(buffer)
+        assert loaded.legacy_format == (buffer is legacy)
+        assert loaded.created and loaded.info_updated and not loaded.cleared
+        assert loaded.data_added == diff.data_added
+        assert loaded.data_updated == {0, 2, 3}
+        assert loaded.data_deleted == {0}
+        assert loaded.data_deleted_ids == {12345}
@@ -9,7 +9,7 @@ def test_tobytes():
     diff.tensor_deleted("deleted2")
     diff.tensor_deleted("deleted3")
 
-    assert diff.tobytes() == b"".join(
+    legacy = b"".join(
         [
             False.to_bytes(1, "big"),
             int(2).to_bytes(8, "big"),
@@ -28,3 +28,10 @@ def test_tobytes():
             "deleted3".encode("utf-8"),
         ]
     )
+
+    for buffer in (legacy, diff.tobytes()):
+        loaded = DatasetDiff.frombuffer(buffer)
+        assert loaded.renamed == diff.renamed
+        assert loaded.deleted == diff.deleted
+        assert loaded.info_updated == diff.info_updated
+        assert loaded.legacy_format == (buffer is legacy)
@@ -0,0 +1,29 @@
+import numpy as np
+from deeplake.core.version_control.index_ranges import IndexRanges
+
+
+def test_index_ranges():
+    a = IndexRanges([5, 1, 2, 3, 8])
+    b = IndexRanges()
+    for i in (3, 4, 9, 8):
+        b.add(i)
+    assert a.intervals() == [(1, 4), (5, 6), (8, 9)]
+    assert a == {1, 2, 3, 5, 8} and {1, 2, 3, 5, 8} == a
+    assert a != {1, 2, 3}
+    assert len(a) == 5 and 2 in a and 4 not in a
+    assert list(b) == [3, 4, 8, 9]
+    assert a | b == {1, 2, 3, 4, 5, 8, 9}
+    assert a & b == {3, 8}
+    assert a - b == {1, 2, 5}
+    # sets on the left, as returned by older versions of Dataset.diff
+    assert {0} | a == {0, 1, 2, 3, 5, 8}
+    assert {2, 4, 5} & a == {2, 5}
+    assert {0, 1, 4} - a == {0, 4}
+    assert a.count_below(np.array([0, 3, 6, 100])).tolist() == [0, 2, 4, 5]
+
+    a.delete(2)
+    assert a == {1, 2, 4, 7}
+    a.remove(7)
+    a.discard(100)
+    assert a.to_array().tolist() == [1, 2, 4]
+    assert not IndexRanges() and IndexRanges() == set()
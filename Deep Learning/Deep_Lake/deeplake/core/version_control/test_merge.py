@@ -639,3 +639,53 @@ def test_merge_with_pop(memory_ds):
         ds.checkout("branch1")
         ds.merge("branch2")
         np.testing.assert_array_equal(ds.x.numpy().flatten(), [1, 2, 4, 5, 6])
+
+
+def test_merge_batched_updates(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("x", max_chunk_size=2000)
+        ds.x.extend(np.arange(100, dtype="int64").reshape(100, 1, 1).repeat(20, 1))
+        ds.commit()
+
+        ds.checkout("alt", create=True)
+        ds.x[10:40] = -np.ones((30, 20, 1), dtype="int64")
+        for i in (50, 52, 53):
+            ds.x[i] = -np.ones((20, 1), dtype="int64")
+        ds.commit()
+
+        ds.checkout("main")
+        ds.x[90] = 2 * np.ones((20, 1), dtype="int64")
+        ds.x.pop(0)
+        ds.merge("alt")
+
+        expected = np.arange(1, 100)
+        expected[89] = 2
+        for i in list(range(10, 40)) + [50, 52, 53]:
+            expected[i - 1] = -1
+        np.testing.assert_array_equal(ds.x[:, 0, 0].numpy(), expected)
+
+
+def test_merge_batched_updates_compressed(local_ds, cat_path, flower_path):
+    with local_ds as ds:
+        ds.create_tensor("images", htype="image", sample_compression="jpeg")
+        ds.create_tensor("links", htype="link[image]", sample_compression="jpeg")
+        ds.images.extend([deeplake.read(cat_path) for _ in range(5)])
+        ds.links.extend([deeplake.link(cat_path) for _ in range(5)])
+        ds.commit()
+
+        ds.checkout("alt", create=True)
+        ds.images[1:4] = [deeplake.read(flower_path) for _ in range(3)]
+        ds.links[1:4] = [deeplake.link(flower_path) for _ in range(3)]
+        ds.commit()
+
+        ds.checkout("main")
+        ds.merge("alt")
+
+        # the jpeg bytes are copied without being decoded and re-encoded
+        with open(flower_path, "rb") as f:
+            flower = f.read()
+        updated = [False, True, True, True, False]
+        assert [ds.images[i].tobytes() == flower for i in range(5)] == updated
+        assert [
+            ds.links[i]._linked_sample().path == flower_path for i in range(5)
+        ] == updated
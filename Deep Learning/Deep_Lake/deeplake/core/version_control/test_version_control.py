@@ -8,6 +8,16 @@ from deeplake.util.diff import (
     sanitize_commit,
 )
 from deeplake.util.remove_cache import get_base_storage
+from deeplake.util.keys import (
+    get_tensor_chunk_commit_index_key,
+    get_tensor_commit_chunk_map_key,
+)
+from deeplake.util.version_control import upgrade_version_control_metadata
+from deeplake.core.serialize import get_format_version
+from deeplake.core.version_control.commit_chunk_map import CommitChunkMap
+from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
+from deeplake.core.version_control.chunk_commit_index import ChunkCommitIndex
+from deeplake.constants import MB
 from deeplake.util.exceptions import (
     CheckoutError,
     CommitError,
@@ -103,6 +113,8 @@ def compare_tensor_dict(d1, d2):
             assert d2[key][1] - d2[key][0] == 0
         else:
             assert d1[key] == d2[key]
+            if key in ("data_updated", "data_deleted"):
+                assert isinstance(d1[key], set)
 
 
 def compare_tensor_diff(diff1, diff2):
@@ -2436,3 +2448,77 @@ def test_version_in_path(local_path):
 
     with pytest.raises(ValueError):
         deeplake.exists(f"{local_path}@main")
+
+
+def test_chunk_commit_index(local_ds):
+    with local_ds:
+        local_ds.create_tensor("abc", max_chunk_size=2 * MB)
+        local_ds.abc.extend(np.zeros((10, 1000, 100), dtype="uint8"))
+        commits = [local_ds.commit()]
+        for i in range(10):
+            local_ds.abc[i] = np.full((1000, 100), i + 1, dtype="uint8")
+            commits.append(local_ds.commit())
+
+    engine = local_ds.abc.chunk_engine
+    index = engine.get_chunk_commit_index(local_ds.version_state["commit_node"].parent)
+    # all the samples fit in one chunk, which was last copied by the last commit
+    for chunk_id in engine.chunk_id_encoder.encoded[:, 0]:
+        chunk_name = ChunkIdEncoder.name_from_id(chunk_id)
+        assert index.get(chunk_name) == (commits[-1], None)
+        assert engine.get_chunk_commit(chunk_name) == (commits[-1], "abc")
+    assert ChunkCommitIndex.frombuffer(index.tobytes()).sources == index.sources
+
+    # indexes are stored by commits, not by reads
+    storage = get_base_storage(local_ds.storage)
+    # the first commit has no index
+    for commit_id in commits[1:]:
+        assert get_tensor_chunk_commit_index_key("abc", commit_id) in storage
+    index_key = get_tensor_chunk_commit_index_key("abc", commits[-1])
+    del storage[index_key]
+    local_ds.storage.clear_cache()
+    assert local_ds.abc.chunk_engine.get_chunk_commit_index(
+        local_ds.version_state["commit_node"].parent
+    ).get(chunk_name) == (commits[-1], None)
+    assert index_key not in storage
+    np.testing.assert_array_equal(local_ds.abc[:, 0, 0].numpy(), np.arange(1, 11))
+
+    for i, commit_id in enumerate(commits):
+        local_ds.checkout(commit_id)
+        expected = [j + 1 if j < i else 0 for j in range(10)]
+        np.testing.assert_array_equal(local_ds.abc[:, 0, 0].numpy(), expected)
+
+
+def test_upgrade_version_control_metadata(local_ds):
+    with local_ds:
+        local_ds.create_tensor("abc")
+        local_ds.abc.append(1)
+        local_ds.commit()
+        local_ds.abc[0] = 2
+        commit_id = local_ds.commit()
+
+    storage = local_ds.storage
+    key = get_tensor_commit_chunk_map_key("abc", commit_id)
+    chunks = storage.get_deeplake_object(key, CommitChunkMap).chunks
+    assert chunks
+    # write the map in the legacy csv format
+    storage[key] = ",".join(
+        map(CommitChunkMap._serialize_entry, chunks.items())
+    ).encode("utf-8")
+    storage.clear_deeplake_objects()
+    storage.clear_cache()
+    assert get_format_version(storage[key], b"\xffDCM") == 0
+    assert storage.get_deeplake_object(key, CommitChunkMap).chunks == chunks
+    storage.clear_deeplake_objects()
+
+    assert upgrade_version_control_metadata(storage, local_ds.version_state) >= 1
+    storage.clear_deeplake_objects()
+    storage.clear_cache()
+    assert get_format_version(storage[key], b"\xffDCM") == 1
+    assert storage.get_deeplake_object(key, CommitChunkMap).chunks == chunks
+    np.testing.assert_array_equal(local_ds.abc.numpy(), [[2]])
+    assert upgrade_version_control_metadata(storage, local_ds.version_state) == 0
+    assert local_ds.upgrade_vc_metadata() == 0
+
+    local_ds.read_only = True
+    with pytest.raises(ReadOnlyModeError):
+        local_ds.upgrade_vc_metadata()
@@ -1,4 +1,5 @@
-from typing import Optional, Sequence, List, Dict
+from random import Random
+from typing import Any, Optional, Sequence, List, Dict
 from deeplake.constants import MB
 from deeplake.integrations.pytorch.common import PytorchTransformFunction
 from deeplake.util.exceptions import TransformFailedError
@@ -92,6 +93,36 @@ def _process(sample, transform: Optional[PytorchTransformFunction], return_index
     return sample
 
 
+def _process_batch(
+    batch, transform: Optional[PytorchTransformFunction], return_index: bool
+):
+    batch = IterableOrderedDict(batch)
+    indices = batch["index"]
+    if not return_index:
+        del batch["index"]
+    if transform:
+        try:
+            return transform(batch)
+        except Exception as e:
+            raise TransformFailedError(indices[:, 0].tolist()) from e
+    return batch
+
+
+def _allocate_tensor(shape, dtype):
+    """Allocates a batch column as a tensor, in shared memory when called from a dataloader worker
+    so that it is not copied again when sent to the main process."""
+    dtype = np.dtype(dtype)
+    # Cast to a pytorch supported dtype.
+    if dtype == np.uint16:
+        dtype = np.dtype(np.int32)
+    elif dtype in (np.uint32, np.uint64):
+        dtype = np.dtype(np.int64)
+    tensor = torch.from_numpy(np.empty(shape, dtype=dtype))
+    if torch.utils.data.get_worker_info() is not None:
+        tensor.share_memory_()
+    return tensor.numpy(), tensor
+
+
 class TorchDataset(torch.utils.data.IterableDataset):
     def __init__(
         self,
@@ -107,6 +138,10 @@ class TorchDataset(torch.utils.data.IterableDataset):
         decode_method: Optional[Dict[str, str]] = None,
         batch_size: int = 1,
         cache_size: int = 32 * MB,
+        stream_batches: bool = False,
+        drop_last: bool = False,
+        shuffle_window: int = 0,
+        seed: Optional[int] = None,
     ) -> None:
         super().__init__()
 
@@ -120,6 +155,13 @@ class TorchDataset(torch.utils.data.IterableDataset):
         self.decode_method = decode_method
         self.batch_size = batch_size
         self.cache_size = cache_size
+        self.stream_batches = stream_batches
+        self.drop_last = drop_last
+        self.shuffle_window = shuffle_window if shuffle else 0
+        self.seed = seed
+        # set by TorchDataLoader before each iteration
+        self.epoch = 0
+        self.offsets: Optional[List[int]] = None
 
         self.use_local_cache = use_local_cache
         self.scheduler = use_scheduler(num_workers, shuffle, batch_size)
@@ -128,7 +170,7 @@ class TorchDataset(torch.utils.data.IterableDataset):
             self.scheduler = DistributedScheduler(num_workers)
 
         if shuffle:
-            self.scheduler = ShufflingSchedulerWrapper(self.scheduler)
+            self.scheduler = ShufflingSchedulerWrapper(self.scheduler, seed)
 
         streaming = SampleStreaming(
             dataset,
@@ -147,9 +189,19 @@ class TorchDataset(torch.utils.data.IterableDataset):
     def __iter__(self):
         worker_info = torch.utils.data.get_worker_info()
         schedule: Schedule = self.schedules[0]
+        worker_id = 0
 
         if worker_info is not None:
-            schedule = self.schedules[worker_info.id]
+            worker_id = worker_info.id
+            schedule = self.schedules[worker_id]
+
+        epoch, offsets = self.epoch, self.offsets
+        # persistent workers keep their copy of the dataset, their next iteration is the next epoch
+        self.epoch += 1
+        self.offsets = None
+        seed = None
+        if self.seed is not None:
+            seed = Random(f"{self.seed}:{epoch}:{worker_id}").getrandbits(63)
 
         streaming = SampleStreaming(
             self.dataset,
@@ -157,20 +209,145 @@ class TorchDataset(torch.utils.data.IterableDataset):
             use_local_cache=self.use_local_cache,
             pad_tensors=self.pad_tensors,
             decode_method=self.decode_method,
+            shuffle_window=self.shuffle_window,
+            seed=seed,
         )
 
         if self.shuffle:
-            schedule.shuffle()
-
-        stream = streaming.read(schedule)
+            schedule = schedule.copy()
+            schedule.shuffle(None if seed is None else Random(seed))
+        skip = offsets[worker_id] if offsets else 0
+
+        if self.stream_batches:
+            for batch in streaming.read_batches(
+                schedule,
+                self.batch_size,
+                self.drop_last,
+                allocate=_allocate_tensor,
+                skip=skip,
+            ):
+                yield _process_batch(batch, self.transform, self.return_index)
+            return
+
+        stream = streaming.read(schedule, skip)
 
         for data in stream:
             yield _process(data, self.transform, self.return_index)
 
     def __len__(self):
+        if self.stream_batches:
+            # number of batches, each schedule is batched separately
+            if self.drop_last:
+                return sum(len(s) // self.batch_size for s in self.schedules)
+            return sum(-(-len(s) // self.batch_size) for s in self.schedules)
         return sum(map(len, self.schedules))
 
 
+def _worker_offsets(
+    num_batches: int, lengths: List[int], batch_size: int, drop_last: bool
+) -> List[int]:
+    """Number of samples of each worker's schedule that are in the first ``num_batches`` batches of a dataloader."""
+    totals = [
+        length // batch_size if drop_last else -(-length // batch_size)
+        for length in lengths
+    ]
+    # the dataloader takes a batch from each worker in turn, skipping the workers that are done
+    lo, hi = 0, max(totals, default=0)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if sum(min(total, mid) for total in totals) <= num_batches:
+            lo = mid
+        else:
+            hi = mid - 1
+    counts = [min(total, lo) for total in totals]
+    extra = num_batches - sum(counts)
+    for worker, total in enumerate(totals):
+        if extra and total > lo:
+            counts[worker] += 1
+            extra -= 1
+    return [min(count * batch_size, length) for count, length in zip(counts, lengths)]
+
+
+class TorchDataLoader(DataLoader):
+    """DataLoader over a :class:`TorchDataset` that keeps track of its position.
+
+    The position can be saved with :meth:`state_dict` and restored with :meth:`load_state_dict`, in which case the next
+    iteration resumes where the saved one stopped, without reading the samples that were already returned.
+    Resuming produces the same samples in the same order as long as the dataset, the dataloader arguments and the seed are the same,
+    and no corrupt sample is skipped.
+    """
+
+    def __init__(self, dataset: TorchDataset, *args, **kwargs):
+        super().__init__(dataset, *args, **kwargs)
+        self._epoch = 0
+        self._num_batches = 0
+        self._resume_state: Optional[Dict[str, Any]] = None
+
+    def __iter__(self):
+        dataset = self.dataset
+        if self._resume_state is not None:
+            state, self._resume_state = self._resume_state, None
+            self._epoch, self._num_batches = state["epoch"], state["num_batches"]
+            dataset.offsets = state["offsets"]
+        else:
+            dataset.offsets = None
+            if self._num_batches:
+                # the previous iteration was interrupted
+                self._epoch += 1
+            self._num_batches = 0
+        dataset.epoch = self._epoch
+        return self._track(super().__iter__())
+
+    def _track(self, iterator):
+        for batch in iterator:
+            self._num_batches += 1
+            yield batch
+        self._epoch += 1
+        self._num_batches = 0
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Returns the position of the dataloader.
+
+        Raises:
+            ValueError: If the samples are shuffled without a seed, in which case their order can not be reproduced.
+        """
+        dataset = self.dataset
+        if dataset.shuffle and dataset.seed is None:
+            raise ValueError(
+                "The state of a dataloader shuffling samples can only be restored if a seed is passed to it."
+            )
+        batch_size = dataset.batch_size if dataset.stream_batches else self.batch_size
+        offsets = _worker_offsets(
+            self._num_batches,
+            [len(schedule) for schedule in dataset.schedules],
+            batch_size or 1,
+            self.drop_last or dataset.drop_last,
+        )
+        return {
+            "seed": dataset.seed,
+            "epoch": self._epoch,
+            "num_batches": self._num_batches,
+            "offsets": offsets,
+        }
+
+    def load_state_dict(self, state_dict: Dict[str, Any]):
+        """Restores a position saved with :meth:`state_dict`. It is used by the next iteration.
+
+        Raises:
+            ValueError: If the state was saved by a dataloader with a different seed or number of workers.
+        """
+        dataset = self.dataset
+        if state_dict["seed"] != dataset.seed:
+            raise ValueError(
+                f"The state was saved with seed {state_dict['seed']}, but the dataloader has seed {dataset.seed}."
+            )
+        if len(state_dict["offsets"]) != len(dataset.schedules):
+            raise ValueError(
+                "The state was saved by a dataloader with a different number of workers."
+            )
+        self._resume_state = dict(state_dict)
+
+
 class SubIterableDataset(torch.utils.data.IterableDataset):
     def __init__(
         self,
@@ -72,17 +72,27 @@ def dataset_to_pytorch(
     decode_method: Optional[Dict[str, str]] = None,
     persistent_workers: bool = False,
     cache_size: int = 32 * MB,
+    stream_batches: bool = False,
+    shuffle_window: int = 0,
+    seed: Optional[int] = None,
     **kwargs,
 ):
     import torch
-    from deeplake.integrations.pytorch.dataset import TorchDataset
+    from deeplake.integrations.pytorch.dataset import TorchDataLoader, TorchDataset
 
     try_flushing(dataset)
 
     torch.multiprocessing.set_sharing_strategy("file_system")
 
+    if stream_batches and batch_size is None:
+        raise ValueError("batch_size should be set when streaming batches.")
+
     if collate_fn is None:
-        collate_fn = default_convert_fn if batch_size is None else default_collate_fn
+        collate_fn = (
+            default_convert_fn
+            if batch_size is None or stream_batches
+            else default_collate_fn
+        )
 
     if tensors is not None and "index" in tensors:
         raise ValueError("index is not a tensor, to get index, pass return_index=True")
@@ -104,7 +114,37 @@ def dataset_to_pytorch(
 
     tensors = map_tensor_keys(dataset, tensors)
 
-    if shuffle and num_workers > 0:
+    if stream_batches:
+        # batches are collated while they are read, the dataloader only converts them
+        return TorchDataLoader(
+            TorchDataset(
+                dataset,
+                tensors=tensors,
+                use_local_cache=use_local_cache,
+                transform=transform,
+                num_workers=num_workers,
+                shuffle=shuffle,
+                return_index=return_index,
+                pad_tensors=pad_tensors,
+                decode_method=decode_method,
+                batch_size=batch_size,
+                cache_size=cache_size,
+                stream_batches=True,
+                drop_last=drop_last,
+                shuffle_window=shuffle_window,
+                seed=seed,
+            ),
+            batch_size=None,
+            collate_fn=collate_fn,
+            pin_memory=pin_memory,
+            num_workers=num_workers,
+            persistent_workers=persistent_workers,
+        )
+    elif shuffle and num_workers > 0 and not shuffle_window:
+        if seed is not None:
+            raise ValueError(
+                "Samples shuffled through the shuffle buffer can not be seeded, pass shuffle_window to shuffle deterministically."
+            )
         return create_dataloader(
             dataset,
             tensors,
@@ -123,7 +163,7 @@ def dataset_to_pytorch(
             cache_size,
         )
     else:
-        return torch.utils.data.DataLoader(
+        return TorchDataLoader(
             TorchDataset(
                 dataset,
                 tensors=tensors,
@@ -137,6 +177,8 @@ def dataset_to_pytorch(
                 decode_method=decode_method,
                 batch_size=batch_size,
                 cache_size=cache_size,
+                shuffle_window=shuffle_window,
+                seed=seed,
             ),
             batch_size=batch_size,
             collate_fn=collate_fn,
@@ -986,3 +986,142 @@ def test_pytorch_data_decode(local_ds, cat_path):
         assert sample["class_label"]["text"] == [animals[i]]
         assert sample["image"]["value"].shape == (900, 900, 3)
         assert sample["generic"]["value"] == i
+
+
+@requires_torch
+@pytest.mark.parametrize("shuffle", [True, False])
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_stream_batches(local_ds, shuffle, num_workers):
+    import torch
+
+    with local_ds as ds:
+        ds.create_tensor(
+            "embedding", dtype="float32", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE
+        )
+        ds.embedding.extend(np.arange(100 * 16, dtype="float32").reshape(100, 16))
+        ds.create_tensor("label", htype="class_label")
+        ds.label.extend(np.arange(100, dtype="uint32"))
+        ds.create_tensor("dynamic")
+        for i in range(100):
+            ds.dynamic.append(np.ones(i % 3 + 1))
+
+    ptds = ds.pytorch(
+        batch_size=16,
+        num_workers=num_workers,
+        shuffle=shuffle,
+        stream_batches=True,
+    )
+    indices = []
+    for batch in ptds:
+        index = batch["index"][:, 0]
+        assert isinstance(batch["embedding"], torch.Tensor)
+        assert batch["embedding"].shape == (len(index), 16)
+        np.testing.assert_array_equal(
+            batch["embedding"].numpy(), ds.embedding.numpy()[index.numpy()]
+        )
+        # uint32 is cast to a type supported by pytorch
+        assert batch["label"].dtype == torch.int64
+        np.testing.assert_array_equal(batch["label"].numpy()[:, 0], index.numpy())
+        # samples of different shapes are returned as a list
+        assert len(batch["dynamic"]) == len(index)
+        for i, sample in zip(index.tolist(), batch["dynamic"]):
+            assert sample.shape == (i % 3 + 1,)
+        indices.extend(index.tolist())
+
+    if shuffle:
+        indices.sort()
+    assert indices == list(range(100))
+
+    ptds = ds.pytorch(
+        tensors=["label"],
+        batch_size=16,
+        num_workers=num_workers,
+        drop_last=True,
+        return_index=False,
+        stream_batches=True,
+    )
+    for batch in ptds:
+        assert batch.keys() == {"label"}
+        assert batch["label"].shape == (16, 1)
+
+
+@requires_torch
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_shuffle_window(local_ds, num_workers):
+    with local_ds as ds:
+        ds.create_tensor("xyz", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE)
+        ds.xyz.extend(np.arange(400 * 16).reshape(400, 16))
+    assert ds.xyz.chunk_engine.num_chunks > 8
+
+    ptds = ds.pytorch(
+        batch_size=1, num_workers=num_workers, shuffle=True, shuffle_window=4
+    )
+    indices = []
+    for batch in ptds:
+        index = batch["index"][0, 0].item()
+        np.testing.assert_array_equal(batch["xyz"][0].numpy(), ds.xyz[index].numpy())
+        indices.append(index)
+
+    assert indices != list(range(400))
+    assert sorted(indices) == list(range(400))
+
+
+@requires_torch
+@pytest.mark.parametrize(
+    "shuffle, shuffle_window, stream_batches",
+    [(False, 0, False), (True, 0, False), (True, 3, False), (True, 3, True)],
+)
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_pytorch_resume(local_ds, shuffle, shuffle_window, stream_batches, num_workers):
+    if shuffle and num_workers and not shuffle_window:
+        pytest.skip("the shuffle buffer can not be seeded")
+    with local_ds as ds:
+        ds.create_tensor("xyz", max_chunk_size=PYTORCH_TESTS_MAX_CHUNK_SIZE)
+        ds.xyz.extend(np.arange(200 * 16).reshape(200, 16))
+
+    def loader():
+        return ds.pytorch(
+            batch_size=8,
+            num_workers=num_workers,
+            shuffle=shuffle,
+            shuffle_window=shuffle_window,
+            stream_batches=stream_batches,
+            seed=42,
+        )
+
+    def indices(batches):
+        return [batch["index"][:, 0].tolist() for batch in batches]
+
+    expected = indices(loader())
+    # the same seed shuffles the same way across runs, and each epoch differently
+    ptds = loader()
+    assert indices(ptds) == expected
+    if shuffle:
+        assert indices(ptds) != expected
+
+    ptds = loader()
+    it = iter(ptds)
+    consumed = indices(next(it) for _ in range(7))
+    state = ptds.state_dict()
+    assert state["epoch"] == 0 and state["num_batches"] == 7
+    assert sum(state["offsets"]) == 56
+    del it
+
+    resumed = loader()
+    resumed.load_state_dict(state)
+    assert consumed + indices(resumed) == expected
+    assert resumed.state_dict()["epoch"] == 1
+
+
+@requires_torch
+def test_pytorch_resume_requires_seed(local_ds):
+    with local_ds as ds:
+        ds.create_tensor("xyz")
+        ds.xyz.extend(np.arange(10))
+
+    with pytest.raises(ValueError):
+        ds.pytorch(shuffle=True, num_workers=0).state_dict()
+    with pytest.raises(ValueError):
+        ds.pytorch(shuffle=True, num_workers=2, seed=0)
+    with pytest.raises(ValueError):
+        ds.pytorch(seed=1).load_state_dict(ds.pytorch(seed=0).state_dict())
@@ -125,3 +125,12 @@ def test_tensorflow_tobytes(local_ds, compressed_image_paths, compression):
         elif i >= 5 and compression:
             with open(compressed_image_paths["jpeg"][0], "rb") as f:
                 assert f.read() == image
+
+
+@requires_tensorflow
+def test_tensorflow_offset(local_ds):
+    local_ds.create_tensor("abc")
+    local_ds.abc.extend(np.arange(20))
+
+    tds = local_ds.tensorflow(offset=15)
+    assert [batch["abc"].numpy().item() for batch in tds] == list(range(15, 20))
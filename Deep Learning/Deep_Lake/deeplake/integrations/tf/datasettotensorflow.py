@@ -12,8 +12,8 @@ from deeplake.util.exceptions import (
 from deeplake.util.check_installation import tensorflow_installed
 
 
-def dataset_to_tensorflow(dataset, tensors, tobytes, fetch_chunks=True):
-    """Converts the dataset into a tensorflow compatible format"""
+def dataset_to_tensorflow(dataset, tensors, tobytes, fetch_chunks=True, offset=0):
+    """Converts the dataset into a tensorflow compatible format, starting at sample ``offset``"""
     if not tensorflow_installed():
         raise ModuleNotInstalledException(
             "'tensorflow' should be installed to convert the Dataset into tensorflow format"
@@ -35,8 +35,10 @@ def dataset_to_tensorflow(dataset, tensors, tobytes, fetch_chunks=True):
                 )
         tobytes = {k: k in tobytes for k in tensors}
 
+    samples = dataset[offset:] if offset else dataset
+
     def __iter__():
-        for sample in dataset:
+        for sample in samples:
             out = {}
             corrupt_sample_found = False
             for key in tensors:
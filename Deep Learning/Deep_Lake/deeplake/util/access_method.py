@@ -144,6 +144,10 @@ def get_local_dataset(
     read_only,
     memory_cache_size,
     local_cache_size,
+    eviction_policy,
+    num_shards,
+    write_behind,
+    use_mmap,
     creds,
     token,
     org_id,
@@ -192,6 +196,10 @@ def get_local_dataset(
         verbose=False,
         memory_cache_size=memory_cache_size,
         local_cache_size=local_cache_size,
+        eviction_policy=eviction_policy,
+        num_shards=num_shards,
+        write_behind=write_behind,
+        use_mmap=use_mmap,
         token=token,
         org_id=org_id,
         reset=reset,
@@ -0,0 +1,26 @@
+from typing import List, Sequence, Tuple
+
+
+def coalesce_byte_ranges(
+    ranges: Sequence[Tuple[int, int]], max_gap: int
+) -> List[Tuple[int, int, List[int]]]:
+    """Merges byte ranges that overlap or are separated by at most ``max_gap`` bytes.
+
+    Args:
+        ranges (Sequence[Tuple[int, int]]): ``(start_byte, end_byte)`` pairs, in any order.
+        max_gap (int): Largest number of unrequested bytes read to save a request.
+
+    Returns:
+        List[Tuple[int, int, List[int]]]: ``(start_byte, end_byte, indices)`` of the merged ranges, sorted by start,
+            where ``indices`` are the positions in ``ranges`` of the ranges they cover.
+    """
+    merged: List[Tuple[int, int, List[int]]] = []
+    for i in sorted(range(len(ranges)), key=lambda i: ranges[i][0]):
+        start, end = ranges[i]
+        if merged and start - merged[-1][1] <= max_gap:
+            last_start, last_end, indices = merged[-1]
+            indices.append(i)
+            merged[-1] = (last_start, max(last_end, end), indices)
+        else:
+            merged.append((start, end, [i]))
+    return merged
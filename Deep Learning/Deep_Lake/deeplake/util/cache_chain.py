@@ -1,5 +1,5 @@
 from deeplake.constants import LOCAL_CACHE_PREFIX
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid1
 import os
 from deeplake.core.storage import (
@@ -7,11 +7,23 @@ from deeplake.core.storage import (
     MemoryProvider,
     LocalProvider,
 )
+from deeplake.core.storage.chunk_cache import (
+    SharedChunkCache,
+    get_chunk_cache_size,
+    get_shared_chunk_cache,
+)
 from deeplake.core.storage.lru_cache import LRUCache
 from deeplake.util.exceptions import ProviderSizeListMismatch, ProviderListEmptyError
 
 
-def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
+def get_cache_chain(
+    storage_list: List[StorageProvider],
+    size_list: List[int],
+    eviction_policy: str = "lru",
+    num_shards: int = 1,
+    write_behind: bool = False,
+    chunk_cache: Optional[SharedChunkCache] = None,
+):
     """Returns a chain of storage providers as a cache
 
     Args:
@@ -21,6 +33,11 @@ def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
         size_list (List[int]): The list of sizes of the caches in bytes.
             Should have size 1 less than provider_list and specifies size of cache for all providers except the last
             one. The last one is the primary storage and is assumed to have infinite space.
+        eviction_policy (str): Eviction policy of the caches. One of "lru", "lfu", "2q" and "arc". Defaults to "lru".
+        num_shards (int): Number of independently locked partitions of each cache. Defaults to 1.
+        write_behind (bool): If True, the caches write to the next layer in background threads. Defaults to False.
+        chunk_cache (SharedChunkCache, optional): Disk cache shared by the processes of the machine that chunks read from
+            the primary storage go through.
 
     Returns:
         StorageProvider: Returns a cache containing all the storage providers in cache_list if cache_list has 2 or more
@@ -39,15 +56,41 @@ def get_cache_chain(storage_list: List[StorageProvider], size_list: List[int]):
         raise ProviderSizeListMismatch
     store = storage_list[-1]
     for size, cache in zip(reversed(size_list), reversed(storage_list[:-1])):
-        store = LRUCache(cache, store, size)
+        store = LRUCache(
+            cache,
+            store,
+            size,
+            eviction_policy=eviction_policy,
+            num_shards=num_shards,
+            write_behind=write_behind,
+            chunk_cache=chunk_cache,
+        )
+        # only the layer reading from the primary storage goes through the chunk cache
+        chunk_cache = None
     return store
 
 
+def get_cache_chain_options(storage: StorageProvider) -> Dict[str, Any]:
+    """Returns the options of :func:`generate_chain` the cache chain ``storage`` was created with, to create another
+    chain that behaves the same way. Empty if ``storage`` is not a cache chain.
+    """
+    if not isinstance(storage, LRUCache):
+        return {}
+    return {
+        "eviction_policy": storage.eviction_policy,
+        "num_shards": storage.num_shards,
+        "write_behind": storage.write_behind,
+    }
+
+
 def generate_chain(
     base_storage: StorageProvider,
     memory_cache_size: int,
     local_cache_size: int,
     path: Optional[str] = None,
+    eviction_policy: str = "lru",
+    num_shards: int = 1,
+    write_behind: bool = False,
 ) -> StorageProvider:
     """Internal function to be used by Dataset, to generate a cache_chain using a base_storage and sizes of memory and
         local caches.
@@ -58,10 +101,17 @@ def generate_chain(
         local_cache_size (int): The size of the local filesystem cache to be used in bytes.
         path (str, optional): The path to the dataset. If not None, it is used to figure out the folder name where the local
             cache is stored.
+        eviction_policy (str): Eviction policy of the caches. One of "lru", "lfu", "2q" and "arc". Defaults to "lru".
+        num_shards (int): Number of independently locked partitions of each cache. Defaults to 1.
+        write_behind (bool): If True, the caches write to the next layer in background threads. Defaults to False.
 
     Returns:
         StorageProvider: Returns a cache containing the base_storage along with memory cache,
             and local cache if a positive size has been specified for it.
+
+    Note:
+        Chunks read from remote storages go through the disk cache shared by the processes of the machine if the
+        ``DEEPLAKE_CHUNK_CACHE_SIZE`` environment variable is set to its budget in MB.
     """
 
     if path:
@@ -85,4 +135,17 @@ def generate_chain(
         )
         size_list.append(local_cache_size)
     storage_list.append(base_storage)
-    return get_cache_chain(storage_list, size_list)
+
+    chunk_cache = None
+    if get_chunk_cache_size() > 0 and not isinstance(
+        base_storage, (MemoryProvider, LocalProvider)
+    ):
+        chunk_cache = get_shared_chunk_cache()
+    return get_cache_chain(
+        storage_list,
+        size_list,
+        eviction_policy=eviction_policy,
+        num_shards=num_shards,
+        write_behind=write_behind,
+        chunk_cache=chunk_cache,
+    )
@@ -1,11 +1,8 @@
-from collections import OrderedDict, defaultdict
 from typing import List
 
-from deeplake.util.hash import hash_str_to_int32
-from deeplake.util.exceptions import EmptyTensorError
 from deeplake.client.log import logger
+from deeplake.constants import TRANSFORM_CHUNK_CACHE_SIZE
 import numpy as np
-import deeplake
 
 
 def convert_to_idx(samples, class_names: List[str]):
@@ -35,28 +32,21 @@ def convert_to_idx(samples, class_names: List[str]):
     return convert(samples)
 
 
-def convert_to_hash(samples, hash_label_map):
-    if isinstance(samples, np.ndarray):
-        samples = samples.tolist()
-    if isinstance(samples, list):
-        return [convert_to_hash(sample, hash_label_map) for sample in samples]
-    else:
-        if isinstance(samples, str):
-            hash_ = hash_str_to_int32(samples)
-            hash_label_map[hash_] = samples
-        else:
-            hash_ = samples
-        return hash_
-
-
-def convert_hash_to_idx(hashes, hash_idx_map):
-    if isinstance(hashes, list):
-        return [convert_hash_to_idx(hash, hash_idx_map) for hash in hashes]
-    else:
-        try:
-            return hash_idx_map[hashes]
-        except KeyError:
-            return hashes
+def has_int_labels_from(samples, start: int) -> bool:
+    """Whether ``samples`` have labels given as indexes rather than class names, that are at least ``start``."""
+    for sample in samples:
+        if isinstance(sample, np.ndarray):
+            if sample.dtype.kind in "iu":
+                if sample.size and sample.max() >= start:
+                    return True
+                continue
+            sample = sample.tolist()
+        if isinstance(sample, (list, tuple)):
+            if has_int_labels_from(sample, start):
+                return True
+        elif isinstance(sample, (int, np.integer)) and sample >= start:
+            return True
+    return False
 
 
 def convert_to_text(inp, class_names: List[str], return_original=False):
@@ -68,66 +58,94 @@ def convert_to_text(inp, class_names: List[str], return_original=False):
     return [convert_to_text(item, class_names) for item in inp]
 
 
-def sync_labels(
-    ds, label_temp_tensors, hash_label_maps, num_workers, scheduler, verbose=True
-):
+def merge_class_labels(
+    ds, storage, all_class_names, all_chunk_id_encoders, verbose=True
+) -> None:
+    """Merges the class names found by the workers of a transform into the class names of the tensors.
+
+    Each worker converts labels with its own copy of the class names of a tensor, giving the labels it doesn't know
+    provisional indexes after the existing ones. New labels are appended in worker order, so the first worker's
+    labels keep their indexes. The chunks of the other workers are only rewritten if their provisional indexes
+    differ from the final ones.
+
+    Args:
+        ds: The dataset the transform wrote to. The meta info of the workers must already be merged.
+        storage: The base storage of the dataset.
+        all_class_names (List[Dict[str, List[str]]]): The class names of each worker, per tensor key.
+        all_chunk_id_encoders (List[Dict[str, ChunkIdEncoder]]): The chunk id encoders of each worker, per tensor key.
+        verbose (bool): Whether to log the labels added to the class names.
+    """
+    from deeplake.core.chunk_engine import ChunkEngine
+    from deeplake.core.storage import LRUCache, MemoryProvider
+
     ds = ds.root
-    hl_maps = defaultdict(OrderedDict)
-    for map in hash_label_maps:
-        for tensor in map:
-            hl_maps[tensor].update(map[tensor])
-    hash_label_maps = hl_maps
-
-    @deeplake.compute
-    def class_label_sync(
-        hash_tensor_sample,
-        samples_out,
-        label_tensor: str,
-        hash_idx_map,
-    ):
-        try:
-            hashes = hash_tensor_sample.numpy().tolist()
-            idxs = convert_hash_to_idx(hashes, hash_idx_map)
-        except EmptyTensorError:
-            idxs = None
-        samples_out[label_tensor].append(idxs)
-
-    for tensor, temp_tensor in label_temp_tensors.items():
-        if len(ds[temp_tensor]) == 0:
-            ds.delete_tensor(temp_tensor, large_ok=True)
-        else:
-            try:
-                target_tensor = ds[tensor]
-                hash_label_map = hash_label_maps[temp_tensor]
-                class_names = target_tensor.info.class_names
-                new_labels = [
-                    label
-                    for label in hash_label_map.values()
-                    if label not in class_names
-                ]
-                if verbose:
-                    N = len(class_names)
-                    for i in range(len(new_labels)):
+    cache = LRUCache(MemoryProvider(), storage, TRANSFORM_CHUNK_CACHE_SIZE)
+    for tensor in all_class_names[0] if all_class_names else []:
+        target_tensor = ds[tensor]
+        class_names = target_tensor.info.class_names
+        num_known = len(class_names)
+        label_idx_map = {class_names[i]: i for i in range(num_known)}
+        remaps = []
+        for worker_class_names in all_class_names:
+            new_labels = worker_class_names[tensor][num_known:]
+            remap = np.zeros(len(new_labels), dtype=np.int64)
+            for i, label in enumerate(new_labels):
+                idx = label_idx_map.get(label)
+                if idx is None:
+                    idx = label_idx_map[label] = len(class_names)
+                    class_names.append(label)
+                    if verbose:
                         logger.info(
-                            f"'{new_labels[i]}' added to {tensor}.info.class_names at index {N + i}"
+                            f"'{label}' added to {tensor}.info.class_names at index {idx}"
                         )
-                class_names.extend(new_labels)
-                label_idx_map = {class_names[i]: i for i in range(len(class_names))}
-                hash_idx_map = {
-                    hash: label_idx_map[hash_label_map[hash]] for hash in hash_label_map
-                }
-                target_tensor.info.is_dirty = True
-                target_tensor.meta._disable_temp_transform = True
-                target_tensor.meta.is_dirty = True
-
-                logger.info("Synchronizing class labels...")
-                class_label_sync(label_tensor=tensor, hash_idx_map=hash_idx_map).eval(
-                    ds[temp_tensor],
-                    ds,
-                    progressbar=True,
-                    check_lengths=False,
-                    skip_ok=True,
-                )
-                target_tensor.meta._disable_temp_transform = False
-            finally:
-                ds.delete_tensor(temp_tensor, large_ok=True)
+                remap[i] = idx
+            remaps.append(remap)
+        if len(class_names) == num_known:
+            continue
+        target_tensor.info.is_dirty = True
+
+        chunk_engine = ChunkEngine(tensor, cache, ds.version_state)
+        for remap, chunk_id_encoders in zip(remaps, all_chunk_id_encoders):
+            if np.array_equal(remap, np.arange(num_known, num_known + len(remap))):
+                continue
+            encoded = chunk_id_encoders[tensor]._encoded
+            if encoded.size:
+                table = np.concatenate([np.arange(num_known), remap])
+                _remap_chunk_labels(chunk_engine, encoded[:, 0], num_known, table)
+    cache.flush()
+    # persist the updated class names
+    ds.storage.flush()
+
+
+def _remap_labels(labels: np.ndarray, num_known: int, table: np.ndarray) -> bool:
+    """Replaces the provisional label indexes in ``labels`` in place. Returns whether any of them was replaced."""
+    provisional = (labels >= num_known) & (labels < len(table))
+    if not provisional.any():
+        return False
+    labels[provisional] = table[labels[provisional]]
+    return True
+
+
+def _remap_chunk_labels(chunk_engine, chunk_ids, num_known: int, table: np.ndarray):
+    """Replaces the provisional label indexes of a worker in its chunks with the final ones."""
+    from deeplake.core.chunk.uncompressed_chunk import UncompressedChunk
+
+    for chunk_id in chunk_ids:
+        chunk = chunk_engine.get_chunk_from_chunk_id(chunk_id)
+        if isinstance(chunk, UncompressedChunk) and chunk.is_fixed_shape:
+            # the buffer of the chunk is the labels of all its samples, remapped at once
+            labels = np.frombuffer(chunk.memoryview_data, dtype=chunk.dtype).copy()
+            updated = _remap_labels(labels, num_known, table)
+            if updated:
+                chunk.prepare_for_write()
+                chunk.data_bytes = bytearray(labels.tobytes())
+        else:
+            updated = False
+            for local_index in range(chunk.num_samples):
+                labels = chunk.read_sample(local_index, copy=True)
+                if _remap_labels(labels, num_known, table):
+                    chunk.update_sample(local_index, labels)
+                    updated = True
+        if updated:
+            chunk_engine._invalidate_chunk_stats(chunk_id)
+            chunk_engine.write_chunk_to_storage(chunk)
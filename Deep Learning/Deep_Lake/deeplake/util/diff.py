@@ -1,8 +1,9 @@
 from collections import OrderedDict
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from deeplake.core.meta.dataset_meta import DatasetMeta
 from deeplake.core.version_control.commit_diff import CommitDiff
 from deeplake.core.version_control.commit_node import CommitNode  # type: ignore
+from deeplake.core.version_control.index_ranges import IndexRanges
 from deeplake.core.storage import LRUCache
 from deeplake.core.version_control.dataset_diff import DatasetDiff
 from deeplake.util.keys import (
@@ -347,8 +348,8 @@ def get_tensor_changes_for_id(
                 "cleared": False,
                 "info_updated": False,
                 "data_added": [0, 0],
-                "data_updated": set(),
-                "data_deleted": set(),
+                "data_updated": IndexRanges(),
+                "data_deleted": IndexRanges(),
                 "data_transformed_in_place": False,
             }
 
@@ -368,7 +369,22 @@ def get_tensor_changes_for_id(
     tensor_changes.append(commit_changes)
 
 
-def compress_into_range_intervals(indexes: Set[int]) -> List[Tuple[int, int]]:
+def index_ranges_to_sets(tensor_changes: Optional[List[Dict]]) -> Optional[List[Dict]]:
+    """Converts the updated and deleted indexes of tensor changes from :class:`IndexRanges` to sets, in place.
+    Used for the changes returned by :meth:`~deeplake.core.dataset.Dataset.diff`.
+    """
+    for commit_changes in tensor_changes or ():
+        for tensor, tensor_change in commit_changes.items():
+            if tensor == "commit_id":
+                continue
+            for key in ("data_updated", "data_deleted"):
+                tensor_change[key] = set(tensor_change[key])
+    return tensor_changes
+
+
+def compress_into_range_intervals(
+    indexes: Union[Set[int], IndexRanges]
+) -> List[Tuple[int, int]]:
     """Compresses the indexes into range intervals.
     Examples:
         compress_into_range_intervals({1, 2, 3, 4, 5, 6, 7, 8, 9, 10})
@@ -377,26 +393,14 @@ def compress_into_range_intervals(indexes: Set[int]) -> List[Tuple[int, int]]:
         >> [(1, 3), (5, 6), (8,8), (10,10)]
 
     Args:
-        indexes (Set[int]): The indexes to compress.
+        indexes (Set[int], IndexRanges): The indexes to compress.
 
     Returns:
         List[Tuple[int, int]]: The compressed range intervals.
     """
-
-    if not indexes:
-        return []
-
-    sorted_indexes = sorted(indexes)
-    compressed_indexes: List[Tuple[int, int]] = []
-    start = sorted_indexes[0]
-    end = sorted_indexes[0]
-    for index in sorted_indexes[1:]:
-        if index != end + 1:
-            compressed_indexes.append((start, end))
-            start = index
-        end = index
-    compressed_indexes.append((start, end))
-    return compressed_indexes
+    if not isinstance(indexes, IndexRanges):
+        indexes = IndexRanges(indexes)
+    return [(start, end - 1) for start, end in indexes.intervals()]
 
 
 def range_interval_list_to_string(range_intervals: List[Tuple[int, int]]) -> str:
@@ -425,7 +429,9 @@ def range_interval_list_to_string(range_intervals: List[Tuple[int, int]]) -> str
     return output[:-2]
 
 
-def convert_updates_deletes_to_string(indexes: Set[int], operation: str) -> str:
+def convert_updates_deletes_to_string(
+    indexes: Union[Set[int], IndexRanges], operation: str
+) -> str:
     range_intervals = compress_into_range_intervals(indexes)
     output = range_interval_list_to_string(range_intervals)
 
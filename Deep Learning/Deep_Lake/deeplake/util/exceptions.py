@@ -606,8 +606,8 @@ class InvalidInputDataError(TransformError):
     def __init__(self, operation):
         super().__init__(
             f"The data_in to transform is invalid. It doesn't support {operation} operation. "
-            "Please use a list, a Deep Lake dataset or an object that supports both __getitem__ and __len__. "
-            "Generators are not supported."
+            "Please use a list, a Deep Lake dataset, an object that supports both __getitem__ and __len__, "
+            "or an iterable such as a generator."
         )
 
 
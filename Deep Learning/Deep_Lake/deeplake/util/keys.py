@@ -31,6 +31,9 @@ from deeplake.util.exceptions import (
     AuthorizationException,
 )
 
+ENCODED_CHUNK_STATS_FOLDER = "chunk_stats"
+CHUNK_COMMIT_INDEX_FILENAME = "chunk_commit_index"
+
 
 def get_chunk_key(key: str, chunk_name: str, commit_id: str) -> str:
     if commit_id == FIRST_COMMIT_ID:
@@ -110,6 +113,20 @@ def get_tensor_tile_encoder_key(key: str, commit_id: str) -> str:
     )
 
 
+def get_tensor_chunk_stats_key(key: str, commit_id: str) -> str:
+    if commit_id == FIRST_COMMIT_ID:
+        return "/".join((key, ENCODED_CHUNK_STATS_FOLDER, UNSHARDED_ENCODER_FILENAME))
+    return "/".join(
+        (
+            "versions",
+            commit_id,
+            key,
+            ENCODED_CHUNK_STATS_FOLDER,
+            UNSHARDED_ENCODER_FILENAME,
+        )
+    )
+
+
 def get_creds_encoder_key(key: str, commit_id: str) -> str:
     if commit_id == FIRST_COMMIT_ID:
         return "/".join((key, ENCODED_CREDS_FOLDER, UNSHARDED_ENCODER_FILENAME))
@@ -136,6 +153,10 @@ def get_tensor_commit_chunk_map_key(key: str, commit_id: str) -> str:
     return "/".join(("versions", commit_id, key, TENSOR_COMMIT_CHUNK_MAP_FILENAME))
 
 
+def get_tensor_chunk_commit_index_key(key: str, commit_id: str) -> str:
+    return "/".join(("versions", commit_id, key, CHUNK_COMMIT_INDEX_FILENAME))
+
+
 def get_tensor_commit_diff_key(key: str, commit_id: str) -> str:
     if commit_id == FIRST_COMMIT_ID:
         return "/".join((key, "commit_diff"))
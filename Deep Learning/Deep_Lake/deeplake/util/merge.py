@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Set, Tuple
 from deeplake.core.version_control.commit_diff import CommitDiff
 from deeplake.core.version_control.commit_node import CommitNode
 from deeplake.core.meta.encode.chunk_id import ChunkIdEncoder
+from deeplake.core.meta.encode.base_encoder import LAST_SEEN_INDEX_COLUMN
 from deeplake.util.class_label import convert_to_text
 from deeplake.util.diff import (
     get_lowest_common_ancestor,
@@ -27,6 +28,7 @@ from deeplake.util.keys import (
     get_tensor_meta_key,
     get_tensor_info_key,
     get_tensor_tile_encoder_key,
+    get_tensor_chunk_stats_key,
     get_creds_encoder_key,
     get_tensor_commit_chunk_map_key,
     get_tensor_commit_diff_key,
@@ -213,6 +215,7 @@ def get_changes_commit_ids_for_node(
     changes_commit_map = defaultdict(list)
     current_node = commit_node
     tensor_key = dataset.version_state["tensor_names"][tensor_name]
+    ids = None
     while current_node and current_node.commit_id != lca_node.commit_id:
         commit_id = current_node.commit_id
         if current_node.is_merge_node:
@@ -223,12 +226,11 @@ def get_changes_commit_ids_for_node(
                 changes_commit_map[idx].extend(changes[idx])
         else:
             diff = get_tensor_commit_diff(dataset, tensor_key, commit_id)
-            if diff is not None:
-                data_updated = sorted(diff.data_updated)
-                id_tensor_key = get_sample_id_tensor_key(tensor_name)
-                id_tensor = dataset[id_tensor_key]
-                for idx in data_updated:
-                    sample_id = id_tensor[idx].numpy()[0]
+            if diff is not None and diff.data_updated:
+                if ids is None:
+                    id_tensor_key = get_sample_id_tensor_key(tensor_name)
+                    ids = dataset[id_tensor_key].numpy().reshape(-1)
+                for sample_id in ids[diff.data_updated.to_array()].tolist():
                     changes_commit_map[sample_id].append(commit_id)
         current_node = current_node.parent
     return changes_commit_map
@@ -292,24 +294,27 @@ def merge_common_tensors(
         for tensor_name in tensor_names
     }
 
-    all_new_idxs = set()
-    for new_idxs, _, _ in idxs.values():
-        all_new_idxs.update(new_idxs)
-    for idx in all_new_idxs:
-        non_pad_found = False
+    all_new_idxs = np.unique(
+        np.concatenate(
+            [np.zeros(0, dtype=np.int64)]
+            + [np.array(new_idxs, dtype=np.int64) for new_idxs, _, _ in idxs.values()]
+        )
+    )
+    if len(all_new_idxs):
+        # new samples that are padding in all the tensors are not merged
+        non_pad_found = np.zeros(len(all_new_idxs), dtype=bool)
         for tensor_name in tensor_names:
             target_engine = target_dataset[tensor_name].chunk_engine
             enc = target_engine.chunk_id_encoder
-            if idx <= enc.num_samples:
-                if not target_engine.pad_encoder.is_padded(idx):
-                    non_pad_found = True
-                    break
-        if not non_pad_found:
-            for new_idxs, _, _ in idxs.values():
-                try:
-                    new_idxs.remove(idx)
-                except ValueError:
-                    pass
+            non_pad_found |= (all_new_idxs <= enc.num_samples) & ~_padded_mask(
+                target_engine.pad_encoder, all_new_idxs
+            )
+        pad_idxs = all_new_idxs[~non_pad_found]
+        if len(pad_idxs):
+            for tensor_name, (new_idxs, updated_idxs, conflict_idxs) in idxs.items():
+                new_idxs = np.array(new_idxs, dtype=np.int64)
+                new_idxs = new_idxs[~np.isin(new_idxs, pad_idxs)].tolist()
+                idxs[tensor_name] = (new_idxs, updated_idxs, conflict_idxs)
     for tensor_name in tensor_names:
         (
             new_indexes,
@@ -358,37 +363,70 @@ def check_common_tensor_mismatches(tensor_names: Set[str], dataset, target_datas
                 raise MergeMismatchError(tensor_name, key, value, target_details[key])
 
 
-def get_indexes_from_ids(
-    elements_ids, id_changes_commit_map, id_to_index_map
-) -> List[int]:
-    new_indexes: List[int] = []
-    for id in elements_ids:
-        id_changes_commit_map.pop(id, None)
-        idx = id_to_index_map[id]
-        new_indexes.append(idx)
-    return new_indexes
+def _padded_mask(pad_encoder: PadEncoder, indexes: np.ndarray) -> np.ndarray:
+    """Returns whether each of the given sample indexes is padding."""
+    pad_encoder._flush()
+    # the encoded array holds the sorted (start, end) boundaries of the padded ranges
+    return np.searchsorted(pad_encoder._encoded, indexes, side="right") % 2 == 1
+
+
+def _index_of(ids: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Returns the positions of the ``query`` ids in ``ids``, -1 for the ones that are missing."""
+    if not len(ids):
+        return np.full(len(query), -1, dtype=np.int64)
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+    pos = np.minimum(np.searchsorted(sorted_ids, query), len(ids) - 1)
+    return np.where(sorted_ids[pos] == query, order[pos], -1)
+
+
+def _ids_array(ids, dtype) -> np.ndarray:
+    return np.fromiter(ids, dtype=dtype)
 
 
 def find_updated_and_conflicts(
     original_id_changes_commit_map,
     target_id_changes_commit_map,
-    original_id_to_index_map,
-    target_id_to_index_map,
+    original_ids: np.ndarray,
+    target_ids: np.ndarray,
 ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
     """Finds the conflicts between the original commit and target id.
 
+    Samples only modified in the target commit are found with set operations on the ids, the commit histories are
+    only compared for the samples modified in both commits.
+
     Args:
         original_id_changes_commit_map: A dictionary mapping sample ids to a list of commit ids that modified the sample.
         target_id_changes_commit_map: A dictionary mapping sample ids to a list of commit ids that modified the sample.
-        original_id_to_index_map: A dictionary mapping sample ids to their index in the original commit.
-        target_id_to_index_map: A dictionary mapping sample ids to their index in the target id.
+        original_ids: The sample ids of the original commit.
+        target_ids: The sample ids of the target commit.
 
     Returns:
         A tuple of list of tuples of the form (original_idx, target_idx)
     """
-    updated_indexes: List[Tuple[int, int]] = []
+    changed_ids = _ids_array(target_id_changes_commit_map, target_ids.dtype)
+    original_changed_ids = _ids_array(
+        (id for id, commit_ids in original_id_changes_commit_map.items() if commit_ids),
+        target_ids.dtype,
+    )
+    target_idxs = _index_of(target_ids, changed_ids)
+    original_idxs = _index_of(original_ids, changed_ids)
+    # samples deleted on either side have nothing to merge
+    present = (target_idxs >= 0) & (original_idxs >= 0)
+    changed_in_both = np.isin(changed_ids, original_changed_ids)
+
+    # this means that the sample was only modified in the target commit, no conflict
+    only_target = present & ~changed_in_both
+    updated_indexes: List[Tuple[int, int]] = list(
+        zip(original_idxs[only_target].tolist(), target_idxs[only_target].tolist())
+    )
     conflict_indexes: List[Tuple[int, int]] = []
-    for id in target_id_changes_commit_map:
+    both = present & changed_in_both
+    for id, original_idx, target_idx in zip(
+        changed_ids[both].tolist(),
+        original_idxs[both].tolist(),
+        target_idxs[both].tolist(),
+    ):
         target_commit_ids = target_id_changes_commit_map[id]
         original_commit_ids = original_id_changes_commit_map[id]
         set_original_commit_ids = set(original_commit_ids)
@@ -397,20 +435,14 @@ def find_updated_and_conflicts(
             if item in set_original_commit_ids:
                 idx = i
                 break
-
-        # this means that the sample was only modified in the target commit, no conflict
-        if not original_commit_ids or (
-            idx is not None and target_commit_ids[idx] == original_commit_ids[0]
-        ):
-            target_idx: int = target_id_to_index_map[id]
-            original_idx: int = original_id_to_index_map[id]
+        if idx is not None and target_commit_ids[idx] == original_commit_ids[0]:
             updated_indexes.append((original_idx, target_idx))
 
         # if no id is common or if a commit id other than the most recent commit_id is in common, there's a conflict
         elif idx is None or idx > 0:
-            target_idx = target_id_to_index_map[id]
-            original_idx = original_id_to_index_map[id]
             conflict_indexes.append((original_idx, target_idx))
+    updated_indexes.sort()
+    conflict_indexes.sort()
     return updated_indexes, conflict_indexes
 
 
@@ -430,7 +462,7 @@ def find_new_updated_and_conflict_indexes(
 
     Returns:
         A tuple of the form (new_indexes, updated_indexes, conflict_indexes)
-        - new_indexes is a list of indexes for new samples
+        - new_indexes is a sorted list of indexes for new samples
         - updated_indexes is a list of tuples of the form (original_idx, target_idx)
         - conflict_indexes is a list of tuples of the form (original_idx, target_idx)
     """
@@ -453,24 +485,21 @@ def find_new_updated_and_conflict_indexes(
         dataset, tensor_name, original_node, lca_node
     )
 
-    original_ids = original_id_tensor.numpy().flatten()
-    original_id_to_index_map = {id: idx for idx, id in enumerate(original_ids)}
+    original_ids = original_id_tensor.numpy().reshape(-1)
+    target_ids = target_id_tensor.numpy().reshape(-1)
 
-    target_ids = target_id_tensor.numpy().flatten()
-    target_id_to_index_map = {id: idx for idx, id in enumerate(target_ids)}
+    is_new = ~np.isin(target_ids, original_ids)
+    if deleted_samples:
+        is_new &= ~np.isin(target_ids, _ids_array(deleted_samples, target_ids.dtype))
+    new_indexes = np.flatnonzero(is_new).tolist()
+    for id in target_ids[is_new].tolist():
+        target_id_changes_commit_map.pop(id, None)
 
-    new_elements_ids = set(target_ids) - set(original_ids)
-    new_elements_ids = new_elements_ids - deleted_samples
-    new_indexes = get_indexes_from_ids(
-        new_elements_ids, target_id_changes_commit_map, target_id_to_index_map
-    )
-    conflict_indexes: List[Tuple[int, int]] = []
-    updated_indexes: List[Tuple[int, int]] = []
     updated_indexes, conflict_indexes = find_updated_and_conflicts(
         original_id_changes_commit_map,
         target_id_changes_commit_map,
-        original_id_to_index_map,
-        target_id_to_index_map,
+        original_ids,
+        target_ids,
     )
     return new_indexes, updated_indexes, conflict_indexes
 
@@ -521,17 +550,20 @@ def merge_tensor_data(
             copy_class_labels = False
     copy_links_only = False
     if copy_class_labels:
-        # TODO optimize this
+        # the labels are remapped to the class names of the original tensor, their chunks can't be copied as is
         links = original_tensor.meta.links
         original_tensor.meta.links = {}
         try:
             with original_tensor.dataset:
-                for index in new_indexes:
-                    sample = target_tensor[index]
-                    sample = convert_to_text(
-                        sample.numpy(), target_class_names, return_original=True
+                for start, end in _group_ranges(new_indexes) if new_indexes else []:
+                    original_tensor.extend(
+                        [
+                            convert_to_text(
+                                sample, target_class_names, return_original=True
+                            )
+                            for sample in target_tensor[start:end].numpy(aslist=True)
+                        ]
                     )
-                    original_tensor.append(sample)
         finally:
             original_tensor.meta.links = links
         copy_links_only = True
@@ -546,14 +578,52 @@ def merge_tensor_data(
     )
 
     updated_indexes = updated_samples_dict[tensor_name]
+    if not updated_indexes:
+        return
     remap_class_label = is_class_label and target_class_names
-    for original_idx, target_idx in updated_indexes:
-        sample = target_tensor[target_idx]
-        if remap_class_label:
-            sample = convert_to_text(
-                sample.numpy(), target_class_names, return_original=True
+    # compressed samples are copied without re-encoding them and links as links by passing the samples as tensors,
+    # the others are read a run at a time
+    pass_tensors = not remap_class_label and (
+        original_tensor.meta.sample_compression or original_tensor.meta.is_link
+    )
+    if original_tensor.is_sequence:
+        runs = [
+            (original_idx, target_idx, 1)
+            for original_idx, target_idx in updated_indexes
+        ]
+    else:
+        boundaries = (
+            original_tensor.chunk_engine.chunk_id_encoder._encoded[
+                :, LAST_SEEN_INDEX_COLUMN
+            ]
+            + 1
+        )
+        runs = _group_index_pairs(
+            np.array(sorted(updated_indexes), dtype=np.int64), boundaries
+        )
+    for original_start, target_start, length in runs:
+        if length == 1 and (original_tensor.is_sequence or not pass_tensors):
+            samples = target_tensor[target_start]
+            if remap_class_label:
+                samples = convert_to_text(
+                    samples.numpy(), target_class_names, return_original=True
+                )
+            original_tensor[original_start] = samples
+            continue
+        if pass_tensors:
+            samples = [
+                target_tensor[i] for i in range(target_start, target_start + length)
+            ]
+        else:
+            samples = target_tensor[target_start : target_start + length].numpy(
+                aslist=True
             )
-        original_tensor[original_idx] = sample
+        if remap_class_label:
+            samples = [
+                convert_to_text(sample, target_class_names, return_original=True)
+                for sample in samples
+            ]
+        original_tensor[original_start : original_start + length] = samples
 
 
 def check_id_tensors_exist(visible_tensors: Set[str], all_tensors: Set[str]):
@@ -570,6 +640,7 @@ def _get_meta_files_for_tensor(tensor_name, commit_id):
         get_tensor_info_key,
         get_chunk_id_encoder_key,
         get_tensor_tile_encoder_key,
+        get_tensor_chunk_stats_key,
         get_creds_encoder_key,
         get_sequence_encoder_key,
     ]
@@ -689,6 +760,27 @@ def _group_ranges(x):
     return ret
 
 
+def _group_index_pairs(
+    pairs: np.ndarray, boundaries: np.ndarray
+) -> List[Tuple[int, int, int]]:
+    """Groups (original index, target index) pairs sorted by original index into runs that are consecutive in both
+    tensors and don't cross the given chunk boundaries of the original tensor, so that each run is updated at once.
+
+    Returns:
+        A list of (original start, target start, length) runs.
+    """
+    steps = np.diff(pairs, axis=0)
+    breaks = np.flatnonzero((steps != 1).any(axis=1)) + 1
+    chunk_rows = np.searchsorted(boundaries, pairs[:, 0], side="right")
+    breaks = np.union1d(breaks, np.flatnonzero(np.diff(chunk_rows)) + 1)
+    starts = [0] + breaks.tolist()
+    ends = breaks.tolist() + [len(pairs)]
+    return [
+        (int(pairs[start, 0]), int(pairs[start, 1]), end - start)
+        for start, end in zip(starts, ends)
+    ]
+
+
 def _merge_encodings(enc1, enc2, start, end, off1=None, off2=None):
     n1 = len(enc1)
     if not n1:
@@ -1,8 +1,9 @@
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from deeplake.core.storage import LRUCache
 from deeplake.core.version_control.commit_diff import CommitDiff
 from deeplake.core.version_control.commit_node import CommitNode
+from deeplake.core.version_control.index_ranges import IndexRanges
 from deeplake.util.diff import sanitize_commit
 from deeplake.util.exceptions import TensorModifiedError
 from deeplake.util.keys import get_tensor_commit_diff_key
@@ -17,9 +18,9 @@ def get_modified_indexes(
 ) -> List[int]:
     if target_id is None:
         indexes, _ = get_modified_indexes_for_commit(tensor, current_commit_id, storage)
-        return sorted(list(indexes))
+        return indexes.to_array().tolist()
 
-    indexes = set()
+    indexes = IndexRanges()
     target_id = sanitize_commit(target_id, version_state)
     commit_node_map = version_state["commit_node_map"]
     current_node: CommitNode = commit_node_map[current_commit_id]
@@ -35,24 +36,23 @@ def get_modified_indexes(
         if stop:
             break
         current_node = current_node.parent  # type: ignore
-    return sorted(list(indexes))
+    return indexes.to_array().tolist()
 
 
 def get_modified_indexes_for_commit(
     tensor: str, commit_id: str, storage: LRUCache
-) -> Tuple[Set[int], bool]:
-    indexes: Set[int] = set()
+) -> Tuple[IndexRanges, bool]:
+    indexes = IndexRanges()
     try:
         commit_diff_key = get_tensor_commit_diff_key(tensor, commit_id)
         commit_diff: CommitDiff = storage.get_deeplake_object(
             commit_diff_key, CommitDiff
         )
 
-        data_added = range(*commit_diff.data_added)
-        data_updated = commit_diff.data_updated
-
-        indexes.update(data_added)
-        indexes.update(data_updated)
+        indexes = IndexRanges.from_ranges(
+            [commit_diff.data_added[0]], [commit_diff.data_added[1]]
+        )
+        indexes.update(commit_diff.data_updated)
 
         stop = commit_diff.data_transformed
         return indexes, stop
@@ -1,6 +1,6 @@
 from deeplake.util.agreement import handle_dataset_agreements
 from deeplake.util.cache_chain import generate_chain
-from deeplake.constants import LOCAL_CACHE_PREFIX, MB
+from deeplake.constants import MB
 from deeplake.util.exceptions import AgreementNotAcceptedError
 from deeplake.util.tag import process_hub_path
 from deeplake.util.path import get_path_type
@@ -27,6 +27,7 @@ def storage_provider_from_path(
     token: Optional[str] = None,
     is_hub_path: bool = False,
     db_engine: bool = False,
+    use_mmap: bool = False,
 ):
     """Construct a StorageProvider given a path.
 
@@ -38,6 +39,7 @@ def storage_provider_from_path(
         token (str): token for authentication into activeloop.
         is_hub_path (bool): Whether the path points to a Deep Lake dataset.
         db_engine (bool): Whether to use Activeloop DB Engine. Only applicable for hub:// paths.
+        use_mmap (bool): Whether the LocalProvider reads chunks from memory mapped files. Only applicable for local paths.
 
     Returns:
         If given a path starting with s3:// returns the S3Provider.
@@ -90,7 +92,7 @@ def storage_provider_from_path(
             storage = MemoryProvider(path)
         else:
             if not os.path.exists(path) or os.path.isdir(path):
-                storage = LocalProvider(path)
+                storage = LocalProvider(path, use_mmap=use_mmap)
             else:
                 raise ValueError(
                     f"Local path {path} must be a path to a local directory"
@@ -189,6 +191,10 @@ def get_storage_and_cache_chain(
     memory_cache_size,
     local_cache_size,
     db_engine=False,
+    eviction_policy="lru",
+    num_shards=1,
+    write_behind=False,
+    use_mmap=False,
 ):
     """
     Returns storage provider and cache chain for a given path, according to arguments passed.
@@ -202,6 +208,10 @@ def get_storage_and_cache_chain(
         memory_cache_size (int): The size of the in-memory cache to use.
         local_cache_size (int): The size of the local cache to use.
         db_engine (bool): Whether to use Activeloop DB Engine, only applicable for hub:// paths.
+        eviction_policy (str): Eviction policy of the caches. One of "lru", "lfu", "2q" and "arc".
+        num_shards (int): Number of independently locked partitions of each cache.
+        write_behind (bool): If True, the caches write to the next layer in background threads.
+        use_mmap (bool): If True, chunks of local datasets are read from memory mapped files.
 
     Returns:
         A tuple of the storage provider and the storage chain.
@@ -213,11 +223,18 @@ def get_storage_and_cache_chain(
         creds=creds,
         read_only=read_only,
         token=token,
+        use_mmap=use_mmap,
     )
     memory_cache_size_bytes = memory_cache_size * MB
     local_cache_size_bytes = local_cache_size * MB
     storage_chain = generate_chain(
-        storage, memory_cache_size_bytes, local_cache_size_bytes, path
+        storage,
+        memory_cache_size_bytes,
+        local_cache_size_bytes,
+        path,
+        eviction_policy=eviction_policy,
+        num_shards=num_shards,
+        write_behind=write_behind,
     )
     if storage.read_only:
         storage_chain.enable_readonly()
@@ -229,11 +246,3 @@ def get_local_storage_path(path: str, prefix: str):
     local_cache_name = local_cache_name.replace("/", "_")
     local_cache_name = local_cache_name.replace("\\", "_")
     return os.path.join(prefix, local_cache_name)
-
-
-def get_pytorch_local_storage(dataset):
-    """Returns a local storage provider for a given dataset to be used for Pytorch iteration"""
-    local_cache_name: str = f"{dataset.path}_pytorch"
-    local_cache_prefix = os.getenv("LOCAL_CACHE_PREFIX", default=LOCAL_CACHE_PREFIX)
-    local_cache_path = get_local_storage_path(local_cache_name, local_cache_prefix)
-    return LocalProvider(local_cache_path)
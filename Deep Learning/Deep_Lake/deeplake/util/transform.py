@@ -1,8 +1,9 @@
 from collections import defaultdict
+import asyncio
 import math
 import warnings
 import deeplake
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from json.decoder import JSONDecodeError
 from deeplake.core.linked_chunk_engine import LinkedChunkEngine
 from deeplake.core.meta.tensor_meta import TensorMeta
@@ -46,6 +47,10 @@ except ImportError:
     pd = None
 
 
+# number of samples pulled at a time from iterable inputs when not checkpointing
+DEFAULT_STREAM_BATCH_SIZE = 1000
+
+
 def transform_sample(
     sample: Any,
     pipeline,
@@ -277,7 +282,7 @@ def _retrieve_memory_objects(all_chunk_engines):
     all_chunk_maps = {}
     all_commit_diffs = {}
     all_creds_encoders = {}
-    all_hash_label_maps = {}
+    all_class_names = {}
     for tensor, chunk_engine in all_chunk_engines.items():
         chunk_engine.cache.flush()
         chunk_engine.meta_cache.flush()
@@ -289,8 +294,8 @@ def _retrieve_memory_objects(all_chunk_engines):
         all_chunk_maps[tensor] = chunk_engine.commit_chunk_map
         all_commit_diffs[tensor] = chunk_engine.commit_diff
         all_creds_encoders[tensor] = chunk_engine.creds_encoder
-        if chunk_engine._is_temp_label_tensor:
-            all_hash_label_maps[tensor] = chunk_engine._hash_label_map
+        if chunk_engine._transform_class_names is not None:
+            all_class_names[tensor] = chunk_engine._transform_class_names
 
     return {
         "tensor_metas": all_tensor_metas,
@@ -301,7 +306,7 @@ def _retrieve_memory_objects(all_chunk_engines):
         "commit_chunk_maps": all_chunk_maps,
         "commit_diffs": all_commit_diffs,
         "creds_encoders": all_creds_encoders,
-        "hash_label_maps": all_hash_label_maps,
+        "class_names": all_class_names,
     }
 
 
@@ -311,7 +316,7 @@ def store_data_slice_with_pbar(pg_callback, transform_input: Tuple) -> Dict:
         group_index,
         tensors,
         visible_tensors,
-        label_temp_tensors,
+        class_label_names,
         pipeline,
         version_state,
         link_creds,
@@ -321,7 +326,7 @@ def store_data_slice_with_pbar(pg_callback, transform_input: Tuple) -> Dict:
         ignore_errors,
     ) = inp
     all_chunk_engines = create_worker_chunk_engines(
-        tensors, label_temp_tensors, output_storage, version_state, link_creds
+        tensors, class_label_names, output_storage, version_state, link_creds
     )
 
     if isinstance(data_slice, deeplake.Dataset):
@@ -333,7 +338,6 @@ def store_data_slice_with_pbar(pg_callback, transform_input: Tuple) -> Dict:
         rel_tensors,
         all_chunk_engines,
         group_index,
-        label_temp_tensors,
         cache_size=cache_size,
     )
 
@@ -373,13 +377,14 @@ def store_data_slice_with_pbar(pg_callback, transform_input: Tuple) -> Dict:
 
 def create_worker_chunk_engines(
     tensors: List[str],
-    label_temp_tensors: Dict[str, str],
+    class_label_names: Dict[str, List[str]],
     output_storage: StorageProvider,
     version_state,
     link_creds,
 ) -> Dict[str, ChunkEngine]:
     """Creates chunk engines corresponding to each storage for all tensors.
     These are created separately for each worker for parallel uploads.
+    Labels of the class_label tensors in ``class_label_names`` are converted with a copy of the given class names.
     """
     all_chunk_engines: Dict[str, ChunkEngine] = {}
     num_tries = 1000
@@ -434,8 +439,13 @@ def create_worker_chunk_engines(
                         tensor, storage_cache, version_state, memory_cache
                     )
                 storage_chunk_engine._all_chunk_engines = all_chunk_engines
-                if tensor in label_temp_tensors.values():
-                    storage_chunk_engine._is_temp_label_tensor = True
+                if tensor in class_label_names:
+                    storage_chunk_engine._transform_class_names = list(
+                        class_label_names[tensor]
+                    )
+                    storage_chunk_engine._transform_num_known_labels = len(
+                        class_label_names[tensor]
+                    )
                 all_chunk_engines[tensor] = storage_chunk_engine
                 break
             except (JSONDecodeError, KeyError):
@@ -474,8 +484,48 @@ def add_cache_to_dataset_slice(
     return dataset_slice
 
 
+def is_stream_input(data_in) -> bool:
+    """Whether ``data_in`` can only be iterated over, e.g. generators, iterators and async iterables."""
+    if hasattr(data_in, "__getitem__") and hasattr(data_in, "__len__"):
+        return False
+    return hasattr(data_in, "__iter__") or hasattr(data_in, "__aiter__")
+
+
+def _iterate_async(data_in) -> Iterator:
+    loop = asyncio.new_event_loop()
+    iterator = data_in.__aiter__()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.close()
+
+
+def iterate_batches(data_in, batch_size: int) -> Iterator[Tuple[List, bool]]:
+    """Pulls samples from an iterable or async iterable in lists of at most ``batch_size`` samples.
+
+    Yields:
+        Tuple of a batch and whether it is the last one. One batch is read ahead to tell the last one apart.
+    """
+    iterator = (
+        _iterate_async(data_in) if hasattr(data_in, "__aiter__") else iter(data_in)
+    )
+    batch: List = []
+    for sample in iterator:
+        if len(batch) == batch_size:
+            yield batch, False
+            batch = []
+        batch.append(sample)
+    yield batch, True
+
+
 def check_transform_data_in(data_in, scheduler: str) -> None:
     """Checks whether the data_in for a transform is valid or not."""
+    if is_stream_input(data_in):
+        return
     if not hasattr(data_in, "__getitem__"):
         raise InvalidInputDataError("__getitem__")
     if not hasattr(data_in, "__len__"):
@@ -534,16 +584,22 @@ def get_pbar_description(compute_functions: List):
     return f"Evaluating [{names_desc}]"
 
 
-def create_slices(data_in, num_workers):
-    size = math.ceil(len(data_in) / num_workers)
+def create_slices(data_in, num_workers, units_per_worker: int = 1):
+    """Splits ``data_in`` into ``num_workers * units_per_worker`` contiguous slices and returns them along with their offsets.
+
+    With more than one unit per worker, the compute pools hand out the next slice to whichever worker is free,
+    so that slow samples don't hold back the workers that got the rest of the input.
+    """
+    size = math.ceil(len(data_in) / (num_workers * max(units_per_worker, 1)))
+    offsets = list(range(0, len(data_in), size))
 
     if isinstance(data_in, Tensor):
         ret = [
-            Tensor(data_in.key, data_in.dataset)[i * size : (i + 1) * size]
-            for i in range(num_workers)
+            Tensor(data_in.key, data_in.dataset)[offset : offset + size]
+            for offset in offsets
         ]
     else:
-        ret = [data_in[i * size : (i + 1) * size] for i in range(num_workers)]
+        ret = [data_in[offset : offset + size] for offset in offsets]
 
     if isinstance(data_in, deeplake.Dataset):
         for ds in ret:
@@ -552,7 +608,6 @@ def create_slices(data_in, num_workers):
             for tensor_key in data_in.version_state["tensor_names"].values():
                 _tensors[tensor_key] = Tensor(tensor_key, ds)
 
-    offsets = list(range(0, len(data_in), size))
     return ret, offsets
 
 
@@ -696,11 +751,14 @@ def check_checkpoint_interval(
         raise ValueError(
             "checkpoint_interval should be a multiple of num_workers if num_workers > 0"
         )
-    if checkpoint_interval > len(data_in):
+    if is_stream_input(data_in):
+        # the length of the input is unknown
+        pass
+    elif checkpoint_interval > len(data_in):
         raise ValueError(
             "checkpoint_interval should be less than or equal to the length of data_in"
         )
-    if checkpoint_interval < len(data_in) / 10 and verbose:
+    elif checkpoint_interval < len(data_in) / 10 and verbose:
         warnings.warn(
             "checkpoint_interval is less than 10% of the length of data_in, this can lead to too many commits, consider increasing checkpoint_interval."
         )
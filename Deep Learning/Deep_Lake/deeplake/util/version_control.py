@@ -15,6 +15,7 @@ from deeplake.core.version_control.commit_diff import CommitDiff
 from deeplake.core.version_control.dataset_diff import DatasetDiff
 from deeplake.core.version_control.commit_node import CommitNode  # type: ignore
 from deeplake.core.version_control.commit_chunk_map import CommitChunkMap  # type: ignore
+from deeplake.core.version_control.chunk_commit_index import load_chunk_commit_index
 from deeplake.core.storage import LRUCache
 from deeplake.core.lock import Lock
 from deeplake.util.exceptions import CheckoutError, CommitError, DatasetCorruptError
@@ -30,6 +31,7 @@ from deeplake.util.keys import (
     get_tensor_info_key,
     get_tensor_meta_key,
     get_tensor_tile_encoder_key,
+    get_tensor_chunk_stats_key,
     get_version_control_info_key,
     get_version_control_info_key_old,
     get_version_control_info_lock_key,
@@ -173,6 +175,7 @@ def commit(
     version_state["commit_node_map"][hash] = new_node
     copy_metas(stored_commit_id, hash, storage)
     create_commit_chunk_maps(stored_commit_id, hash, storage)
+    create_chunk_commit_indexes(stored_commit_node, storage)
     discard_old_metas(stored_commit_id, storage, version_state["full_tensors"])
     if reload_meta:
         load_meta(dataset)
@@ -333,6 +336,15 @@ def copy_metas(
         except KeyError:
             pass
 
+        try:
+            src_chunk_stats_key = get_tensor_chunk_stats_key(tensor, src_commit_id)
+            dest_chunk_stats_key = get_tensor_chunk_stats_key(tensor, dest_commit_id)
+            src_chunk_stats = storage[src_chunk_stats_key]
+            dest_chunk_stats = convert_to_bytes(src_chunk_stats)
+            storage[dest_chunk_stats_key] = dest_chunk_stats
+        except KeyError:
+            pass
+
         try:
             src_sequence_encoder_key = get_sequence_encoder_key(tensor, src_commit_id)
             dest_sequence_encoder_key = get_sequence_encoder_key(tensor, dest_commit_id)
@@ -376,6 +388,12 @@ def create_commit_chunk_maps(
         storage[key] = CommitChunkMap()
 
 
+def create_chunk_commit_indexes(commit_node: CommitNode, storage: LRUCache) -> None:
+    """Stores the chunk commit indexes of all tensors of a commit that can no longer change."""
+    for tensor in _get_dataset_meta_at_commit(storage, commit_node.commit_id).tensors:
+        load_chunk_commit_index(storage, tensor, commit_node, write=True)
+
+
 def discard_old_metas(
     src_commit_id: str,
     storage: LRUCache,
@@ -401,18 +419,14 @@ def discard_old_metas(
         src_tile_encoder_key = get_tensor_tile_encoder_key(tensor, src_commit_id)
         all_src_keys.append(src_tile_encoder_key)
 
+        src_chunk_stats_key = get_tensor_chunk_stats_key(tensor, src_commit_id)
+        all_src_keys.append(src_chunk_stats_key)
+
         src_tensor_info_key = get_tensor_info_key(tensor, src_commit_id)
         all_src_keys.append(src_tensor_info_key)
 
     for key in all_src_keys:
-        storage.dirty_keys.pop(key, None)
-        if key in storage.lru_sizes:
-            size = storage.lru_sizes.pop(key)
-            storage.cache_used -= size
-        try:
-            del storage.cache_storage[key]
-        except KeyError:
-            pass
+        storage.remove_from_cache(key)
 
 
 def reset_and_checkout(ds, address, err, verbose=True):
@@ -806,6 +820,38 @@ def commit_diff_exists(
         return False
 
 
+def upgrade_version_control_metadata(
+    storage: LRUCache, version_state: Dict[str, Any]
+) -> int:
+    """Rewrites the commit chunk maps and diffs of all the commits that are stored in legacy formats in the current
+    binary formats. Legacy objects can still be read, but are otherwise only rewritten once they are modified.
+    Exposed as :meth:`Dataset.upgrade_vc_metadata`.
+
+    Returns:
+        int: The number of rewritten objects.
+    """
+    num_rewritten = 0
+    for commit_id in version_state["commit_node_map"]:
+        keys: List = [(get_dataset_diff_key(commit_id), DatasetDiff)]
+        for tensor in _get_dataset_meta_at_commit(storage, commit_id).tensors:
+            keys.append((get_tensor_commit_diff_key(tensor, commit_id), CommitDiff))
+            if commit_id != FIRST_COMMIT_ID:
+                keys.append(
+                    (get_tensor_commit_chunk_map_key(tensor, commit_id), CommitChunkMap)
+                )
+        for key, cls in keys:
+            try:
+                obj = storage.get_deeplake_object(key, cls)
+            except KeyError:
+                continue
+            if obj.legacy_format:
+                obj.legacy_format = False
+                storage[key] = obj
+                num_rewritten += 1
+    storage.flush()
+    return num_rewritten
+
+
 def _get_dataset_meta_at_commit(storage, commit_id):
     """Get dataset meta at commit."""
     meta_key = get_dataset_meta_key(commit_id)